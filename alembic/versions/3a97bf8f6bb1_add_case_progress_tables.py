@@ -0,0 +1,222 @@
+"""Add latest analysis and case progress tables
+
+Revision ID: 3a97bf8f6bb1
+Revises: 9008aa5065b4
+Create Date: 2023-05-08 10:12:41.482103
+
+"""
+
+import datetime as dt
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3a97bf8f6bb1"
+down_revision = "9008aa5065b4"
+branch_labels = None
+depends_on = None
+
+metadata = sa.MetaData()
+
+analysis = sa.Table(
+    "analysis",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("family_id", sa.Integer),
+    sa.Column("started_at", sa.DateTime),
+    sa.Column("completed_at", sa.DateTime),
+)
+application = sa.Table(
+    "application",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("is_external", sa.Boolean),
+    sa.Column("prep_category", sa.String(64)),
+    sa.Column("percent_reads_guaranteed", sa.Integer),
+    sa.Column("target_reads", sa.BigInteger),
+)
+application_version = sa.Table(
+    "application_version",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("application_id", sa.Integer),
+)
+family = sa.Table("family", metadata, sa.Column("id", sa.Integer, primary_key=True))
+family_sample = sa.Table(
+    "family_sample",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("family_id", sa.Integer),
+    sa.Column("sample_id", sa.Integer),
+)
+sample = sa.Table(
+    "sample",
+    metadata,
+    sa.Column("id", sa.Integer, primary_key=True),
+    sa.Column("application_version_id", sa.Integer),
+    sa.Column("ordered_at", sa.DateTime),
+    sa.Column("priority", sa.String(32)),
+    sa.Column("reads", sa.BigInteger),
+    sa.Column("sequenced_at", sa.DateTime),
+)
+case_progress = sa.Table(
+    "case_progress",
+    metadata,
+    sa.Column("family_id", sa.Integer, primary_key=True),
+    sa.Column("latest_sequenced_at", sa.DateTime),
+    sa.Column("latest_analyzed_at", sa.DateTime),
+    sa.Column("all_samples_pass_qc", sa.Boolean),
+    sa.Column("updated_at", sa.DateTime),
+)
+latest_analysis = sa.Table(
+    "latest_analysis",
+    metadata,
+    sa.Column("family_id", sa.Integer, primary_key=True),
+    sa.Column("analysis_id", sa.Integer),
+)
+
+
+def backfill_latest_analysis(bind) -> None:
+    latest_started_at = (
+        sa.select([analysis.c.family_id, sa.func.max(analysis.c.started_at).label("started_at")])
+        .group_by(analysis.c.family_id)
+        .alias("latest_started_at")
+    )
+    rows = bind.execute(
+        sa.select([analysis.c.family_id, sa.func.max(analysis.c.id)])
+        .select_from(
+            analysis.join(
+                latest_started_at,
+                sa.and_(
+                    analysis.c.family_id == latest_started_at.c.family_id,
+                    analysis.c.started_at == latest_started_at.c.started_at,
+                ),
+            )
+        )
+        .group_by(analysis.c.family_id)
+    ).fetchall()
+    if rows:
+        bind.execute(
+            latest_analysis.insert(),
+            [{"family_id": case_id, "analysis_id": analysis_id} for case_id, analysis_id in rows],
+        )
+
+
+def backfill_case_progress(bind) -> None:
+    # As Family.latest_analyzed, a case with an analysis that is not completed is not analysed
+    latest_analyzed_at = dict(
+        bind.execute(
+            sa.select(
+                [
+                    analysis.c.family_id,
+                    sa.case(
+                        [
+                            (
+                                sa.func.count() == sa.func.count(analysis.c.completed_at),
+                                sa.func.max(analysis.c.completed_at),
+                            )
+                        ],
+                        else_=None,
+                    ),
+                ]
+            ).group_by(analysis.c.family_id)
+        ).fetchall()
+    )
+    sample_passes_qc = sa.case(
+        [
+            (sample.c.id.is_(None), 1),
+            (application.c.is_external, 1),
+            (
+                sample.c.priority == "express",
+                sa.case([(sample.c.reads * 2 >= application.c.target_reads, 1)], else_=0),
+            ),
+            (application.c.prep_category == "rml", sa.case([(sample.c.reads > 0, 1)], else_=0)),
+        ],
+        else_=sa.case(
+            [
+                (
+                    sample.c.reads * 100
+                    > application.c.target_reads * application.c.percent_reads_guaranteed,
+                    1,
+                )
+            ],
+            else_=0,
+        ),
+    )
+    rows = bind.execute(
+        sa.select(
+            [
+                family.c.id,
+                sa.func.max(
+                    sa.case(
+                        [(application.c.is_external, sample.c.ordered_at)],
+                        else_=sample.c.sequenced_at,
+                    )
+                ),
+                sa.func.min(sample_passes_qc),
+            ]
+        )
+        .select_from(
+            family.outerjoin(family_sample, family_sample.c.family_id == family.c.id)
+            .outerjoin(sample, sample.c.id == family_sample.c.sample_id)
+            .outerjoin(
+                application_version,
+                application_version.c.id == sample.c.application_version_id,
+            )
+            .outerjoin(application, application.c.id == application_version.c.application_id)
+        )
+        .group_by(family.c.id)
+    ).fetchall()
+    updated_at = dt.datetime.now()
+    if rows:
+        bind.execute(
+            case_progress.insert(),
+            [
+                {
+                    "family_id": case_id,
+                    "latest_sequenced_at": latest_sequenced_at,
+                    "latest_analyzed_at": latest_analyzed_at.get(case_id),
+                    "all_samples_pass_qc": all_samples_pass_qc != 0,
+                    "updated_at": updated_at,
+                }
+                for case_id, latest_sequenced_at, all_samples_pass_qc in rows
+            ],
+        )
+
+
+def upgrade():
+    op.create_table(
+        "case_progress",
+        sa.Column("family_id", sa.Integer(), nullable=False),
+        sa.Column("latest_sequenced_at", sa.DateTime(), nullable=True),
+        sa.Column("latest_analyzed_at", sa.DateTime(), nullable=True),
+        sa.Column("all_samples_pass_qc", sa.Boolean(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["family_id"], ["family.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("family_id"),
+    )
+    op.create_index(
+        op.f("ix_case_progress_latest_sequenced_at"),
+        "case_progress",
+        ["latest_sequenced_at"],
+        unique=False,
+    )
+    op.create_table(
+        "latest_analysis",
+        sa.Column("family_id", sa.Integer(), nullable=False),
+        sa.Column("analysis_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["analysis_id"], ["analysis.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["family_id"], ["family.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("family_id"),
+        sa.UniqueConstraint("analysis_id"),
+    )
+    bind = op.get_bind()
+    backfill_latest_analysis(bind=bind)
+    backfill_case_progress(bind=bind)
+
+
+def downgrade():
+    op.drop_table("latest_analysis")
+    op.drop_index(op.f("ix_case_progress_latest_sequenced_at"), table_name="case_progress")
+    op.drop_table("case_progress")
@@ -0,0 +1,49 @@
+"""Add indexes for the columns of the status filters
+
+Revision ID: b105ef4a6ad3
+Revises: 3a97bf8f6bb1
+Create Date: 2023-05-10 14:31:07.220964
+
+"""
+
+from typing import List, Tuple
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b105ef4a6ad3"
+down_revision = "3a97bf8f6bb1"
+branch_labels = None
+depends_on = None
+
+INDEXES: List[Tuple[str, str, List[str]]] = [
+    ("ix_analysis_cleaned_at_started_at", "analysis", ["cleaned_at", "started_at"]),
+    (
+        "ix_analysis_pipeline_uploaded_at_completed_at",
+        "analysis",
+        ["pipeline", "uploaded_at", "completed_at"],
+    ),
+    ("ix_analysis_uploaded_at_completed_at", "analysis", ["uploaded_at", "completed_at"]),
+    (
+        "ix_family_action_data_analysis_ordered_at",
+        "family",
+        ["action", "data_analysis", "ordered_at"],
+    ),
+    ("ix_flowcell_status", "flowcell", ["status"]),
+    ("ix_pool_delivered_at", "pool", ["delivered_at"]),
+    ("ix_pool_received_at", "pool", ["received_at"]),
+    ("ix_sample_delivered_at", "sample", ["delivered_at"]),
+    ("ix_sample_prepared_at", "sample", ["prepared_at"]),
+    ("ix_sample_received_at", "sample", ["received_at"]),
+    ("ix_sample_sequenced_at", "sample", ["sequenced_at"]),
+]
+
+
+def upgrade():
+    for index_name, table_name, columns in INDEXES:
+        op.create_index(index_name, table_name, columns, unique=False)
+
+
+def downgrade():
+    for index_name, table_name, _ in reversed(INDEXES):
+        op.drop_index(index_name, table_name=table_name)
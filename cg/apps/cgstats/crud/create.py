@@ -1,5 +1,5 @@
 import logging
-from typing import Dict, Iterable, Optional, Union
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import sqlalchemy
 from cgmodels.demultiplex.sample_sheet import NovaSeqSample, SampleSheet
@@ -117,25 +117,46 @@ def create_sample(manager: StatsAPI, sample_id: str, barcode: str, project_id: i
     return sample
 
 
+def get_unaligned_values(demux_sample: DemuxSample) -> dict:
+    """Return the unaligned column values for a sample demultiplexed with bcl2fastq."""
+    return {
+        "lane": demux_sample.lane,
+        "yield_mb": round(int(demux_sample.pass_filter_yield) / 1000000, 2),
+        "passed_filter_pct": demux_sample.pass_filter_yield_pc,
+        "readcounts": demux_sample.pass_filter_clusters * 2,
+        "raw_clusters_per_lane_pct": demux_sample.raw_clusters_pc,
+        "perfect_indexreads_pct": (
+            round(demux_sample.perfect_barcodes / demux_sample.barcodes * 100, 5)
+            if demux_sample.barcodes
+            else 0
+        ),
+        "q30_bases_pct": demux_sample.pass_filter_Q30,
+        "mean_quality_score": demux_sample.pass_filter_qscore,
+    }
+
+
+def get_dragen_unaligned_values(demux_sample: DragenDemuxSample) -> dict:
+    """Return the unaligned column values for a sample demultiplexed with Dragen."""
+    return {
+        "lane": demux_sample.lane,
+        "passed_filter_pct": DRAGEN_PASSED_FILTER_PCT,
+        "readcounts": _calculate_read_counts(demux_sample),
+        "perfect_indexreads_pct": _calculate_perfect_indexreads_pct(demux_sample),
+        "q30_bases_pct": _calculate_q30_bases_pct(demux_sample),
+        "yield_mb": _calculate_yield(demux_sample),
+        "mean_quality_score": demux_sample.mean_quality_score,
+    }
+
+
 def create_unaligned(
     manager: StatsAPI, demux_sample: DemuxSample, sample_id: int, demux_id: int
 ) -> Unaligned:
-    unaligned: Unaligned = manager.Unaligned()
-    unaligned.sample_id = sample_id
-    unaligned.demux_id = demux_id
-    unaligned.lane = demux_sample.lane
-    unaligned.yield_mb = round(int(demux_sample.pass_filter_yield) / 1000000, 2)
-    unaligned.passed_filter_pct = demux_sample.pass_filter_yield_pc
-    unaligned.readcounts = demux_sample.pass_filter_clusters * 2
-    unaligned.raw_clusters_per_lane_pct = demux_sample.raw_clusters_pc
-    unaligned.perfect_indexreads_pct = (
-        round(demux_sample.perfect_barcodes / demux_sample.barcodes * 100, 5)
-        if demux_sample.barcodes
-        else 0
+    unaligned: Unaligned = manager.Unaligned(
+        sample_id=sample_id,
+        demux_id=demux_id,
+        time=sqlalchemy.func.now(),
+        **get_unaligned_values(demux_sample=demux_sample),
     )
-    unaligned.q30_bases_pct = demux_sample.pass_filter_Q30
-    unaligned.mean_quality_score = demux_sample.pass_filter_qscore
-    unaligned.time = sqlalchemy.func.now()
 
     manager.add(unaligned)
     manager.flush()
@@ -146,17 +167,12 @@ def create_dragen_unaligned(
     manager: StatsAPI, demux_sample: DragenDemuxSample, sample_id: int, demux_id: int
 ) -> Unaligned:
     """Create an unaligned object in cgstats for a sample demultiplexed with Dragen"""
-    unaligned: Unaligned = manager.Unaligned()
-    unaligned.sample_id: int = sample_id
-    unaligned.demux_id: int = demux_id
-    unaligned.lane: int = demux_sample.lane
-    unaligned.passed_filter_pct: float = DRAGEN_PASSED_FILTER_PCT
-    unaligned.readcounts: int = _calculate_read_counts(demux_sample)
-    unaligned.perfect_indexreads_pct: float = _calculate_perfect_indexreads_pct(demux_sample)
-    unaligned.q30_bases_pct: float = _calculate_q30_bases_pct(demux_sample)
-    unaligned.yield_mb: float = _calculate_yield(demux_sample)
-    unaligned.mean_quality_score: float = demux_sample.mean_quality_score
-    unaligned.time: sqlalchemy.sql.func.now = sqlalchemy.func.now()
+    unaligned: Unaligned = manager.Unaligned(
+        sample_id=sample_id,
+        demux_id=demux_id,
+        time=sqlalchemy.func.now(),
+        **get_dragen_unaligned_values(demux_sample=demux_sample),
+    )
 
     manager.add(unaligned)
     manager.flush()
@@ -208,12 +224,17 @@ def create_projects(manager: StatsAPI, project_names: Iterable[str]) -> Dict[str
     return project_name_to_id
 
 
+def _get_sample_barcode(sample: NovaSeqSample) -> str:
+    """Return the barcode of a sample sheet sample."""
+    return f"{sample.index}+{sample.second_index}" if sample.second_index else sample.index
+
+
 def _create_samples(
     manager: StatsAPI, sample: NovaSeqSample, project_name_to_id: Dict[str, int]
 ) -> Union[int, None]:
     """handles sample objects creation for the table `Sample` in cgstats"""
 
-    barcode = f"{sample.index}+{sample.second_index}" if sample.second_index else sample.index
+    barcode: str = _get_sample_barcode(sample=sample)
 
     sample_id: Optional[int] = manager.find_handler.get_sample_id(
         sample_id=sample.sample_id, barcode=barcode
@@ -233,23 +254,18 @@ def _create_samples(
     return sample_id
 
 
-def _create_dragen_samples(
+def insert_samples_one_by_one(
     manager: StatsAPI,
-    demux_results: DemuxResults,
+    samples: List[NovaSeqSample],
+    demux_samples: Dict[int, dict],
+    create_unaligned_function: Callable,
     project_name_to_id: Dict[str, int],
     demux_id: int,
-    sample_sheet: SampleSheet,
-):
-    """Handles sample creation: creates sample objects and unaligned objects in their respective
-    tables in cgstats for samples demultiplexed with Dragen"""
-
-    demux_samples: Dict[int, dict] = get_dragen_demux_samples(
-        demux_results=demux_results,
-        sample_sheet=sample_sheet,
-    )
-
+) -> None:
+    """Create the missing sample and unaligned objects for sample sheet samples in cgstats,
+    one sample at a time."""
     sample: NovaSeqSample
-    for sample in sample_sheet.samples:
+    for sample in samples:
         sample_id: int = _create_samples(
             manager=manager, sample=sample, project_name_to_id=project_name_to_id
         )
@@ -261,15 +277,38 @@ def _create_dragen_samples(
             sample_id=sample_id, demux_id=demux_id, lane=sample.lane
         )
         if not unaligned_id:
-            dragen_demux_sample: DragenDemuxSample = demux_samples[sample.lane][sample.sample_id]
-            create_dragen_unaligned(
+            create_unaligned_function(
                 manager=manager,
-                demux_sample=dragen_demux_sample,
+                demux_sample=demux_samples[sample.lane][sample.sample_id],
                 sample_id=sample_id,
                 demux_id=demux_id,
             )
 
 
+def _create_dragen_samples(
+    manager: StatsAPI,
+    demux_results: DemuxResults,
+    project_name_to_id: Dict[str, int],
+    demux_id: int,
+    sample_sheet: SampleSheet,
+):
+    """Handles sample creation: creates sample objects and unaligned objects in their respective
+    tables in cgstats for samples demultiplexed with Dragen"""
+
+    demux_samples: Dict[int, Dict[str, DragenDemuxSample]] = get_dragen_demux_samples(
+        demux_results=demux_results,
+        sample_sheet=sample_sheet,
+    )
+    insert_samples_one_by_one(
+        manager=manager,
+        samples=sample_sheet.samples,
+        demux_samples=demux_samples,
+        create_unaligned_function=create_dragen_unaligned,
+        project_name_to_id=project_name_to_id,
+        demux_id=demux_id,
+    )
+
+
 def _create_bcl2fastq_samples(
     manager: StatsAPI,
     demux_results: DemuxResults,
@@ -285,27 +324,14 @@ def _create_bcl2fastq_samples(
         demux_stats_path=demux_results.demux_stats_path,
         sample_sheet=sample_sheet,
     )
-
-    sample: NovaSeqSample
-    for sample in sample_sheet.samples:
-        sample_id: int = _create_samples(
-            manager=manager, sample=sample, project_name_to_id=project_name_to_id
-        )
-
-        if not sample_id:
-            continue
-
-        unaligned_id: Optional[int] = manager.find_handler.get_unaligned_id(
-            sample_id=sample_id, demux_id=demux_id, lane=sample.lane
-        )
-        if not unaligned_id:
-            demux_sample: DemuxSample = demux_samples[sample.lane][sample.sample_id]
-            create_unaligned(
-                manager=manager,
-                demux_sample=demux_sample,
-                sample_id=sample_id,
-                demux_id=demux_id,
-            )
+    insert_samples_one_by_one(
+        manager=manager,
+        samples=sample_sheet.samples,
+        demux_samples=demux_samples,
+        create_unaligned_function=create_unaligned,
+        project_name_to_id=project_name_to_id,
+        demux_id=demux_id,
+    )
 
 
 def create_samples(
@@ -328,8 +354,120 @@ def create_samples(
     )
 
 
-def create_novaseq_flowcell(manager: StatsAPI, demux_results: DemuxResults):
-    """Add a novaseq flowcell to CG stats"""
+def create_projects_in_bulk(manager: StatsAPI, project_names: Iterable[str]) -> Dict[str, int]:
+    """Create the missing projects in one statement and return the ids of all projects."""
+    project_names: Set[str] = set(project_names)
+    project_name_to_id: Dict[str, int] = manager.find_handler.get_project_ids_by_names(
+        project_names=project_names
+    )
+    new_project_names: Set[str] = project_names.difference(project_name_to_id)
+    if not new_project_names:
+        return project_name_to_id
+    LOG.info(f"Creating {len(new_project_names)} new projects")
+    manager.execute(
+        Project.__table__.insert().values(time=sqlalchemy.func.now()),
+        [{"projectname": project_name} for project_name in sorted(new_project_names)],
+    )
+    return manager.find_handler.get_project_ids_by_names(project_names=project_names)
+
+
+def insert_samples_in_bulk(
+    manager: StatsAPI,
+    samples: List[NovaSeqSample],
+    demux_samples: Dict[int, dict],
+    get_unaligned_values_function: Callable[[Union[DemuxSample, DragenDemuxSample]], dict],
+    project_name_to_id: Dict[str, int],
+    demux_id: int,
+) -> None:
+    """Create the missing sample and unaligned objects for sample sheet samples in cgstats
+    with one set query and one insert statement per table."""
+    samples: List[NovaSeqSample] = [sample for sample in samples if sample.project != "indexcheck"]
+    sample_key_to_id: Dict[
+        Tuple[str, str], int
+    ] = manager.find_handler.get_sample_ids_by_names_and_barcodes(
+        sample_names=[sample.sample_id for sample in samples]
+    )
+    new_samples: Dict[Tuple[str, str], dict] = {}
+    for sample in samples:
+        sample_key: Tuple[str, str] = (sample.sample_id, _get_sample_barcode(sample=sample))
+        if sample_key in sample_key_to_id or sample_key in new_samples:
+            continue
+        new_samples[sample_key] = {
+            "project_id": project_name_to_id[sample.project],
+            "samplename": sample.sample_id,
+            "limsid": sample.sample_id.split("_")[0],
+            "barcode": sample_key[1],
+        }
+    if new_samples:
+        LOG.info(f"Creating {len(new_samples)} new samples")
+        manager.execute(
+            Sample.__table__.insert().values(time=sqlalchemy.func.now()),
+            list(new_samples.values()),
+        )
+        sample_key_to_id: Dict[
+            Tuple[str, str], int
+        ] = manager.find_handler.get_sample_ids_by_names_and_barcodes(
+            sample_names=[sample.sample_id for sample in samples]
+        )
+
+    unaligned_keys: Set[Tuple[int, int]] = manager.find_handler.get_unaligned_sample_ids_and_lanes(
+        demux_id=demux_id
+    )
+    new_unaligned: List[dict] = []
+    for sample in samples:
+        sample_id: int = sample_key_to_id[(sample.sample_id, _get_sample_barcode(sample=sample))]
+        if (sample_id, sample.lane) in unaligned_keys:
+            continue
+        unaligned_keys.add((sample_id, sample.lane))
+        new_unaligned.append(
+            {
+                "sample_id": sample_id,
+                "demux_id": demux_id,
+                **get_unaligned_values_function(demux_samples[sample.lane][sample.sample_id]),
+            }
+        )
+    if new_unaligned:
+        LOG.info(f"Creating {len(new_unaligned)} new unaligned objects")
+        manager.execute(
+            Unaligned.__table__.insert().values(time=sqlalchemy.func.now()), new_unaligned
+        )
+
+
+def create_samples_in_bulk(
+    manager: StatsAPI,
+    demux_results: DemuxResults,
+    project_name_to_id: Dict[str, int],
+    demux_id: int,
+) -> None:
+    """Create sample objects and unaligned objects for all samples of a flow cell with bulk
+    statements, based on the bcl-converter used in demultiplexing."""
+    LOG.info(f"Creating samples in bulk for flow cell {demux_results.flow_cell.full_name}")
+    sample_sheet: SampleSheet = demux_results.flow_cell.get_sample_sheet()
+    if demux_results.bcl_converter == "dragen":
+        demux_samples: Dict[int, dict] = get_dragen_demux_samples(
+            demux_results=demux_results, sample_sheet=sample_sheet
+        )
+        get_unaligned_values_function: Callable = get_dragen_unaligned_values
+    else:
+        demux_samples: Dict[int, dict] = get_demux_samples(
+            conversion_stats=demux_results.conversion_stats,
+            demux_stats_path=demux_results.demux_stats_path,
+            sample_sheet=sample_sheet,
+        )
+        get_unaligned_values_function: Callable = get_unaligned_values
+    insert_samples_in_bulk(
+        manager=manager,
+        samples=sample_sheet.samples,
+        demux_samples=demux_samples,
+        get_unaligned_values_function=get_unaligned_values_function,
+        project_name_to_id=project_name_to_id,
+        demux_id=demux_id,
+    )
+
+
+def create_novaseq_flowcell(manager: StatsAPI, demux_results: DemuxResults, bulk: bool = False):
+    """Add a novaseq flowcell to CG stats. In bulk mode the projects, samples and unaligned
+    objects are created with a few set queries and bulk insert statements."""
     LOG.info("Adding flowcell information to cgstats")
     support_parameters_id: Optional[int] = manager.find_handler.get_support_parameters_id(
         demux_results=demux_results
@@ -376,6 +514,19 @@ def create_novaseq_flowcell(manager: StatsAPI, demux_results: DemuxResults):
     else:
         LOG.info("Demux object already exists")
 
+    if bulk:
+        project_name_to_id: Dict[str, int] = create_projects_in_bulk(
+            manager=manager, project_names=demux_results.projects
+        )
+        create_samples_in_bulk(
+            manager=manager,
+            demux_results=demux_results,
+            project_name_to_id=project_name_to_id,
+            demux_id=demux_id,
+        )
+        manager.commit()
+        return
+
     project_name_to_id = create_projects(manager=manager, project_names=demux_results.projects)
 
     create_samples(
@@ -1,5 +1,5 @@
 import logging
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
 import alchy
 from sqlalchemy import or_
@@ -124,6 +124,33 @@ class FindHandler:
         """Get sample by name and barcode."""
         return Sample.query.filter_by(samplename=sample_name).filter_by(barcode=barcode).first()
 
+    def get_project_ids_by_names(self, project_names: Iterable[str]) -> Dict[str, int]:
+        """Get a map from project name to project id for the existing projects."""
+        projects: alchy.Query = (
+            Project.query.filter(Project.projectname.in_(set(project_names)))
+            .order_by(Project.project_id.desc())
+            .with_entities(Project.projectname, Project.project_id)
+        )
+        return {project_name: project_id for project_name, project_id in projects}
+
+    def get_sample_ids_by_names_and_barcodes(
+        self, sample_names: Iterable[str]
+    ) -> Dict[Tuple[str, str], int]:
+        """Get a map from sample name and barcode to sample id for the existing samples."""
+        samples: alchy.Query = (
+            Sample.query.filter(Sample.samplename.in_(set(sample_names)))
+            .order_by(Sample.sample_id.desc())
+            .with_entities(Sample.samplename, Sample.barcode, Sample.sample_id)
+        )
+        return {(sample_name, barcode): sample_id for sample_name, barcode, sample_id in samples}
+
+    def get_unaligned_sample_ids_and_lanes(self, demux_id: int) -> Set[Tuple[int, int]]:
+        """Get the sample ids and lanes that have unaligned results for a demux."""
+        unaligned: alchy.Query = Unaligned.query.filter_by(demux_id=demux_id).with_entities(
+            Unaligned.sample_id, Unaligned.lane
+        )
+        return {(sample_id, lane) for sample_id, lane in unaligned}
+
     def get_unaligned_id(self, sample_id: int, demux_id: int, lane: int) -> Optional[int]:
         """Get unaligned id by sample id, demux id and lane."""
         unaligned: Unaligned = self.get_unaligned_by_sample_id_demux_id_and_lane(
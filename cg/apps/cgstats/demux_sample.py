@@ -192,7 +192,7 @@ def get_demux_samples(
     information"""
     LOG.info("Gather post demultiplexing statistics for demultiplexed samples")
     demux_samples: Dict[int, Dict[str, DemuxSample]] = {}
-    demux_stats: DemuxStats = DemuxStats(demux_stats_path=demux_stats_path)
+    demux_stats: DemuxStats = DemuxStats(demux_stats_path=demux_stats_path, fast=True)
     raw_clusters: Dict[int, int] = conversion_stats.raw_clusters_per_lane
     flowcell_id: str = conversion_stats.flowcell_id
     sample: NovaSeqSample
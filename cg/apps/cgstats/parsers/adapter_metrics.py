@@ -2,15 +2,15 @@
 import csv
 import logging
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 LOG = logging.getLogger(__name__)
 
 
 class AdapterMetrics:
-    def __init__(self, adapter_metrics_path: Path):
+    def __init__(self, adapter_metrics_path: Path, fast: bool = False):
         self.adapter_metrics_path = adapter_metrics_path
-        self.parsed_metrics = self.parse_metrics_file()
+        self.parsed_metrics = self.parse_metrics_file_fast() if fast else self.parse_metrics_file()
 
     @staticmethod
     def summerize_adapter_metrics(parsed_metrics: Dict[int, dict]) -> Dict[Tuple[str, str], dict]:
@@ -44,3 +44,30 @@ class AdapterMetrics:
                 parsed_metrics[lane][(read_number, sample_id)] = row
 
         return self.summerize_adapter_metrics(parsed_metrics=parsed_metrics)
+
+    def parse_metrics_file_fast(self) -> Dict[int, dict]:
+        """Parse the Dragen adapter metrics file and summerize the reads of each sample in each lane
+        in one pass. Each sample is expected once per read."""
+        LOG.info(
+            "Fast parsing Dragen demultiplexing adapter metrics file %s", self.adapter_metrics_path
+        )
+        summarized_metrics: Dict[int, dict] = {}
+
+        with self.adapter_metrics_path.open("r") as metrics_file:
+            metrics_reader = csv.reader(metrics_file)
+            header: List[str] = next(metrics_reader)
+            lane_column: int = header.index("Lane")
+            sample_id_column: int = header.index("Sample_ID")
+            read_number_column: int = header.index("ReadNumber")
+            sample_bases_column: int = header.index("SampleBases")
+            for row in metrics_reader:
+                lane_metrics: dict = summarized_metrics.setdefault(int(row[lane_column]), {})
+                sample_metrics: dict = lane_metrics.get(row[sample_id_column])
+                if sample_metrics is None:
+                    sample_metrics = dict(zip(header, row))
+                    lane_metrics[row[sample_id_column]] = sample_metrics
+                sample_metrics["R" + row[read_number_column] + "_SampleBases"] = row[
+                    sample_bases_column
+                ]
+
+        return summarized_metrics
@@ -20,15 +20,20 @@ Flowcell
 
 There are many tiles for each lane. We are not interested about the tile level but want to add upp the information to
 lane level, just like we do in the demux stats.
+
+In the fast parse mode the tile counts are added up in plain integers, and the results of a sample
+on a lane are only turned into a SampleConversionResults object when they are looked up.
 """
 import copy
 import logging
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Mapping, Optional, Set, Tuple
 from xml.etree.ElementTree import Element, iterparse
 
 from pydantic import BaseModel
 
+from cg.apps.cgstats.parsers.lazy_mapping import LazyModelMapping
+
 LOG = logging.getLogger(__name__)
 
 
@@ -55,8 +60,20 @@ class UnknownBarcode(BaseModel):
     read_count: int
 
 
+# Positions of the tile counts of a sample on a lane in the fast parse mode
+RAW_CLUSTER_COUNT = 0
+RAW_YIELD = 1
+PASS_FILTER_CLUSTER_COUNT = 2
+PASS_FILTER_READ1_YIELD = 3
+PASS_FILTER_READ2_YIELD = 4
+PASS_FILTER_READ1_Q30 = 5
+PASS_FILTER_READ2_Q30 = 6
+PASS_FILTER_QUALITY_SCORE_SUM = 7
+NR_OF_COUNTS = 8
+
+
 class ConversionStats:
-    def __init__(self, conversion_stats_path: Path):
+    def __init__(self, conversion_stats_path: Path, fast: bool = False):
         self.conversion_stats_path: Path = conversion_stats_path
         self._current_sample = ""
         self._current_barcode = ""
@@ -74,12 +91,18 @@ class ConversionStats:
         self.lanes: Set[int] = set()
         self.unknown_barcodes: List[UnknownBarcode] = []
         # Mapping from lane to barcodes and the results
-        self.lanes_to_barcode: Dict[int, Dict[str, SampleConversionResults]] = {}
-        self.barcode_to_lanes: Dict[str, Dict[int, SampleConversionResults]] = {}
+        self.lanes_to_barcode: Dict[int, Mapping[str, SampleConversionResults]] = {}
+        self.barcode_to_lanes: Dict[str, Mapping[int, SampleConversionResults]] = {}
         self.lanes_to_unknown_barcode: Dict[int, List[UnknownBarcode]] = {}
         # This is just a summary of all raw clusters per lane
         self.raw_clusters_per_lane: Dict[int, int] = {}
-        self.parse_file()
+        # Sample id and tile counts of each lane and barcode in the fast parse mode
+        self._counts: Dict[Tuple[int, str], Tuple[str, List[int]]] = {}
+        self._results_cache: Dict[Tuple[int, str], SampleConversionResults] = {}
+        if fast:
+            self.parse_file_fast()
+        else:
+            self.parse_file()
 
     @staticmethod
     def get_current_tag(node: Element) -> str:
@@ -108,6 +131,111 @@ class ConversionStats:
             # Release element tree from memory
             node.clear()
 
+    def parse_file_fast(self) -> None:
+        """Parse a file with demux conversion stats information, adding up the tile counts of each
+        sample on each lane without keeping track of the whole path in the xml file"""
+        event: str
+        node: Element
+        LOG.info("Fast parsing demux conversion stats file %s", self.conversion_stats_path)
+        tile_depth: int = 0
+        raw_depth: int = 0
+        read1_depth: int = 0
+        counts: List[int] = [0] * NR_OF_COUNTS
+        for event, node in iterparse(str(self.conversion_stats_path), ["start", "end"]):
+            tag: str = node.tag
+            if event == "start":
+                if tag == "Tile":
+                    tile_depth += 1
+                elif tag == "Raw":
+                    raw_depth += 1
+                elif tag == "Read":
+                    read1_depth += node.attrib["number"] == "1"
+                elif tile_depth == 0:
+                    self.evaluate_start_node(node=node, current_tag=tag)
+                continue
+
+            if not self._skip_entry:
+                if tile_depth:
+                    if tag == "ClusterCount":
+                        if raw_depth:
+                            counts[RAW_CLUSTER_COUNT] += int(node.text)
+                        else:
+                            counts[PASS_FILTER_CLUSTER_COUNT] += int(node.text)
+                    elif tag == "Yield":
+                        if raw_depth:
+                            counts[RAW_YIELD] += int(node.text)
+                        elif read1_depth:
+                            counts[PASS_FILTER_READ1_YIELD] += int(node.text)
+                        else:
+                            counts[PASS_FILTER_READ2_YIELD] += int(node.text)
+                    elif tag == "YieldQ30" and not raw_depth:
+                        if read1_depth:
+                            counts[PASS_FILTER_READ1_Q30] += int(node.text)
+                        else:
+                            counts[PASS_FILTER_READ2_Q30] += int(node.text)
+                    elif tag == "QualityScoreSum" and not raw_depth:
+                        counts[PASS_FILTER_QUALITY_SCORE_SUM] += int(node.text)
+                elif tag == "Lane":
+                    if self.unknown_barcodes_entry:
+                        self.create_unknown_barcodes_entry()
+                    else:
+                        self.add_counts(counts=counts)
+                        counts = [0] * NR_OF_COUNTS
+            if tag == "Tile":
+                tile_depth -= 1
+            elif tag == "Raw":
+                raw_depth -= 1
+            elif tag == "Read":
+                read1_depth -= node.attrib["number"] == "1"
+            node.clear()
+
+    def add_counts(self, counts: List[int]) -> None:
+        """Add the tile counts of the current sample on the current lane"""
+        lane: int = self._current_lane
+        barcode: str = self._current_barcode
+        self._counts[(lane, barcode)] = (self._current_sample, counts)
+        self._results_cache.pop((lane, barcode), None)
+        self.raw_clusters_per_lane[lane] = (
+            self.raw_clusters_per_lane.get(lane, 0) + counts[RAW_CLUSTER_COUNT]
+        )
+        if lane not in self.lanes_to_barcode:
+            self.lanes_to_barcode[lane] = LazyModelMapping(
+                build_model=lambda barcode_key, lane_key=lane: self.get_results(
+                    lane=lane_key, barcode=barcode_key
+                )
+            )
+        self.lanes_to_barcode[lane].add(barcode)
+        if barcode not in self.barcode_to_lanes:
+            self.barcode_to_lanes[barcode] = LazyModelMapping(
+                build_model=lambda lane_key, barcode_key=barcode: self.get_results(
+                    lane=lane_key, barcode=barcode_key
+                )
+            )
+        self.barcode_to_lanes[barcode].add(lane)
+
+    def get_results(self, lane: int, barcode: str) -> SampleConversionResults:
+        """Return the conversion results of a barcode on a lane from the tile counts, which are
+        only turned into results once"""
+        if (lane, barcode) in self._results_cache:
+            return self._results_cache[(lane, barcode)]
+        sample_id, counts = self._counts[(lane, barcode)]
+        entry = SampleConversionResults(
+            raw_cluster_count=counts[RAW_CLUSTER_COUNT],
+            raw_yield=counts[RAW_YIELD],
+            pass_filter_cluster_count=counts[PASS_FILTER_CLUSTER_COUNT],
+            pass_filter_read1_yield=counts[PASS_FILTER_READ1_YIELD],
+            pass_filter_read2_yield=counts[PASS_FILTER_READ2_YIELD],
+            pass_filter_read1_q30=counts[PASS_FILTER_READ1_Q30],
+            pass_filter_read2_q30=counts[PASS_FILTER_READ2_Q30],
+            pass_filter_quality_score_sum=counts[PASS_FILTER_QUALITY_SCORE_SUM],
+            barcode=barcode,
+            sample_id=sample_id,
+        )
+        self.update_summaries(entry)
+        self.update_quality_score(entry)
+        self._results_cache[(lane, barcode)] = entry
+        return entry
+
     @staticmethod
     def update_quality_score(entry: SampleConversionResults) -> None:
         """Calculate the quality score for the lane results"""
@@ -155,6 +283,9 @@ class ConversionStats:
     def evaluate_start_event(self, node: Element, current_tag: str) -> None:
         LOG.debug("Add start event %s to current path", current_tag)
         self.current_path.append(current_tag)
+        self.evaluate_start_node(node=node, current_tag=current_tag)
+
+    def evaluate_start_node(self, node: Element, current_tag: str) -> None:
         if current_tag == "Lane":
             self.set_current_lane(lane_nr=int(node.attrib["number"]))
         elif current_tag == "Sample":
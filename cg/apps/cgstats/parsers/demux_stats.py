@@ -1,11 +1,13 @@
 """Parse statistics from the demultiplexing stats file"""
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Mapping, Optional, Set, Tuple
 from xml.etree.ElementTree import Element, iterparse
 
 from pydantic import BaseModel
 
+from cg.apps.cgstats.parsers.lazy_mapping import LazyModelMapping
+
 LOG = logging.getLogger(__name__)
 
 
@@ -16,7 +18,7 @@ class SampleBarcodeStats(BaseModel):
 
 
 class DemuxStats:
-    def __init__(self, demux_stats_path: Path):
+    def __init__(self, demux_stats_path: Path, fast: bool = False):
         self.demux_stats_path: Path = demux_stats_path
         self._current_project = ""
         self._current_sample = ""
@@ -32,12 +34,19 @@ class DemuxStats:
         self.barcodes: Set[str] = set()
         self.barcode_to_sample: Dict[str, str] = {}
         self.lanes: Set[int] = set()
-        self.lanes_to_barcode = {}
-        self.barcode_to_lanes = {}
+        self.lanes_to_barcode: Dict[int, Mapping[str, SampleBarcodeStats]] = {}
+        self.barcode_to_lanes: Dict[str, Mapping[int, SampleBarcodeStats]] = {}
+        # Barcode counts of each lane and barcode in the fast parse mode
+        self._counts: Dict[Tuple[int, str], Tuple[int, int, int]] = {}
+        self._stats_cache: Dict[Tuple[int, str], SampleBarcodeStats] = {}
+        self._fast: bool = fast
         self.parse_file()
 
     def create_entry(self) -> None:
         """Create a entry of SampleBarcodeStats and add it in a structured way"""
+        if self._fast:
+            self.add_counts()
+            return
         entry: SampleBarcodeStats = SampleBarcodeStats(
             barcode_count=self._current_barcode_count,
             perfect_barcode_count=self._current_perfect_barcode_count,
@@ -51,6 +60,45 @@ class DemuxStats:
             self.barcode_to_lanes[self._current_barcode] = {}
         self.barcode_to_lanes[self._current_barcode][self._current_lane] = entry
 
+    def add_counts(self) -> None:
+        """Add the barcode counts of the current lane and barcode, to be turned into a
+        SampleBarcodeStats entry when looked up"""
+        lane: int = self._current_lane
+        barcode: str = self._current_barcode
+        self._counts[(lane, barcode)] = (
+            self._current_barcode_count,
+            self._current_perfect_barcode_count,
+            self._current_mismatch_barcode_count,
+        )
+        self._stats_cache.pop((lane, barcode), None)
+        if lane not in self.lanes_to_barcode:
+            self.lanes_to_barcode[lane] = LazyModelMapping(
+                build_model=lambda barcode_key, lane_key=lane: self.get_barcode_stats(
+                    lane=lane_key, barcode=barcode_key
+                )
+            )
+        self.lanes_to_barcode[lane].add(barcode)
+        if barcode not in self.barcode_to_lanes:
+            self.barcode_to_lanes[barcode] = LazyModelMapping(
+                build_model=lambda lane_key, barcode_key=barcode: self.get_barcode_stats(
+                    lane=lane_key, barcode=barcode_key
+                )
+            )
+        self.barcode_to_lanes[barcode].add(lane)
+
+    def get_barcode_stats(self, lane: int, barcode: str) -> SampleBarcodeStats:
+        """Return the barcode stats of a barcode on a lane, which are only created once"""
+        if (lane, barcode) not in self._stats_cache:
+            barcode_count, perfect_barcode_count, mismatch_barcode_count = self._counts[
+                (lane, barcode)
+            ]
+            self._stats_cache[(lane, barcode)] = SampleBarcodeStats(
+                barcode_count=barcode_count,
+                perfect_barcode_count=perfect_barcode_count,
+                one_mismatch_barcode_count=mismatch_barcode_count,
+            )
+        return self._stats_cache[(lane, barcode)]
+
     def parse_file(self) -> None:
         """Parse a XML file with demux statistics"""
         LOG.info("Parsing demux stats file %s", self.demux_stats_path)
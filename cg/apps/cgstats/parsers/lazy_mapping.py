@@ -0,0 +1,31 @@
+"""Read-only mappings of parsed results that build their models when first accessed"""
+from collections.abc import Mapping
+from typing import Callable, Dict, Hashable, Iterator
+
+from pydantic import BaseModel
+
+
+class LazyModelMapping(Mapping):
+    """Mapping from keys to models, where the models are built from the parsed values when they are
+    looked up"""
+
+    def __init__(self, build_model: Callable[[Hashable], BaseModel]):
+        self.build_model: Callable[[Hashable], BaseModel] = build_model
+        self._keys: Dict[Hashable, None] = {}
+
+    def add(self, key: Hashable) -> None:
+        self._keys[key] = None
+
+    def __getitem__(self, key: Hashable) -> BaseModel:
+        if key not in self._keys:
+            raise KeyError(key)
+        return self.build_model(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self):
+        return f"LazyModelMapping(keys={list(self._keys)})"
@@ -2,15 +2,15 @@
 import csv
 import logging
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, List, Tuple
 
 LOG = logging.getLogger(__name__)
 
 
 class QualityMetrics:
-    def __init__(self, quality_metrics_path: Path):
+    def __init__(self, quality_metrics_path: Path, fast: bool = False):
         self.quality_metrics_path = quality_metrics_path
-        self.parsed_metrics = self.parse_metrics_file()
+        self.parsed_metrics = self.parse_metrics_file_fast() if fast else self.parse_metrics_file()
 
     def parse_metrics_file(
         self,
@@ -32,6 +32,38 @@ class QualityMetrics:
 
         return self.summerize_quality_metrics(parsed_metrics=parsed_metrics)
 
+    def parse_metrics_file_fast(self) -> Dict[int, dict]:
+        """Parse the Dragen quality metrics file and summerize the reads of each sample in each lane
+        in one pass, converting only the summed columns. Each sample is expected once per read."""
+        LOG.info(
+            "Fast parsing Dragen demultiplexing quality metrics file %s", self.quality_metrics_path
+        )
+
+        summarized_metrics: Dict[int, dict] = {}
+
+        with open(self.quality_metrics_path, mode="r") as metrics_file:
+            metrics_reader = csv.reader(metrics_file)
+            header: List[str] = next(metrics_reader)
+            lane_column: int = header.index("Lane")
+            sample_id_column: int = header.index("SampleID")
+            yield_q30_column: int = header.index("YieldQ30")
+            mean_quality_score_column: int = header.index("Mean Quality Score (PF)")
+            quality_score_sum_column: int = header.index("QualityScoreSum")
+            for row in metrics_reader:
+                lane_metrics: dict = summarized_metrics.setdefault(int(row[lane_column]), {})
+                sample_metrics: dict = lane_metrics.get(row[sample_id_column])
+                if sample_metrics is None:
+                    sample_metrics = dict(zip(header, row))
+                    sample_metrics["YieldQ30"] = 0
+                    sample_metrics["Mean Quality Score (PF)"] = 0.0
+                    sample_metrics["QualityScoreSum"] = 0
+                    lane_metrics[row[sample_id_column]] = sample_metrics
+                sample_metrics["YieldQ30"] += int(row[yield_q30_column])
+                sample_metrics["Mean Quality Score (PF)"] += float(row[mean_quality_score_column])
+                sample_metrics["QualityScoreSum"] += int(row[quality_score_sum_column])
+
+        return summarized_metrics
+
     @staticmethod
     def summerize_quality_metrics(parsed_metrics: Dict[int, dict]) -> Dict[Tuple[str, str], dict]:
         """Summerize forward and reverse read information for each sample in each lane."""
@@ -1,6 +1,6 @@
 import logging
 from pathlib import Path
-from typing import Dict, Iterator, List, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 
 import alchy
 import sqlalchemy as sqa
@@ -47,28 +47,41 @@ class StatsAPI(alchy.Manager):
         return raw_sample_name.rstrip("AB")
 
     def get_flowcell_samples(self, flowcell_object: Flowcell) -> List[StatsSample]:
+        """Fetch reads and FASTQ files of the samples on a flow cell, from one aggregated query and
+        one directory walk per flow cell that the samples have been sequenced on."""
         flowcell_samples: List[StatsSample] = []
-        for sample_obj in self.flowcell_samples(flowcell_obj=flowcell_object):
-            curated_sample_name: str = self.get_curated_sample_name(sample_obj.samplename)
-            sample_data = {"name": curated_sample_name, "reads": 0, "fastqs": []}
-            for fc_data in self.sample_reads(sample_obj):
-                if fc_data.q30 >= FLOWCELL_Q30_THRESHOLD[fc_data.type]:
-                    sample_data["reads"] += fc_data.reads
-                else:
-                    q30_threshold: int = FLOWCELL_Q30_THRESHOLD[fc_data.type]
-                    LOG.warning(
-                        f"q30 too low for {curated_sample_name} on {fc_data.name}:"
-                        f"{fc_data.q30} < {q30_threshold}%"
-                    )
+        sample_reads: list = self.flowcell_sample_reads(flowcell_obj=flowcell_object).all()
+        flowcell_names: Set[str] = {fc_data.name for fc_data in sample_reads}
+        pooled_lanes: Set[Tuple[str, Optional[int]]] = self.pooled_lanes(
+            flowcell_names=flowcell_names
+        )
+        flowcell_fastqs: Dict[str, Dict[str, List[Path]]] = {
+            flowcell_name: self.flowcell_fastqs(flowcell_name=flowcell_name)
+            for flowcell_name in flowcell_names
+        }
+        sample_data: Dict[str, Union[str, int, List[str]]] = {}
+        current_sample_id: Optional[int] = None
+        for fc_data in sample_reads:
+            curated_sample_name: str = self.get_curated_sample_name(fc_data.samplename)
+            if fc_data.sample_id != current_sample_id:
+                current_sample_id = fc_data.sample_id
+                sample_data = {"name": curated_sample_name, "reads": 0, "fastqs": []}
+            if fc_data.q30 >= FLOWCELL_Q30_THRESHOLD[fc_data.type]:
+                sample_data["reads"] += fc_data.reads
+            else:
+                q30_threshold: int = FLOWCELL_Q30_THRESHOLD[fc_data.type]
+                LOG.warning(
+                    f"q30 too low for {curated_sample_name} on {fc_data.name}:"
+                    f"{fc_data.q30} < {q30_threshold}%"
+                )
+                continue
+
+            is_lane_pooled: bool = (fc_data.name, fc_data.lane) in pooled_lanes
+            for fastq_path in flowcell_fastqs[fc_data.name].get(fc_data.samplename, []):
+                if is_lane_pooled and "Undetermined" in str(fastq_path):
                     continue
-
-                for fastq_path in self.fastqs(fc_data.name, sample_obj):
-                    if self.is_lane_pooled(
-                        flowcell_obj=flowcell_object, lane=fc_data.lane
-                    ) and "Undetermined" in str(fastq_path):
-                        continue
-                    sample_data["fastqs"].append(str(fastq_path))
-                flowcell_samples.append(StatsSample(**sample_data))
+                sample_data["fastqs"].append(str(fastq_path))
+            flowcell_samples.append(StatsSample(**sample_data))
         return flowcell_samples
 
     def flowcell(self, flowcell_name: str) -> StatsFlowcell:
@@ -118,6 +131,41 @@ class StatsAPI(alchy.Manager):
             .group_by(Flowcell.flowcellname)
         )
 
+    def flowcell_sample_reads(self, flowcell_obj: Flowcell) -> alchy.Query:
+        """Calculate reads and q30 per flow cell for all the samples on a flow cell."""
+        flowcell_sample_ids = (
+            self.session.query(Unaligned.sample_id)
+            .join(Unaligned.demux)
+            .filter(Demux.flowcell == flowcell_obj)
+            .subquery()
+        )
+        return (
+            self.session.query(
+                Sample.sample_id,
+                Sample.samplename,
+                Flowcell.flowcellname.label("name"),
+                Flowcell.hiseqtype.label("type"),
+                sqa.func.min(Unaligned.lane).label("lane"),
+                sqa.func.sum(Unaligned.readcounts).label("reads"),
+                sqa.func.min(Unaligned.q30_bases_pct).label("q30"),
+            )
+            .join(Flowcell.demux, Demux.unaligned, Unaligned.sample)
+            .filter(Unaligned.sample_id.in_(flowcell_sample_ids))
+            .group_by(Sample.sample_id, Sample.samplename, Flowcell.flowcellname)
+            .order_by(Sample.sample_id, Flowcell.flowcellname)
+        )
+
+    def pooled_lanes(self, flowcell_names: Set[str]) -> Set[Tuple[str, Optional[int]]]:
+        """Return the flow cell names and lanes of the pooled lanes on the flow cells."""
+        query = (
+            self.session.query(Flowcell.flowcellname, Unaligned.lane)
+            .join(Flowcell.demux, Demux.unaligned)
+            .filter(Flowcell.flowcellname.in_(flowcell_names))
+            .group_by(Flowcell.flowcellname, Unaligned.lane)
+            .having(sqa.func.count(Unaligned.sample_id) > 1)
+        )
+        return {(flowcell_name, lane) for flowcell_name, lane in query}
+
     def flow_cell_reads_and_q30_summary(self, flow_cell_name: str) -> Dict[str, Union[int, float]]:
         """Calculate reads and q30 for a flow cell."""
         flow_cell_reads_and_q30_summary: Dict[str, Union[int, float]] = {"reads": 0, "q30": 0.0}
@@ -126,16 +174,15 @@ class StatsAPI(alchy.Manager):
         )
 
         if flow_cell_obj:
-            sample_count: int = 0
             q30_list: List[float] = []
 
-            for sample in self.flowcell_samples(flowcell_obj=flow_cell_obj):
-                sample_count += 1
-                sample_info = self.sample_reads(sample_obj=sample).first()
+            for sample_info in self.flowcell_sample_reads(flowcell_obj=flow_cell_obj).filter(
+                Flowcell.flowcellname == flow_cell_name
+            ):
                 flow_cell_reads_and_q30_summary["reads"] += int(sample_info.reads)
                 q30_list.append(float(sample_info.q30))
 
-            flow_cell_reads_and_q30_summary["q30"]: float = sum(q30_list) / sample_count
+            flow_cell_reads_and_q30_summary["q30"]: float = sum(q30_list) / len(q30_list)
         else:
             LOG.error(f"StatsAPI: Could not find flowcell in database with name: {flow_cell_name}")
 
@@ -152,3 +199,22 @@ class StatsAPI(alchy.Manager):
         for fastq_pattern in (base_pattern, alt_pattern):
             pattern = fastq_pattern.format(flowcell, sample_obj.samplename)
             yield from self.root_dir.glob(pattern)
+
+    def flowcell_fastqs(self, flowcell_name: str) -> Dict[str, List[Path]]:
+        """Fetch the FASTQ files of all samples on a flow cell, by sample name, with one directory
+        walk. Files in a directory with the sample name come before files in a directory with the
+        sample name and a suffix, as in the two patterns of fastqs()."""
+        fastq_paths: List[Path] = sorted(
+            self.root_dir.glob(f"*{flowcell_name}/Unaligned*/Project_*/Sample_*/*.fastq.gz")
+        )
+        sample_fastqs: Dict[str, List[Path]] = {}
+        for fastq_path in fastq_paths:
+            sample_dir_name: str = fastq_path.parent.name[len("Sample_") :]
+            sample_fastqs.setdefault(sample_dir_name, []).append(fastq_path)
+        for fastq_path in fastq_paths:
+            sample_dir_name = fastq_path.parent.name[len("Sample_") :]
+            for separator_position, character in enumerate(sample_dir_name):
+                if character == "_":
+                    sample_name: str = sample_dir_name[:separator_position]
+                    sample_fastqs.setdefault(sample_name, []).append(fastq_path)
+        return sample_fastqs
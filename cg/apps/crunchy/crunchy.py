@@ -53,6 +53,12 @@ class CrunchyAPI:
         self.dry_run = dry_run
         self.slurm_api.set_dry_run(dry_run=dry_run)
 
+    def get_number_of_queued_jobs(self) -> int:
+        """Return the number of compression and decompression jobs pending or running in SLURM."""
+        return self.slurm_api.get_number_of_queued_jobs(
+            account=self.slurm_account, quality_of_service=SlurmQos.MAINTENANCE
+        )
+
     # Methods to check compression status
     @staticmethod
     def is_compression_pending(compression_obj: CompressionData) -> bool:
@@ -1,7 +1,9 @@
 """Functions that deals with modifications of the indexes"""
 import csv
 import logging
-from typing import Dict, List, Set
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Set, Tuple
 
 from cg.apps.lims.samplesheet import LimsFlowcellSample
 from cg.resources import valid_indexes_path
@@ -20,6 +22,16 @@ def index_exists(index: str, indexes: Set[str]) -> bool:
     return any(existing_index.startswith(index) for existing_index in indexes)
 
 
+def get_index_prefixes(indexes: Set[str]) -> Set[str]:
+    """Return all prefixes of the indexes, so that checking if an index is the start of any of
+    the indexes is a set lookup"""
+    return {
+        existing_index[:prefix_length]
+        for existing_index in indexes
+        for prefix_length in range(len(existing_index) + 1)
+    }
+
+
 def get_indexes_by_lane(samples: List[LimsFlowcellSample]) -> Dict[int, Set[str]]:
     """Group the indexes from samples by lane"""
     indexes_by_lane = {}
@@ -36,6 +48,51 @@ class Index(BaseModel):
     sequence: str
 
 
+class IndexCatalogue(NamedTuple):
+    """Immutable catalogue of the valid indexes, with lookups by sequence and the reverse
+    complements of the second indexes computed up front"""
+
+    indexes: Tuple[Index, ...]
+    indexes_by_sequence: Mapping[str, Index]
+    reverse_complements: Mapping[str, str]
+
+    def get_index(self, sequence: str) -> Optional[Index]:
+        """Return the valid index with the sequence, if any"""
+        return self.indexes_by_sequence.get(sequence)
+
+    def get_reverse_complement(self, dna: str) -> str:
+        """Return the reverse complement of a DNA sequence, precomputed for the second indexes"""
+        if dna in self.reverse_complements:
+            return self.reverse_complements[dna]
+        return get_reverse_complement_dna_seq(dna)
+
+
+def build_index_catalogue(indexes: Iterable[Index]) -> IndexCatalogue:
+    """Build a catalogue of indexes with the reverse complements of their second indexes, both
+    as they are and padded"""
+    indexes: Tuple[Index, ...] = tuple(indexes)
+    reverse_complements: Dict[str, str] = {}
+    for index_obj in indexes:
+        if not is_dual_index(index_obj.sequence):
+            continue
+        index2: str = index_obj.sequence.split("-")[1].strip()
+        for sequence in (index2, pad_index_two(index_string=index2, reverse_complement=True)):
+            reverse_complements[sequence] = get_reverse_complement_dna_seq(sequence)
+    return IndexCatalogue(
+        indexes=indexes,
+        indexes_by_sequence=MappingProxyType(
+            {index_obj.sequence: index_obj for index_obj in indexes}
+        ),
+        reverse_complements=MappingProxyType(reverse_complements),
+    )
+
+
+@lru_cache(maxsize=None)
+def get_index_catalogue(dual_indexes_only: bool = True) -> IndexCatalogue:
+    """Return the catalogue of valid indexes, which is read from file once"""
+    return build_index_catalogue(indexes=get_valid_indexes(dual_indexes_only=dual_indexes_only))
+
+
 def get_valid_indexes(dual_indexes_only: bool = True) -> List[Index]:
     LOG.info("Fetch valid indexes from %s", valid_indexes_path)
     indexes: List[Index] = []
@@ -116,6 +173,7 @@ def adapt_indexes(
         control_software_version=control_software_version,
         reagent_kit_version_string=reagent_kit_version,
     )
+    index_catalogue: IndexCatalogue = get_index_catalogue(dual_indexes_only=True)
     for sample in samples:
         index1, index2 = sample.index.split("-")
         index1: str = index1.strip()
@@ -126,7 +184,7 @@ def adapt_indexes(
             index1 = pad_index_one(index_string=index1)
             index2 = pad_index_two(index_string=index2, reverse_complement=reverse_complement)
         if reverse_complement:
-            index2 = get_reverse_complement_dna_seq(index2)
+            index2 = index_catalogue.get_reverse_complement(index2)
         sample.index = index1
         sample.index2 = index2
 
@@ -134,3 +192,18 @@ def adapt_indexes(
 def is_dual_index(index: str) -> bool:
     """Determines if an index in the raw sample sheet is dual index or not"""
     return "-" in index
+
+
+def get_index_collisions(
+    samples: List[LimsFlowcellSample],
+) -> List[Tuple[LimsFlowcellSample, LimsFlowcellSample]]:
+    """Return the pairs of samples in the same lane that have the same indexes"""
+    collisions: List[Tuple[LimsFlowcellSample, LimsFlowcellSample]] = []
+    samples_by_indexes: Dict[Tuple[int, str, str], LimsFlowcellSample] = {}
+    for sample in samples:
+        lane_indexes: Tuple[int, str, str] = (sample.lane, sample.index, sample.index2)
+        if lane_indexes in samples_by_indexes:
+            collisions.append((samples_by_indexes[lane_indexes], sample))
+            continue
+        samples_by_indexes[lane_indexes] = sample
+    return collisions
@@ -1,7 +1,7 @@
 """ Create a samplesheet for Novaseq flowcells """
 
 import logging
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 from cg.apps.demultiplex.sample_sheet import index
 from cg.apps.demultiplex.sample_sheet.dummy_sample import dummy_sample
@@ -14,6 +14,7 @@ from cg.constants.demultiplexing import (
     SAMPLE_SHEET_SETTING_BARCODE_MISMATCH_INDEX1,
     SAMPLE_SHEET_SETTING_BARCODE_MISMATCH_INDEX2,
 )
+from cg.exc import FlowCellError
 from cg.models.demultiplex.run_parameters import RunParameters
 from cgmodels.demultiplex.sample_sheet import get_sample_sheet
 
@@ -39,7 +40,7 @@ class SampleSheetCreator:
 
     @property
     def valid_indexes(self) -> List[Index]:
-        return index.get_valid_indexes(dual_indexes_only=True)
+        return list(index.get_index_catalogue(dual_indexes_only=True).indexes)
 
     def add_dummy_samples(self) -> None:
         """Add all dummy samples with non existing indexes to samples
@@ -49,10 +50,12 @@ class SampleSheetCreator:
         """
         LOG.info("Adding dummy samples for unused indexes")
         indexes_by_lane: Dict[int, Set[str]] = index.get_indexes_by_lane(samples=self.lims_samples)
+        valid_indexes: List[Index] = self.valid_indexes
         for lane, lane_indexes in indexes_by_lane.items():
             LOG.debug("Add dummy samples for lane %s", lane)
-            for index_obj in self.valid_indexes:
-                if index.index_exists(index=index_obj.sequence, indexes=lane_indexes):
+            lane_index_prefixes: Set[str] = index.get_index_prefixes(indexes=lane_indexes)
+            for index_obj in valid_indexes:
+                if index_obj.sequence in lane_index_prefixes:
                     LOG.debug("Index %s already in use", index_obj.sequence)
                     continue
                 dummy_sample_obj: LimsFlowcellSample = dummy_sample(
@@ -77,6 +80,19 @@ class SampleSheetCreator:
             samples_to_keep.append(sample)
         self.lims_samples = samples_to_keep
 
+    def check_index_collisions(self) -> None:
+        """Raise if samples in the same lane have the same indexes"""
+        collisions: List[
+            Tuple[LimsFlowcellSample, LimsFlowcellSample]
+        ] = index.get_index_collisions(samples=self.lims_samples)
+        for sample, other_sample in collisions:
+            LOG.error(
+                f"Samples {sample.sample_id} and {other_sample.sample_id} in lane {sample.lane} "
+                f"have the same indexes {sample.index}-{sample.index2}"
+            )
+        if collisions:
+            raise FlowCellError(f"Found {len(collisions)} index collisions in the sample sheet")
+
     @staticmethod
     def convert_sample_to_header_dict(
         sample: LimsFlowcellSample,
@@ -129,6 +145,7 @@ class SampleSheetCreator:
             LOG.info("Skipping validation of sample sheet due to force flag")
             return sample_sheet
         LOG.info("Validating sample sheet")
+        self.check_index_collisions()
         get_sample_sheet(
             sample_sheet=sample_sheet,
             sheet_type="S2",
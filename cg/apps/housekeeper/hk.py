@@ -325,7 +325,7 @@ class HousekeeperAPI:
 
     def add_and_include_file_to_latest_version(
         self, bundle_name: str, file: Path, tags: list
-    ) -> None:
+    ) -> File:
         """Adds and includes a file in the latest version of a bundle."""
         version: Version = self.last_version(bundle_name)
         if not version:
@@ -334,6 +334,7 @@ class HousekeeperAPI:
         hk_file: File = self.add_file(version_obj=version, tags=tags, path=str(file.absolute()))
         self.include_file(version_obj=version, file_obj=hk_file)
         self.commit()
+        return hk_file
 
     def include_files_to_latest_version(self, bundle_name: str) -> None:
         """Include all files in the latest version on a bundle."""
@@ -376,6 +377,69 @@ class HousekeeperAPI:
             raise HousekeeperBundleVersionMissingError
         return self.files(version=version.id, tags=tags)
 
+    def get_latest_versions(self, bundle_names: List[str]) -> Dict[str, Version]:
+        """Return the latest version of each of the given bundles, fetched in a single query."""
+        latest_versions: Dict[str, Version] = {}
+        if not bundle_names:
+            return latest_versions
+        versions: Query = (
+            self._store._get_query(table=Version)
+            .join(Version.bundle)
+            .filter(Bundle.name.in_(bundle_names))
+            .order_by(Version.created_at)
+            .with_entities(Bundle.name, Version)
+        )
+        for bundle_name, version in versions:
+            latest_versions[bundle_name] = version
+        return latest_versions
+
+    def get_files_from_versions(self, version_ids: List[int], tags: List[str]) -> Query:
+        """Return the files with the given tags in any of the given versions."""
+        return self.files(tags=tags).filter(File.version_id.in_(version_ids))
+
+    def get_or_create_latest_versions(self, bundle_names: List[str]) -> Dict[str, Version]:
+        """Return the latest version of each of the given bundles, adding new bundles with a version
+        to the session for the bundles that do not exist. Nothing is committed."""
+        latest_versions: Dict[str, Version] = self.get_latest_versions(bundle_names=bundle_names)
+        missing_bundle_names: Set[str] = set(bundle_names) - set(latest_versions)
+        if not missing_bundle_names:
+            return latest_versions
+        for bundle in self._store._get_query(table=Bundle).filter(
+            Bundle.name.in_(missing_bundle_names)
+        ):
+            LOG.info(f"Bundle: {bundle.name} has no version in Housekeeper")
+            raise HousekeeperBundleVersionMissingError
+        created_at: dt.datetime = dt.datetime.now()
+        for bundle_name in sorted(missing_bundle_names):
+            new_bundle: Bundle = self.new_bundle(name=bundle_name, created_at=created_at)
+            new_version: Version = self.new_version(created_at=created_at)
+            new_bundle.versions.append(new_version)
+            self._store.session.add(new_bundle)
+            LOG.info(f"New bundle created with name {new_bundle.name}")
+            latest_versions[bundle_name] = new_version
+        return latest_versions
+
+    def add_and_include_files(
+        self, version: Version, file_paths: List[Path], tags: List[str]
+    ) -> List[File]:
+        """Add and include files in a version, fetching the tags once for all files. Neither the
+        files nor any new tags are committed, new tags are only flushed so that they are found by
+        the next batch of files."""
+        file_tags: List[models.Tag] = []
+        for tag_name in tags:
+            tag: Optional[models.Tag] = self.get_tag(tag_name)
+            if tag is None:
+                tag = self._store.new_tag(tag_name)
+                self._store.session.add(tag)
+                self._store.session.flush()
+            file_tags.append(tag)
+        hk_files: List[File] = []
+        for file_path in file_paths:
+            hk_file: File = self.new_file(path=str(file_path.absolute()), tags=list(file_tags))
+            hk_file.version = version
+            hk_files.append(self.include_file(file_obj=hk_file, version_obj=version))
+        return hk_files
+
     def is_fastq_or_spring_in_all_bundles(self, bundle_names: List[str]) -> bool:
         """Return whether or not all FASTQ/SPRING files are included for the given bundles."""
         sequencing_files_in_hk: Dict[str, bool] = {}
@@ -1,23 +1,30 @@
 """Contains API to communicate with LIMS"""
 import datetime as dt
 import logging
-from typing import Generator, Optional, Union, Dict, List, Tuple
+from pathlib import Path
+from typing import Any, Generator, Optional, Union, Dict, List, Tuple
+from urllib.parse import urlencode
+from xml.etree import ElementTree
 
-# fixes https://github.com/Clinical-Genomics/servers/issues/30
-import requests_cache
 from dateutil.parser import parse as parse_date
-from genologics.entities import Process, Project, Sample, Artifact
+from genologics.entities import Entity, Process, Project, Sample, Artifact
 from genologics.lims import Lims
 from requests.exceptions import HTTPError
 
-from cg.constants.lims import MASTER_STEPS_UDFS, PROP2UDF, DocumentationMethod
+from cg.apps.lims.cache import LimsResponseCache
+from cg.constants.lims import (
+    LIMS_BATCH_SIZE,
+    LIMS_CACHE_EXPIRE_AFTER,
+    LIMS_CACHE_MAX_ENTRIES,
+    MASTER_STEPS_UDFS,
+    PROP2UDF,
+    DocumentationMethod,
+)
 from cg.exc import LimsDataError
 
 from .order import OrderHandler
 from ...constants import Priority
 
-requests_cache.install_cache(backend="memory")
-
 SEX_MAP = {"F": "female", "M": "male", "Unknown": "unknown", "unknown": "unknown"}
 REV_SEX_MAP = {value: key for key, value in SEX_MAP.items()}
 AM_METHODS = {
@@ -47,12 +54,74 @@ class LimsAPI(Lims, OrderHandler):
     def __init__(self, config):
         lconf = config["lims"]
         super(LimsAPI, self).__init__(lconf["host"], lconf["username"], lconf["password"])
+        cache_config: dict = lconf.get("cache") or {}
+        cache_path: Optional[str] = cache_config.get("path")
+        self.response_cache = LimsResponseCache(
+            expire_after=cache_config.get("expire_after", LIMS_CACHE_EXPIRE_AFTER),
+            max_entries=cache_config.get("max_entries", LIMS_CACHE_MAX_ENTRIES),
+            path=Path(cache_path) if cache_path else None,
+        )
+
+    def cache_response(self, uri: str, root: ElementTree.Element) -> None:
+        """Add a response to the response cache and forget the entities of evicted responses."""
+        for evicted_uri in self.response_cache.set(
+            uri=uri, response=ElementTree.tostring(root, encoding="unicode")
+        ):
+            self.cache.pop(evicted_uri, None)
+
+    def get(self, uri, params=dict()) -> ElementTree.Element:
+        """GET data from the URI, from the response cache unless the response has expired."""
+        cache_uri: str = f"{uri}?{urlencode(params)}" if params else uri
+        response: Optional[str] = self.response_cache.get(cache_uri)
+        if response is not None:
+            return ElementTree.fromstring(response)
+        root: ElementTree.Element = super(LimsAPI, self).get(uri, params=params)
+        self.cache_response(uri=cache_uri, root=root)
+        return root
+
+    def put(self, uri, data, params=dict()) -> ElementTree.Element:
+        """PUT data to the URI and cache the updated entity."""
+        root: ElementTree.Element = super(LimsAPI, self).put(uri, data, params=params)
+        self.cache_response(uri=uri, root=root)
+        return root
+
+    def get_batch(self, instances, force=False) -> list:
+        """Get the content of entities in one batch request, including entities that have been
+        loaded before if their responses have expired, and cache their responses."""
+        for instance in instances:
+            if instance.root is not None and instance.uri not in self.response_cache:
+                instance.root = None
+        loaded_instances: list = super(LimsAPI, self).get_batch(instances, force=force)
+        for instance in loaded_instances:
+            if instance.uri not in self.response_cache:
+                self.cache_response(uri=instance.uri, root=instance.root)
+        return loaded_instances
+
+    def invalidate(self, entity: Entity) -> None:
+        """Remove the cached response of an entity, so that it is fetched again when used."""
+        self.response_cache.invalidate(uri=entity.uri)
+        entity.root = None
+
+    def get_sample(self, lims_id: str) -> Sample:
+        """Return a LIMS sample, that is fetched again when used if its response has expired."""
+        lims_sample = Sample(self, id=lims_id)
+        if lims_sample.root is not None and lims_sample.uri not in self.response_cache:
+            lims_sample.root = None
+        return lims_sample
 
     def sample(self, lims_id: str):
         """Fetch a sample from the LIMS database."""
-        lims_sample = Sample(self, id=lims_id)
+        lims_sample = self.get_sample(lims_id)
         return self._export_sample(lims_sample)
 
+    def samples(self, lims_ids: List[str]) -> Dict[str, dict]:
+        """Fetch the samples from the LIMS database, in batches. Samples that are not found are
+        left out."""
+        lims_samples: List[Sample] = self.load_samples(
+            samples=[Sample(self, id=lims_id) for lims_id in lims_ids]
+        )
+        return {lims_sample.id: self._export_sample(lims_sample) for lims_sample in lims_samples}
+
     def samples_in_pools(self, pool_name, projectname):
         """Fetch all samples from a pool"""
         return self.get_samples(udf={"pool name": str(pool_name)}, projectname=projectname)
@@ -95,7 +164,7 @@ class LimsAPI(Lims, OrderHandler):
     def get_received_date(self, lims_id: str) -> dt.date:
         """Get the date when a sample was received."""
 
-        sample = Sample(self, id=lims_id)
+        sample = self.get_sample(lims_id)
         try:
             date = sample.udf.get("Received at")
         except HTTPError:
@@ -105,7 +174,7 @@ class LimsAPI(Lims, OrderHandler):
     def get_prepared_date(self, lims_id: str) -> dt.date:
         """Get the date when a sample was prepared in the lab."""
 
-        sample = Sample(self, id=lims_id)
+        sample = self.get_sample(lims_id)
         try:
             date = sample.udf.get("Library Prep Finished")
         except HTTPError:
@@ -115,20 +184,61 @@ class LimsAPI(Lims, OrderHandler):
     def get_delivery_date(self, lims_id: str) -> dt.date:
         """Get delivery date for a sample."""
 
-        sample = Sample(self, id=lims_id)
+        sample = self.get_sample(lims_id)
         try:
             date = sample.udf.get("Delivered at")
         except HTTPError:
             date = None
         return date
 
+    def load_samples(
+        self, samples: List[Sample], batch_size: int = LIMS_BATCH_SIZE
+    ) -> List[Sample]:
+        """Load the given LIMS samples with one batch request per batch of samples.
+        Samples in a failing batch are loaded one at a time and skipped if not found."""
+        loaded_samples: List[Sample] = []
+        for batch_start in range(0, len(samples), batch_size):
+            batch: List[Sample] = samples[batch_start : batch_start + batch_size]
+            try:
+                loaded_samples.extend(self.get_batch(batch))
+                continue
+            except HTTPError:
+                LOG.warning("Could not fetch samples in batch, fetching them one at a time")
+            for sample in batch:
+                try:
+                    sample.get()
+                except HTTPError:
+                    LOG.warning(f"Could not fetch sample {sample.id} from LIMS")
+                    continue
+                loaded_samples.append(sample)
+        return loaded_samples
+
+    def get_sample_udf_values(self, lims_ids: List[str], udf_key: str) -> Dict[str, Any]:
+        """Return the value of a UDF for each of the given samples, fetched in batches."""
+        samples: List[Sample] = self.load_samples(
+            samples=[Sample(self, id=lims_id) for lims_id in lims_ids]
+        )
+        return {sample.id: sample.udf.get(udf_key) for sample in samples}
+
+    def get_received_dates(self, lims_ids: List[str]) -> Dict[str, Optional[dt.date]]:
+        """Get the dates when the samples were received."""
+        return self.get_sample_udf_values(lims_ids=lims_ids, udf_key="Received at")
+
+    def get_prepared_dates(self, lims_ids: List[str]) -> Dict[str, Optional[dt.date]]:
+        """Get the dates when the samples were prepared in the lab."""
+        return self.get_sample_udf_values(lims_ids=lims_ids, udf_key="Library Prep Finished")
+
+    def get_delivery_dates(self, lims_ids: List[str]) -> Dict[str, Optional[dt.date]]:
+        """Get the delivery dates for the samples."""
+        return self.get_sample_udf_values(lims_ids=lims_ids, udf_key="Delivered at")
+
     def capture_kit(self, lims_id: str) -> str:
         """Get capture kit for a LIMS sample."""
 
         step_names_udfs = MASTER_STEPS_UDFS["capture_kit_step"]
         capture_kits = set()
 
-        lims_sample = Sample(self, id=lims_id)
+        lims_sample = self.get_sample(lims_id)
         capture_kit = lims_sample.udf.get("Bait Set")
 
         if capture_kit and capture_kit != "NA":
@@ -203,7 +313,7 @@ class LimsAPI(Lims, OrderHandler):
         self, lims_id: str, sex=None, target_reads: int = None, name: str = None, **kwargs
     ):
         """Update information about a sample."""
-        lims_sample = Sample(self, id=lims_id)
+        lims_sample = self.get_sample(lims_id)
 
         if sex:
             lims_gender = REV_SEX_MAP.get(sex)
@@ -226,7 +336,7 @@ class LimsAPI(Lims, OrderHandler):
     def get_sample_attribute(self, lims_id: str, key: str) -> str:
         """Get data from a sample."""
 
-        sample = Sample(self, id=lims_id)
+        sample = self.get_sample(lims_id)
         if not PROP2UDF.get(key):
             raise LimsDataError(
                 f"Unknown how to get {key} from LIMS since it is not defined in " f"{PROP2UDF}"
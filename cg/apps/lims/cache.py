@@ -0,0 +1,130 @@
+"""Cache of LIMS responses that expire, with a maximum number of entries and optional persistence"""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from cachetools import TTLCache
+
+LOG = logging.getLogger(__name__)
+
+
+class EvictionTrackingTTLCache(TTLCache):
+    """TTL cache that keeps the keys of the items evicted to make room for new items"""
+
+    def __init__(self, maxsize: int, ttl: int):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evicted_keys: List[str] = []
+
+    def popitem(self):
+        key, value = super().popitem()
+        self.evicted_keys.append(key)
+        return key, value
+
+
+class LimsResponseCache:
+    """Cache of LIMS responses by URI. Responses expire after a number of seconds, the least
+    recently used responses are evicted when there are too many and, given a path, responses are
+    kept in an SQLite database so that they can be reused by later processes. The time each
+    response was fetched is kept with it, so that persisted responses expire on time."""
+
+    def __init__(self, expire_after: int, max_entries: int, path: Optional[Path] = None):
+        self.expire_after: int = expire_after
+        self.max_entries: int = max_entries
+        self.path: Optional[Path] = path
+        self._responses = EvictionTrackingTTLCache(maxsize=max_entries, ttl=expire_after)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        if path:
+            self._connection = self._connect(path=path)
+            self._load()
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(path), check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(uri TEXT PRIMARY KEY, created_at REAL NOT NULL, response TEXT NOT NULL)"
+        )
+        return connection
+
+    def _load(self) -> None:
+        """Load the responses that have not expired from the database, removing the others."""
+        expired_before: float = time.time() - self.expire_after
+        self._connection.execute("DELETE FROM responses WHERE created_at <= ?", (expired_before,))
+        self._connection.commit()
+        rows: List[Tuple[str, float, str]] = self._connection.execute(
+            "SELECT uri, created_at, response FROM responses ORDER BY created_at DESC LIMIT ?",
+            (self.max_entries,),
+        ).fetchall()
+        for uri, created_at, response in reversed(rows):
+            self._responses[uri] = (created_at, response)
+        LOG.debug(f"Loaded {len(self._responses)} LIMS responses from {self.path}")
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at >= self.expire_after
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+    def __contains__(self, uri: str) -> bool:
+        """Return True if there is a response for the URI that has not expired."""
+        with self._lock:
+            entry: Optional[Tuple[float, str]] = self._responses.get(uri)
+            return entry is not None and not self._is_expired(created_at=entry[0])
+
+    def get(self, uri: str) -> Optional[str]:
+        """Return the response for the URI, unless it is missing or has expired."""
+        with self._lock:
+            entry: Optional[Tuple[float, str]] = self._responses.get(uri)
+            if entry is None:
+                return None
+            created_at, response = entry
+            if self._is_expired(created_at=created_at):
+                self._remove(uris=[uri])
+                if self._connection:
+                    self._connection.commit()
+                return None
+            return response
+
+    def set(self, uri: str, response: str) -> List[str]:
+        """Add the response for the URI and return the URIs of the evicted responses."""
+        with self._lock:
+            created_at: float = time.time()
+            self._responses[uri] = (created_at, response)
+            if self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                    (uri, created_at, response),
+                )
+            evicted_uris: List[str] = self._responses.evicted_keys
+            self._responses.evicted_keys = []
+            self._remove(uris=evicted_uris)
+            if self._connection:
+                self._connection.commit()
+            return evicted_uris
+
+    def invalidate(self, uri: str) -> None:
+        """Remove the response for the URI."""
+        with self._lock:
+            self._remove(uris=[uri])
+            if self._connection:
+                self._connection.commit()
+
+    def clear(self) -> None:
+        """Remove all responses."""
+        with self._lock:
+            self._remove(uris=list(self._responses.keys()))
+            if self._connection:
+                self._connection.commit()
+
+    def _remove(self, uris: List[str]) -> None:
+        for uri in uris:
+            self._responses.pop(uri, None)
+        if self._connection and uris:
+            self._connection.executemany(
+                "DELETE FROM responses WHERE uri = ?", [(uri,) for uri in uris]
+            )
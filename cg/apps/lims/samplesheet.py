@@ -1,11 +1,15 @@
 """Functions to get sample sheet information from Lims"""
 import logging
 import re
-from typing import Iterable, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, Iterable, List, Optional, Union
 
 from pydantic import BaseModel, Field
+from requests.exceptions import HTTPError
 
-from genologics.entities import Artifact, Container, Sample
+from cg.constants.lims import LIMS_BATCH_SIZE, LIMS_MAX_CONCURRENT_REQUESTS
+from genologics.entities import Artifact, Container, Entity, Sample
 from genologics.lims import Lims
 
 LOG = logging.getLogger(__name__)
@@ -87,6 +91,63 @@ def get_index(lims: Lims, label: str) -> str:
     return sequence
 
 
+def load_batch(lims: Lims, entities: List[Entity], batch_size: int = LIMS_BATCH_SIZE) -> None:
+    """Load artifacts or samples with one batch request per batch. Entities in a failing batch
+    are loaded one at a time when they are first used."""
+    for batch_start in range(0, len(entities), batch_size):
+        batch: List[Entity] = entities[batch_start : batch_start + batch_size]
+        try:
+            lims.get_batch(batch)
+        except HTTPError:
+            LOG.warning("Could not fetch %s entities in batch", len(batch))
+
+
+def load_concurrently(entities: Iterable[Optional[Entity]]) -> None:
+    """Load entities that can not be fetched in batch, such as processes and projects,
+    concurrently and each entity once"""
+    entities_to_load: List[Entity] = [entity for entity in dict.fromkeys(entities) if entity]
+    with ThreadPoolExecutor(max_workers=LIMS_MAX_CONCURRENT_REQUESTS) as executor:
+        list(executor.map(lambda entity: entity.get(), entities_to_load))
+
+
+def prefetch_flowcell_artifacts(lims: Lims, placement_artifacts: List[Artifact]) -> List[Artifact]:
+    """Load the artifacts placed on a flow cell, the artifacts they were pooled from and their
+    samples and projects, with batch requests per level of pooling, so that the sample sheet
+    can be built from memory. Return the non pooled artifacts."""
+    non_pooled_artifacts: List[Artifact] = []
+    artifacts: List[Artifact] = placement_artifacts
+    while artifacts:
+        load_batch(lims=lims, entities=artifacts)
+        pooled_artifacts: List[Artifact] = []
+        for artifact in artifacts:
+            if len(artifact.samples) == 1:
+                non_pooled_artifacts.append(artifact)
+                continue
+            pooled_artifacts.append(artifact)
+        load_concurrently(artifact.parent_process for artifact in pooled_artifacts)
+        artifacts = list(
+            dict.fromkeys(
+                chain.from_iterable(artifact.input_artifact_list() for artifact in pooled_artifacts)
+            )
+        )
+    samples: List[Sample] = list(
+        dict.fromkeys(artifact.samples[0] for artifact in non_pooled_artifacts)
+    )
+    LOG.info("Fetching %s samples of flow cell artifacts", len(samples))
+    load_batch(lims=lims, entities=samples)
+    load_concurrently(sample.project for sample in samples)
+    return non_pooled_artifacts
+
+
+def get_indexes_by_label(lims: Lims, labels: Iterable[Optional[str]]) -> Dict[Optional[str], str]:
+    """Return the index sequence of each reagent label, fetched concurrently and once per label"""
+    unique_labels: List[Optional[str]] = list(dict.fromkeys(labels))
+    with ThreadPoolExecutor(max_workers=LIMS_MAX_CONCURRENT_REQUESTS) as executor:
+        return dict(
+            zip(unique_labels, executor.map(lambda label: get_index(lims, label), unique_labels))
+        )
+
+
 def flowcell_samples(
     lims: Lims, flowcell_id: str, bcl_converter: str
 ) -> Iterable[Union[LimsFlowcellSampleBcl2Fastq, LimsFlowcellSampleDragen]]:
@@ -100,6 +161,12 @@ def flowcell_samples(
         return []
     container: Container = containers[-1]  # only take the last one. See ÖA#217.
     raw_lanes: List[str] = sorted(container.placements.keys())
+    flowcell_artifacts: List[Artifact] = prefetch_flowcell_artifacts(
+        lims=lims, placement_artifacts=[container.placements[raw_lane] for raw_lane in raw_lanes]
+    )
+    indexes_by_label: Dict[Optional[str], str] = get_indexes_by_label(
+        lims=lims, labels=(get_reagent_label(artifact) for artifact in flowcell_artifacts)
+    )
     for raw_lane in raw_lanes:
         lane: int = get_placement_lane(raw_lane)
         placement_artifact: Artifact = container.placements[raw_lane]
@@ -107,7 +174,7 @@ def flowcell_samples(
         for artifact in non_pooled_artifacts:
             sample: Sample = artifact.samples[0]  # we are assured it only has one sample
             label: Optional[str] = get_reagent_label(artifact)
-            index = get_index(lims=lims, label=label)
+            index: str = indexes_by_label[label]
             yield lims_flowcell_sample[bcl_converter](
                 flowcell_id=flowcell_id,
                 lane=lane,
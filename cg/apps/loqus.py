@@ -1,5 +1,6 @@
 """Module for Loqusdb API."""
 
+import copy
 import logging
 from pathlib import Path
 from subprocess import CalledProcessError
@@ -22,6 +23,13 @@ class LoqusdbAPI:
         self.config_path = config_path
         self.process = Process(binary=self.binary_path, config=self.config_path)
 
+    def clone(self) -> "LoqusdbAPI":
+        """Return a copy of the API with a process of its own, to run commands from another
+        thread. The output of a command is kept on the process that ran it."""
+        loqusdb_api: LoqusdbAPI = copy.copy(self)
+        loqusdb_api.process = copy.copy(self.process)
+        return loqusdb_api
+
     def load(
         self,
         case_id: str,
@@ -21,6 +21,7 @@ class SlurmAPI:
     def __init__(self):
         """Initialize SlurmAPI class."""
         self.process: Process = Process(binary="sbatch")
+        self.queue_process: Process = Process(binary="squeue")
         self.dry_run: bool = False
 
     def set_dry_run(self, dry_run: bool) -> None:
@@ -84,6 +85,24 @@ class SlurmAPI:
                 job_number = 123456
         return job_number
 
+    def get_number_of_queued_jobs(self, account: str, quality_of_service: str) -> int:
+        """Return the number of pending and running jobs of an account and quality of service."""
+        self.queue_process.run_command(
+            parameters=[
+                "--noheader",
+                "--account",
+                account,
+                "--qos",
+                quality_of_service,
+                "--states",
+                "PENDING,RUNNING",
+                "--format",
+                "%i",
+            ],
+            dry_run=self.dry_run,
+        )
+        return len([line for line in self.queue_process.stdout_lines() if line.strip()])
+
     def submit_sbatch(self, sbatch_content: str, sbatch_path: Path) -> int:
         """Submit sbatch file to slurm.
 
@@ -2,17 +2,27 @@
 import datetime
 import datetime as dt
 import logging
-from typing import Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
 
 from google.auth import jwt
 from google.auth.crypt import RSASigner
+from requests import Session
 
 from cg.apps.tb.models import TrailblazerAnalysis
 from cg.constants import Pipeline
 from cg.constants.constants import APIMethods, FileFormat, WorkflowManager
 from cg.constants.priority import SlurmQos
-from cg.constants.tb import AnalysisStatus
+from cg.constants.tb import (
+    TRAILBLAZER_POOL_SIZE,
+    TRAILBLAZER_RETRIES,
+    TRAILBLAZER_RETRY_BACKOFF_FACTOR,
+    TRAILBLAZER_RETRY_STATUS_CODES,
+    TRAILBLAZER_TIMEOUT,
+    AnalysisStatus,
+)
 from cg.exc import TrailblazerAPIHTTPError
+from cg.io.api import get_session
 from cg.io.controller import APIRequest, ReadStream
 
 LOG = logging.getLogger(__name__)
@@ -34,13 +44,29 @@ class TrailblazerAPI:
         self.service_account = config["trailblazer"]["service_account"]
         self.service_account_auth_file = config["trailblazer"]["service_account_auth_file"]
         self.host = config["trailblazer"]["host"]
+        self._auth_header: Optional[dict] = None
+        self._session: Optional[Session] = None
 
     @property
     def auth_header(self) -> dict:
-        signer = RSASigner.from_service_account_file(self.service_account_auth_file)
-        payload = {"email": self.service_account}
-        jwt_token = jwt.encode(signer=signer, payload=payload).decode("ascii")
-        return {"Authorization": f"Bearer {jwt_token}"}
+        if self._auth_header is None:
+            signer = RSASigner.from_service_account_file(self.service_account_auth_file)
+            payload = {"email": self.service_account}
+            jwt_token = jwt.encode(signer=signer, payload=payload).decode("ascii")
+            self._auth_header = {"Authorization": f"Bearer {jwt_token}"}
+        return self._auth_header
+
+    @property
+    def session(self) -> Session:
+        """Session that keeps the connections to Trailblazer alive and retries failed requests."""
+        if self._session is None:
+            self._session = get_session(
+                pool_size=TRAILBLAZER_POOL_SIZE,
+                retries=TRAILBLAZER_RETRIES,
+                backoff_factor=TRAILBLAZER_RETRY_BACKOFF_FACTOR,
+                retry_status_codes=TRAILBLAZER_RETRY_STATUS_CODES,
+            )
+        return self._session
 
     def query_trailblazer(
         self, command: str, request_body: dict, method: str = APIMethods.POST
@@ -49,8 +75,13 @@ class TrailblazerAPI:
         LOG.debug(f"REQUEST HEADER {self.auth_header}")
         LOG.debug(f"{method}: URL={url}; JSON={request_body}")
 
-        response = APIRequest.api_request_from_content(
-            api_method=method, url=url, headers=self.auth_header, json=request_body
+        response = APIRequest.api_request_from_session(
+            session=self.session,
+            api_method=method,
+            url=url,
+            headers=self.auth_header,
+            json=request_body,
+            timeout=TRAILBLAZER_TIMEOUT,
         )
 
         LOG.debug(f"RESPONSE STATUS CODE {response.status_code}")
@@ -113,6 +144,25 @@ class TrailblazerAPI:
         if latest_analysis:
             return latest_analysis.status
 
+    def get_latest_analyses_statuses(self, case_ids: List[str]) -> Dict[str, Optional[str]]:
+        """Return the status of the latest analysis of each case, querying Trailblazer for the
+        cases concurrently over the pooled connections."""
+        with ThreadPoolExecutor(max_workers=TRAILBLAZER_POOL_SIZE) as executor:
+            statuses: List[Optional[str]] = list(
+                executor.map(
+                    lambda case_id: self.get_latest_analysis_status(case_id=case_id), case_ids
+                )
+            )
+        return dict(zip(case_ids, statuses))
+
+    def get_cases_with_latest_analysis_completed(self, case_ids: List[str]) -> Set[str]:
+        """Return the cases whose latest analysis is completed."""
+        return {
+            case_id
+            for case_id, status in self.get_latest_analyses_statuses(case_ids=case_ids).items()
+            if status == AnalysisStatus.COMPLETED
+        }
+
     def has_latest_analysis_started(self, case_id: str) -> bool:
         return self.get_latest_analysis_status(case_id=case_id) in self.__STARTED_STATUSES
 
@@ -3,10 +3,12 @@
 """
 
 import logging
+from typing import List
 
 from cg.constants.constants import FileFormat
+from cg.constants.process import MAX_CONCURRENT_PROCESSES
 from cg.io.controller import WriteStream
-from cg.utils.commands import Process
+from cg.utils.commands import Process, ProcessPool, ProcessResult
 
 LOG = logging.getLogger(__name__)
 
@@ -23,9 +25,10 @@ class VogueAPI:
         self.vogue_binary = config["vogue"]["binary_path"]
         self.process = Process(binary=self.vogue_binary, config=self.vogue_config)
 
-    def load_genotype_data(self, genotype_dict: dict) -> None:
-        """Load genotype data from a dict"""
-        load_call = [
+    @staticmethod
+    def get_load_genotype_call(genotype_dict: dict) -> List[str]:
+        """Return the parameters to load genotype data from a dict"""
+        return [
             "load",
             "genotype",
             "-s",
@@ -33,12 +36,39 @@ class VogueAPI:
                 content=genotype_dict, file_format=FileFormat.JSON
             ),
         ]
+
+    def load_genotype_data(self, genotype_dict: dict) -> None:
+        """Load genotype data from a dict"""
+        load_call = self.get_load_genotype_call(genotype_dict=genotype_dict)
         self.process.run_command(parameters=load_call)
 
         # Execute command and print its stdout+stderr as it executes
         for line in self.process.stderr_lines():
             LOG.info("vogue output: %s", line)
 
+    def load_genotype_data_bulk(
+        self, genotype_dicts: List[dict], max_workers: int = MAX_CONCURRENT_PROCESSES
+    ) -> List[str]:
+        """Load genotype data from many dicts, with concurrent vogue commands, and return the ids
+        of the documents that were loaded"""
+        results: List[ProcessResult] = ProcessPool(
+            process=self.process, max_workers=max_workers
+        ).run_commands(
+            parameters=[
+                self.get_load_genotype_call(genotype_dict=genotype_dict)
+                for genotype_dict in genotype_dicts
+            ]
+        )
+        loaded_ids: List[str] = []
+        for genotype_dict, result in zip(genotype_dicts, results):
+            for line in result.stderr.splitlines():
+                LOG.info("vogue output: %s", line)
+            if result.success:
+                loaded_ids.append(genotype_dict["_id"])
+            else:
+                LOG.error(f"Could not load genotype data of {genotype_dict['_id']}")
+        return loaded_ids
+
     def load_apptags(self, apptag_list: list) -> None:
         """Add observations from a VCF."""
         load_call = [
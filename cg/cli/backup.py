@@ -35,7 +35,11 @@ def fetch_flow_cell(context: CGConfig, dry_run: bool, flow_cell_id: Optional[str
     """Fetch the first flow cell in the requested queue from backup"""
 
     pdc_api = PdcAPI(binary_path=context.pdc.binary_path, dry_run=dry_run)
-    encryption_api = EncryptionAPI(binary_path=context.encryption.binary_path, dry_run=dry_run)
+    encryption_api = EncryptionAPI(
+        binary_path=context.encryption.binary_path,
+        dry_run=dry_run,
+        checksum_cache=context.checksum_cache_api,
+    )
     tar_api = TarAPI(binary_path=context.tar.binary_path, dry_run=dry_run)
     context.meta_apis["backup_api"] = BackupAPI(
         encryption_api=encryption_api,
@@ -106,6 +110,7 @@ def archive_spring_file(config: CGConfig, spring_file_path: str, dry_run: bool):
     encryption_api: SpringEncryptionAPI = SpringEncryptionAPI(
         binary_path=config.encryption.binary_path,
         dry_run=dry_run,
+        checksum_cache=config.checksum_cache_api,
     )
     spring_backup_api: SpringBackupAPI = SpringBackupAPI(
         encryption_api=encryption_api,
@@ -172,6 +177,7 @@ def retrieve_spring_file(config: CGConfig, spring_file_path: str, dry_run: bool)
     encryption_api: SpringEncryptionAPI = SpringEncryptionAPI(
         binary_path=config.encryption.binary_path,
         dry_run=dry_run,
+        checksum_cache=config.checksum_cache_api,
     )
     LOG.debug("Start spring retrieval if not dry run mode=%s", dry_run)
     spring_backup_api: SpringBackupAPI = SpringBackupAPI(
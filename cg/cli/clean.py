@@ -1,8 +1,9 @@
 """cg module for cleaning databases and files."""
 import logging
 from datetime import datetime, timedelta
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from cg.utils.dispatcher import Dispatcher
 
 import click
@@ -38,6 +39,7 @@ from cg.utils.date import get_timedelta_from_date, get_date_days_ago
 from cg.exc import FlowCellError, HousekeeperBundleVersionMissingError
 from cg.meta.clean.api import CleanAPI
 from cg.meta.clean.demultiplexed_flow_cells import DemultiplexedRunsFlowCell
+from cg.meta.clean.housekeeper_flow_cell_index import HousekeeperFlowCellIndex
 from cg.meta.clean.flow_cell_run_directories import RunDirFlowCell
 from cg.models.cg_config import CGConfig
 from cg.store import Store
@@ -277,16 +279,27 @@ def remove_invalid_flow_cell_directories(context: CGConfig, failed_only: bool, d
     spring_files_in_housekeeper: Query = housekeeper_api.files(
         tags=[SequencingFileTag.SPRING]
     ).filter(File.path.like(search))
-    for flow_cell_dir in demux_api.out_dir.iterdir():
-        flow_cell: DemultiplexedRunsFlowCell = DemultiplexedRunsFlowCell(
+    flow_cells: List[DemultiplexedRunsFlowCell] = [
+        DemultiplexedRunsFlowCell(
             flow_cell_path=flow_cell_dir,
             status_db=status_db,
             housekeeper_api=housekeeper_api,
             trailblazer_api=trailblazer_api,
             sample_sheets_dir=sample_sheets_dir,
-            fastq_files=fastq_files_in_housekeeper,
-            spring_files=spring_files_in_housekeeper,
         )
+        for flow_cell_dir in demux_api.out_dir.iterdir()
+    ]
+    housekeeper_index = HousekeeperFlowCellIndex(
+        housekeeper_api=housekeeper_api, flow_cell_ids=[flow_cell.id for flow_cell in flow_cells]
+    )
+    housekeeper_index.add_flow_cell_files(
+        tag=SequencingFileTag.FASTQ, files=fastq_files_in_housekeeper
+    )
+    housekeeper_index.add_flow_cell_files(
+        tag=SequencingFileTag.SPRING, files=spring_files_in_housekeeper
+    )
+    for flow_cell in flow_cells:
+        flow_cell.housekeeper_index = housekeeper_index
         if not flow_cell.is_demultiplexing_ongoing_or_started_and_not_completed:
             LOG.info(f"Found flow cell ready to be checked: {flow_cell.path}!")
             checked_flow_cells.append(flow_cell)
@@ -345,16 +358,25 @@ def fix_flow_cell_status(context: CGConfig, dry_run: bool):
         f"Number of flow cells with status {FlowCellStatus.ON_DISK.value} or {FlowCellStatus.REMOVED} in Statusdb: {len(flow_cells_in_statusdb)}"
     )
 
+    flow_cell_bundle_names: Dict[str, List[str]] = {
+        flow_cell.name: [sample.internal_id for sample in flow_cell.samples]
+        for flow_cell in flow_cells_in_statusdb
+    }
+    housekeeper_index = HousekeeperFlowCellIndex(
+        housekeeper_api=housekeeper_api, flow_cell_ids=flow_cell_bundle_names
+    )
+    housekeeper_index.add_bundles(bundle_names=chain.from_iterable(flow_cell_bundle_names.values()))
+
     for flow_cell in flow_cells_in_statusdb:
-        sample_bundle_names: List[str] = [sample.internal_id for sample in flow_cell.samples]
+        sample_bundle_names: List[str] = flow_cell_bundle_names[flow_cell.name]
         are_sequencing_files_in_hk: bool = False
         are_sequencing_files_on_disk: bool = False
         try:
-            are_sequencing_files_in_hk: bool = housekeeper_api.is_fastq_or_spring_in_all_bundles(
+            are_sequencing_files_in_hk: bool = housekeeper_index.is_fastq_or_spring_in_all_bundles(
                 bundle_names=sample_bundle_names
             )
             are_sequencing_files_on_disk: bool = (
-                housekeeper_api.is_fastq_or_spring_on_disk_in_all_bundles(
+                housekeeper_index.is_fastq_or_spring_on_disk_in_all_bundles(
                     bundle_names=sample_bundle_names
                 )
             )
@@ -11,6 +11,7 @@ from cg.cli.compress.fastq import (
     decompress_ticket,
     fastq_cmd,
     fix_spring,
+    schedule_fastq_cmd,
 )
 from cg.meta.backup.backup import SpringBackupAPI
 from cg.meta.backup.pdc import PdcAPI
@@ -36,6 +37,7 @@ def compress(context: CGConfig):
 
 
 compress.add_command(fastq_cmd)
+compress.add_command(schedule_fastq_cmd)
 
 
 @compress.group()
@@ -57,6 +59,7 @@ def decompress(context: CGConfig):
     pdc_api: PdcAPI = PdcAPI(binary_path=context.pdc.binary_path)
     spring_encryption_api: SpringEncryptionAPI = SpringEncryptionAPI(
         binary_path=context.encryption.binary_path,
+        checksum_cache=context.checksum_cache_api,
     )
     spring_backup_api: SpringBackupAPI = SpringBackupAPI(
         encryption_api=spring_encryption_api,
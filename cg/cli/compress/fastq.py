@@ -1,6 +1,7 @@
 """CLI function to compress FASTQ files into SPRING archives."""
 
 import logging
+from pathlib import Path
 from typing import Iterable, List, Optional
 
 import click
@@ -12,8 +13,11 @@ from cg.cli.compress.helpers import (
     is_case_ignored,
     get_cases_to_process,
     compress_sample_fastqs_in_cases,
+    compress_sample_fastqs_by_priority,
 )
+from cg.constants.compression import MAX_QUEUED_COMPRESSION_JOBS
 from cg.constants.constants import DRY_RUN
+from cg.constants.process import MAX_CONCURRENT_PROCESSES
 from cg.exc import CaseNotFoundError
 from cg.meta.compress import CompressAPI
 from cg.models.cg_config import CGConfig
@@ -67,6 +71,71 @@ def fastq_cmd(
     )
 
 
+@click.command("schedule-fastq")
+@click.option(
+    "-b",
+    "--days-back",
+    default=60,
+    show_default=True,
+    help="Threshold for how long ago family was created",
+)
+@click.option("--hours", type=int, help="Hours to allocate for slurm job")
+@click.option("-m", "--mem", type=int, help="Memory for slurm job")
+@click.option("-t", "--ntasks", type=int, help="Number of tasks for slurm job")
+@click.option(
+    "-q",
+    "--max-queued-jobs",
+    default=MAX_QUEUED_COMPRESSION_JOBS,
+    type=int,
+    show_default=True,
+    help="Maximum number of compression jobs in the SLURM queue",
+)
+@click.option(
+    "--checkpoint",
+    type=click.Path(dir_okay=False),
+    help="File to save progress to, and to resume an interrupted run from",
+)
+@click.option(
+    "--threads",
+    default=MAX_CONCURRENT_PROCESSES,
+    type=int,
+    show_default=True,
+    help="Number of samples to check for FASTQ files concurrently",
+)
+@DRY_RUN
+@click.pass_obj
+def schedule_fastq_cmd(
+    context: CGConfig,
+    days_back: int,
+    hours: Optional[int],
+    dry_run: bool,
+    mem: Optional[int],
+    ntasks: Optional[int],
+    max_queued_jobs: int,
+    checkpoint: Optional[str],
+    threads: int,
+):
+    """Compress old FASTQ files into SPRING, most reclaimable bytes first."""
+    LOG.info("Running scheduled compress FASTQ")
+    compress_api: CompressAPI = context.meta_apis["compress_api"]
+    store: Store = context.status_db
+    cases: List[Family] = get_cases_to_process(days_back=days_back, store=store)
+    if not cases:
+        LOG.info("No cases to compress")
+        return None
+    compress_sample_fastqs_by_priority(
+        compress_api=compress_api,
+        cases=cases,
+        dry_run=dry_run,
+        max_queued_jobs=max_queued_jobs,
+        checkpoint_path=Path(checkpoint) if checkpoint else None,
+        threads=threads,
+        hours=hours,
+        mem=mem,
+        ntasks=ntasks,
+    )
+
+
 @click.command("fastq")
 @click.option("-c", "--case-id")
 @click.option(
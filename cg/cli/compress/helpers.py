@@ -4,19 +4,21 @@ import logging
 import os
 from math import ceil
 from pathlib import Path
-from typing import Iterator, Optional, List
+from typing import Dict, Iterator, Optional, List
 
 from housekeeper.store.models import Version, Bundle
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants.compression import CASES_TO_IGNORE, MAX_READS_PER_GB, CRUNCHY_MIN_GB_PER_PROCESS
+from cg.constants.process import MAX_CONCURRENT_PROCESSES
 from cg.constants.slurm import Slurm
 from cg.utils.date import get_date_days_ago
 from cg.exc import CaseNotFoundError
 from cg.meta.compress import CompressAPI
 from cg.meta.compress.files import get_spring_paths
+from cg.meta.compress.scheduler import FastqCompressionCandidate, FastqCompressionScheduler
 from cg.store import Store
-from cg.store.models import Family
+from cg.store.models import Family, Sample
 
 LOG = logging.getLogger(__name__)
 
@@ -180,6 +182,50 @@ def compress_sample_fastqs_in_cases(
     )
 
 
+def compress_sample_fastqs_by_priority(
+    compress_api: CompressAPI,
+    cases: List[Family],
+    dry_run: bool,
+    max_queued_jobs: int,
+    checkpoint_path: Optional[Path] = None,
+    threads: int = MAX_CONCURRENT_PROCESSES,
+    hours: int = None,
+    mem: int = None,
+    ntasks: int = None,
+) -> List[str]:
+    """Compress sample FASTQs for samples in cases, most reclaimable bytes first, without
+    exceeding the maximum number of queued compression jobs."""
+    samples: Dict[str, Sample] = {}
+    for case in cases:
+        if is_case_ignored(case_id=case.internal_id):
+            continue
+        for case_link in case.links:
+            samples[case_link.sample.internal_id] = case_link.sample
+    update_compress_api(compress_api=compress_api, dry_run=dry_run)
+
+    def compress_sample(candidate: FastqCompressionCandidate) -> bool:
+        sample_process_mem: Optional[int] = set_memory_according_to_reads(
+            sample_process_mem=mem, sample_id=candidate.sample_id, sample_reads=candidate.reads
+        )
+        update_compress_api(
+            compress_api=compress_api,
+            dry_run=dry_run,
+            hours=hours,
+            mem=sample_process_mem,
+            ntasks=ntasks,
+        )
+        return compress_api.compress_fastq(sample_id=candidate.sample_id)
+
+    scheduler = FastqCompressionScheduler(
+        compress_api=compress_api, checkpoint_path=checkpoint_path, max_workers=threads
+    )
+    return scheduler.compress(
+        samples=list(samples.values()),
+        max_queued_jobs=max_queued_jobs,
+        compress_sample=compress_sample,
+    )
+
+
 def correct_spring_paths(
     hk_api: HousekeeperAPI, bundle_name: str = None, dry_run: bool = False
 ) -> None:
@@ -25,8 +25,9 @@ LOG = logging.getLogger(__name__)
 @click.command(name="add")
 @OPTION_BCL_CONVERTER
 @click.argument("flow-cell-name")
+@click.option("--bulk", is_flag=True, help="Create samples with bulk insert statements")
 @click.pass_obj
-def add_flow_cell_cmd(context: CGConfig, flow_cell_name: str, bcl_converter: str):
+def add_flow_cell_cmd(context: CGConfig, flow_cell_name: str, bcl_converter: str, bulk: bool):
     """Add a flow cell to the cgstats database."""
     stats_api: StatsAPI = context.cg_stats_api
     demultiplex_api: DemultiplexingAPI = context.demultiplex_api
@@ -47,7 +48,7 @@ def add_flow_cell_cmd(context: CGConfig, flow_cell_name: str, bcl_converter: str
     demux_results: DemuxResults = DemuxResults(
         demux_dir=demux_results_path, flow_cell=flow_cell, bcl_converter=bcl_converter
     )
-    create_novaseq_flowcell(manager=stats_api, demux_results=demux_results)
+    create_novaseq_flowcell(manager=stats_api, demux_results=demux_results, bulk=bulk)
 
 
 @click.command(name="select")
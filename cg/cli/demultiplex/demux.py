@@ -1,5 +1,6 @@
 import logging
 from pathlib import Path
+from typing import List
 
 import click
 
@@ -8,6 +9,7 @@ from cg.apps.tb import TrailblazerAPI
 from cg.constants.demultiplexing import OPTION_BCL_CONVERTER
 from cg.exc import FlowCellError
 from cg.meta.demultiplex.delete_demultiplex_api import DeleteDemuxAPI
+from cg.meta.demultiplex.flow_cell_discovery import get_flow_cells_ready_for_demultiplexing
 from cg.models.cg_config import CGConfig
 from cg.models.demultiplex.flow_cell import FlowCell
 
@@ -34,29 +36,23 @@ def demultiplex_all(
     demultiplex_api.set_dry_run(dry_run=dry_run)
     tb_api: TrailblazerAPI = context.trailblazer_api
     LOG.info(f"Search for flow cells ready to demultiplex in {flow_cells_directory}")
-    for sub_dir in flow_cells_directory.iterdir():
-        if not sub_dir.is_dir():
-            continue
-        LOG.info(f"Found directory {sub_dir}")
-        try:
-            flow_cell = FlowCell(flow_cell_path=sub_dir, bcl_converter=bcl_converter)
-        except FlowCellError:
-            continue
-
-        if not demultiplex_api.is_demultiplexing_possible(flow_cell=flow_cell) and not dry_run:
-            continue
-
-        if not flow_cell.validate_sample_sheet():
-            LOG.warning(
-                f"Malformed sample sheet. Run cg demultiplex samplesheet validate {flow_cell.sample_sheet_path}",
-            )
-            continue
-
+    flow_cells: List[FlowCell] = get_flow_cells_ready_for_demultiplexing(
+        flow_cells_directory=flow_cells_directory,
+        bcl_converter=bcl_converter,
+        demultiplex_api=demultiplex_api,
+        dry_run=dry_run,
+        validation_cache_path=(
+            Path(context.demultiplex.sample_sheet_validation_cache)
+            if context.demultiplex.sample_sheet_validation_cache
+            else None
+        ),
+    )
+    for flow_cell in flow_cells:
         delete_demux_api: DeleteDemuxAPI = DeleteDemuxAPI(
             config=context,
             demultiplex_base=demultiplex_api.out_dir,
             dry_run=dry_run,
-            run_path=(flow_cells_directory / sub_dir),
+            run_path=flow_cell.path,
         )
 
         delete_demux_api.delete_flow_cell(
@@ -32,6 +32,6 @@ def create_report_cmd(context: CGConfig, flow_cell_name: str):
         LOG.warning(f"Could not find conversion stats file {conversion_stats}")
         raise click.Abort
     report = create_demux_report(
-        conversion_stats=ConversionStats(demux_results.conversion_stats_path)
+        conversion_stats=ConversionStats(demux_results.conversion_stats_path, fast=True)
     )
     click.echo("\n".join(report))
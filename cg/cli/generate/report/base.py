@@ -2,9 +2,10 @@
 
 import logging
 import sys
+from contextlib import nullcontext
 from datetime import datetime
 from pathlib import Path
-from typing import TextIO, Optional
+from typing import List, TextIO, Optional
 
 import click
 
@@ -105,36 +106,59 @@ def available_delivery_reports(
             )
         )
     else:
-        for case in cases_without_delivery_report:
-            case_id: str = case.internal_id
-            LOG.info("Generating delivery report for case: %s", case_id)
-            try:
-                context.invoke(
-                    delivery_report,
-                    case_id=case_id,
-                    force_report=force_report,
-                    dry_run=dry_run,
-                )
-            except FileNotFoundError as error:
-                LOG.error(
-                    "The delivery report generation is missing a file for case: %s, %s",
-                    case_id,
-                    error,
-                )
-                exit_code = EXIT_FAIL
-            except CgError as error:
-                LOG.error(
-                    "The delivery report generation failed for case: %s, %s",
-                    case_id,
-                    error,
-                )
-                exit_code = EXIT_FAIL
-            except Exception as error:
-                LOG.error(
-                    "Unspecified error when generating the delivery report for case: %s, %s",
-                    case_id,
-                    error,
-                )
-                exit_code = EXIT_FAIL
+        # Report data is only shared when all cases are reported by the same pipeline API
+        report_data = (
+            report_api.prefetched_report_data(cases=cases_without_delivery_report)
+            if pipeline
+            else nullcontext()
+        )
+        with report_data:
+            exit_code = generate_delivery_reports(
+                context=context,
+                cases=cases_without_delivery_report,
+                force_report=force_report,
+                dry_run=dry_run,
+            )
 
     sys.exit(exit_code)
+
+
+def generate_delivery_reports(
+    context: click.Context, cases: List[Family], force_report: bool, dry_run: bool
+) -> int:
+    """Generates the delivery reports of the cases and returns the exit code."""
+
+    exit_code = EXIT_SUCCESS
+    for case in cases:
+        case_id: str = case.internal_id
+        LOG.info("Generating delivery report for case: %s", case_id)
+        try:
+            context.invoke(
+                delivery_report,
+                case_id=case_id,
+                force_report=force_report,
+                dry_run=dry_run,
+            )
+        except FileNotFoundError as error:
+            LOG.error(
+                "The delivery report generation is missing a file for case: %s, %s",
+                case_id,
+                error,
+            )
+            exit_code = EXIT_FAIL
+        except CgError as error:
+            LOG.error(
+                "The delivery report generation failed for case: %s, %s",
+                case_id,
+                error,
+            )
+            exit_code = EXIT_FAIL
+        except Exception as error:
+            LOG.error(
+                "Unspecified error when generating the delivery report for case: %s, %s",
+                case_id,
+                error,
+            )
+            exit_code = EXIT_FAIL
+
+    return exit_code
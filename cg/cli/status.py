@@ -3,7 +3,7 @@ from typing import List
 import click
 from cg.constants import CASE_ACTIONS, Pipeline
 from cg.models.cg_config import CGConfig
-from cg.store import Store
+from cg.store.api.core import CoreHandler
 from cg.store.models import Family, Sample
 from ansi.colour import fg
 from ansi.colour.fx import reset
@@ -60,7 +60,9 @@ def status():
 @click.pass_obj
 def analysis(context: CGConfig):
     """Which families will be analyzed?"""
-    records: List[Family] = context.status_db.cases_to_analyze(pipeline=Pipeline.MIP_DNA)
+    records: List[Family] = context.status_db.read_only_store.cases_to_analyze(
+        pipeline=Pipeline.MIP_DNA
+    )
     for case_obj in records:
         click.echo(case_obj)
 
@@ -175,7 +177,7 @@ def cases(
     exclude_invoiced,
 ):
     """progress of each case"""
-    status_db: Store = context.status_db
+    status_db: CoreHandler = context.status_db.read_only_store
     records: List[Family] = status_db.cases(
         days=days,
         internal_id=internal_id,
@@ -355,7 +357,7 @@ def cases(
 @click.pass_obj
 def samples(context: CGConfig, skip: int):
     """View status of samples."""
-    status_db: Store = context.status_db
+    status_db: CoreHandler = context.status_db.read_only_store
     records: List[Sample] = status_db.get_samples()[skip : skip + 30]
     for record in records:
         message = f"{record.internal_id} ({record.customer.internal_id})"
@@ -380,7 +382,7 @@ def samples(context: CGConfig, skip: int):
 def families(context: CGConfig, skip: int):
     """View status of families."""
     click.echo("red: prio > 1, blue: prio = 1, green: completed, yellow: action")
-    status_db: Store = context.status_db
+    status_db: CoreHandler = context.status_db.read_only_store
     records: List[Family] = status_db._get_query(table=Family).offset(skip).limit(30)
     for case_obj in records:
         color = "red" if case_obj.priority_int > 1 else "blue"
@@ -24,7 +24,10 @@ def transfer_group(context: CGConfig):
     hk_api: HousekeeperAPI = context.housekeeper_api
     stats_api: StatsAPI = context.cg_stats_api
     context.meta_apis["transfer_flow_cell_api"] = TransferFlowCell(
-        db=status_db, stats_api=stats_api, hk_api=hk_api
+        db=status_db,
+        stats_api=stats_api,
+        hk_api=hk_api,
+        fastq_header_index=context.fastq_header_index_api,
     )
     context.meta_apis["transfer_lims_api"] = TransferLims(status=status_db, lims=lims_api)
 
@@ -63,22 +66,32 @@ def flow_cell(context: CGConfig, flow_cell_dir: str, flow_cell_id: str, store: b
     "-i", "--include", type=click.Choice(["unset", "not-invoiced", "all"]), default="unset"
 )
 @click.option("--sample-id", help="Lims Submitted Sample id. use together with status.")
+@click.option(
+    "--batch", is_flag=True, help="Fetch LIMS data in batches and commit all updates at once"
+)
 @click.pass_obj
-def lims(context: CGConfig, status: str, include: str, sample_id: str):
+def lims(context: CGConfig, status: str, include: str, sample_id: str, batch: bool):
     """Check if samples have been updated in LIMS."""
     transfer_api: TransferLims = context.meta_apis["transfer_lims_api"]
-    transfer_api.transfer_samples(
-        status_type=SampleState[status.upper()], include=include, sample_id=sample_id
+    transfer_function = (
+        transfer_api.transfer_samples_in_batch if batch else transfer_api.transfer_samples
     )
+    transfer_function(status_type=SampleState[status.upper()], include=include, sample_id=sample_id)
 
 
 @transfer_group.command()
 @click.option("-s", "--status", type=click.Choice(["received", "delivered"]), default="delivered")
+@click.option(
+    "--batch", is_flag=True, help="Fetch LIMS data in batches and commit all updates at once"
+)
 @click.pass_obj
-def pools(context: CGConfig, status: str):
+def pools(context: CGConfig, status: str, batch: bool):
     """
     Update pools with received_at or delivered_at dates from LIMS. Defaults to delivered if no
     option is provided.
     """
     transfer_api: TransferLims = context.meta_apis["transfer_lims_api"]
+    if batch:
+        transfer_api.transfer_pools_in_batch(status_type=PoolState[status.upper()])
+        return
     transfer_api.transfer_pools(status_type=PoolState[status.upper()])
@@ -10,7 +10,12 @@ from sqlalchemy.orm import Query
 from cgmodels.cg.constants import Pipeline
 from pydantic import ValidationError
 
-from cg.cli.upload.observations.utils import get_observations_case_to_upload, get_observations_api
+from cg.cli.upload.observations.utils import (
+    get_observations_case_to_upload,
+    get_observations_api,
+    upload_observations_batch,
+)
+from cg.constants.observations import LOQUSDB_MAX_CONCURRENT_UPLOADS
 from cg.exc import LoqusdbError, CaseNotFoundError
 from cg.meta.observations.balsamic_observations_api import BalsamicObservationsAPI
 from cg.meta.observations.mip_dna_observations_api import MipDNAObservationsAPI
@@ -23,6 +28,7 @@ from cg.cli.workflow.commands import (
     OPTION_LOQUSDB_SUPPORTED_PIPELINES,
 )
 from cg.models.cg_config import CGConfig
+from cg.models.observations.upload_report import ObservationsUploadReport
 
 
 LOG = logging.getLogger(__name__)
@@ -52,9 +58,27 @@ def observations(context: CGConfig, case_id: Optional[str], dry_run: bool):
 
 @click.command("available-observations")
 @OPTION_LOQUSDB_SUPPORTED_PIPELINES
+@click.option(
+    "--batch",
+    is_flag=True,
+    help="Upload the cases together, running the Loqusdb commands of several cases concurrently",
+)
+@click.option(
+    "--threads",
+    default=LOQUSDB_MAX_CONCURRENT_UPLOADS,
+    type=int,
+    show_default=True,
+    help="Number of cases to upload concurrently to each Loqusdb instance in batch mode",
+)
 @OPTION_DRY
 @click.pass_context
-def available_observations(context: click.Context, pipeline: Optional[Pipeline], dry_run: bool):
+def available_observations(
+    context: click.Context,
+    pipeline: Optional[Pipeline],
+    batch: bool,
+    threads: int,
+    dry_run: bool,
+):
     """Uploads the available observations to Loqusdb."""
 
     click.echo(click.style("----------------- AVAILABLE OBSERVATIONS -----------------"))
@@ -67,6 +91,14 @@ def available_observations(context: click.Context, pipeline: Optional[Pipeline],
         )
         return
 
+    if batch and not dry_run:
+        report: ObservationsUploadReport = upload_observations_batch(
+            context=context.obj, cases=cases_to_upload.all(), max_workers=threads
+        )
+        for line in report.get_summary():
+            LOG.info(line)
+        return
+
     for case in cases_to_upload:
         try:
             LOG.info(f"Will upload observations for {case.internal_id}")
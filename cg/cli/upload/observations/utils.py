@@ -1,7 +1,7 @@
 """Helper functions for observations related actions."""
 
 import logging
-from typing import Union
+from typing import Dict, List, Tuple, Type, Union
 
 from sqlalchemy.orm import Query
 from cgmodels.cg.constants import Pipeline
@@ -15,6 +15,7 @@ from cg.store import Store
 from cg.store.models import Family
 
 from cg.models.cg_config import CGConfig
+from cg.models.observations.upload_report import ObservationsUploadReport
 
 LOG = logging.getLogger(__name__)
 
@@ -55,11 +56,47 @@ def get_observations_api(
     context: CGConfig, case: Family
 ) -> Union[MipDNAObservationsAPI, BalsamicObservationsAPI]:
     """Return an observations API given a specific case object."""
-    observations_apis = {
-        Pipeline.MIP_DNA: MipDNAObservationsAPI(context, get_sequencing_method(case)),
-        Pipeline.BALSAMIC: BalsamicObservationsAPI(context, get_sequencing_method(case)),
+    observations_apis: Dict[
+        Pipeline, Type[Union[MipDNAObservationsAPI, BalsamicObservationsAPI]]
+    ] = {
+        Pipeline.MIP_DNA: MipDNAObservationsAPI,
+        Pipeline.BALSAMIC: BalsamicObservationsAPI,
     }
-    return observations_apis[case.data_analysis]
+    return observations_apis[case.data_analysis](context, get_sequencing_method(case))
+
+
+def upload_observations_batch(
+    context: CGConfig, cases: List[Family], max_workers: int
+) -> ObservationsUploadReport:
+    """Upload the observations of many cases, with concurrent Loqusdb commands, using one
+    observations API for each pipeline and sequencing method."""
+    report = ObservationsUploadReport()
+    observations_apis: Dict[
+        Tuple[Pipeline, SequencingMethod], Union[MipDNAObservationsAPI, BalsamicObservationsAPI]
+    ] = {}
+    api_cases: Dict[Tuple[Pipeline, SequencingMethod], List[Family]] = {}
+    for case in cases:
+        try:
+            if not case.customer.loqus_upload:
+                LOG.error(
+                    f"Customer {case.customer.internal_id} is not whitelisted for upload to Loqusdb"
+                )
+                raise LoqusdbUploadCaseError
+            api_key: Tuple[Pipeline, SequencingMethod] = (
+                case.data_analysis,
+                get_sequencing_method(case),
+            )
+            if api_key not in observations_apis:
+                observations_apis[api_key] = get_observations_api(context=context, case=case)
+        except LoqusdbUploadCaseError:
+            LOG.error(f"Cancelling upload of observations for {case.internal_id}")
+            report.failed_case_ids.append(case.internal_id)
+            continue
+        api_cases.setdefault(api_key, []).append(case)
+    for api_key, observations_api in observations_apis.items():
+        LOG.info(f"Uploading observations for {len(api_cases[api_key])} {api_key} cases")
+        report.add(observations_api.upload_batch(cases=api_cases[api_key], max_workers=max_workers))
+    return report
 
 
 def get_sequencing_method(case: Family) -> SequencingMethod:
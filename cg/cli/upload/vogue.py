@@ -48,8 +48,13 @@ def vogue(context: CGConfig):
 @click.option(
     "-d", "--days", type=int, required="True", help="load X days old sampels from genotype to vogue"
 )
+@click.option(
+    "--state-file",
+    type=click.Path(dir_okay=False),
+    help="File keeping track of loaded samples, to only load new or changed data",
+)
 @click.pass_obj
-def genotype(context: CGConfig, days: int):
+def genotype(context: CGConfig, days: int, state_file: Optional[str]):
     """Loading samples from the genotype database to the trending database"""
 
     upload_vogue_api = UploadVogueAPI(
@@ -57,6 +62,9 @@ def genotype(context: CGConfig, days: int):
     )
     click.echo(click.style("----------------- GENOTYPE -----------------------"))
 
+    if state_file:
+        upload_vogue_api.load_genotype_incremental(days=days, state_path=Path(state_file))
+        return
     upload_vogue_api.load_genotype(days=days)
 
 
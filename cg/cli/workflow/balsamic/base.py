@@ -1,7 +1,7 @@
 """CLI support to create config and/or start BALSAMIC."""
 
 import logging
-from typing import List
+from typing import Dict, List
 
 import click
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -15,12 +15,13 @@ from cg.cli.workflow.balsamic.options import (
     OPTION_OBSERVATIONS,
     OPTION_FORCE_NORMAL,
 )
-from cg.cli.workflow.commands import link, resolve_compression, ARGUMENT_CASE_ID
+from cg.cli.workflow.commands import OPTION_WORKERS, link, resolve_compression, ARGUMENT_CASE_ID
 from cg.constants import EXIT_FAIL, EXIT_SUCCESS
 from cg.constants.constants import DRY_RUN
 from cg.exc import CgError, DecompressionNeededError
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.balsamic import BalsamicAnalysisAPI
+from cg.meta.workflow.case_scheduler import start_cases
 from cg.models.cg_config import CGConfig
 from cg.store import Store
 from pydantic import ValidationError
@@ -229,23 +230,23 @@ def start(
 
 @balsamic.command("start-available")
 @DRY_RUN
+@OPTION_WORKERS
 @click.pass_context
-def start_available(context: click.Context, dry_run: bool = False):
+def start_available(context: click.Context, dry_run: bool = False, workers: int = 1):
     """Start full workflow for all cases ready for analysis"""
 
     analysis_api: AnalysisAPI = context.obj.meta_apis["analysis_api"]
 
-    exit_code: int = EXIT_SUCCESS
-    for case_obj in analysis_api.get_cases_to_analyze():
-        try:
-            context.invoke(start, case_id=case_obj.internal_id, dry_run=dry_run, run_analysis=True)
-        except CgError as error:
-            LOG.error(error)
-            exit_code = EXIT_FAIL
-        except Exception as error:
-            LOG.error("Unspecified error occurred: %s", error)
-            exit_code = EXIT_FAIL
-    if exit_code:
+    case_ids: List[str] = [case.internal_id for case in analysis_api.get_cases_to_analyze()]
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids,
+        start_case=lambda case_id: context.invoke(
+            start, case_id=case_id, dry_run=dry_run, run_analysis=True
+        ),
+        pipeline=analysis_api.pipeline,
+        workers=workers,
+    )
+    if failed_cases:
         raise click.Abort
 
 
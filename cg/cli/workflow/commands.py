@@ -32,6 +32,13 @@ OPTION_DRY = click.option(
     "-d", "--dry-run", help="Simulate process without executing", is_flag=True
 )
 OPTION_YES = click.option("-y", "--yes", is_flag=True, help="Skip confirmation")
+OPTION_WORKERS = click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of cases to start concurrently, limited per pipeline",
+)
 ARGUMENT_BEFORE_STR = click.argument("before_str", type=str)
 ARGUMENT_CASE_ID = click.argument("case_id", required=True)
 OPTION_ANALYSIS_PARAMETERS_CONFIG = click.option(
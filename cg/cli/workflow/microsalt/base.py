@@ -3,14 +3,14 @@
 import datetime as dt
 import logging
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 import click
-from cg.cli.workflow.commands import resolve_compression, store, store_available
+from cg.cli.workflow.commands import OPTION_WORKERS, resolve_compression, store, store_available
 from cg.constants import EXIT_FAIL, EXIT_SUCCESS, Pipeline
 from cg.constants.constants import FileFormat
-from cg.exc import CgError
 from cg.io.controller import WriteStream, WriteFile
+from cg.meta.workflow.case_scheduler import start_cases
 from cg.meta.workflow.microsalt import MicrosaltAnalysisAPI
 from cg.models.cg_config import CGConfig
 from cg.store.models import Analysis, Sample
@@ -197,23 +197,21 @@ def start(
 
 @microsalt.command("start-available")
 @OPTION_DRY_RUN
+@OPTION_WORKERS
 @click.pass_context
-def start_available(context: click.Context, dry_run: bool = False):
+def start_available(context: click.Context, dry_run: bool = False, workers: int = 1):
     """Start full analysis workflow for all cases ready for analysis"""
 
     analysis_api: MicrosaltAnalysisAPI = context.obj.meta_apis["analysis_api"]
 
-    exit_code: int = EXIT_SUCCESS
-    for case_obj in analysis_api.get_cases_to_analyze():
-        try:
-            context.invoke(start, unique_id=case_obj.internal_id, dry_run=dry_run)
-        except CgError as error:
-            LOG.error(error)
-            exit_code = EXIT_FAIL
-        except Exception as error:
-            LOG.error(f"Unspecified error occurred: {error}")
-            exit_code = EXIT_FAIL
-    if exit_code:
+    case_ids: List[str] = [case.internal_id for case in analysis_api.get_cases_to_analyze()]
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids,
+        start_case=lambda case_id: context.invoke(start, unique_id=case_id, dry_run=dry_run),
+        pipeline=analysis_api.pipeline,
+        workers=workers,
+    )
+    if failed_cases:
         raise click.Abort
 
 
@@ -1,10 +1,15 @@
 """Module for common workflow commands."""
 import logging
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import click
 from cg.apps.environ import environ_email
-from cg.cli.workflow.commands import ensure_flow_cells_on_disk, link, resolve_compression
+from cg.cli.workflow.commands import (
+    OPTION_WORKERS,
+    ensure_flow_cells_on_disk,
+    link,
+    resolve_compression,
+)
 from cg.cli.workflow.mip.options import (
     ARGUMENT_CASE_ID,
     EMAIL_OPTION,
@@ -17,8 +22,8 @@ from cg.cli.workflow.mip.options import (
     START_AFTER_PROGRAM,
     START_WITH_PROGRAM,
 )
-from cg.constants import EXIT_FAIL, EXIT_SUCCESS
 from cg.exc import CgError, DecompressionNeededError, FlowCellsNeededError
+from cg.meta.workflow.case_scheduler import start_cases
 from cg.meta.workflow.mip import MipAnalysisAPI
 from cg.models.cg_config import CGConfig
 
@@ -185,21 +190,19 @@ def start(
 
 @click.command("start-available")
 @OPTION_DRY
+@OPTION_WORKERS
 @click.pass_context
-def start_available(context: click.Context, dry_run: bool = False):
+def start_available(context: click.Context, dry_run: bool = False, workers: int = 1):
     """Start full analysis workflow for all cases ready for analysis."""
 
     analysis_api: MipAnalysisAPI = context.obj.meta_apis["analysis_api"]
 
-    exit_code: int = EXIT_SUCCESS
-    for case_obj in analysis_api.get_cases_to_analyze():
-        try:
-            context.invoke(start, case_id=case_obj.internal_id, dry_run=dry_run)
-        except CgError as error:
-            LOG.error(error)
-            exit_code = EXIT_FAIL
-        except Exception as error:
-            LOG.error(f"Unspecified error occurred: {error}")
-            exit_code = EXIT_FAIL
-    if exit_code:
+    case_ids: List[str] = [case.internal_id for case in analysis_api.get_cases_to_analyze()]
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids,
+        start_case=lambda case_id: context.invoke(start, case_id=case_id, dry_run=dry_run),
+        pipeline=analysis_api.pipeline,
+        workers=workers,
+    )
+    if failed_cases:
         raise click.Abort
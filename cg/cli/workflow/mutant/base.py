@@ -1,17 +1,19 @@
 import logging
+from typing import Dict, List
 
 import click
 from cg.cli.workflow.commands import (
     ARGUMENT_CASE_ID,
     OPTION_DRY,
+    OPTION_WORKERS,
     link,
     resolve_compression,
     store,
     store_available,
     OPTION_ANALYSIS_PARAMETERS_CONFIG,
 )
-from cg.constants import EXIT_FAIL, EXIT_SUCCESS
-from cg.exc import CgError, DecompressionNeededError
+from cg.exc import DecompressionNeededError
+from cg.meta.workflow.case_scheduler import start_cases
 from cg.meta.workflow.mutant import MutantAnalysisAPI
 from cg.models.cg_config import CGConfig
 from cg.meta.workflow.analysis import AnalysisAPI
@@ -82,21 +84,19 @@ def start(context: click.Context, dry_run: bool, case_id: str, config_artic: str
 
 @mutant.command("start-available")
 @OPTION_DRY
+@OPTION_WORKERS
 @click.pass_context
-def start_available(context: click.Context, dry_run: bool = False):
+def start_available(context: click.Context, dry_run: bool = False, workers: int = 1):
     """Start full analysis workflow for all cases ready for analysis"""
 
     analysis_api: MutantAnalysisAPI = context.obj.meta_apis["analysis_api"]
 
-    exit_code: int = EXIT_SUCCESS
-    for case_obj in analysis_api.get_cases_to_analyze():
-        try:
-            context.invoke(start, case_id=case_obj.internal_id, dry_run=dry_run)
-        except CgError as error:
-            LOG.error(error)
-            exit_code = EXIT_FAIL
-        except Exception as error:
-            LOG.error(f"Unspecified error occurred: %s", error)
-            exit_code = EXIT_FAIL
-    if exit_code:
+    case_ids: List[str] = [case.internal_id for case in analysis_api.get_cases_to_analyze()]
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids,
+        start_case=lambda case_id: context.invoke(start, case_id=case_id, dry_run=dry_run),
+        pipeline=analysis_api.pipeline,
+        workers=workers,
+    )
+    if failed_cases:
         raise click.Abort
@@ -9,6 +9,10 @@ MAX_READS_PER_GB: int = 18_000_000
 CRUNCHY_MIN_GB_PER_PROCESS: int = 30
 PENDING_PATH_SUFFIX: str = ".crunchy.pending.txt"
 
+# Constants for scheduling FASTQ compression
+FASTQ_COMPRESSION_CHECKPOINT_MAX_AGE = datetime.timedelta(days=1)
+MAX_QUEUED_COMPRESSION_JOBS: int = 200
+
 
 # Number of days until FASTQs counts as old
 FASTQ_DELTA = 21
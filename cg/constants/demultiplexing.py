@@ -74,6 +74,8 @@ DEMUX_STATS_PATH = {
 
 DRAGEN_PASSED_FILTER_PCT = 100.00000
 
+MAX_FLOW_CELL_DISCOVERY_WORKERS = 16
+
 
 class DemultiplexingDirsAndFiles(StrEnum):
     """Demultiplexing related directories and files."""
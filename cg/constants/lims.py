@@ -139,6 +139,11 @@ MASTER_STEPS_UDFS = {
 
 PROCESSES = {"sequenced_date": "AUTOMATED - NovaSeq Run"}
 
+LIMS_BATCH_SIZE: int = 500
+LIMS_MAX_CONCURRENT_REQUESTS: int = 8
+LIMS_CACHE_EXPIRE_AFTER: int = 3600
+LIMS_CACHE_MAX_ENTRIES: int = 20000
+
 
 class DocumentationMethod(StrEnum):
     ATLAS: str = "Atlas"
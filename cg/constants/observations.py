@@ -10,6 +10,7 @@ LOQUSDB_ID = "_id"
 LOQUSDB_SUPPORTED_PIPELINES = [Pipeline.MIP_DNA, Pipeline.BALSAMIC]
 LOQUSDB_MIP_SEQUENCING_METHODS = [SequencingMethod.WGS, SequencingMethod.WES]
 LOQUSDB_BALSAMIC_SEQUENCING_METHODS = [SequencingMethod.WGS]
+LOQUSDB_MAX_CONCURRENT_UPLOADS: int = 4
 
 
 class LoqusdbMipCustomers(StrEnum):
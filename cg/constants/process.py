@@ -1,6 +1,15 @@
 """Constants for Processes"""
+from typing import Dict
+
+from cgmodels.cg.constants import Pipeline
 
 RETURN_SUCCESS = 0
 RETURN_WARNING = 8
 EXIT_SUCCESS = 0
 EXIT_FAIL = 1
+MAX_CONCURRENT_PROCESSES = 8
+MAX_CONCURRENT_CASE_STARTS: Dict[Pipeline, int] = {
+    Pipeline.FLUFFY: 1,
+    Pipeline.MIP_DNA: 4,
+    Pipeline.MIP_RNA: 4,
+}
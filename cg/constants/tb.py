@@ -1,3 +1,6 @@
+from typing import Tuple
+
+
 class AnalysisStatus:
     CANCELLED: str = "cancelled"
     COMPLETED: str = "completed"
@@ -6,3 +9,10 @@ class AnalysisStatus:
     PENDING: str = "pending"
     RUNNING: str = "running"
     TIMEOUT: str = "timeout"
+
+
+TRAILBLAZER_POOL_SIZE: int = 16
+TRAILBLAZER_RETRIES: int = 3
+TRAILBLAZER_RETRY_BACKOFF_FACTOR: float = 0.5
+TRAILBLAZER_RETRY_STATUS_CODES: Tuple[int, ...] = (502, 503)
+TRAILBLAZER_TIMEOUT: Tuple[float, float] = (10, 120)
@@ -1,6 +1,10 @@
 """Module to create API requests."""
+from typing import Optional, Tuple, Union
+
 import requests
-from requests import Response
+from requests import Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 def put(url: str, headers: dict, json: dict) -> Response:
@@ -26,3 +30,37 @@ def get(url: str, headers: dict, json: dict) -> Response:
 def patch(url: str, headers: dict, json: dict) -> Response:
     """Create PATCH request."""
     return requests.patch(url=url, headers=headers, json=json)
+
+
+def get_session(
+    pool_size: int, retries: int, backoff_factor: float, retry_status_codes: Tuple[int, ...]
+) -> Session:
+    """Return a session that keeps connections alive in a pool and retries failed requests.
+    Requests are retried when a connection can not be made. Idempotent requests are also retried
+    when the response has one of the retry status codes, while other requests, such as POST, are
+    never retried after they may have been processed by the server."""
+    retry = Retry(
+        total=retries,
+        read=0,
+        other=0,
+        backoff_factor=backoff_factor,
+        status_forcelist=retry_status_codes,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def request_from_session(
+    session: Session,
+    method: str,
+    url: str,
+    headers: dict,
+    json: dict,
+    timeout: Optional[Union[float, Tuple[float, float]]] = None,
+) -> Response:
+    """Create a request using a session."""
+    return session.request(method=method, url=url, headers=headers, json=json, timeout=timeout)
@@ -1,12 +1,12 @@
 from pathlib import Path
-from typing import Any
-from requests import Response
+from typing import Any, Optional, Tuple, Union
+from requests import Response, Session
 
 from cg.constants.constants import FileFormat, APIMethods
 from cg.io.json import read_json, write_json, write_json_stream, read_json_stream
 from cg.io.yaml import read_yaml, write_yaml, read_yaml_stream, write_yaml_stream
 from cg.io.csv import read_csv, write_csv, read_csv_stream, write_csv_stream
-from cg.io.api import put, post, patch, delete, get
+from cg.io.api import put, post, patch, delete, get, request_from_session
 
 
 class ReadFile:
@@ -85,3 +85,21 @@ class APIRequest:
         cls, api_method: str, url: str, headers: dict, json: dict
     ) -> Response:
         return cls.api_request[api_method](url=url, headers=headers, json=json)
+
+    @staticmethod
+    def api_request_from_session(
+        session: Session,
+        api_method: str,
+        url: str,
+        headers: dict,
+        json: dict,
+        timeout: Optional[Union[float, Tuple[float, float]]] = None,
+    ) -> Response:
+        return request_from_session(
+            session=session,
+            method=api_method,
+            url=url,
+            headers=headers,
+            json=json,
+            timeout=timeout,
+        )
@@ -16,6 +16,7 @@ from cg.constants.demultiplexing import DemultiplexingDirsAndFiles
 from cg.constants.sequencing import Sequencers, sequencer_types
 from cg.constants.symbols import ASTERISK
 from cg.constants.housekeeper_tags import SequencingFileTag
+from cg.meta.clean.housekeeper_flow_cell_index import HousekeeperFlowCellIndex
 from cg.store import Store
 
 FLOW_CELL_IDENTIFIER_POSITION = 3
@@ -43,6 +44,7 @@ class DemultiplexedRunsFlowCell:
         sample_sheets_dir: Optional[str] = None,
         fastq_files: Optional[Query] = None,
         spring_files: Optional[Query] = None,
+        housekeeper_index: Optional[HousekeeperFlowCellIndex] = None,
     ):
         self.sample_sheets_dir: Path = Path(sample_sheets_dir) if sample_sheets_dir else None
         self.path: Path = flow_cell_path
@@ -51,6 +53,7 @@ class DemultiplexedRunsFlowCell:
         self.tb: TrailblazerAPI = trailblazer_api
         self.all_fastq_files: Optional[Query] = fastq_files
         self.all_spring_files: Optional[Query] = spring_files
+        self.housekeeper_index: Optional[HousekeeperFlowCellIndex] = housekeeper_index
         self.run_name: str = self.path.name
         self.split_name: List[str] = re.split("[_.]", self.run_name)
         self.identifier: str = self.split_name[FLOW_CELL_IDENTIFIER_POSITION]
@@ -80,6 +83,10 @@ class DemultiplexedRunsFlowCell:
     @property
     def hk_fastq_files(self) -> list:
         """All FASTQ files in Housekeeper for a particular flow cell."""
+        if self._hk_fastq_files is None and self.housekeeper_index:
+            self._hk_fastq_files = self.housekeeper_index.get_flow_cell_files(
+                flow_cell_id=self.id, tag=SequencingFileTag.FASTQ
+            )
         if self._hk_fastq_files is None:
             self._hk_fastq_files = [
                 fastq_file for fastq_file in self.all_fastq_files if self.id in fastq_file.path
@@ -89,6 +96,10 @@ class DemultiplexedRunsFlowCell:
     @property
     def hk_spring_files(self) -> list:
         """All spring files in Housekeeper for a particular flow cell"""
+        if self._hk_spring_files is None and self.housekeeper_index:
+            self._hk_spring_files = self.housekeeper_index.get_flow_cell_files(
+                flow_cell_id=self.id, tag=SequencingFileTag.SPRING
+            )
         if self._hk_spring_files is None:
             self._hk_spring_files = [
                 spring_file for spring_file in self.all_spring_files if self.id in spring_file.path
@@ -0,0 +1,117 @@
+"""Index of the Housekeeper files and sample bundles of flow cells, built once per run so that
+checking many flow cells does not scan all Housekeeper files or query Housekeeper per flow cell."""
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Set
+
+from housekeeper.store.models import File, Version
+
+from cg.apps.housekeeper.hk import HousekeeperAPI
+from cg.constants.housekeeper_tags import SequencingFileTag
+from cg.exc import HousekeeperBundleVersionMissingError
+
+LOG = logging.getLogger(__name__)
+
+SEQUENCING_FILE_TAGS: List[str] = [SequencingFileTag.FASTQ, SequencingFileTag.SPRING_METADATA]
+
+
+class HousekeeperFlowCellIndex:
+    """Housekeeper files per flow cell and sequencing files per sample bundle.
+
+    Files are mapped to the flow cells whose id occurs anywhere in the file path, which is found
+    by looking up every substring of the path with the length of a flow cell id. Each file is
+    thus only visited once, regardless of the number of flow cells.
+    """
+
+    def __init__(self, housekeeper_api: HousekeeperAPI, flow_cell_ids: Iterable[str]):
+        self.hk: HousekeeperAPI = housekeeper_api
+        self.flow_cell_ids: Set[str] = set(flow_cell_ids)
+        self._flow_cell_id_lengths: Set[int] = {
+            len(flow_cell_id) for flow_cell_id in self.flow_cell_ids
+        }
+        self._flow_cell_files: Dict[str, Dict[str, List[File]]] = {}
+        self._bundle_files: Dict[str, Dict[str, List[File]]] = {}
+        self._is_bundle_included: Dict[str, bool] = {}
+        self._is_bundle_on_disk: Dict[str, bool] = {}
+
+    def get_flow_cell_ids_in_path(self, path: str) -> Set[str]:
+        """Return the ids of the indexed flow cells that occur in a path."""
+        flow_cell_ids: Set[str] = set()
+        for length in self._flow_cell_id_lengths:
+            for start in range(len(path) - length + 1):
+                substring: str = path[start : start + length]
+                if substring in self.flow_cell_ids:
+                    flow_cell_ids.add(substring)
+        return flow_cell_ids
+
+    def add_flow_cell_files(self, tag: str, files: Iterable[File]) -> None:
+        """Index Housekeeper files with a tag on the flow cells in their paths."""
+        flow_cell_files: Dict[str, List[File]] = self._flow_cell_files.setdefault(tag, {})
+        for file in files:
+            for flow_cell_id in self.get_flow_cell_ids_in_path(path=file.path):
+                flow_cell_files.setdefault(flow_cell_id, []).append(file)
+
+    def get_flow_cell_files(self, flow_cell_id: str, tag: str) -> List[File]:
+        """Return the indexed Housekeeper files with a tag for a flow cell."""
+        return self._flow_cell_files.get(tag, {}).get(flow_cell_id, [])
+
+    def add_bundles(self, bundle_names: Iterable[str]) -> None:
+        """Index the FASTQ and SPRING metadata files in the latest version of sample bundles."""
+        bundle_names: List[str] = [
+            bundle_name
+            for bundle_name in set(bundle_names)
+            if bundle_name not in self._bundle_files
+        ]
+        if not bundle_names:
+            return
+        LOG.info(f"Indexing sequencing files of {len(bundle_names)} bundles in Housekeeper")
+        latest_versions: Dict[str, Version] = self.hk.get_latest_versions(bundle_names=bundle_names)
+        version_to_bundle: Dict[int, str] = {
+            version.id: bundle_name for bundle_name, version in latest_versions.items()
+        }
+        for bundle_name in latest_versions:
+            self._bundle_files[bundle_name] = {tag: [] for tag in SEQUENCING_FILE_TAGS}
+        for tag in SEQUENCING_FILE_TAGS:
+            for file in self.hk.get_files_from_versions(
+                version_ids=list(version_to_bundle), tags=[tag]
+            ):
+                self._bundle_files[version_to_bundle[file.version_id]][tag].append(file)
+
+    def get_bundle_files(self, bundle_name: str, tag: str) -> List[File]:
+        """Return the indexed files with a tag in the latest version of a bundle."""
+        if bundle_name not in self._bundle_files:
+            self.add_bundles(bundle_names=[bundle_name])
+        if bundle_name not in self._bundle_files:
+            LOG.info(f"Bundle: {bundle_name} not found in Housekeeper")
+            raise HousekeeperBundleVersionMissingError
+        return self._bundle_files[bundle_name][tag]
+
+    def _has_sequencing_file(self, bundle_name: str, predicate: Callable[[File], bool]) -> bool:
+        """Return whether any FASTQ file, or else any SPRING metadata file, of a bundle fulfills
+        a predicate."""
+        return any(
+            any(predicate(file) for file in self.get_bundle_files(bundle_name=bundle_name, tag=tag))
+            for tag in SEQUENCING_FILE_TAGS
+        )
+
+    def is_fastq_or_spring_in_all_bundles(self, bundle_names: List[str]) -> bool:
+        """Return whether or not all FASTQ/SPRING files are included for the given bundles."""
+        if not bundle_names:
+            return False
+        for bundle_name in bundle_names:
+            if bundle_name not in self._is_bundle_included:
+                self._is_bundle_included[bundle_name] = self._has_sequencing_file(
+                    bundle_name=bundle_name, predicate=lambda file: file.is_included
+                )
+        return all(self._is_bundle_included[bundle_name] for bundle_name in bundle_names)
+
+    def is_fastq_or_spring_on_disk_in_all_bundles(self, bundle_names: List[str]) -> bool:
+        """Return whether or not all FASTQ/SPRING files are on disk for the given bundles."""
+        if not bundle_names:
+            return False
+        for bundle_name in bundle_names:
+            if bundle_name not in self._is_bundle_on_disk:
+                self._is_bundle_on_disk[bundle_name] = self._has_sequencing_file(
+                    bundle_name=bundle_name, predicate=lambda file: Path(file.full_path).exists()
+                )
+        return all(self._is_bundle_on_disk[bundle_name] for bundle_name in bundle_names)
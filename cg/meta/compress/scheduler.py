@@ -0,0 +1,192 @@
+"""Scheduling of FASTQ compression for many samples.
+
+The FASTQ files of the samples are checked on the file system concurrently, and the samples are
+compressed in order of the number of bytes that compression can reclaim, within a budget of
+queued SLURM jobs. The scan and the compressed samples are saved in a checkpoint, so that an
+interrupted run can be resumed without scanning again.
+"""
+import datetime as dt
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from housekeeper.store.models import Version
+from pydantic import BaseModel
+
+from cg.apps.crunchy import CrunchyAPI
+from cg.constants import HK_FASTQ_TAGS
+from cg.constants.compression import FASTQ_COMPRESSION_CHECKPOINT_MAX_AGE
+from cg.constants.process import MAX_CONCURRENT_PROCESSES
+from cg.meta.compress import files
+from cg.meta.compress.compress import CompressAPI
+from cg.models import CompressionData, FileData
+from cg.store.models import Sample
+
+LOG = logging.getLogger(__name__)
+
+
+class FastqCompressionCandidate(BaseModel):
+    """A sample with FASTQ files to compress."""
+
+    sample_id: str
+    reads: Optional[int]
+    reclaimable_bytes: int = 0
+    jobs: int = 0
+
+
+class FastqCompressionCheckpoint(BaseModel):
+    """The candidates of a compression run and the samples handled so far."""
+
+    created_at: dt.datetime
+    candidates: List[FastqCompressionCandidate]
+    handled_sample_ids: List[str] = []
+
+
+def get_fastq_compression_candidate(
+    sample_id: str, reads: Optional[int], fastq_paths: List[Path]
+) -> Optional[FastqCompressionCandidate]:
+    """Return the compression candidate of a sample if any of its FASTQ files can be compressed
+    or are empty. Only the file system is accessed."""
+    candidate = FastqCompressionCandidate(sample_id=sample_id, reads=reads)
+    has_empty_fastq: bool = False
+    compressions: List[CompressionData] = files.get_compression_data(fastq_files=fastq_paths)
+    for compression in compressions:
+        if not files.check_fastqs(compression_obj=compression):
+            continue
+        if FileData.is_empty(compression.fastq_first):
+            has_empty_fastq = True
+            continue
+        if not CrunchyAPI.is_fastq_compression_possible(compression_obj=compression):
+            continue
+        candidate.reclaimable_bytes += (
+            compression.fastq_first.stat().st_size + compression.fastq_second.stat().st_size
+        )
+        candidate.jobs += 1
+    if candidate.jobs or has_empty_fastq:
+        return candidate
+    return None
+
+
+class FastqCompressionScheduler:
+    """Compress the FASTQ files of samples in order of reclaimable bytes."""
+
+    def __init__(
+        self,
+        compress_api: CompressAPI,
+        checkpoint_path: Optional[Path] = None,
+        max_workers: int = MAX_CONCURRENT_PROCESSES,
+    ):
+        self.compress_api: CompressAPI = compress_api
+        self.checkpoint_path: Optional[Path] = checkpoint_path
+        self.max_workers: int = max_workers
+
+    def _get_fastq_paths(self, sample_id: str) -> List[Path]:
+        """Return the paths of the FASTQ files of a sample in Housekeeper."""
+        version: Version = self.compress_api.hk_api.get_latest_bundle_version(bundle_name=sample_id)
+        if not version:
+            return []
+        return list(files.get_hk_files_dict(tags=HK_FASTQ_TAGS, version_obj=version))
+
+    def scan(self, samples: List[Sample]) -> List[FastqCompressionCandidate]:
+        """Return the compression candidates among the samples, with the most reclaimable bytes
+        first. Housekeeper is queried one sample at a time, the file system concurrently."""
+        fastq_paths: Dict[str, List[Path]] = {}
+        reads: Dict[str, Optional[int]] = {}
+        for sample in samples:
+            fastq_paths[sample.internal_id] = self._get_fastq_paths(sample_id=sample.internal_id)
+            reads[sample.internal_id] = sample.reads
+        LOG.info(f"Checking FASTQ files of {len(fastq_paths)} samples")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            candidates: List[Optional[FastqCompressionCandidate]] = list(
+                executor.map(
+                    lambda sample_id: get_fastq_compression_candidate(
+                        sample_id=sample_id,
+                        reads=reads[sample_id],
+                        fastq_paths=fastq_paths[sample_id],
+                    ),
+                    fastq_paths,
+                )
+            )
+        return sorted(
+            (candidate for candidate in candidates if candidate),
+            key=lambda candidate: candidate.reclaimable_bytes,
+            reverse=True,
+        )
+
+    def read_checkpoint(self) -> Optional[FastqCompressionCheckpoint]:
+        """Return the checkpoint of an interrupted run, unless it is missing or outdated."""
+        if not self.checkpoint_path or not self.checkpoint_path.exists():
+            return None
+        checkpoint: FastqCompressionCheckpoint = FastqCompressionCheckpoint.parse_file(
+            self.checkpoint_path
+        )
+        if checkpoint.created_at < dt.datetime.now() - FASTQ_COMPRESSION_CHECKPOINT_MAX_AGE:
+            LOG.info(f"Ignoring outdated checkpoint {self.checkpoint_path}")
+            return None
+        LOG.info(
+            f"Resuming from checkpoint {self.checkpoint_path} with "
+            f"{len(checkpoint.handled_sample_ids)} handled samples"
+        )
+        return checkpoint
+
+    def write_checkpoint(self, checkpoint: FastqCompressionCheckpoint) -> None:
+        """Save the checkpoint, replacing the previous one at once."""
+        if not self.checkpoint_path or self.compress_api.dry_run:
+            return
+        temporary_path: Path = self.checkpoint_path.with_suffix(".tmp")
+        temporary_path.write_text(checkpoint.json())
+        temporary_path.replace(self.checkpoint_path)
+
+    def remove_checkpoint(self) -> None:
+        """Remove the checkpoint of a completed run."""
+        if self.checkpoint_path and self.checkpoint_path.exists() and not self.compress_api.dry_run:
+            self.checkpoint_path.unlink()
+
+    def get_job_budget(self, max_queued_jobs: int) -> int:
+        """Return the number of jobs that can be queued without exceeding the maximum."""
+        queued_jobs: int = self.compress_api.crunchy_api.get_number_of_queued_jobs()
+        LOG.info(f"{queued_jobs} compression jobs are queued, allowing {max_queued_jobs}")
+        return max(max_queued_jobs - queued_jobs, 0)
+
+    def compress(
+        self,
+        samples: List[Sample],
+        max_queued_jobs: int,
+        compress_sample: Callable[[FastqCompressionCandidate], bool],
+    ) -> List[str]:
+        """Compress the FASTQ files of the samples with the most reclaimable bytes that fit the
+        job budget and return the ids of the compressed samples."""
+        checkpoint: Optional[FastqCompressionCheckpoint] = self.read_checkpoint()
+        if checkpoint is None:
+            checkpoint = FastqCompressionCheckpoint(
+                created_at=dt.datetime.now(), candidates=self.scan(samples=samples)
+            )
+            self.write_checkpoint(checkpoint=checkpoint)
+        job_budget: int = self.get_job_budget(max_queued_jobs=max_queued_jobs)
+        compressed_sample_ids: List[str] = []
+        is_completed: bool = True
+        for candidate in checkpoint.candidates:
+            if candidate.sample_id in checkpoint.handled_sample_ids:
+                continue
+            if candidate.jobs > job_budget:
+                LOG.debug(f"No job budget left for sample {candidate.sample_id}")
+                is_completed = False
+                continue
+            if compress_sample(candidate):
+                compressed_sample_ids.append(candidate.sample_id)
+            job_budget -= candidate.jobs
+            checkpoint.handled_sample_ids.append(candidate.sample_id)
+            self.write_checkpoint(checkpoint=checkpoint)
+        if is_completed:
+            self.remove_checkpoint()
+        reclaimed_bytes: int = sum(
+            candidate.reclaimable_bytes
+            for candidate in checkpoint.candidates
+            if candidate.sample_id in compressed_sample_ids
+        )
+        LOG.info(
+            f"Compressed {len(compressed_sample_ids)} of {len(checkpoint.candidates)} candidate "
+            f"samples, reclaiming {reclaimed_bytes} bytes"
+        )
+        return compressed_sample_ids
@@ -35,7 +35,10 @@ class DemuxPostProcessingAPI:
         self.status_db: Store = config.status_db
         self.hk_api: HousekeeperAPI = config.housekeeper_api
         self.transfer_flow_cell_api: TransferFlowCell = TransferFlowCell(
-            db=self.status_db, stats_api=self.stats_api, hk_api=self.hk_api
+            db=self.status_db,
+            stats_api=self.stats_api,
+            hk_api=self.hk_api,
+            fastq_header_index=config.fastq_header_index_api,
         )
         self.dry_run = False
 
@@ -197,7 +200,9 @@ class DemuxPostProcessingNovaseqAPI(DemuxPostProcessingAPI):
 
     def add_to_cgstats(self, demux_results: DemuxResults) -> None:
         """Add the information from demultiplexing to cgstats"""
-        create.create_novaseq_flowcell(manager=self.stats_api, demux_results=demux_results)
+        create.create_novaseq_flowcell(
+            manager=self.stats_api, demux_results=demux_results, bulk=True
+        )
 
     def fetch_report_samples(self, flow_cell_id: str, project_name: str) -> List[StatsSample]:
         samples: List[StatsSample] = self.stats_api.find_handler.project_sample_stats(
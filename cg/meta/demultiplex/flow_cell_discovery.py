@@ -0,0 +1,143 @@
+"""Find the flow cells in a run directory that are ready to be demultiplexed."""
+import json
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from threading import Lock
+from typing import Dict, List, Optional, Set
+
+from cg.apps.demultiplex.demultiplex_api import DemultiplexingAPI
+from cg.constants.demultiplexing import MAX_FLOW_CELL_DISCOVERY_WORKERS
+from cg.exc import FlowCellError
+from cg.models.demultiplex.flow_cell import FlowCell
+
+LOG = logging.getLogger(__name__)
+
+
+class SampleSheetValidationCache:
+    """Sample sheet validation results, keyed on the sample sheet path and modification time.
+
+    Given a path, the results are kept between runs. Only the results of the sample sheets checked
+    in a run are written, so that flow cells that have been removed are evicted from the cache.
+    """
+
+    def __init__(self, cache_path: Optional[Path] = None):
+        self.cache_path: Optional[Path] = cache_path
+        self._lock = Lock()
+        self._validations: Dict[str, dict] = self._read()
+        self._checked_sample_sheets: Set[str] = set()
+
+    def _read(self) -> Dict[str, dict]:
+        """Return the cached validation results, or nothing if the cache can not be read."""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            return json.loads(self.cache_path.read_text())
+        except (OSError, ValueError) as error:
+            LOG.warning(f"Could not read sample sheet validation cache {self.cache_path}: {error}")
+            return {}
+
+    def write(self) -> None:
+        """Write the validation results of the sample sheets checked in this run to the cache
+        file."""
+        if not self.cache_path:
+            return
+        with self._lock:
+            validations: Dict[str, dict] = {
+                sample_sheet_path: validation
+                for sample_sheet_path, validation in self._validations.items()
+                if sample_sheet_path in self._checked_sample_sheets
+            }
+            try:
+                self.cache_path.write_text(json.dumps(validations))
+            except OSError as error:
+                LOG.warning(
+                    f"Could not write sample sheet validation cache {self.cache_path}: {error}"
+                )
+
+    def is_sample_sheet_valid(self, flow_cell: FlowCell) -> bool:
+        """Validate the sample sheet of a flow cell, unless it is unchanged since the last
+        validation."""
+        sample_sheet_path: str = flow_cell.sample_sheet_path.as_posix()
+        modified_at: int = os.stat(sample_sheet_path).st_mtime_ns
+        with self._lock:
+            self._checked_sample_sheets.add(sample_sheet_path)
+            validation: Optional[dict] = self._validations.get(sample_sheet_path)
+        if (
+            validation
+            and validation["modified_at"] == modified_at
+            and validation["bcl_converter"] == flow_cell.bcl_converter
+        ):
+            LOG.debug(f"Using cached validation of sample sheet {sample_sheet_path}")
+            return validation["is_valid"]
+        is_valid: bool = flow_cell.validate_sample_sheet()
+        with self._lock:
+            self._validations[sample_sheet_path] = {
+                "bcl_converter": flow_cell.bcl_converter,
+                "is_valid": is_valid,
+                "modified_at": modified_at,
+            }
+        return is_valid
+
+
+def get_flow_cell_ready_for_demultiplexing(
+    flow_cell_dir: Path,
+    bcl_converter: str,
+    demultiplex_api: DemultiplexingAPI,
+    validation_cache: SampleSheetValidationCache,
+    dry_run: bool,
+) -> Optional[FlowCell]:
+    """Return the flow cell in a directory if it is ready for demultiplexing."""
+    LOG.info(f"Found directory {flow_cell_dir}")
+    try:
+        flow_cell = FlowCell(flow_cell_path=flow_cell_dir, bcl_converter=bcl_converter)
+    except FlowCellError:
+        return None
+
+    if not demultiplex_api.is_demultiplexing_possible(flow_cell=flow_cell) and not dry_run:
+        return None
+
+    if not validation_cache.is_sample_sheet_valid(flow_cell=flow_cell):
+        LOG.warning(
+            f"Malformed sample sheet. Run cg demultiplex samplesheet validate {flow_cell.sample_sheet_path}",
+        )
+        return None
+    return flow_cell
+
+
+def get_flow_cells_ready_for_demultiplexing(
+    flow_cells_directory: Path,
+    bcl_converter: str,
+    demultiplex_api: DemultiplexingAPI,
+    dry_run: bool,
+    validation_cache_path: Optional[Path] = None,
+    max_workers: int = MAX_FLOW_CELL_DISCOVERY_WORKERS,
+) -> List[FlowCell]:
+    """Return the flow cells in a run directory that are ready for demultiplexing.
+
+    The flow cell directories are checked concurrently and, given a cache path, the sample sheet
+    validation results are kept between runs.
+    """
+    validation_cache = SampleSheetValidationCache(cache_path=validation_cache_path)
+    flow_cell_dirs: List[Path] = [
+        flow_cell_dir for flow_cell_dir in flow_cells_directory.iterdir() if flow_cell_dir.is_dir()
+    ]
+    get_flow_cell = partial(
+        get_flow_cell_ready_for_demultiplexing,
+        bcl_converter=bcl_converter,
+        demultiplex_api=demultiplex_api,
+        validation_cache=validation_cache,
+        dry_run=dry_run,
+    )
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        flow_cells: List[Optional[FlowCell]] = list(executor.map(get_flow_cell, flow_cell_dirs))
+    if not dry_run:
+        validation_cache.write()
+    ready_flow_cells: List[FlowCell] = [flow_cell for flow_cell in flow_cells if flow_cell]
+    LOG.info(
+        f"Found {len(ready_flow_cells)} flow cells ready for demultiplexing out of "
+        f"{len(flow_cell_dirs)} directories"
+    )
+    return ready_flow_cells
@@ -4,13 +4,14 @@ import subprocess
 from io import TextIOWrapper
 from pathlib import Path
 from tempfile import NamedTemporaryFile
-from typing import List
+from typing import List, Optional
 
 from cg.constants import FileExtensions
 from cg.constants.encryption import GPGParameters
 from cg.exc import ChecksumFailedError
 from cg.utils import Process
 from cg.utils.checksum.checksum import sha512_checksum
+from cg.utils.checksum.checksum_cache import ChecksumCache
 
 LOG = logging.getLogger(__name__)
 
@@ -18,10 +19,16 @@ LOG = logging.getLogger(__name__)
 class EncryptionAPI:
     """Class that uses gpg for various encryption and decryption functionality"""
 
-    def __init__(self, binary_path: str, dry_run: bool = False):
+    def __init__(
+        self,
+        binary_path: str,
+        dry_run: bool = False,
+        checksum_cache: Optional[ChecksumCache] = None,
+    ):
         self.binary_path: str = binary_path
         self.process: Process = Process(binary=binary_path)
         self.dry_run: bool = dry_run
+        self.checksum_cache: Optional[ChecksumCache] = checksum_cache
 
     def run_gpg_command(self, command: list) -> None:
         """Runs a GPG command"""
@@ -58,9 +65,9 @@ class EncryptionAPI:
 
     def compare_file_checksums(self, original_file: Path, decrypted_file_checksum: Path) -> bool:
         """Performs a checksum by decrypting an encrypted file and comparing it to the original file"""
-        is_checksum_equal = sha512_checksum(original_file) == sha512_checksum(
-            decrypted_file_checksum
-        )
+        is_checksum_equal = sha512_checksum(
+            original_file, checksum_cache=self.checksum_cache
+        ) == sha512_checksum(decrypted_file_checksum)
         if not is_checksum_equal:
             raise ChecksumFailedError(message="Checksum comparison failed!")
         LOG.info("Checksum comparison successful!")
@@ -109,8 +116,9 @@ class SpringEncryptionAPI(EncryptionAPI):
         self,
         binary_path: str,
         dry_run: bool = False,
+        checksum_cache: Optional[ChecksumCache] = None,
     ):
-        super().__init__(binary_path=binary_path, dry_run=dry_run)
+        super().__init__(binary_path=binary_path, dry_run=dry_run, checksum_cache=checksum_cache)
         self._temporary_passphrase = None
 
     def spring_symmetric_encryption(self, spring_file_path: Path) -> None:
@@ -196,9 +204,9 @@ class SpringEncryptionAPI(EncryptionAPI):
             spring_file_path=spring_file_path,
             output_file=self.decrypted_spring_file_checksum(spring_file_path),
         )
-        is_checksum_equal = sha512_checksum(spring_file_path) == sha512_checksum(
-            self.decrypted_spring_file_checksum(spring_file_path)
-        )
+        is_checksum_equal = sha512_checksum(
+            spring_file_path, checksum_cache=self.checksum_cache
+        ) == sha512_checksum(self.decrypted_spring_file_checksum(spring_file_path))
         if not is_checksum_equal:
             raise ChecksumFailedError(f"Checksum comparison failed!")
         LOG.info("Checksum comparison successful!")
@@ -1,15 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from cg.apps.lims import LimsAPI
 from cg.server.ext import lims as genologics_lims
 from cg.server.ext import FlaskLims
 from cg.store import Store
-from typing import Optional, Union, List, Any
-from cg.store.models import Invoice, Customer, User, Sample, Pool
+from typing import Dict, Optional, Tuple, Union, List, Any
+from cg.store.models import ApplicationVersion, Invoice, Customer, User, Sample, Pool
 from cg.constants.priority import PriorityTerms
 from cg.constants.sequencing import RecordType
 from cg.constants.invoice import (
     CostCenters,
     CustomerNames,
 )
+from cg.constants.lims import LIMS_MAX_CONCURRENT_REQUESTS
 from cg.models.invoice.invoice import InvoiceContact, InvoiceApplication, InvoiceReport, InvoiceInfo
 from pydantic import ValidationError
 
@@ -26,6 +29,8 @@ class InvoiceAPI:
         self._set_record_type()
         self.genologics_lims: FlaskLims = genologics_lims
         self.invoice_info: Optional[InvoiceInfo] = None
+        self.application_versions: Dict[int, ApplicationVersion] = self._get_application_versions()
+        self.pool_samples: Dict[Tuple[str, str], List] = {}
 
     def _set_record_type(self):
         """Define the record_type based on the invoice object.
@@ -37,6 +42,46 @@ class InvoiceAPI:
             self.record_type = RecordType.Sample
             self.raw_records = self.invoice_obj.samples
 
+    def _get_application_versions(self) -> Dict[int, ApplicationVersion]:
+        """Return the application versions of all records, loaded with their applications in one
+        pass. They are kept so that the records resolve them without further queries."""
+        application_versions: List[ApplicationVersion] = (
+            self.db.get_application_versions_by_entry_ids(
+                entry_ids=list({record.application_version_id for record in self.raw_records})
+            )
+            if self.raw_records
+            else []
+        )
+        return {
+            application_version.id: application_version
+            for application_version in application_versions
+        }
+
+    def get_application_version(self, record: Union[Sample, Pool]) -> ApplicationVersion:
+        """Return the application version of a record, from the preloaded application versions."""
+        return (
+            self.application_versions.get(record.application_version_id)
+            or record.application_version
+        )
+
+    def get_pooled_samples(self) -> List:
+        """Return the LIMS samples of all pool records. The contents of each pool are fetched once,
+        concurrently for the pools not fetched before."""
+        pools: List[Tuple[str, str]] = [(record.name, record.ticket) for record in self.raw_records]
+        pools_to_fetch: List[Tuple[str, str]] = [
+            pool for pool in dict.fromkeys(pools) if pool not in self.pool_samples
+        ]
+        with ThreadPoolExecutor(max_workers=LIMS_MAX_CONCURRENT_REQUESTS) as executor:
+            self.pool_samples.update(
+                zip(
+                    pools_to_fetch,
+                    executor.map(
+                        lambda pool: self.genologics_lims.samples_in_pools(*pool), pools_to_fetch
+                    ),
+                )
+            )
+        return [sample for pool in pools for sample in self.pool_samples[pool]]
+
     def get_customer_by_cost_center(self, cost_center: str) -> Union[Customer, str]:
         """Return the costumer based on cost center."""
         return (
@@ -87,13 +132,11 @@ class InvoiceAPI:
         """Return invoice information as dictionary to generate Excel report."""
 
         records: List[dict] = []
-        pooled_samples: List = []
+        pooled_samples: List = (
+            self.get_pooled_samples() if self.record_type == RecordType.Pool else []
+        )
 
         for raw_record in self.raw_records:
-            if self.record_type == RecordType.Pool:
-                pooled_samples += self.genologics_lims.samples_in_pools(
-                    raw_record.name, raw_record.ticket
-                )
             record = self.get_invoice_entity_record(
                 cost_center=cost_center.lower(),
                 discount=self.invoice_obj.discount,
@@ -130,7 +173,7 @@ class InvoiceAPI:
     def _discount_price(self, record: Sample or Pool, discount: int = 0) -> Optional[int]:
         """Return discount price for a sample or pool."""
         priority = self.get_priority(record, for_discount_price=True)
-        full_price = getattr(record.application_version, f"price_{priority}")
+        full_price = getattr(self.get_application_version(record=record), f"price_{priority}")
         discount_factor = 1 - discount / 100
         if not full_price:
             return None
@@ -186,11 +229,12 @@ class InvoiceAPI:
         self, record: Sample or Pool, discount: int
     ) -> Optional[InvoiceApplication]:
         """Return the application information."""
+        application_version: ApplicationVersion = self.get_application_version(record=record)
         try:
             application = InvoiceApplication(
-                tag=record.application_version.application.tag,
-                version=record.application_version.version,
-                percent_kth=record.application_version.application.percent_kth,
+                tag=application_version.application.tag,
+                version=application_version.version,
+                percent_kth=application_version.application.percent_kth,
                 discounted_price=self._discount_price(record, discount),
             )
             return application
@@ -243,7 +287,7 @@ class InvoiceAPI:
                 name=record.name,
                 lims_id=lims_id,
                 id=record.id,
-                application_tag=record.application_version.application.tag,
+                application_tag=self.get_application_version(record=record).application.tag,
                 project=f"{order or 'NA'} ({ticket or 'NA'})",
                 date=record.received_at.date() if record.received_at else "",
                 price=split_discounted_price,
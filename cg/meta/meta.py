@@ -41,7 +41,8 @@ class MetaAPI:
                 demux_root=config.demultiplex.out_dir,
                 backup_api=SpringBackupAPI(
                     encryption_api=SpringEncryptionAPI(
-                        binary_path=config.dict()["encryption"]["binary_path"]
+                        binary_path=config.dict()["encryption"]["binary_path"],
+                        checksum_cache=config.checksum_cache_api,
                     ),
                     hk_api=config.housekeeper_api,
                     pdc_api=PdcAPI(config.dict()["pdc"]["binary_path"]),
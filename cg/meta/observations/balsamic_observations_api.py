@@ -37,42 +37,78 @@ class BalsamicObservationsAPI(ObservationsAPI):
 
     def load_observations(self, case: Family, input_files: BalsamicObservationsInputFiles) -> None:
         """Load observation counts to Loqusdb for a Balsamic case."""
+        self.check_case_to_upload(case)
+
+        loqusdb_upload_apis: List[LoqusdbAPI] = self.get_loqusdb_upload_apis()
+        for loqusdb_api in loqusdb_upload_apis:
+            if self.is_duplicate(
+                case=case,
+                loqusdb_api=loqusdb_api,
+                profile_vcf_path=None,
+                profile_threshold=None,
+            ):
+                LOG.error(f"Case {case.internal_id} has already been uploaded to Loqusdb")
+                raise LoqusdbDuplicateRecordError
+
+        loqusdb_id: str = self.load_observations_to_loqusdb(
+            case_id=case.internal_id, input_files=input_files, loqusdb_apis=loqusdb_upload_apis
+        )
+        self.update_statusdb_loqusdb_id(samples=case.samples, loqusdb_id=loqusdb_id)
+
+    def check_case_to_upload(self, case: Family) -> None:
+        """Check that the sequencing method of a Balsamic case is supported by Loqusdb."""
         if self.sequencing_method not in LOQUSDB_BALSAMIC_SEQUENCING_METHODS:
             LOG.error(
                 f"Sequencing method {self.sequencing_method} is not supported by Loqusdb. Cancelling upload."
             )
             raise LoqusdbUploadCaseError
 
-        loqusdb_upload_apis: List[LoqusdbAPI] = [self.loqusdb_somatic_api, self.loqusdb_tumor_api]
-        for loqusdb_api in loqusdb_upload_apis:
-            if self.is_duplicate(
-                case=case,
+    def get_loqusdb_upload_apis(self) -> List[LoqusdbAPI]:
+        """Return the somatic and tumor Loqusdb APIs."""
+        return [self.loqusdb_somatic_api, self.loqusdb_tumor_api]
+
+    def check_loqusdb_duplicates(
+        self,
+        case_id: str,
+        input_files: BalsamicObservationsInputFiles,
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> None:
+        """Check that a Balsamic case has not been loaded to any of the Loqusdb instances."""
+        for loqusdb_api in loqusdb_apis:
+            if self.is_loqusdb_duplicate(
+                case_id=case_id,
                 loqusdb_api=loqusdb_api,
                 profile_vcf_path=None,
                 profile_threshold=None,
             ):
-                LOG.error(f"Case {case.internal_id} has already been uploaded to Loqusdb")
+                LOG.error(f"Case {case_id} has already been uploaded to Loqusdb")
                 raise LoqusdbDuplicateRecordError
 
-        for loqusdb_api in loqusdb_upload_apis:
+    def load_observations_to_loqusdb(
+        self,
+        case_id: str,
+        input_files: BalsamicObservationsInputFiles,
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> str:
+        """Load observation counts of a Balsamic case to the somatic and tumor Loqusdb instances
+        and return the germline Loqusdb ID of the case."""
+        for loqusdb_api in loqusdb_apis:
             self.load_cancer_observations(
-                case=case, input_files=input_files, loqusdb_api=loqusdb_api
+                case_id=case_id, input_files=input_files, loqusdb_api=loqusdb_api
             )
-
-        # Update Statusb with a germline Loqusdb ID
-        loqusdb_id: str = str(self.loqusdb_tumor_api.get_case(case_id=case.internal_id)[LOQUSDB_ID])
-        self.update_statusdb_loqusdb_id(samples=case.samples, loqusdb_id=loqusdb_id)
+        loqusdb_tumor_api: LoqusdbAPI = loqusdb_apis[-1]
+        return str(loqusdb_tumor_api.get_case(case_id=case_id)[LOQUSDB_ID])
 
     @staticmethod
     def load_cancer_observations(
-        case: Family,
+        case_id: str,
         input_files: BalsamicObservationsInputFiles,
         loqusdb_api: LoqusdbAPI,
     ) -> None:
         """Load cancer observations to a specific Loqusdb API."""
         is_somatic: bool = "somatic" in str(loqusdb_api.config_path)
         load_output: dict = loqusdb_api.load(
-            case_id=case.internal_id,
+            case_id=case_id,
             snv_vcf_path=input_files.snv_vcf_path if is_somatic else input_files.snv_all_vcf_path,
             sv_vcf_path=input_files.sv_vcf_path if is_somatic else None,
             profile_vcf_path=None,
@@ -1,7 +1,7 @@
 """API for uploading rare disease observations."""
 
 import logging
-from typing import Dict
+from typing import Dict, List
 
 from housekeeper.store.models import Version, File
 
@@ -49,9 +49,7 @@ class MipDNAObservationsAPI(ObservationsAPI):
 
     def load_observations(self, case: Family, input_files: MipDNAObservationsInputFiles) -> None:
         """Load observation counts to Loqusdb for a MIP-DNA case."""
-        if case.tumour_samples:
-            LOG.error(f"Case {case.internal_id} has tumour samples. Cancelling upload.")
-            raise LoqusdbUploadCaseError
+        self.check_case_to_upload(case)
 
         if self.is_duplicate(
             case=case,
@@ -64,19 +62,60 @@ class MipDNAObservationsAPI(ObservationsAPI):
             )
             raise LoqusdbDuplicateRecordError
 
-        load_output: dict = self.loqusdb_api.load(
-            case_id=case.internal_id,
-            snv_vcf_path=input_files.snv_vcf_path,
-            sv_vcf_path=input_files.sv_vcf_path,
-            profile_vcf_path=input_files.profile_vcf_path,
-            family_ped_path=input_files.family_ped_path,
-            gq_threshold=MipDNALoadParameters.GQ_THRESHOLD.value,
-            hard_threshold=MipDNALoadParameters.HARD_THRESHOLD.value,
-            soft_threshold=MipDNALoadParameters.SOFT_THRESHOLD.value,
+        loqusdb_id: str = self.load_observations_to_loqusdb(
+            case_id=case.internal_id, input_files=input_files, loqusdb_apis=[self.loqusdb_api]
         )
-        loqusdb_id: str = str(self.loqusdb_api.get_case(case_id=case.internal_id)[LOQUSDB_ID])
         self.update_statusdb_loqusdb_id(samples=case.samples, loqusdb_id=loqusdb_id)
-        LOG.info(f"Uploaded {load_output['variants']} variants to {repr(self.loqusdb_api)}")
+
+    def check_case_to_upload(self, case: Family) -> None:
+        """Check that a MIP-DNA case has no tumour samples."""
+        if case.tumour_samples:
+            LOG.error(f"Case {case.internal_id} has tumour samples. Cancelling upload.")
+            raise LoqusdbUploadCaseError
+
+    def get_loqusdb_upload_apis(self) -> List[LoqusdbAPI]:
+        """Return the Loqusdb API of the sequencing method."""
+        return [self.loqusdb_api]
+
+    def check_loqusdb_duplicates(
+        self,
+        case_id: str,
+        input_files: MipDNAObservationsInputFiles,
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> None:
+        """Check that a MIP-DNA case or its profile has not been loaded to Loqusdb."""
+        for loqusdb_api in loqusdb_apis:
+            if self.is_loqusdb_duplicate(
+                case_id=case_id,
+                loqusdb_api=loqusdb_api,
+                profile_vcf_path=input_files.profile_vcf_path,
+                profile_threshold=MipDNALoadParameters.PROFILE_THRESHOLD.value,
+            ):
+                LOG.error(f"Case {case_id} has already been uploaded to {repr(loqusdb_api)}")
+                raise LoqusdbDuplicateRecordError
+
+    def load_observations_to_loqusdb(
+        self,
+        case_id: str,
+        input_files: MipDNAObservationsInputFiles,
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> str:
+        """Load observation counts of a MIP-DNA case to Loqusdb and return its Loqusdb ID."""
+        loqusdb_id: str = ""
+        for loqusdb_api in loqusdb_apis:
+            load_output: dict = loqusdb_api.load(
+                case_id=case_id,
+                snv_vcf_path=input_files.snv_vcf_path,
+                sv_vcf_path=input_files.sv_vcf_path,
+                profile_vcf_path=input_files.profile_vcf_path,
+                family_ped_path=input_files.family_ped_path,
+                gq_threshold=MipDNALoadParameters.GQ_THRESHOLD.value,
+                hard_threshold=MipDNALoadParameters.HARD_THRESHOLD.value,
+                soft_threshold=MipDNALoadParameters.SOFT_THRESHOLD.value,
+            )
+            loqusdb_id = str(loqusdb_api.get_case(case_id=case_id)[LOQUSDB_ID])
+            LOG.info(f"Uploaded {load_output['variants']} variants to {repr(loqusdb_api)}")
+        return loqusdb_id
 
     def extract_observations_files_from_hk(
         self, hk_version: Version
@@ -1,21 +1,38 @@
 """Observations API."""
 
 import logging
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional, Union
+from subprocess import CalledProcessError
+from threading import Lock
+from typing import Dict, List, Optional, Tuple, Union
 
 from housekeeper.store.models import Version
+from pydantic import ValidationError
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.apps.loqus import LoqusdbAPI
-from cg.constants.observations import LoqusdbInstance, LoqusdbBalsamicCustomers, LoqusdbMipCustomers
-from cg.exc import LoqusdbUploadCaseError
-from cg.models.cg_config import CGConfig, CommonAppConfig
+from cg.constants.observations import (
+    LOQUSDB_MAX_CONCURRENT_UPLOADS,
+    LoqusdbInstance,
+    LoqusdbBalsamicCustomers,
+    LoqusdbMipCustomers,
+)
+from cg.exc import (
+    CaseNotFoundError,
+    LoqusdbDuplicateRecordError,
+    LoqusdbError,
+    LoqusdbUploadCaseError,
+)
+from cg.models.cg_config import CGConfig
 from cg.models.observations.input_files import (
     MipDNAObservationsInputFiles,
     BalsamicObservationsInputFiles,
 )
+from cg.models.observations.upload_report import ObservationsUploadReport
 from cg.store import Store
 from cg.store.models import Customer, Family, Analysis
 
@@ -26,12 +43,9 @@ class ObservationsAPI:
     """API to manage Loqusdb observations."""
 
     def __init__(self, config: CGConfig):
+        self.config: CGConfig = config
         self.store: Store = config.status_db
         self.housekeeper_api: HousekeeperAPI = config.housekeeper_api
-        self.loqusdb_config: CommonAppConfig = config.loqusdb
-        self.loqusdb_wes_config: CommonAppConfig = config.loqusdb_wes
-        self.loqusdb_somatic_config: CommonAppConfig = config.loqusdb_somatic
-        self.loqusdb_tumor_config: CommonAppConfig = config.loqusdb_tumor
 
     def upload(self, case: Family) -> None:
         """Upload observations to Loqusdb."""
@@ -52,37 +66,119 @@ class ObservationsAPI:
         )
         return self.extract_observations_files_from_hk(hk_version)
 
+    def upload_batch(
+        self, cases: List[Family], max_workers: int = LOQUSDB_MAX_CONCURRENT_UPLOADS
+    ) -> ObservationsUploadReport:
+        """Upload observations of many cases to Loqusdb, running the Loqusdb commands of several
+        cases concurrently. StatusDB and Housekeeper are only accessed from the calling thread.
+
+        The duplicate check and the load of a case hold the lock of each Loqusdb instance the case
+        is loaded to, so that a case is never checked against an instance while another case of
+        the batch, possibly of the same individual, is being loaded to it."""
+        report = ObservationsUploadReport()
+        start_time: float = time.perf_counter()
+        cases_input_files: Dict[
+            str, Union[MipDNAObservationsInputFiles, BalsamicObservationsInputFiles]
+        ] = {}
+        batch_sample_case_ids: Dict[str, str] = {}
+        for case in cases:
+            try:
+                self.check_customer_loqusdb_permissions(case.customer)
+                self.check_case_to_upload(case)
+                if case.loqusdb_uploaded_samples:
+                    LOG.error(f"Case {case.internal_id} has already been uploaded to Loqusdb")
+                    raise LoqusdbDuplicateRecordError
+                self.check_batch_duplicates(case=case, batch_sample_case_ids=batch_sample_case_ids)
+                cases_input_files[case.internal_id] = self.get_observations_input_files(case)
+            except (LoqusdbError, CaseNotFoundError, FileNotFoundError, ValidationError) as error:
+                LOG.error(f"Error preparing observations for {case.internal_id}: {error}")
+                report.failed_case_ids.append(case.internal_id)
+        report.prepare_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        instance_locks: Dict[str, Lock] = {
+            loqusdb_api.config_path: Lock() for loqusdb_api in self.get_loqusdb_upload_apis()
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures: Dict[str, Future] = {
+                case_id: executor.submit(
+                    self.upload_to_loqusdb,
+                    case_id=case_id,
+                    input_files=input_files,
+                    instance_locks=instance_locks,
+                )
+                for case_id, input_files in cases_input_files.items()
+            }
+        loqusdb_ids: Dict[str, str] = {}
+        for case_id, future in futures.items():
+            try:
+                loqusdb_ids[case_id], report.case_seconds[case_id] = future.result()
+            except (LoqusdbError, CalledProcessError) as error:
+                LOG.error(f"Error uploading observations for {case_id}: {error}")
+                report.failed_case_ids.append(case_id)
+        report.loqusdb_seconds = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        for case in cases:
+            if case.internal_id in loqusdb_ids:
+                self.update_statusdb_loqusdb_id(
+                    samples=case.samples, loqusdb_id=loqusdb_ids[case.internal_id]
+                )
+                report.uploaded_case_ids.append(case.internal_id)
+        report.statusdb_seconds = time.perf_counter() - start_time
+        return report
+
+    @staticmethod
+    def check_batch_duplicates(case: Family, batch_sample_case_ids: Dict[str, str]) -> None:
+        """Check that a case shares no samples with the cases before it in a batch, as it would
+        be a duplicate of the profile of the first of them once loaded, and add its samples."""
+        sample_ids: List[str] = [sample.internal_id for sample in case.samples]
+        for sample_id in sample_ids:
+            if sample_id in batch_sample_case_ids:
+                LOG.error(
+                    f"Case {case.internal_id} shares sample {sample_id} with case "
+                    f"{batch_sample_case_ids[sample_id]} in the same upload"
+                )
+                raise LoqusdbDuplicateRecordError
+        batch_sample_case_ids.update({sample_id: case.internal_id for sample_id in sample_ids})
+
+    def upload_to_loqusdb(
+        self,
+        case_id: str,
+        input_files: Union[MipDNAObservationsInputFiles, BalsamicObservationsInputFiles],
+        instance_locks: Dict[str, Lock],
+    ) -> Tuple[str, float]:
+        """Check a case for duplicates and load its observations with copies of the Loqusdb APIs,
+        so that it can run in a thread, holding the locks of the Loqusdb instances. Return the
+        Loqusdb ID and the time taken."""
+        start_time: float = time.perf_counter()
+        loqusdb_apis: List[LoqusdbAPI] = [
+            loqusdb_api.clone() for loqusdb_api in self.get_loqusdb_upload_apis()
+        ]
+        with ExitStack() as locks:
+            for config_path in sorted(loqusdb_api.config_path for loqusdb_api in loqusdb_apis):
+                locks.enter_context(instance_locks[config_path])
+            self.check_loqusdb_duplicates(
+                case_id=case_id, input_files=input_files, loqusdb_apis=loqusdb_apis
+            )
+            loqusdb_id: str = self.load_observations_to_loqusdb(
+                case_id=case_id, input_files=input_files, loqusdb_apis=loqusdb_apis
+            )
+        return loqusdb_id, time.perf_counter() - start_time
+
     def get_loqusdb_api(self, loqusdb_instance: LoqusdbInstance) -> LoqusdbAPI:
         """Returns a Loqusdb API for the given Loqusdb instance."""
-        loqusdb_apis = {
-            LoqusdbInstance.WGS: LoqusdbAPI(
-                binary_path=self.loqusdb_config.binary_path,
-                config_path=self.loqusdb_config.config_path,
-            ),
-            LoqusdbInstance.WES: LoqusdbAPI(
-                binary_path=self.loqusdb_wes_config.binary_path,
-                config_path=self.loqusdb_wes_config.config_path,
-            ),
-            LoqusdbInstance.SOMATIC: LoqusdbAPI(
-                binary_path=self.loqusdb_somatic_config.binary_path,
-                config_path=self.loqusdb_somatic_config.config_path,
-            ),
-            LoqusdbInstance.TUMOR: LoqusdbAPI(
-                binary_path=self.loqusdb_tumor_config.binary_path,
-                config_path=self.loqusdb_tumor_config.config_path,
-            ),
-        }
-        return loqusdb_apis[loqusdb_instance]
+        return self.config.get_loqusdb_api(loqusdb_instance)
 
     @staticmethod
-    def is_duplicate(
-        case: Family,
+    def is_loqusdb_duplicate(
+        case_id: str,
         loqusdb_api: LoqusdbAPI,
         profile_vcf_path: Optional[Path],
         profile_threshold: Optional[float],
     ) -> bool:
-        """Check if a case has already been uploaded to Loqusdb."""
-        loqusdb_case: dict = loqusdb_api.get_case(case_id=case.internal_id)
+        """Check if a case or a matching profile has already been loaded to a Loqusdb instance."""
+        loqusdb_case: dict = loqusdb_api.get_case(case_id=case_id)
         duplicate = (
             loqusdb_api.get_duplicate(
                 profile_vcf_path=profile_vcf_path, profile_threshold=profile_threshold
@@ -90,7 +186,23 @@ class ObservationsAPI:
             if profile_vcf_path and profile_threshold
             else None
         )
-        return bool(loqusdb_case or duplicate or case.loqusdb_uploaded_samples)
+        return bool(loqusdb_case or duplicate)
+
+    @staticmethod
+    def is_duplicate(
+        case: Family,
+        loqusdb_api: LoqusdbAPI,
+        profile_vcf_path: Optional[Path],
+        profile_threshold: Optional[float],
+    ) -> bool:
+        """Check if a case has already been uploaded to Loqusdb."""
+        is_loqusdb_duplicate: bool = ObservationsAPI.is_loqusdb_duplicate(
+            case_id=case.internal_id,
+            loqusdb_api=loqusdb_api,
+            profile_vcf_path=profile_vcf_path,
+            profile_threshold=profile_threshold,
+        )
+        return bool(is_loqusdb_duplicate or case.loqusdb_uploaded_samples)
 
     def update_statusdb_loqusdb_id(self, samples: List[Family], loqusdb_id: Optional[str]) -> None:
         """Update Loqusdb ID field in StatusDB for each of the provided samples."""
@@ -119,6 +231,32 @@ class ObservationsAPI:
         """Load observation counts to Loqusdb."""
         raise NotImplementedError
 
+    def check_case_to_upload(self, case: Family) -> None:
+        """Check that a case can be uploaded to Loqusdb, without running Loqusdb commands."""
+        raise NotImplementedError
+
+    def get_loqusdb_upload_apis(self) -> List[LoqusdbAPI]:
+        """Return the Loqusdb APIs that the observations of a case are loaded to."""
+        raise NotImplementedError
+
+    def check_loqusdb_duplicates(
+        self,
+        case_id: str,
+        input_files: Union[MipDNAObservationsInputFiles, BalsamicObservationsInputFiles],
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> None:
+        """Check that a case has not been loaded to any of the Loqusdb instances."""
+        raise NotImplementedError
+
+    def load_observations_to_loqusdb(
+        self,
+        case_id: str,
+        input_files: Union[MipDNAObservationsInputFiles, BalsamicObservationsInputFiles],
+        loqusdb_apis: List[LoqusdbAPI],
+    ) -> str:
+        """Load observation counts of a case to the Loqusdb instances and return its Loqusdb ID."""
+        raise NotImplementedError
+
     def extract_observations_files_from_hk(
         self, hk_version: Version
     ) -> Union[MipDNAObservationsInputFiles, BalsamicObservationsInputFiles]:
@@ -86,9 +86,7 @@ class MipDNAReportAPI(ReportAPI):
             case_internal_id=case.internal_id
         )[0].sample
         lims_sample = self.get_lims_sample(case_sample.internal_id)
-        application: Application = self.status_db.get_application_by_tag(
-            tag=lims_sample.get("application")
-        )
+        application: Application = self.get_application(tag=lims_sample.get("application"))
 
         return application.analysis_type if application else None
 
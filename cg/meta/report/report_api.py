@@ -1,9 +1,12 @@
 """Module to create delivery reports"""
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from functools import lru_cache
 import logging
 from pathlib import Path
-from typing import TextIO, Optional, List
+from typing import Dict, Iterator, TextIO, Optional, List, Set
 
 import requests
 from sqlalchemy.orm import Query
@@ -12,6 +15,7 @@ from cgmodels.cg.constants import Pipeline
 from housekeeper.store.models import File, Version
 
 from cg.constants.constants import FileFormat, MAX_ITEMS_TO_RETRIEVE
+from cg.constants.lims import LIMS_MAX_CONCURRENT_REQUESTS
 from cg.exc import DeliveryReportError
 from cg.io.controller import WriteStream
 from cg.meta.report.field_validators import get_missing_report_data, get_empty_report_data
@@ -35,12 +39,25 @@ from jinja2 import Environment, PackageLoader, select_autoescape
 LOG = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def get_report_environment() -> Environment:
+    """Returns the Jinja environment of the report templates, which keeps the compiled templates."""
+
+    return Environment(
+        loader=PackageLoader("cg", "meta/report/templates"),
+        autoescape=select_autoescape(["html", "xml"]),
+    )
+
+
 class ReportAPI(MetaAPI):
     """Common Delivery Report API."""
 
     def __init__(self, config: CGConfig, analysis_api: AnalysisAPI):
         super().__init__(config=config)
         self.analysis_api = analysis_api
+        self.lims_samples: Dict[str, dict] = {}
+        self.sample_methods: Dict[str, MethodsModel] = {}
+        self.applications: Dict[str, Optional[Application]] = {}
 
     def create_delivery_report(
         self, case_id: str, analysis_date: datetime, force_report: bool
@@ -115,14 +132,58 @@ class ReportAPI(MetaAPI):
     def render_delivery_report(self, report_data: dict) -> str:
         """Renders the report on the Jinja template."""
 
-        env = Environment(
-            loader=PackageLoader("cg", "meta/report/templates"),
-            autoescape=select_autoescape(["html", "xml"]),
-        )
-        template_name = self.get_template_name()
-        template = env.get_template(template_name)
+        template = get_report_environment().get_template(self.get_template_name())
         return template.render(**report_data)
 
+    def prefetch_report_data(self, cases: List[Family]) -> None:
+        """Fetches the LIMS samples, methods and applications of the case samples at once."""
+
+        sample_ids: List[str] = sorted(
+            {sample.internal_id for case in cases for sample in case.samples}
+        )
+        LOG.info(f"Fetching report data of {len(sample_ids)} samples from LIMS")
+        try:
+            lims_samples: Dict[str, dict] = self.lims_api.samples(sample_ids)
+            self.lims_samples.update(
+                {sample_id: lims_samples.get(sample_id, dict()) for sample_id in sample_ids}
+            )
+        except requests.exceptions.HTTPError as ex:
+            LOG.info("Could not fetch samples from LIMS: %s", ex)
+        with ThreadPoolExecutor(max_workers=LIMS_MAX_CONCURRENT_REQUESTS) as executor:
+            self.sample_methods.update(
+                zip(sample_ids, executor.map(self.get_sample_methods_data, sample_ids))
+            )
+
+        tags: Set[str] = {
+            lims_sample.get("application")
+            for lims_sample in self.lims_samples.values()
+            if lims_sample.get("application")
+        }
+        self.applications.update(dict.fromkeys(tags))
+        self.applications.update(
+            {
+                application.tag: application
+                for application in self.status_db.get_applications_by_tags(tags=list(tags))
+            }
+        )
+
+    def clear_report_data(self) -> None:
+        """Removes the prefetched report data."""
+
+        self.lims_samples.clear()
+        self.sample_methods.clear()
+        self.applications.clear()
+
+    @contextmanager
+    def prefetched_report_data(self, cases: List[Family]) -> Iterator[None]:
+        """Generates the delivery reports of the cases within the context from prefetched data."""
+
+        self.prefetch_report_data(cases=cases)
+        try:
+            yield
+        finally:
+            self.clear_report_data()
+
     def get_cases_without_delivery_report(self, pipeline: Pipeline) -> List[Family]:
         """Returns a list of cases that has been stored and need a delivery report."""
 
@@ -283,6 +344,9 @@ class ReportAPI(MetaAPI):
     def get_lims_sample(self, sample_id: str) -> Optional[dict]:
         """Fetches sample data from LIMS. Returns an empty dictionary if the request was unsuccessful."""
 
+        if sample_id in self.lims_samples:
+            return self.lims_samples[sample_id]
+
         lims_sample = dict()
         try:
             lims_sample = self.lims_api.sample(sample_id)
@@ -291,12 +355,18 @@ class ReportAPI(MetaAPI):
 
         return lims_sample
 
+    def get_application(self, tag: str) -> Optional[Application]:
+        """Returns the application of a tag, if prefetched, or from status DB."""
+
+        if tag in self.applications:
+            return self.applications[tag]
+
+        return self.status_db.get_application_by_tag(tag=tag)
+
     def get_sample_application_data(self, lims_sample: dict) -> ApplicationModel:
         """Retrieves the analysis application attributes."""
 
-        application: Application = self.status_db.get_application_by_tag(
-            tag=lims_sample.get("application")
-        )
+        application: Optional[Application] = self.get_application(lims_sample.get("application"))
 
         return (
             ApplicationModel(
@@ -326,6 +396,9 @@ class ReportAPI(MetaAPI):
     def get_sample_methods_data(self, sample_id: str) -> MethodsModel:
         """Fetches sample library preparation and sequencing methods from LIMS."""
 
+        if sample_id in self.sample_methods:
+            return self.sample_methods[sample_id]
+
         library_prep = None
         sequencing = None
         try:
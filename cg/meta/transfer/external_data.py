@@ -1,7 +1,7 @@
 import datetime as dt
 import logging
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from cg.apps.cgstats.db.models import Version
 from cg.apps.slurm.slurm_api import SlurmAPI
@@ -11,7 +11,8 @@ from cg.meta.rsync.sbatch import ERROR_RSYNC_FUNCTION, RSYNC_CONTENTS_COMMAND
 from cg.models.cg_config import CGConfig
 from cg.models.slurm.sbatch import Sbatch
 from cg.store.models import Sample, Customer
-from cg.utils.checksum.checksum import check_md5sum, extract_md5sum
+from cg.utils.checksum.checksum import check_md5sum, extract_md5sum, get_file_checksums
+from cg.utils.checksum.checksum_cache import ChecksumCache
 
 LOG = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ class ExternalDataAPI(MetaAPI):
         self.account: str = config.data_delivery.account
         self.mail_user: str = config.data_delivery.mail_user
         self.slurm_api: SlurmAPI = SlurmAPI()
+        self.checksum_cache: Optional[ChecksumCache] = config.checksum_cache_api
         self.RSYNC_FILE_POSTFIX: str = "_rsync_external_data"
 
     def create_log_dir(self, dry_run: bool, ticket: str) -> Path:
@@ -108,7 +110,9 @@ class ExternalDataAPI(MetaAPI):
         """Returns the path of the input file if it does not match its md5sum"""
         if Path(str(fastq_path) + ".md5").exists():
             given_md5sum: str = extract_md5sum(md5sum_file=Path(str(fastq_path) + ".md5"))
-            if not check_md5sum(file_path=fastq_path, md5sum=given_md5sum):
+            if not check_md5sum(
+                file_path=fastq_path, md5sum=given_md5sum, checksum_cache=self.checksum_cache
+            ):
                 return fastq_path
 
     def get_available_samples(self, folder: Path, ticket: str) -> List[Sample]:
@@ -130,11 +134,21 @@ class ExternalDataAPI(MetaAPI):
             self.housekeeper_api.add_file(path=path, version_obj=last_version, tags=HK_FASTQ_TAGS)
 
     def get_failed_fastq_paths(self, fastq_paths_to_add: List[Path]) -> List[Path]:
+        """Returns the paths of the fastq files that do not match their md5sums, hashing the
+        files concurrently"""
+        given_md5sums: Dict[Path, str] = {
+            path: extract_md5sum(md5sum_file=Path(f"{path}.md5"))
+            for path in fastq_paths_to_add
+            if Path(f"{path}.md5").exists()
+        }
+        calculated_md5sums: Dict[Path, str] = get_file_checksums(
+            file_paths=list(given_md5sums), checksum_cache=self.checksum_cache
+        )
         failed_sum_paths: List[Path] = []
-        for path in fastq_paths_to_add:
-            failed_path: Optional[Path] = self.check_fastq_md5sum(path)
-            if failed_path:
-                failed_sum_paths.append(failed_path)
+        for path, given_md5sum in given_md5sums.items():
+            if calculated_md5sums[path] != given_md5sum:
+                LOG.info(f"The given md5sum does not match the md5sum for file {path}")
+                failed_sum_paths.append(path)
         return failed_sum_paths
 
     def get_fastq_paths_to_add(
@@ -3,14 +3,16 @@
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 
-from housekeeper.store.models import Bundle, Version
+from housekeeper.store.models import File, Version
 from cg.apps.cgstats.stats import StatsAPI
 from cg.apps.housekeeper.hk import HousekeeperAPI
 from cg.constants import FlowCellStatus
 from cg.constants.demultiplexing import DemultiplexingDirsAndFiles
 from cg.constants.housekeeper_tags import SequencingFileTag
+from cg.meta.workflow.fastq import FastqHandler
+from cg.meta.workflow.fastq_header_index import FastqHeaderIndex
 from cg.models.cgstats.flowcell import StatsFlowcell
 from cg.store import Store
 from cg.store.models import Sample, Flowcell
@@ -41,10 +43,17 @@ def log_enough_reads(
 class TransferFlowCell:
     """Transfer flow cell API."""
 
-    def __init__(self, db: Store, stats_api: StatsAPI, hk_api: HousekeeperAPI):
+    def __init__(
+        self,
+        db: Store,
+        stats_api: StatsAPI,
+        hk_api: HousekeeperAPI,
+        fastq_header_index: Optional[FastqHeaderIndex] = None,
+    ):
         self.db: Store = db
         self.stats: StatsAPI = stats_api
         self.hk: HousekeeperAPI = hk_api
+        self.fastq_header_index: Optional[FastqHeaderIndex] = fastq_header_index
 
     def transfer(self, flow_cell_dir: Path, flow_cell_id: str, store: bool = True) -> Flowcell:
         """Populate the database with the information."""
@@ -92,25 +101,31 @@ class TransferFlowCell:
         store: bool,
     ) -> None:
         """Adds fastq to Housekeeper, set sequenced at for sample, add samples to flow cell."""
+        status_db_samples: Dict[str, Sample] = {
+            sample.internal_id: sample
+            for sample in self.db.get_samples_by_internal_ids(
+                internal_ids=[cgstats_sample.name for cgstats_sample in cgstats_flow_cell.samples]
+            )
+        }
+        if store:
+            self._store_bundles_sequencing_files(
+                flow_cell_id=flow_cell_id,
+                bundle_sequencing_files={
+                    cgstats_sample.name: cgstats_sample.fastqs
+                    for cgstats_sample in cgstats_flow_cell.samples
+                    if cgstats_sample.name in status_db_samples
+                },
+                tag_name=SequencingFileTag.FASTQ,
+            )
         for cgstats_sample in cgstats_flow_cell.samples:
             LOG.debug(f"Adding reads/FASTQs to sample: {cgstats_sample.name}")
 
-            status_db_sample: Sample = self.db.get_sample_by_internal_id(
-                internal_id=cgstats_sample.name
-            )
+            status_db_sample: Optional[Sample] = status_db_samples.get(cgstats_sample.name)
 
             if not status_db_sample:
                 LOG.warning(f"Unable to find sample: {cgstats_sample.name}")
                 continue
 
-            if store:
-                self._store_sequencing_files(
-                    flow_cell_id=flow_cell_id,
-                    sample_id=status_db_sample.internal_id,
-                    sequencing_files=cgstats_sample.fastqs,
-                    tag_name=SequencingFileTag.FASTQ,
-                )
-
             status_db_sample.reads = cgstats_sample.reads
 
             _set_status_db_sample_sequenced_at(
@@ -179,13 +194,6 @@ class TransferFlowCell:
                 tag_name=SequencingFileTag.CGSTATS_LOG,
             )
 
-    def _check_if_sequencing_file_is_on_bundle(self, file: str, bundle: Bundle) -> bool:
-        """Check if file name is already on bundle."""
-        latest_version: Version = self.hk.get_latest_bundle_version(bundle_name=bundle.name)
-        return any(
-            Path(file).name == Path(bundle_file.path).name for bundle_file in latest_version.files
-        )
-
     def _store_sequencing_files(
         self,
         flow_cell_id: str,
@@ -194,19 +202,65 @@ class TransferFlowCell:
         sample_id: Optional[str] = None,
     ) -> None:
         """Store sequencing file(s) in Housekeeper."""
-        bundle_name: str = sample_id or flow_cell_id
-        hk_bundle: Optional[Bundle] = self.hk.bundle(bundle_name)
-        if not hk_bundle:
-            hk_bundle: Bundle = self.hk.create_new_bundle_and_version(name=bundle_name)
+        self._store_bundles_sequencing_files(
+            flow_cell_id=flow_cell_id,
+            bundle_sequencing_files={sample_id or flow_cell_id: sequencing_files},
+            tag_name=tag_name,
+        )
 
+    def _store_bundles_sequencing_files(
+        self, flow_cell_id: str, bundle_sequencing_files: Dict[str, List[str]], tag_name: str
+    ) -> None:
+        """Store the sequencing files of bundles in Housekeeper in a single transaction.
+        The latest versions of the bundles and their files are fetched with one query each and
+        files whose name is already in the latest version of their bundle are skipped."""
+        if not bundle_sequencing_files:
+            return
         with self.hk.session_no_autoflush():
-            for file in sequencing_files:
-                if self._check_if_sequencing_file_is_on_bundle(file=file, bundle=hk_bundle):
-                    LOG.info(f"Found file: {file}.")
-                    LOG.info("Skipping file")
-                else:
+            latest_versions: Dict[str, Version] = self.hk.get_or_create_latest_versions(
+                bundle_names=list(bundle_sequencing_files)
+            )
+            version_ids: List[int] = [
+                version.id for version in latest_versions.values() if version.id
+            ]
+            version_file_names: Dict[int, Set[str]] = {
+                version_id: set() for version_id in version_ids
+            }
+            if version_ids:
+                for hk_file in self.hk.get_files_from_versions(version_ids=version_ids, tags=[]):
+                    version_file_names[hk_file.version_id].add(Path(hk_file.path).name)
+            new_hk_files: List[File] = []
+            for bundle_name, sequencing_files in bundle_sequencing_files.items():
+                version: Version = latest_versions[bundle_name]
+                file_names: Set[str] = version_file_names.get(version.id, set())
+                new_files: List[Path] = []
+                for file in sequencing_files:
+                    if Path(file).name in file_names:
+                        LOG.info(f"Found file: {file}.")
+                        LOG.info("Skipping file")
+                        continue
                     LOG.info(f"Found new file: {file}.")
                     LOG.info(f"Adding file using tag: {tag_name}")
-                    self.hk.add_and_include_file_to_latest_version(
-                        bundle_name=bundle_name, file=Path(file), tags=[tag_name, flow_cell_id]
+                    file_names.add(Path(file).name)
+                    new_files.append(Path(file))
+                new_hk_files.extend(
+                    self.hk.add_and_include_files(
+                        version=version,
+                        file_paths=new_files,
+                        tags=[tag_name, flow_cell_id],
                     )
+                )
+            self.hk.commit()
+        LOG.info(f"Added {len(new_hk_files)} files to Housekeeper using tag: {tag_name}")
+        if tag_name == SequencingFileTag.FASTQ and self.fastq_header_index:
+            for hk_file in new_hk_files:
+                self._index_fastq_header(fastq_path=hk_file.full_path)
+
+    def _index_fastq_header(self, fastq_path: str) -> None:
+        """Add the header data of a FASTQ file to the FASTQ header index."""
+        try:
+            self.fastq_header_index.get_file_data(
+                fastq_path=fastq_path, parse_file_data=FastqHandler.parse_file_data
+            )
+        except (OSError, TypeError, ValueError) as error:
+            LOG.warning(f"Could not index FASTQ header of {fastq_path}: {error}")
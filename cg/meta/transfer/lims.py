@@ -1,6 +1,8 @@
+import datetime as dt
 import logging
+import time
 from enum import Enum
-from typing import Dict, Union, List
+from typing import Dict, Optional, Union, List
 
 from cg.store.models import Pool, Sample
 import genologics.entities
@@ -58,6 +60,14 @@ class TransferLims(object):
             PoolState.DELIVERED: self.lims.get_delivery_date,
         }
 
+        self._batch_date_functions = {
+            SampleState.RECEIVED: self.lims.get_received_dates,
+            SampleState.PREPARED: self.lims.get_prepared_dates,
+            SampleState.DELIVERED: self.lims.get_delivery_dates,
+            PoolState.RECEIVED: self.lims.get_received_dates,
+            PoolState.DELIVERED: self.lims.get_delivery_dates,
+        }
+
     def _get_samples_not_yet_delivered(self):
         return self.status.get_samples_not_delivered()
 
@@ -94,6 +104,46 @@ class TransferLims(object):
             else:
                 LOG.debug(f"no {status_type.value} date found for {sample_obj.internal_id}")
 
+    def transfer_samples_in_batch(
+        self, status_type: SampleState, include: str = "unset", sample_id: str = None
+    ) -> None:
+        """Transfer information about samples, fetching the LIMS dates in batches and
+        committing all updates in one transaction."""
+        start_time: float = time.time()
+        if sample_id:
+            samples: List[Sample] = self.status.get_samples_by_internal_id(internal_id=sample_id)
+        else:
+            samples: List[Sample] = self._get_samples_to_include(include, status_type)
+
+        if samples is None:
+            LOG.info(f"No samples to process found with {include} {status_type.value}")
+            return
+        LOG.info(f"{len(samples)} samples to process")
+
+        lims_dates: Dict[str, dt.date] = self._batch_date_functions[status_type](
+            [sample_obj.internal_id for sample_obj in samples]
+        )
+        updated_samples: int = 0
+        for sample_obj in samples:
+            lims_date: Optional[dt.date] = lims_dates.get(sample_obj.internal_id)
+            statusdb_date: Optional[dt.datetime] = getattr(sample_obj, f"{status_type.value}_at")
+            if not lims_date:
+                LOG.debug(f"no {status_type.value} date found for {sample_obj.internal_id}")
+                continue
+            if statusdb_date and statusdb_date.date() == lims_date:
+                continue
+
+            LOG.info(
+                f"Found new {status_type.value} date for {sample_obj.internal_id}: "
+                f"{lims_date}, old value: {statusdb_date} "
+            )
+            setattr(sample_obj, f"{status_type.value}_at", lims_date)
+            updated_samples += 1
+        self.status.session.commit()
+        self._log_throughput(
+            processed=len(samples), updated=updated_samples, start_time=start_time, unit="samples"
+        )
+
     def _get_samples_to_include(self, include, status_type):
         samples = None
         if include == IncludeOptions.UNSET.value:
@@ -134,6 +184,57 @@ class TransferLims(object):
                 self.status.session.commit()
                 break
 
+    def transfer_pools_in_batch(self, status_type: PoolState) -> None:
+        """Transfer information about pools, fetching the pool samples in batches and
+        committing all updates in one transaction."""
+        start_time: float = time.time()
+        pools: List[Pool] = self._pool_functions[status_type]()
+        updated_pools: int = 0
+        for pool_obj in pools:
+            ticket: str = pool_obj.ticket
+            samples_in_pool: List[genologics.entities.Sample] = (
+                self.lims.get_samples(projectname=ticket) if ticket else []
+            )
+            if not self._is_pool_valid(pool_obj, ticket, len(samples_in_pool)):
+                continue
+
+            valid_sample_ids: List[str] = [
+                sample_obj.id
+                for sample_obj in self.lims.load_samples(samples=samples_in_pool)
+                if self._is_sample_valid(pool_obj, sample_obj)
+            ]
+            status_dates: Dict[str, dt.date] = self._batch_date_functions[status_type](
+                valid_sample_ids
+            )
+            status_date: Optional[dt.date] = next(
+                (
+                    status_dates[sample_id]
+                    for sample_id in valid_sample_ids
+                    if status_dates.get(sample_id)
+                ),
+                None,
+            )
+            if status_date is None:
+                continue
+
+            LOG.info(f"Found {status_type.value} date for pool id {pool_obj.id}: {status_date}")
+            setattr(pool_obj, f"{status_type.value}_at", status_date)
+            updated_pools += 1
+        self.status.session.commit()
+        self._log_throughput(
+            processed=len(pools), updated=updated_pools, start_time=start_time, unit="pools"
+        )
+
+    @staticmethod
+    def _log_throughput(processed: int, updated: int, start_time: float, unit: str) -> None:
+        """Log the number of processed and updated records and the transfer rate."""
+        elapsed_seconds: float = time.time() - start_time
+        rate: float = processed / elapsed_seconds if elapsed_seconds else 0.0
+        LOG.info(
+            f"Updated {updated} of {processed} {unit} in {elapsed_seconds:.1f} s "
+            f"({rate:.1f} {unit}/s)"
+        )
+
     def _get_samples_in_step(self, status_type) -> List[Sample]:
         return self._sample_functions[status_type]()
 
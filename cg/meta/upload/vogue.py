@@ -1,15 +1,39 @@
 """API to run Vogue"""
 
 import datetime as dt
-from typing import Optional, List
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, Optional, List, Set
+
+from pydantic import BaseModel
 
 from cg.apps.gt import GenotypeAPI
 from cg.apps.vogue import VogueAPI
 from cg.constants.constants import FileFormat
-from cg.io.controller import ReadStream
+from cg.exc import CaseNotFoundError
+from cg.io.controller import ReadStream, WriteStream
 from cg.store import Store
 from cg.store.models import Application, Analysis
 
+LOG = logging.getLogger(__name__)
+
+
+class GenotypeLoadState(BaseModel):
+    """The high-water mark of the genotype data loaded into the trending database, with the
+    digests of the documents loaded since the start of the last export window."""
+
+    loaded_at: Optional[dt.datetime] = None
+    document_digests: Dict[str, str] = {}
+
+
+def get_document_digest(document: dict) -> str:
+    """Return a digest of the content of a document."""
+    document_stream: str = WriteStream.write_stream_from_content(
+        content=document, file_format=FileFormat.JSON
+    )
+    return hashlib.sha1(document_stream.encode()).hexdigest()
+
 
 class UploadVogueAPI:
     """API to load data into Vogue"""
@@ -36,6 +60,75 @@ class UploadVogueAPI:
             sample_dict["_id"] = sample_id
             self.vogue_api.load_genotype_data(sample_dict)
 
+    @staticmethod
+    def read_genotype_load_state(state_path: Path) -> GenotypeLoadState:
+        """Return the state of the previous genotype loads, if any."""
+        if not state_path.exists():
+            return GenotypeLoadState()
+        return GenotypeLoadState.parse_file(state_path)
+
+    @staticmethod
+    def write_genotype_load_state(state_path: Path, state: GenotypeLoadState) -> None:
+        """Save the state of the genotype loads, replacing the previous one at once."""
+        temporary_path: Path = state_path.with_suffix(".tmp")
+        temporary_path.write_text(state.json())
+        temporary_path.replace(state_path)
+
+    @staticmethod
+    def get_export_days(days: int, loaded_at: Optional[dt.datetime]) -> int:
+        """Return the number of days to export, which covers the time since the previous load
+        but is never more than the given number of days."""
+        if not loaded_at:
+            return days
+        return min(days, (dt.datetime.now() - loaded_at).days + 1)
+
+    def load_genotype_incremental(self, days: int, state_path: Path) -> int:
+        """Load the genotype documents that are new or changed since the previous load, with
+        concurrent vogue commands, and return the number of loaded documents."""
+        state: GenotypeLoadState = self.read_genotype_load_state(state_path=state_path)
+        export_days: int = self.get_export_days(days=days, loaded_at=state.loaded_at)
+        started_at: dt.datetime = dt.datetime.now()
+        document_digests: Dict[str, str] = {}
+        nr_loaded_documents: int = 0
+        has_failed_loads: bool = False
+        for document_type, export in [
+            ("sample", self.genotype_api.export_sample),
+            ("sample_analysis", self.genotype_api.export_sample_analysis),
+        ]:
+            try:
+                documents: dict = ReadStream.get_content_from_stream(
+                    file_format=FileFormat.JSON, stream=export(days=export_days)
+                )
+            except CaseNotFoundError:
+                LOG.info(f"No {document_type} documents in the last {export_days} days")
+                continue
+            new_documents: Dict[str, dict] = {}
+            for sample_id, sample_dict in documents.items():
+                sample_dict["_id"] = sample_id
+                document_key: str = f"{document_type}/{sample_id}"
+                document_digests[document_key] = get_document_digest(document=sample_dict)
+                if state.document_digests.get(document_key) != document_digests[document_key]:
+                    new_documents[document_key] = sample_dict
+            LOG.info(
+                f"Loading {len(new_documents)} new of {len(documents)} {document_type} documents"
+            )
+            loaded_ids: Set[str] = set(
+                self.vogue_api.load_genotype_data_bulk(genotype_dicts=list(new_documents.values()))
+            )
+            nr_loaded_documents += len(loaded_ids)
+            for document_key, sample_dict in new_documents.items():
+                if sample_dict["_id"] not in loaded_ids:
+                    document_digests.pop(document_key)
+                    has_failed_loads = True
+        self.write_genotype_load_state(
+            state_path=state_path,
+            state=GenotypeLoadState(
+                loaded_at=state.loaded_at if has_failed_loads else started_at,
+                document_digests=document_digests,
+            ),
+        )
+        return nr_loaded_documents
+
     def load_apptags(self) -> None:
         """Loading application tags from statusdb into the trending database"""
         applications: List[Application] = self.store.get_applications()
@@ -2,9 +2,10 @@ import datetime as dt
 import logging
 import os
 import shutil
+import threading
 from pathlib import Path
 from subprocess import CalledProcessError
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 
 import click
 from housekeeper.store.models import Bundle, Version
@@ -16,9 +17,11 @@ from cg.constants.priority import PRIORITY_TO_SLURM_QOS
 from cg.exc import BundleAlreadyAddedError, CgDataError, CgError
 from cg.meta.meta import MetaAPI
 from cg.meta.workflow.fastq import FastqHandler
+from cg.meta.workflow.fastq_header_index import FastqHeaderIndex
 from cg.models.analysis import AnalysisModel
 from cg.models.cg_config import CGConfig
 from cg.store.models import Analysis, BedVersion, Family, FamilySample, Sample
+from cg.utils import Process
 
 LOG = logging.getLogger(__name__)
 
@@ -31,7 +34,20 @@ class AnalysisAPI(MetaAPI):
     def __init__(self, pipeline: Pipeline, config: CGConfig):
         super().__init__(config=config)
         self.pipeline = pipeline
-        self._process = None
+        self._thread_local = threading.local()
+
+    @property
+    def _process(self) -> Optional[Process]:
+        """Return the process of the current thread.
+
+        Each thread that starts cases runs its own process, so that the output read after a
+        command is the output of that command.
+        """
+        return getattr(self._thread_local, "process", None)
+
+    @_process.setter
+    def _process(self, process: Optional[Process]) -> None:
+        self._thread_local.process = process
 
     @property
     def root(self):
@@ -275,19 +291,30 @@ class AnalysisAPI(MetaAPI):
     def get_cases_to_store(self) -> List[Family]:
         """Retrieve a list of cases where analysis finished successfully,
         and is ready to be stored in Housekeeper"""
+        running_cases: List[Family] = self.get_running_cases()
+        completed_ids: Set[str] = self.trailblazer_api.get_cases_with_latest_analysis_completed(
+            case_ids=[case_object.internal_id for case_object in running_cases]
+        )
         return [
-            case_object
-            for case_object in self.get_running_cases()
-            if self.trailblazer_api.is_latest_analysis_completed(case_id=case_object.internal_id)
+            case_object for case_object in running_cases if case_object.internal_id in completed_ids
         ]
 
     def get_sample_fastq_destination_dir(self, case: Family, sample: Sample):
         """Return the path to the FASTQ destination directory."""
         raise NotImplementedError
 
+    def parse_fastq_file_data(self, fastq_path: str) -> dict:
+        """Return the FASTQ header data, from the FASTQ header index if one is configured."""
+        fastq_header_index: Optional[FastqHeaderIndex] = self.config.fastq_header_index_api
+        if fastq_header_index is None:
+            return self.fastq_handler.parse_file_data(fastq_path)
+        return fastq_header_index.get_file_data(
+            fastq_path=fastq_path, parse_file_data=self.fastq_handler.parse_file_data
+        )
+
     def gather_file_metadata_for_sample(self, sample_obj: Sample) -> List[dict]:
         return [
-            self.fastq_handler.parse_file_data(file_obj.full_path)
+            self.parse_fastq_file_data(fastq_path=file_obj.full_path)
             for file_obj in self.housekeeper_api.files(
                 bundle=sample_obj.internal_id, tags=["fastq"]
             )
@@ -87,14 +87,19 @@ class BalsamicAnalysisAPI(AnalysisAPI):
         cases_query: List[Family] = self.status_db.cases_to_analyze(
             pipeline=self.pipeline, threshold=self.threshold_reads
         )
+        analyzed_case_ids: List[str] = [
+            case_obj.internal_id
+            for case_obj in cases_query
+            if case_obj.action != "analyze" and case_obj.latest_analyzed
+        ]
+        latest_analysis_statuses: Dict[
+            str, Optional[str]
+        ] = self.trailblazer_api.get_latest_analyses_statuses(case_ids=analyzed_case_ids)
         cases_to_analyze = []
         for case_obj in cases_query:
             if case_obj.action == "analyze" or not case_obj.latest_analyzed:
                 cases_to_analyze.append(case_obj)
-            elif (
-                self.trailblazer_api.get_latest_analysis_status(case_id=case_obj.internal_id)
-                == "failed"
-            ):
+            elif latest_analysis_statuses[case_obj.internal_id] == "failed":
                 cases_to_analyze.append(case_obj)
         return cases_to_analyze
 
@@ -0,0 +1,68 @@
+"""Start the analyses of several cases, optionally with a pool of workers."""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from cg.constants import Pipeline
+from cg.constants.process import MAX_CONCURRENT_CASE_STARTS, MAX_CONCURRENT_PROCESSES
+from cg.exc import CgError
+
+LOG = logging.getLogger(__name__)
+
+
+def get_case_start_workers(pipeline: Pipeline, workers: int) -> int:
+    """Return the number of workers to start cases with, limited by the pipeline."""
+    max_workers: int = MAX_CONCURRENT_CASE_STARTS.get(pipeline, MAX_CONCURRENT_PROCESSES)
+    if workers > max_workers:
+        LOG.info(f"Limiting the number of workers for {pipeline} to {max_workers}")
+    return max(min(workers, max_workers), 1)
+
+
+def _start_case(case_id: str, start_case: Callable[[str], None]) -> Optional[str]:
+    """Start the analysis of a case and return the error if it failed."""
+    try:
+        start_case(case_id)
+    except CgError as error:
+        LOG.error(error)
+        return str(error) or error.__class__.__name__
+    except Exception as error:
+        LOG.error(f"Unspecified error occurred: {error}")
+        return str(error) or error.__class__.__name__
+    return None
+
+
+def start_cases(
+    case_ids: List[str],
+    start_case: Callable[[str], None],
+    pipeline: Pipeline,
+    workers: int = 1,
+) -> Dict[str, str]:
+    """Start the analyses of cases and return the errors of the cases that failed.
+
+    With a single worker the cases are started one at a time in the calling thread. With more
+    workers the cases are started concurrently, each worker using its own database session and
+    its own process, so that the output of the commands of a case is not read by another case.
+    """
+    workers: int = get_case_start_workers(pipeline=pipeline, workers=workers)
+    LOG.info(f"Starting {len(case_ids)} {pipeline} cases with {workers} workers")
+    if workers == 1:
+        errors: List[Optional[str]] = [
+            _start_case(case_id=case_id, start_case=start_case) for case_id in case_ids
+        ]
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            errors: List[Optional[str]] = list(
+                executor.map(lambda case_id: _start_case(case_id, start_case), case_ids)
+            )
+    failed_cases: Dict[str, str] = {
+        case_id: error for case_id, error in zip(case_ids, errors) if error is not None
+    }
+    log_case_start_report(case_ids=case_ids, failed_cases=failed_cases)
+    return failed_cases
+
+
+def log_case_start_report(case_ids: List[str], failed_cases: Dict[str, str]) -> None:
+    """Log a summary of the started cases and the reason each failed case failed."""
+    LOG.info(f"Started {len(case_ids) - len(failed_cases)} of {len(case_ids)} cases")
+    for case_id, error in failed_cases.items():
+        LOG.error(f"Could not start {case_id}: {error}")
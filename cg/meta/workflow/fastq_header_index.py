@@ -0,0 +1,93 @@
+"""Persistent index of data parsed from FASTQ headers."""
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Callable, Optional, Union
+
+LOG = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS fastq_header (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    lane INTEGER NOT NULL,
+    flowcell TEXT NOT NULL,
+    read INTEGER NOT NULL,
+    undetermined INTEGER NOT NULL
+)
+"""
+
+
+class FastqHeaderIndex:
+    """Local index of the lane, flow cell and read number parsed from FASTQ headers.
+
+    Entries are keyed on the file path and are only valid as long as the size and modification
+    time of the file are unchanged, so a changed file is parsed again on the next lookup.
+    """
+
+    def __init__(self, index_path: Union[Path, str]):
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.index_path.as_posix(), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(CREATE_TABLE_SQL)
+
+    def get(self, fastq_path: Union[Path, str]) -> Optional[dict]:
+        """Return the indexed file data or None if missing or if the file has changed."""
+        file_stat: os.stat_result = os.stat(fastq_path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, lane, flowcell, read, undetermined FROM fastq_header "
+                "WHERE path = ?",
+                (str(fastq_path),),
+            ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, lane, flowcell, read, undetermined = row
+        if size != file_stat.st_size or mtime_ns != file_stat.st_mtime_ns:
+            LOG.debug(f"FASTQ file has changed since it was indexed: {fastq_path}")
+            self.remove(fastq_path=fastq_path)
+            return None
+        return {
+            "path": fastq_path,
+            "lane": lane,
+            "flowcell": flowcell,
+            "read": read,
+            "undetermined": bool(undetermined),
+        }
+
+    def add(self, fastq_path: Union[Path, str], file_data: dict) -> None:
+        """Add or replace the file data of a FASTQ file in the index."""
+        file_stat: os.stat_result = os.stat(fastq_path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO fastq_header VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    str(fastq_path),
+                    file_stat.st_size,
+                    file_stat.st_mtime_ns,
+                    file_data["lane"],
+                    file_data["flowcell"],
+                    file_data["read"],
+                    int(file_data["undetermined"]),
+                ),
+            )
+
+    def remove(self, fastq_path: Union[Path, str]) -> None:
+        """Remove a FASTQ file from the index."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM fastq_header WHERE path = ?", (str(fastq_path),))
+
+    def get_file_data(
+        self, fastq_path: Union[Path, str], parse_file_data: Callable[[Union[Path, str]], dict]
+    ) -> dict:
+        """Return the file data from the index, parsing and indexing the file on a miss."""
+        file_data: Optional[dict] = self.get(fastq_path=fastq_path)
+        if file_data is None:
+            file_data: dict = parse_file_data(fastq_path)
+            self.add(fastq_path=fastq_path, file_data=file_data)
+        return file_data
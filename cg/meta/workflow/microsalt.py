@@ -11,7 +11,7 @@ import re
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import glob
 
 import click
@@ -279,11 +279,11 @@ class MicrosaltAnalysisAPI(AnalysisAPI):
 
     def get_completed_cases(self) -> List[Family]:
         """Retrieve a list of cases that are completed in trailblazer."""
-        return [
-            case
-            for case in self.get_running_cases()
-            if self.trailblazer_api.is_latest_analysis_completed(case_id=case.internal_id)
-        ]
+        running_cases: List[Family] = self.get_running_cases()
+        completed_ids: Set[str] = self.trailblazer_api.get_cases_with_latest_analysis_completed(
+            case_ids=[case.internal_id for case in running_cases]
+        )
+        return [case for case in running_cases if case.internal_id in completed_ids]
 
     def resolve_case_sample_id(
         self, sample: bool, ticket: bool, unique_id: Any
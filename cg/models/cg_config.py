@@ -1,5 +1,5 @@
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 from pydantic import BaseModel, EmailStr, Field
 from typing_extensions import Literal
@@ -19,9 +19,12 @@ from cg.apps.mutacc_auto import MutaccAutoAPI
 from cg.apps.scout.scoutapi import ScoutAPI
 from cg.apps.tb import TrailblazerAPI
 from cg.apps.vogue import VogueAPI
+from cg.constants.lims import LIMS_CACHE_EXPIRE_AFTER, LIMS_CACHE_MAX_ENTRIES
 from cg.constants.observations import LoqusdbInstance
 from cg.constants.priority import SlurmQos
+from cg.meta.workflow.fastq_header_index import FastqHeaderIndex
 from cg.store import Store
+from cg.utils.checksum.checksum_cache import ChecksumCache
 
 LOG = logging.getLogger(__name__)
 
@@ -65,6 +68,13 @@ class SlurmConfig(BaseModel):
     qos: SlurmQos = SlurmQos.LOW
 
 
+class DatabasePoolConfig(BaseModel):
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_pre_ping: bool = True
+    pool_recycle: int = 7200
+
+
 class HousekeeperConfig(BaseModel):
     database: str
     root: str
@@ -74,6 +84,7 @@ class DemultiplexConfig(BaseModel):
     run_dir: str  # Base path to  un demultiplexed flowcells
     out_dir: str  # Base path to where the demultiplexed results lives
     slurm: SlurmConfig
+    sample_sheet_validation_cache: Optional[str] = None
 
 
 class TrailblazerConfig(BaseModel):
@@ -109,10 +120,17 @@ class FluffyConfig(CommonAppConfig):
     sftp: FluffyUploadConfig
 
 
+class LimsCacheConfig(BaseModel):
+    expire_after: int = LIMS_CACHE_EXPIRE_AFTER
+    max_entries: int = LIMS_CACHE_MAX_ENTRIES
+    path: Optional[str] = None
+
+
 class LimsConfig(BaseModel):
     host: str
     username: str
     password: str
+    cache: LimsCacheConfig = LimsCacheConfig()
 
 
 class CrunchyConfig(BaseModel):
@@ -233,6 +251,8 @@ class DDNDataFlowConfig(BaseModel):
 
 class CGConfig(BaseModel):
     database: str
+    database_pool: DatabasePoolConfig = DatabasePoolConfig()
+    database_read_only: Optional[str] = None
     environment: Literal["production", "stage"] = "stage"
     madeline_exe: str
     delivery_path: str
@@ -250,6 +270,8 @@ class CGConfig(BaseModel):
     cg_stats_api_: StatsAPI = None
     chanjo: CommonAppConfig = None
     chanjo_api_: ChanjoAPI = None
+    checksum_cache: Optional[str] = None
+    checksum_cache_api_: ChecksumCache = None
     clean: Optional[CleanConfig] = None
     crunchy: CrunchyConfig = None
     crunchy_api_: CrunchyAPI = None
@@ -259,6 +281,8 @@ class CGConfig(BaseModel):
     demultiplex_api_: DemultiplexingAPI = None
     encryption: Optional[CommonAppConfig] = None
     external: ExternalConfig = None
+    fastq_header_index: Optional[str] = None
+    fastq_header_index_api_: FastqHeaderIndex = None
     genotype: CommonAppConfig = None
     genotype_api_: GenotypeAPI = None
     gens: CommonAppConfig = None
@@ -269,6 +293,7 @@ class CGConfig(BaseModel):
     lims_api_: LimsAPI = None
     loqusdb: CommonAppConfig = Field(None, alias=LoqusdbInstance.WGS.value)
     loqusdb_api_: LoqusdbAPI = None
+    loqusdb_apis_: Dict[LoqusdbInstance, LoqusdbAPI] = {}
     loqusdb_wes: CommonAppConfig = Field(None, alias=LoqusdbInstance.WES.value)
     loqusdb_somatic: CommonAppConfig = Field(None, alias=LoqusdbInstance.SOMATIC.value)
     loqusdb_tumor: CommonAppConfig = Field(None, alias=LoqusdbInstance.TUMOR.value)
@@ -304,14 +329,17 @@ class CGConfig(BaseModel):
         fields = {
             "cg_stats_api_": "cg_stats_api",
             "chanjo_api_": "chanjo_api",
+            "checksum_cache_api_": "checksum_cache_api",
             "crunchy_api_": "crunchy_api",
             "demultiplex_api_": "demultiplex_api",
+            "fastq_header_index_api_": "fastq_header_index_api",
             "genotype_api_": "genotype_api",
             "gens_api_": "gens_api",
             "hermes_api_": "hermes_api",
             "housekeeper_api_": "housekeeper_api",
             "lims_api_": "lims_api",
             "loqusdb_api_": "loqusdb_api",
+            "loqusdb_apis_": "loqusdb_apis",
             "madeline_api_": "madeline_api",
             "mutacc_auto_api_": "mutacc_auto_api",
             "scout_api_": "scout_api",
@@ -356,6 +384,26 @@ class CGConfig(BaseModel):
             self.demultiplex_api_ = demultiplex_api
         return demultiplex_api
 
+    @property
+    def checksum_cache_api(self) -> Optional[ChecksumCache]:
+        """Return the checksum cache if a path to it has been configured."""
+        api = self.__dict__.get("checksum_cache_api_")
+        if api is None and self.checksum_cache:
+            LOG.debug("Instantiating checksum cache")
+            api = ChecksumCache(cache_path=self.checksum_cache)
+            self.checksum_cache_api_ = api
+        return api
+
+    @property
+    def fastq_header_index_api(self) -> Optional[FastqHeaderIndex]:
+        """Return the FASTQ header index if a path to it has been configured."""
+        api = self.__dict__.get("fastq_header_index_api_")
+        if api is None and self.fastq_header_index:
+            LOG.debug("Instantiating FASTQ header index")
+            api = FastqHeaderIndex(index_path=self.fastq_header_index)
+            self.fastq_header_index_api_ = api
+        return api
+
     @property
     def genotype_api(self) -> GenotypeAPI:
         api = self.__dict__.get("genotype_api_")
@@ -413,6 +461,25 @@ class CGConfig(BaseModel):
             self.loqusdb_api_ = api
         return api
 
+    def get_loqusdb_api(self, loqusdb_instance: LoqusdbInstance) -> LoqusdbAPI:
+        """Return the Loqusdb API of a Loqusdb instance, instantiated on first use and shared
+        afterwards."""
+        api: Optional[LoqusdbAPI] = self.loqusdb_apis_.get(loqusdb_instance)
+        if api is None:
+            LOG.debug(f"Instantiating {loqusdb_instance} api")
+            loqusdb_configs: Dict[LoqusdbInstance, CommonAppConfig] = {
+                LoqusdbInstance.WGS: self.loqusdb,
+                LoqusdbInstance.WES: self.loqusdb_wes,
+                LoqusdbInstance.SOMATIC: self.loqusdb_somatic,
+                LoqusdbInstance.TUMOR: self.loqusdb_tumor,
+            }
+            api = LoqusdbAPI(
+                binary_path=loqusdb_configs[loqusdb_instance].binary_path,
+                config_path=loqusdb_configs[loqusdb_instance].config_path,
+            )
+            self.loqusdb_apis_[loqusdb_instance] = api
+        return api
+
     @property
     def madeline_api(self) -> MadelineAPI:
         api = self.__dict__.get("madeline_api_")
@@ -445,7 +512,11 @@ class CGConfig(BaseModel):
         status_db = self.__dict__.get("status_db_")
         if status_db is None:
             LOG.debug("Instantiating status db")
-            status_db = Store(uri=self.database)
+            status_db = Store(
+                uri=self.database,
+                read_only_uri=self.database_read_only,
+                **self.database_pool.dict(),
+            )
             self.status_db_ = status_db
         return status_db
 
@@ -63,7 +63,7 @@ class DemuxResults:
     def conversion_stats(self) -> ConversionStats:
         if self._conversion_stats:
             return self._conversion_stats
-        self._conversion_stats = ConversionStats(self.conversion_stats_path)
+        self._conversion_stats = ConversionStats(self.conversion_stats_path, fast=True)
         return self._conversion_stats
 
     @property
@@ -77,14 +77,14 @@ class DemuxResults:
     def adapter_metrics(self) -> AdapterMetrics:
         if self._adapter_metrics:
             return self._adapter_metrics
-        self._adapter_metrics = AdapterMetrics(self.adapter_metrics_path)
+        self._adapter_metrics = AdapterMetrics(self.adapter_metrics_path, fast=True)
         return self._adapter_metrics
 
     @property
     def quality_metrics(self) -> QualityMetrics:
         if self._quality_metrics:
             return self._quality_metrics
-        self._quality_metrics = QualityMetrics(self.quality_metrics_path)
+        self._quality_metrics = QualityMetrics(self.quality_metrics_path, fast=True)
         return self._quality_metrics
 
     @property
@@ -0,0 +1,47 @@
+"""Loqusdb batch upload report models."""
+
+from typing import Dict, List
+
+from pydantic import BaseModel
+
+
+class ObservationsUploadReport(BaseModel):
+    """Model for the outcome and timing of an upload of the observations of many cases."""
+
+    uploaded_case_ids: List[str] = []
+    failed_case_ids: List[str] = []
+    case_seconds: Dict[str, float] = {}
+    prepare_seconds: float = 0
+    loqusdb_seconds: float = 0
+    statusdb_seconds: float = 0
+
+    @property
+    def total_seconds(self) -> float:
+        return self.prepare_seconds + self.loqusdb_seconds + self.statusdb_seconds
+
+    def add(self, report: "ObservationsUploadReport") -> None:
+        """Add the outcome and timing of another upload to the report."""
+        self.uploaded_case_ids.extend(report.uploaded_case_ids)
+        self.failed_case_ids.extend(report.failed_case_ids)
+        self.case_seconds.update(report.case_seconds)
+        self.prepare_seconds += report.prepare_seconds
+        self.loqusdb_seconds += report.loqusdb_seconds
+        self.statusdb_seconds += report.statusdb_seconds
+
+    def get_summary(self) -> List[str]:
+        """Return the lines of a summary of the upload."""
+        summary: List[str] = [
+            f"Uploaded {len(self.uploaded_case_ids)} cases, {len(self.failed_case_ids)} failed, "
+            f"in {self.total_seconds:.1f}s",
+            f"Preparing input files: {self.prepare_seconds:.1f}s",
+            f"Loading to Loqusdb: {self.loqusdb_seconds:.1f}s",
+            f"Updating StatusDB: {self.statusdb_seconds:.1f}s",
+        ]
+        if self.case_seconds:
+            slowest_case_id: str = max(self.case_seconds, key=self.case_seconds.get)
+            average_seconds: float = sum(self.case_seconds.values()) / len(self.case_seconds)
+            summary.append(
+                f"Loqusdb time per case: {average_seconds:.1f}s on average, "
+                f"{self.case_seconds[slowest_case_id]:.1f}s at most ({slowest_case_id})"
+            )
+        return summary
@@ -5,11 +5,12 @@ import json
 import tempfile
 from functools import wraps
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from cachetools import TTLCache
 
 import requests
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Query
 from urllib3.exceptions import MaxRetryError, NewConnectionError
 
 from cg.apps.orderform.excel_orderform_parser import ExcelOrderformParser
@@ -23,7 +24,18 @@ from cg.meta.orders import OrdersAPI
 from cg.store.models import Customer, Sample, Pool, Family, Application, Flowcell, Analysis, User
 from cg.models.orders.order import OrderIn, OrderType
 from cg.models.orders.orderform_schema import Orderform
-from flask import Blueprint, abort, current_app, g, jsonify, make_response, request
+from flask import (
+    Blueprint,
+    Response,
+    abort,
+    current_app,
+    g,
+    jsonify,
+    make_response,
+    request,
+    stream_with_context,
+)
+from flask.json import dumps as json_dumps
 from google.auth import jwt
 from pydantic import ValidationError
 from requests.exceptions import HTTPError
@@ -181,10 +193,45 @@ def submit_order(order_type):
         return abort(make_response(jsonify(message=error_message), http_error_response))
 
 
+def _get_page_arguments(default_limit: int) -> Tuple[int, int]:
+    """Return the offset and limit of the requested page."""
+    try:
+        offset: int = max(int(request.args.get("offset", 0)), 0)
+        limit: int = max(int(request.args.get("limit", default_limit)), 0)
+    except ValueError:
+        abort(
+            make_response(
+                jsonify(message="Offset and limit must be integers"), http.HTTPStatus.BAD_REQUEST
+            )
+        )
+    return offset, limit
+
+
+def _get_page(records: Query, default_limit: int) -> Tuple[Query, int]:
+    """Return the requested page of records, limited in the database, and the total count."""
+    offset, limit = _get_page_arguments(default_limit=default_limit)
+    total: int = records.order_by(None).count()
+    return records.offset(offset).limit(limit), total
+
+
+def _stream_records(
+    records_key: str, records: Iterable[Any], total: int, **to_dict_kwargs
+) -> Response:
+    """Return a JSON response streaming the records one at a time."""
+
+    def generate() -> Iterator[str]:
+        yield f'{{"{records_key}": ['
+        for index, record in enumerate(records):
+            yield ("," if index else "") + json_dumps(record.to_dict(**to_dict_kwargs))
+        yield f'], "total": {total}}}'
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
 @BLUEPRINT.route("/cases")
 def parse_cases():
     """Fetch cases."""
-    cases: List[Family] = db.get_cases_created_within_days(days=31)
+    cases: List[Family] = db.read_only_store.get_cases_created_within_days(days=31)
     return jsonify(cases=cases, total=len(cases))
 
 
@@ -197,16 +244,17 @@ def _get_current_customers() -> Optional[List[Customer]]:
 
 def _get_cases(
     status: str, enquiry: Optional[str], action: Optional[str], customers: Optional[List[Customer]]
-) -> List[Family]:
-    """Get cases based on the provided filters."""
+) -> Tuple[Query, int]:
+    """Get the requested page of cases based on the provided filters and the total count."""
     if status == "analysis":
-        return db.cases_to_analyze(pipeline=Pipeline.MIP_DNA)
-
-    return db.get_cases_by_customers_action_and_case_search(
-        case_search=enquiry,
-        customers=customers,
-        action=action,
-    )
+        cases: Query = db.read_only_store.get_cases_to_analyze_query(pipeline=Pipeline.MIP_DNA)
+    else:
+        cases: Query = db.read_only_store.get_cases_by_customers_action_and_case_search_query(
+            case_search=enquiry,
+            customers=customers,
+            action=action,
+        )
+    return _get_page(records=cases, default_limit=30)
 
 
 @BLUEPRINT.route("/families")
@@ -217,13 +265,8 @@ def get_families():
     action: str = request.args.get("action")
 
     customers: List[Customer] = _get_current_customers()
-    cases: List[Family] = _get_cases(
-        status=status, enquiry=enquiry, action=action, customers=customers
-    )
-
-    count = len(cases)
-    case_dicts = [case.to_dict(links=True) for case in cases]
-    return jsonify(families=case_dicts, total=count)
+    cases, total = _get_cases(status=status, enquiry=enquiry, action=action, customers=customers)
+    return _stream_records(records_key="families", records=cases, total=total, links=True)
 
 
 @BLUEPRINT.route("/families_in_collaboration")
@@ -236,7 +279,7 @@ def parse_families_in_collaboration():
 
     customer = db.get_customer_by_internal_id(customer_internal_id=customer_internal_id)
 
-    cases = db.get_cases_by_customer_pipeline_and_case_search(
+    cases = db.read_only_store.get_cases_by_customer_pipeline_and_case_search(
         case_search=case_search_pattern,
         customer=customer,
         pipeline=pipeline,
@@ -275,21 +318,20 @@ def parse_samples():
     if request.args.get("status") and not g.current_user.is_admin:
         return abort(http.HTTPStatus.FORBIDDEN)
     if request.args.get("status") == "incoming":
-        samples: List[Sample] = db.get_samples_to_receive()
+        samples: Query = db.read_only_store.get_samples_to_receive_query()
     elif request.args.get("status") == "labprep":
-        samples: List[Sample] = db.get_samples_to_prepare()
+        samples: Query = db.read_only_store.get_samples_to_prepare_query()
     elif request.args.get("status") == "sequencing":
-        samples: List[Sample] = db.get_samples_to_sequence()
+        samples: Query = db.read_only_store.get_samples_to_sequence_query()
     else:
         customers: Optional[List[Customer]] = (
             None if g.current_user.is_admin else g.current_user.customers
         )
-        samples: List[Sample] = db.get_samples_by_customer_id_and_pattern(
+        samples: Query = db.read_only_store.get_samples_by_customer_id_and_pattern_query(
             pattern=request.args.get("enquiry"), customers=customers
         )
-    limit = int(request.args.get("limit", 50))
-    parsed_samples: List[Dict] = [sample.to_dict() for sample in samples[:limit]]
-    return jsonify(samples=parsed_samples, total=len(samples))
+    page, total = _get_page(records=samples, default_limit=50)
+    return _stream_records(records_key="samples", records=page, total=total)
 
 
 @BLUEPRINT.route("/samples_in_collaboration")
@@ -298,12 +340,11 @@ def parse_samples_in_collaboration():
     customer: Customer = db.get_customer_by_internal_id(
         customer_internal_id=request.args.get("customer")
     )
-    samples: List[Sample] = db.get_samples_by_customer_id_and_pattern(
+    samples: Query = db.read_only_store.get_samples_by_customer_id_and_pattern_query(
         pattern=request.args.get("enquiry"), customers=customer.collaborators
     )
-    limit = int(request.args.get("limit", 50))
-    parsed_samples: List[Dict] = [sample.to_dict() for sample in samples[:limit]]
-    return jsonify(samples=parsed_samples, total=len(samples))
+    page, total = _get_page(records=samples, default_limit=50)
+    return _stream_records(records_key="samples", records=page, total=total)
 
 
 @BLUEPRINT.route("/samples/<sample_id>")
@@ -335,11 +376,11 @@ def parse_pools():
     customers: Optional[List[Customer]] = (
         g.current_user.customers if not g.current_user.is_admin else None
     )
-    pools: List[Pool] = db.get_pools_to_render(
+    pools: Query = db.read_only_store.get_pools_to_render_query(
         customers=customers, enquiry=request.args.get("enquiry")
     )
-    parsed_pools: List[Dict] = [pool_obj.to_dict() for pool_obj in pools[:30]]
-    return jsonify(pools=parsed_pools, total=len(pools))
+    page, total = _get_page(records=pools, default_limit=30)
+    return _stream_records(records_key="pools", records=page, total=total)
 
 
 @BLUEPRINT.route("/pools/<pool_id>")
@@ -356,12 +397,12 @@ def parse_pool(pool_id):
 @BLUEPRINT.route("/flowcells")
 def parse_flow_cells() -> Any:
     """Return flow cells."""
-    flow_cells: List[Flowcell] = db.get_flow_cell_by_name_pattern_and_status(
+    flow_cells: Query = db.read_only_store.get_flow_cell_by_name_pattern_and_status_query(
         flow_cell_statuses=[request.args.get("status")],
         name_pattern=request.args.get("enquiry"),
     )
-    parsed_flow_cells: List[Dict] = [flow_cell.to_dict() for flow_cell in flow_cells[:50]]
-    return jsonify(flowcells=parsed_flow_cells, total=len(flow_cells))
+    page, total = _get_page(records=flow_cells, default_limit=50)
+    return _stream_records(records_key="flowcells", records=page, total=total)
 
 
 @BLUEPRINT.route("/flowcells/<flowcell_id>")
@@ -377,13 +418,14 @@ def parse_flow_cell(flowcell_id):
 def parse_analyses():
     """Return analyses."""
     if request.args.get("status") == "delivery":
-        analyses: List[Analysis] = db.get_analyses_to_deliver_for_pipeline()
+        # The join to samples repeats analyses, so make them distinct to count and page them
+        analyses: Query = db.read_only_store.get_analyses_to_deliver_for_pipeline_query().distinct()
     elif request.args.get("status") == "upload":
-        analyses: List[Analysis] = db.get_analyses_to_upload()
+        analyses: Query = db.read_only_store.get_analyses_to_upload_query()
     else:
-        analyses: List[Analysis] = db.get_analyses()
-    parsed_analysis: List[Dict] = [analysis_obj.to_dict() for analysis_obj in analyses[:30]]
-    return jsonify(analyses=parsed_analysis, total=len(analyses))
+        analyses: Query = db.read_only_store.get_analyses_query()
+    page, total = _get_page(records=analyses, default_limit=30)
+    return _stream_records(records_key="analyses", records=page, total=total)
 
 
 @BLUEPRINT.route("/options")
@@ -7,6 +7,10 @@ TEMPLATES_AUTO_RELOAD = True
 
 # sqlalchemy
 SQLALCHEMY_DATABASE_URI = os.environ["CG_SQL_DATABASE_URI"]
+SQLALCHEMY_READ_ONLY_DATABASE_URI = os.environ.get("CG_SQL_READ_ONLY_DATABASE_URI")
+SQLALCHEMY_POOL_SIZE = int(os.environ.get("CG_SQL_POOL_SIZE", 5))
+SQLALCHEMY_MAX_OVERFLOW = int(os.environ.get("CG_SQL_MAX_OVERFLOW", 10))
+SQLALCHEMY_POOL_PRE_PING = True
 SQLALCHEMY_POOL_RECYCLE = 7200
 SQLALCHEMY_TRACK_MODIFICATIONS = "FLASK_DEBUG" in os.environ
 
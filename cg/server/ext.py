@@ -28,8 +28,14 @@ class FlaskStore(Store):
             self.init_app(app)
 
     def init_app(self, app):
-        uri = app.config["SQLALCHEMY_DATABASE_URI"]
-        super(FlaskStore, self).__init__(uri)
+        super(FlaskStore, self).__init__(
+            uri=app.config["SQLALCHEMY_DATABASE_URI"],
+            read_only_uri=app.config["SQLALCHEMY_READ_ONLY_DATABASE_URI"],
+            pool_size=app.config["SQLALCHEMY_POOL_SIZE"],
+            max_overflow=app.config["SQLALCHEMY_MAX_OVERFLOW"],
+            pool_pre_ping=app.config["SQLALCHEMY_POOL_PRE_PING"],
+            pool_recycle=app.config["SQLALCHEMY_POOL_RECYCLE"],
+        )
 
 
 cors = CORS(resources={r"/api/*": {"origins": "*"}}, supports_credentials=True)
@@ -1,8 +1,9 @@
 """All models aggregated in a base class"""
+
 from typing import Callable, Optional, Type, List
 
 from sqlalchemy.orm import Query, Session
-from sqlalchemy import and_, func
+from sqlalchemy import case, func
 from dataclasses import dataclass
 from cg.store.filters.status_case_filters import CaseFilter, apply_case_filter
 from cg.store.filters.status_customer_filters import CustomerFilter, apply_customer_filter
@@ -11,10 +12,13 @@ from cg.store.models import (
     Analysis,
     Application,
     ApplicationVersion,
+    CaseProgress,
     Customer,
     Family,
     FamilySample,
     Flowcell,
+    Invoice,
+    LatestAnalysis,
     Sample,
 )
 from cg.store.filters.status_analysis_filters import AnalysisFilter, apply_analysis_filter
@@ -87,26 +91,58 @@ class BaseHandler:
         """Return join analysis to sample to case query."""
         return self._get_query(table=Analysis).join(Family, Family.links, FamilySample.sample)
 
-    def _get_subquery_with_latest_case_analysis_date(self) -> Query:
-        """Return a subquery with the case internal id and the date of its latest analysis."""
-        case_and_date: Query = (
-            self._get_join_analysis_case_query()
-            .group_by(Family.id)
-            .with_entities(Analysis.family_id, func.max(Analysis.started_at).label("started_at"))
-            .subquery()
-        )
-        return case_and_date
+    def _get_join_cases_with_progress_query(self) -> Query:
+        """Return a join query for all cases in the database with their progress."""
+        return self._get_query(table=Family).join(CaseProgress, CaseProgress.family_id == Family.id)
 
     def _get_latest_analyses_for_cases_query(self) -> Query:
         """Return a join query for the latest analysis for each case."""
-        analyses: Query = self._get_query(table=Analysis)
-        case_and_date_subquery: Query = self._get_subquery_with_latest_case_analysis_date()
-        return analyses.join(
-            case_and_date_subquery,
-            and_(
-                Analysis.family_id == case_and_date_subquery.c.family_id,
-                Analysis.started_at == case_and_date_subquery.c.started_at,
-            ),
+        return self._get_query(table=Analysis).join(
+            LatestAnalysis, LatestAnalysis.analysis_id == Analysis.id
+        )
+
+    def _get_case_sample_aggregates_query(self, case_ids: Query) -> Query:
+        """Return a query with per case sample counts and dates for the given case ids."""
+        return (
+            self._get_query(table=FamilySample)
+            .join(FamilySample.sample, Sample.application_version, ApplicationVersion.application)
+            .outerjoin(Sample.invoice)
+            .filter(FamilySample.family_id.in_(case_ids))
+            .group_by(FamilySample.family_id)
+            .with_entities(
+                FamilySample.family_id.label("case_id"),
+                func.count(FamilySample.id).label("total_samples"),
+                func.sum(case([(Application.is_external, 1)], else_=0)).label(
+                    "total_external_samples"
+                ),
+                func.sum(case([(Sample.no_invoice, 1)], else_=0)).label("samples_no_invoice"),
+                func.count(Sample.received_at).label("samples_received"),
+                func.count(Sample.prepared_at).label("samples_prepared"),
+                func.count(Sample.sequenced_at).label("samples_sequenced"),
+                func.count(Sample.delivered_at).label("samples_delivered"),
+                func.count(Invoice.invoiced_at).label("samples_invoiced"),
+                func.max(Sample.received_at).label("samples_received_at"),
+                func.max(Sample.prepared_at).label("samples_prepared_at"),
+                func.max(Sample.sequenced_at).label("samples_sequenced_at"),
+                func.max(Sample.delivered_at).label("samples_delivered_at"),
+                func.max(Invoice.invoiced_at).label("samples_invoiced_at"),
+                func.max(Application.turnaround_time).label("max_tat"),
+            )
+        )
+
+    def _get_case_flow_cell_statuses_query(self, case_ids: Query) -> Query:
+        """Return a query with the distinct flow cells and their status for the given case ids."""
+        return (
+            self._get_query(table=FamilySample)
+            .join(FamilySample.sample, Sample.flowcells)
+            .filter(FamilySample.family_id.in_(case_ids))
+            .with_entities(
+                FamilySample.family_id.label("case_id"),
+                Flowcell.id.label("flow_cell_id"),
+                Flowcell.status.label("status"),
+            )
+            .distinct()
+            .order_by(FamilySample.family_id, Flowcell.id)
         )
 
     def _get_filtered_case_query(
@@ -1,7 +1,12 @@
 import logging
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from typing import List, Optional
 
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
+
+from cg.exc import CgError
+from cg.store.case_progress import refresh_case_progress, track_case_progress
 from cg.store.models import Model
 from cg.store.api.delete import DeleteDataHandler
 from cg.store.api.find_business_data import FindBusinessDataHandler
@@ -12,6 +17,25 @@ from .status import StatusHandler
 
 LOG = logging.getLogger(__name__)
 
+SIZED_POOL_OPTIONS: List[str] = ["max_overflow", "pool_size"]
+
+
+def get_engine_options(uri: str, **engine_options) -> dict:
+    """Return the engine options that apply to the database of an uri. SQLite databases are not
+    pooled by size, so the size options are left out for them."""
+    if make_url(uri).get_backend_name() == "sqlite":
+        return {
+            option: value
+            for option, value in engine_options.items()
+            if option not in SIZED_POOL_OPTIONS
+        }
+    return engine_options
+
+
+def _prevent_flush(session: Session, flush_context, instances) -> None:
+    """Raise an error when changes are flushed to a read-only database."""
+    raise CgError("Changes cannot be written to a read-only store")
+
 
 class CoreHandler(
     AddHandler,
@@ -29,19 +53,52 @@ class CoreHandler(
         StatusHandler(session=session)
 
 
+class ReadOnlyStore(CoreHandler):
+    """Store api for a read-only database, such as a replica of the primary database."""
+
+    uri: str = ""
+
+    def __init__(self, uri: str, **engine_options):
+        self.uri = uri
+        self.engine = create_engine(uri, **get_engine_options(uri=uri, **engine_options))
+        session_factory = sessionmaker(bind=self.engine, autoflush=False)
+        event.listen(session_factory, "before_flush", _prevent_flush)
+        self.session = scoped_session(session_factory)
+        super().__init__(session=self.session)
+
+
 class Store(CoreHandler):
     uri: str = ""
 
-    def __init__(self, uri):
+    def __init__(self, uri: str, read_only_uri: Optional[str] = None, **engine_options):
+        """Connect to the primary database and, if given, a read-only replica that heavy reads can
+        be routed to through `read_only_store`. The engine options, such as the pool settings,
+        apply to both databases."""
         self.uri = uri
-        self.engine = create_engine(uri)
-        self.session = scoped_session(sessionmaker(bind=self.engine))
+        self.engine = create_engine(uri, **get_engine_options(uri=uri, **engine_options))
+        session_factory = sessionmaker(bind=self.engine)
+        track_case_progress(session_factory=session_factory)
+        self.session = scoped_session(session_factory)
         super().__init__(session=self.session)
+        self.read_only_store: CoreHandler = self
+        if read_only_uri:
+            self.read_only_store = ReadOnlyStore(uri=read_only_uri, **engine_options)
+
+    def remove_sessions(self) -> None:
+        """Remove the sessions of the current scope from the primary and read-only databases."""
+        self.session.remove()
+        if self.read_only_store is not self:
+            self.read_only_store.session.remove()
 
     def create_all(self):
         """Create all tables in the database."""
         Model.metadata.create_all(bind=self.session.get_bind())
 
+    def refresh_case_progress(self) -> None:
+        """Rebuild the latest analysis and progress of all cases."""
+        refresh_case_progress(session=self.session)
+        self.session.commit()
+
     def drop_all(self):
         """Drop all tables in the database."""
         Model.metadata.drop_all(bind=self.session.get_bind())
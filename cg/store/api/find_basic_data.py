@@ -2,7 +2,7 @@
 import datetime as dt
 from typing import List, Optional
 
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, selectinload
 
 from cg.store.models import (
     Application,
@@ -47,6 +47,14 @@ class FindBasicDataHandler(BaseHandler):
             tag=tag,
         ).first()
 
+    def get_applications_by_tags(self, tags: List[str]) -> List[Application]:
+        """Return applications by tags."""
+        return apply_application_filter(
+            applications=self._get_query(table=Application),
+            filter_functions=[ApplicationFilter.FILTER_BY_TAGS],
+            tags=tags,
+        ).all()
+
     def get_applications_by_prep_category(self, prep_category: str) -> List[Application]:
         """Return applications by prep category."""
         return (
@@ -126,6 +134,20 @@ class FindBasicDataHandler(BaseHandler):
         """Return all application versions."""
         return self._get_query(table=ApplicationVersion).all()
 
+    def get_application_versions_by_entry_ids(
+        self, entry_ids: List[int]
+    ) -> List[ApplicationVersion]:
+        """Return application versions by entry ids, with their applications loaded."""
+        return (
+            apply_application_versions_filter(
+                application_versions=self._get_query(table=ApplicationVersion),
+                filter_functions=[ApplicationVersionFilter.FILTER_BY_ENTRY_IDS],
+                application_version_entry_ids=entry_ids,
+            )
+            .options(selectinload(ApplicationVersion.application))
+            .all()
+        )
+
     def get_bed_version_by_short_name(self, bed_version_short_name: str) -> BedVersion:
         """Return bed version with short name."""
         return apply_bed_version_filter(
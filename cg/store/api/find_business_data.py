@@ -216,6 +216,21 @@ class FindBusinessDataHandler(BaseHandler):
         Returns:
             List[Family]: A list of filtered cases sorted by creation time and limited by the specified number.
         """
+        return (
+            self.get_cases_by_customers_action_and_case_search_query(
+                customers=customers, action=action, case_search=case_search
+            )
+            .limit(limit=limit)
+            .all()
+        )
+
+    def get_cases_by_customers_action_and_case_search_query(
+        self,
+        customers: Optional[List[Customer]],
+        action: Optional[str],
+        case_search: Optional[str],
+    ) -> Query:
+        """Return a query for cases filtered by customers, action and case search."""
         filter_functions: List[Callable] = [
             CaseFilter.FILTER_BY_CUSTOMER_ENTRY_IDS,
             CaseFilter.FILTER_BY_ACTION,
@@ -227,14 +242,13 @@ class FindBusinessDataHandler(BaseHandler):
             [customer.id for customer in customers] if customers else None
         )
 
-        filtered_cases: Query = apply_case_filter(
+        return apply_case_filter(
             cases=self._get_query(table=Family),
             filter_functions=filter_functions,
             customer_entry_ids=customer_entry_ids,
             action=action,
             case_search=case_search,
         )
-        return filtered_cases.limit(limit=limit).all()
 
     def get_cases_by_customer_pipeline_and_case_search(
         self,
@@ -414,16 +428,28 @@ class FindBusinessDataHandler(BaseHandler):
 
     def get_flow_cells_by_statuses(self, flow_cell_statuses: List[str]) -> Optional[List[Flowcell]]:
         """Return flow cells with supplied statuses."""
-        return apply_flow_cell_filter(
-            flow_cells=self._get_query(table=Flowcell),
-            flow_cell_statuses=flow_cell_statuses,
-            filter_functions=[FlowCellFilter.GET_WITH_STATUSES],
-        ).all()
+        return (
+            apply_flow_cell_filter(
+                flow_cells=self._get_query(table=Flowcell),
+                flow_cell_statuses=flow_cell_statuses,
+                filter_functions=[FlowCellFilter.GET_WITH_STATUSES],
+            )
+            .order_by(Flowcell.id)
+            .all()
+        )
 
     def get_flow_cell_by_name_pattern_and_status(
         self, flow_cell_statuses: List[str], name_pattern: str
     ) -> List[Flowcell]:
         """Return flow cell by name pattern and status."""
+        return self.get_flow_cell_by_name_pattern_and_status_query(
+            flow_cell_statuses=flow_cell_statuses, name_pattern=name_pattern
+        ).all()
+
+    def get_flow_cell_by_name_pattern_and_status_query(
+        self, flow_cell_statuses: List[str], name_pattern: str
+    ) -> Query:
+        """Return a query for flow cells by name pattern and status, latest sequenced first."""
         filter_functions: List[FlowCellFilter] = [
             FlowCellFilter.GET_WITH_STATUSES,
             FlowCellFilter.GET_BY_NAME_SEARCH,
@@ -433,7 +459,7 @@ class FindBusinessDataHandler(BaseHandler):
             name_search=name_pattern,
             flow_cell_statuses=flow_cell_statuses,
             filter_functions=filter_functions,
-        ).all()
+        ).order_by(Flowcell.sequenced_at.desc())
 
     def get_flow_cells_by_case(self, case: Family) -> Optional[List[Flowcell]]:
         """Return flow cells for case."""
@@ -565,20 +591,23 @@ class FindBusinessDataHandler(BaseHandler):
             pools=pools, entry_id=entry_id, filter_functions=[PoolFilter.FILTER_BY_ENTRY_ID]
         ).first()
 
-    def get_pools_to_render(
+    def get_pools_to_render_query(
         self, customers: Optional[List[Customer]] = None, enquiry: str = None
-    ) -> List[Pool]:
-        pools: List[Pool] = (
-            self.get_pools_by_customer_id(customers=customers) if customers else self.get_pools()
-        )
+    ) -> Query:
+        """Return a query for pools of the customers with a name or order matching the enquiry."""
+        filter_functions: List[PoolFilter] = []
+        customer_ids: Optional[List[int]] = None
+        if customers:
+            customer_ids = [customer.id for customer in customers]
+            filter_functions.append(PoolFilter.FILTER_BY_CUSTOMER_ID)
         if enquiry:
-            pools: List[Pool] = list(
-                set(
-                    self.get_pools_by_name_enquiry(name_enquiry=enquiry)
-                    or set(self.get_pools_by_order_enquiry(order_enquiry=enquiry))
-                )
-            )
-        return pools
+            filter_functions.append(PoolFilter.FILTER_BY_NAME_OR_ORDER_ENQUIRY)
+        return apply_pool_filter(
+            pools=self._get_query(table=Pool),
+            customer_ids=customer_ids,
+            enquiry=enquiry,
+            filter_functions=filter_functions,
+        ).order_by(Pool.created_at.desc())
 
     def get_ready_made_library_expected_reads(self, case_id: str) -> int:
         """Return the target reads of a ready made library case."""
@@ -608,6 +637,14 @@ class FindBusinessDataHandler(BaseHandler):
         self, *, customers: Optional[List[Customer]] = None, pattern: str = None
     ) -> List[Sample]:
         """Get samples by customer and sample internal id  or sample name pattern."""
+        return self.get_samples_by_customer_id_and_pattern_query(
+            customers=customers, pattern=pattern
+        ).all()
+
+    def get_samples_by_customer_id_and_pattern_query(
+        self, *, customers: Optional[List[Customer]] = None, pattern: str = None
+    ) -> Query:
+        """Return a query for samples by customer and sample internal id or sample name pattern."""
         samples: Query = self._get_query(table=Sample)
         customer_entry_ids: List[int] = []
         filter_functions: List[SampleFilter] = []
@@ -624,7 +661,7 @@ class FindBusinessDataHandler(BaseHandler):
             customer_entry_ids=customer_entry_ids,
             search_pattern=pattern,
             filter_functions=filter_functions,
-        ).all()
+        )
 
     def _get_samples_by_customer_and_subject_id_query(
         self, customer_internal_id: str, subject_id: str
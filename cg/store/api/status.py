@@ -1,9 +1,9 @@
 from datetime import datetime, timedelta
 from types import SimpleNamespace
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, selectinload
 from typing_extensions import Literal
 
 from cg.constants import CASE_ACTIONS, Pipeline, FlowCellStatus
@@ -38,6 +38,10 @@ class StatusHandler(BaseHandler):
 
     def get_samples_to_receive(self, external: bool = False) -> List[Sample]:
         """Return samples to receive."""
+        return self.get_samples_to_receive_query(external=external).all()
+
+    def get_samples_to_receive_query(self, external: bool = False) -> Query:
+        """Return a query for samples to receive."""
         records: Query = self._get_join_sample_application_version_query()
         sample_filter_functions: List[SampleFilter] = [
             SampleFilter.FILTER_IS_NOT_RECEIVED,
@@ -55,10 +59,14 @@ class StatusHandler(BaseHandler):
                 applications=records,
                 filter_functions=[ApplicationFilter.FILTER_IS_NOT_EXTERNAL],
             )
-        return records.order_by(Sample.ordered_at).all()
+        return records.order_by(Sample.ordered_at)
 
     def get_samples_to_prepare(self) -> List[Sample]:
         """Return samples to prepare."""
+        return self.get_samples_to_prepare_query().all()
+
+    def get_samples_to_prepare_query(self) -> Query:
+        """Return a query for samples to prepare."""
         records: Query = self._get_join_sample_application_version_query()
         sample_filter_functions: List[SampleFilter] = [
             SampleFilter.FILTER_IS_RECEIVED,
@@ -73,10 +81,14 @@ class StatusHandler(BaseHandler):
             applications=records, filter_functions=[ApplicationFilter.FILTER_IS_NOT_EXTERNAL]
         )
 
-        return records.order_by(Sample.received_at).all()
+        return records.order_by(Sample.received_at)
 
     def get_samples_to_sequence(self) -> List[Sample]:
         """Return samples in sequencing."""
+        return self.get_samples_to_sequence_query().all()
+
+    def get_samples_to_sequence_query(self) -> Query:
+        """Return a query for samples in sequencing."""
         records: Query = self._get_join_sample_application_version_query()
         sample_filter_functions: List[SampleFilter] = [
             SampleFilter.FILTER_IS_PREPARED,
@@ -89,7 +101,7 @@ class StatusHandler(BaseHandler):
         records: Query = apply_application_filter(
             applications=records, filter_functions=[ApplicationFilter.FILTER_IS_NOT_EXTERNAL]
         )
-        return records.order_by(Sample.prepared_at).all()
+        return records.order_by(Sample.prepared_at)
 
     def get_families_with_analyses(self) -> Query:
         """Return all cases in the database with an analysis."""
@@ -103,32 +115,39 @@ class StatusHandler(BaseHandler):
         self, pipeline: Pipeline = None, threshold: bool = False, limit: int = None
     ) -> List[Family]:
         """Returns a list if cases ready to be analyzed or set to be reanalyzed."""
+        return (
+            self.get_cases_to_analyze_query(pipeline=pipeline, threshold=threshold)
+            .limit(limit)
+            .all()
+        )
+
+    def get_cases_to_analyze_query(
+        self, pipeline: Pipeline = None, threshold: bool = False
+    ) -> Query:
+        """Return a query of cases ready to be analyzed or set to be reanalyzed, oldest order
+        first."""
         case_filter_functions: List[CaseFilter] = [
             CaseFilter.GET_HAS_SEQUENCE,
             CaseFilter.GET_WITH_PIPELINE,
             CaseFilter.GET_FOR_ANALYSIS,
         ]
-        cases = apply_case_filter(
+        case_ids: Query = apply_case_filter(
             filter_functions=case_filter_functions,
             cases=self.get_families_with_analyses(),
             pipeline=pipeline,
-        )
-
-        families: List[Query] = list(cases.order_by(Family.ordered_at))
-        families = [
-            case_obj
-            for case_obj in families
-            if case_obj.latest_sequenced
-            and (
-                case_obj.action == CaseActions.ANALYZE
-                or not case_obj.latest_analyzed
-                or case_obj.latest_analyzed < case_obj.latest_sequenced
-            )
+        ).with_entities(Family.id)
+        progress_filter_functions: List[CaseFilter] = [
+            CaseFilter.FILTER_BY_ENTRY_IDS,
+            CaseFilter.GET_WITH_NEW_SEQUENCE_DATA,
         ]
-
         if threshold:
-            families = [case_obj for case_obj in families if case_obj.all_samples_pass_qc]
-        return families[:limit]
+            progress_filter_functions.append(CaseFilter.GET_PASS_SEQUENCING_QC)
+        cases: Query = apply_case_filter(
+            filter_functions=progress_filter_functions,
+            cases=self._get_join_cases_with_progress_query(),
+            entry_ids=case_ids,
+        )
+        return cases.order_by(Family.ordered_at)
 
     def cases(
         self,
@@ -173,8 +192,7 @@ class StatusHandler(BaseHandler):
 
         cases = []
 
-        for case_obj in case_q:
-            case_data = self._calculate_case_data(case_obj)
+        for case_data in self._get_cases_data(cases_query=case_q):
 
             skip_case = self._should_be_skipped(
                 case_data,
@@ -255,6 +273,14 @@ class StatusHandler(BaseHandler):
             internal_id=internal_id,
         ).first()
 
+    def get_samples_by_internal_ids(self, internal_ids: List[str]) -> List[Sample]:
+        """Return the samples with any of the given lims ids."""
+        return apply_sample_filter(
+            filter_functions=[SampleFilter.FILTER_BY_INTERNAL_IDS],
+            samples=self._get_query(table=Sample),
+            internal_ids=internal_ids,
+        ).all()
+
     def get_samples_by_internal_id(self, internal_id: str) -> List[Sample]:
         """Return all samples by lims id."""
         return apply_sample_filter(
@@ -365,7 +391,29 @@ class StatusHandler(BaseHandler):
             skip_case = True
         return skip_case
 
-    def _calculate_case_data(self, case_obj: Family) -> SimpleNamespace:
+    def _get_cases_data(self, cases_query: Query) -> List[SimpleNamespace]:
+        """Return status data for all cases in the query, aggregated in a few grouped queries."""
+        case_ids: Query = cases_query.with_entities(Family.id)
+        cases: List[Family] = cases_query.options(selectinload(Family.analyses)).all()
+        sample_aggregates: Dict[int, Any] = {
+            row.case_id: row
+            for row in self._get_case_sample_aggregates_query(case_ids=case_ids).all()
+        }
+        flow_cell_statuses: Dict[int, List[str]] = {}
+        for row in self._get_case_flow_cell_statuses_query(case_ids=case_ids).all():
+            flow_cell_statuses.setdefault(row.case_id, []).append(row.status)
+        return [
+            self._calculate_case_data(
+                case_obj=case_obj,
+                sample_aggregates=sample_aggregates.get(case_obj.id),
+                flow_cell_statuses=flow_cell_statuses.get(case_obj.id, []),
+            )
+            for case_obj in cases
+        ]
+
+    def _calculate_case_data(
+        self, case_obj: Family, sample_aggregates: Optional[Any], flow_cell_statuses: List[str]
+    ) -> SimpleNamespace:
         case_data = self._get_empty_case_data()
 
         case_data.data_analysis = case_obj.data_analysis
@@ -375,45 +423,27 @@ class StatusHandler(BaseHandler):
 
         case_data.analysis_in_progress = case_obj.action == "analyze"
         case_data.case_action = case_obj.action
-        case_data.total_samples = len(case_obj.links)
-        case_data.total_external_samples = len(
-            [
-                link.sample.application_version.application.is_external
-                for link in case_obj.links
-                if link.sample.application_version.application.is_external
-            ]
+        case_data.total_samples = sample_aggregates.total_samples if sample_aggregates else 0
+        case_data.total_external_samples = (
+            int(sample_aggregates.total_external_samples) if sample_aggregates else 0
         )
         case_data.total_internal_samples = (
             case_data.total_samples - case_data.total_external_samples
         )
         case_data.case_external_bool = case_data.total_external_samples == case_data.total_samples
         if case_data.total_samples > 0:
-            case_data.samples_received = len(
-                [link.sample.received_at for link in case_obj.links if link.sample.received_at]
-            )
-            case_data.samples_prepared = len(
-                [link.sample.prepared_at for link in case_obj.links if link.sample.prepared_at]
-            )
-            case_data.samples_sequenced = len(
-                [link.sample.sequenced_at for link in case_obj.links if link.sample.sequenced_at]
-            )
-            case_data.samples_delivered = len(
-                [link.sample.delivered_at for link in case_obj.links if link.sample.delivered_at]
-            )
-            case_data.samples_invoiced = len(
-                [
-                    link.sample.invoice.invoiced_at
-                    for link in case_obj.links
-                    if link.sample.invoice and link.sample.invoice.invoiced_at
-                ]
-            )
+            case_data.samples_received = sample_aggregates.samples_received
+            case_data.samples_prepared = sample_aggregates.samples_prepared
+            case_data.samples_sequenced = sample_aggregates.samples_sequenced
+            case_data.samples_delivered = sample_aggregates.samples_delivered
+            case_data.samples_invoiced = sample_aggregates.samples_invoiced
 
             case_data.samples_to_receive = case_data.total_internal_samples
             case_data.samples_to_prepare = case_data.total_internal_samples
             case_data.samples_to_sequence = case_data.total_internal_samples
             case_data.samples_to_deliver = case_data.total_internal_samples
-            case_data.samples_to_invoice = case_data.total_samples - len(
-                [link.sample.no_invoice for link in case_obj.links if link.sample.no_invoice]
+            case_data.samples_to_invoice = case_data.total_samples - int(
+                sample_aggregates.samples_no_invoice
             )
 
             case_data.samples_received_bool = (
@@ -433,44 +463,22 @@ class StatusHandler(BaseHandler):
             )
 
             if case_data.samples_to_receive > 0 and case_data.samples_received_bool:
-                case_data.samples_received_at = max(
-                    link.sample.received_at
-                    for link in case_obj.links
-                    if link.sample.received_at is not None
-                )
+                case_data.samples_received_at = sample_aggregates.samples_received_at
 
             if case_data.samples_to_prepare > 0 and case_data.samples_prepared_bool:
-                case_data.samples_prepared_at = max(
-                    link.sample.prepared_at
-                    for link in case_obj.links
-                    if link.sample.prepared_at is not None
-                )
+                case_data.samples_prepared_at = sample_aggregates.samples_prepared_at
 
             if case_data.samples_to_sequence > 0 and case_data.samples_sequenced_bool:
-                case_data.samples_sequenced_at = max(
-                    link.sample.sequenced_at
-                    for link in case_obj.links
-                    if link.sample.sequenced_at is not None
-                )
+                case_data.samples_sequenced_at = sample_aggregates.samples_sequenced_at
 
             if case_data.samples_to_deliver > 0 and case_data.samples_delivered_bool:
-                case_data.samples_delivered_at = max(
-                    link.sample.delivered_at
-                    for link in case_obj.links
-                    if link.sample.delivered_at is not None
-                )
+                case_data.samples_delivered_at = sample_aggregates.samples_delivered_at
 
             if case_data.samples_to_invoice > 0 and case_data.samples_invoiced_bool:
-                case_data.samples_invoiced_at = max(
-                    link.sample.invoice.invoiced_at
-                    for link in case_obj.links
-                    if link.sample.invoice and link.sample.invoice.invoiced_at
-                )
-
-            case_data.flowcells = len(list(self.get_flow_cells_by_case(case=case_obj)))
-            case_data.flowcells_status = [
-                flow_cell.status for flow_cell in self.get_flow_cells_by_case(case=case_obj)
-            ]
+                case_data.samples_invoiced_at = sample_aggregates.samples_invoiced_at
+
+            case_data.flowcells = len(flow_cell_statuses)
+            case_data.flowcells_status = list(flow_cell_statuses)
             case_data.flowcells_on_disk = len(
                 [
                     status
@@ -521,7 +529,9 @@ class StatusHandler(BaseHandler):
             case_data.analysis_uploaded_at,
             case_data.samples_delivered_at,
         )
-        case_data.max_tat = self._get_max_tat(links=case_obj.links)
+        case_data.max_tat = (
+            sample_aggregates.max_tat if sample_aggregates and sample_aggregates.max_tat else 0
+        )
         return case_data
 
     @staticmethod
@@ -540,6 +550,10 @@ class StatusHandler(BaseHandler):
 
     def get_analyses_to_upload(self, pipeline: Pipeline = None) -> List[Analysis]:
         """Return analyses that have not been uploaded."""
+        return self.get_analyses_to_upload_query(pipeline=pipeline).all()
+
+    def get_analyses_to_upload_query(self, pipeline: Pipeline = None) -> Query:
+        """Return a query for analyses that have not been uploaded."""
         analysis_filter_functions: List[AnalysisFilter] = [
             AnalysisFilter.FILTER_WITH_PIPELINE,
             AnalysisFilter.FILTER_COMPLETED,
@@ -551,7 +565,7 @@ class StatusHandler(BaseHandler):
             filter_functions=analysis_filter_functions,
             analyses=self._get_join_analysis_case_query(),
             pipeline=pipeline,
-        ).all()
+        )
 
     def get_analyses_to_clean(
         self, before: datetime = datetime.now(), pipeline: Pipeline = None
@@ -666,8 +680,16 @@ class StatusHandler(BaseHandler):
     def get_analyses(self) -> List[Analysis]:
         return self._get_query(table=Analysis).all()
 
+    def get_analyses_query(self) -> Query:
+        """Return a query for all analyses, latest started first."""
+        return self._get_query(table=Analysis).order_by(Analysis.started_at.desc())
+
     def get_analyses_to_deliver_for_pipeline(self, pipeline: Pipeline = None) -> List[Analysis]:
         """Return analyses that have been uploaded but not delivered."""
+        return self.get_analyses_to_deliver_for_pipeline_query(pipeline=pipeline).all()
+
+    def get_analyses_to_deliver_for_pipeline_query(self, pipeline: Pipeline = None) -> Query:
+        """Return a query for analyses that have been uploaded but not delivered."""
         analyses: Query = apply_sample_filter(
             samples=self._get_join_analysis_sample_family_query(),
             filter_functions=[SampleFilter.FILTER_IS_NOT_DELIVERED],
@@ -679,7 +701,7 @@ class StatusHandler(BaseHandler):
         ]
         return apply_analysis_filter(
             analyses=analyses, filter_functions=filter_functions, pipeline=pipeline
-        ).all()
+        )
 
     def analyses_to_delivery_report(self, pipeline: Pipeline = None) -> Query:
         """Return analyses that need a delivery report to be regenerated."""
@@ -885,14 +907,6 @@ class StatusHandler(BaseHandler):
             delta = (last_date - first_date).days
         return delta
 
-    @staticmethod
-    def _get_max_tat(links) -> int:
-        max_tat = 0
-        for link in links:
-            if link.sample.application_version.application.turnaround_time:
-                max_tat = max(0, link.sample.application_version.application.turnaround_time)
-        return max_tat
-
     @staticmethod
     def _get_empty_case_data() -> SimpleNamespace:
         case_data = SimpleNamespace()
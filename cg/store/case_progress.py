@@ -0,0 +1,255 @@
+"""Maintenance of the latest analysis and progress summary tables of cases.
+
+The summary tables are refreshed for the cases touched by a flush, in the same transaction as
+the flush, so that queries can filter on them in SQL instead of walking the case samples and
+analyses in Python. Changes to the applications that decide whether samples pass sequencing QC
+refresh the cases with samples of those applications. Writes that bypass the session, such as
+bulk updates, are not tracked, after such writes the summaries of all cases can be rebuilt with
+`refresh_case_progress`.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import and_, case, event, func, inspect, or_
+from sqlalchemy.orm import Query, Session, sessionmaker
+
+from cg.constants import Priority
+from cg.constants.constants import PrepCategory
+from cg.store.models import (
+    Analysis,
+    Application,
+    ApplicationVersion,
+    CaseProgress,
+    Family,
+    FamilySample,
+    LatestAnalysis,
+    Sample,
+)
+
+LOG = logging.getLogger(__name__)
+
+ANALYSIS_PROGRESS_ATTRIBUTES: List[str] = ["completed_at", "family", "family_id", "started_at"]
+APPLICATION_PROGRESS_ATTRIBUTES: List[str] = [
+    "is_external",
+    "percent_reads_guaranteed",
+    "prep_category",
+    "target_reads",
+]
+APPLICATION_VERSION_PROGRESS_ATTRIBUTES: List[str] = ["application", "application_id"]
+LINK_PROGRESS_ATTRIBUTES: List[str] = ["family", "family_id", "sample", "sample_id"]
+SAMPLE_PROGRESS_ATTRIBUTES: List[str] = [
+    "application_version",
+    "application_version_id",
+    "ordered_at",
+    "priority",
+    "reads",
+    "sequenced_at",
+]
+
+
+def _has_changes(instance: object, attributes: List[str]) -> bool:
+    """Return whether any of the given attributes of an instance has changed."""
+    instance_attributes = inspect(instance).attrs
+    return any(instance_attributes[attribute].history.has_changes() for attribute in attributes)
+
+
+def _get_changed_case_ids(session: Session) -> Set[int]:
+    """Return the ids of the cases whose progress is affected by the changes being flushed."""
+    case_ids: Set[int] = set()
+    sample_ids: Set[int] = set()
+    application_ids: Set[int] = set()
+    application_version_ids: Set[int] = set()
+    for instance in session.new | session.deleted:
+        if isinstance(instance, Family):
+            case_ids.add(instance.id)
+        elif isinstance(instance, (Analysis, FamilySample)):
+            case_ids.add(instance.family_id)
+        elif isinstance(instance, Sample):
+            sample_ids.add(instance.id)
+    for instance in session.dirty:
+        if isinstance(instance, Analysis) and _has_changes(
+            instance=instance, attributes=ANALYSIS_PROGRESS_ATTRIBUTES
+        ):
+            case_ids.add(instance.family_id)
+        elif isinstance(instance, FamilySample) and _has_changes(
+            instance=instance, attributes=LINK_PROGRESS_ATTRIBUTES
+        ):
+            case_ids.add(instance.family_id)
+        elif isinstance(instance, Sample) and _has_changes(
+            instance=instance, attributes=SAMPLE_PROGRESS_ATTRIBUTES
+        ):
+            sample_ids.add(instance.id)
+        elif isinstance(instance, Application) and _has_changes(
+            instance=instance, attributes=APPLICATION_PROGRESS_ATTRIBUTES
+        ):
+            application_ids.add(instance.id)
+        elif isinstance(instance, ApplicationVersion) and _has_changes(
+            instance=instance, attributes=APPLICATION_VERSION_PROGRESS_ATTRIBUTES
+        ):
+            application_version_ids.add(instance.id)
+    application_filters: list = []
+    if application_ids:
+        application_filters.append(ApplicationVersion.application_id.in_(application_ids))
+    if application_version_ids:
+        application_filters.append(ApplicationVersion.id.in_(application_version_ids))
+    if application_filters:
+        case_ids.update(
+            case_id
+            for case_id, in session.query(FamilySample.family_id)
+            .join(FamilySample.sample)
+            .join(Sample.application_version)
+            .filter(or_(*application_filters))
+        )
+    if sample_ids:
+        case_ids.update(
+            case_id
+            for case_id, in session.query(FamilySample.family_id).filter(
+                FamilySample.sample_id.in_(sample_ids)
+            )
+        )
+    case_ids.discard(None)
+    return case_ids
+
+
+def _get_sample_passes_qc_expression():
+    """Return an SQL expression that is 1 for a sample that passes sequencing QC, as
+    `Sample.sequencing_qc`, or is externally sequenced and 0 otherwise."""
+    return case(
+        [
+            (Sample.id.is_(None), 1),
+            (Application.is_external, 1),
+            (
+                Sample.priority == Priority.express,
+                case([(Sample.reads * 2 >= Application.target_reads, 1)], else_=0),
+            ),
+            (
+                Application.prep_category == PrepCategory.READY_MADE_LIBRARY,
+                case([(Sample.reads > 0, 1)], else_=0),
+            ),
+        ],
+        else_=case(
+            [
+                (
+                    Sample.reads * 100
+                    > Application.target_reads * Application.percent_reads_guaranteed,
+                    1,
+                )
+            ],
+            else_=0,
+        ),
+    )
+
+
+def _filter_case_ids(query: Query, column, case_ids: Optional[Set[int]]) -> Query:
+    """Filter a query on case ids, unless all cases are refreshed."""
+    return query if case_ids is None else query.filter(column.in_(case_ids))
+
+
+def _get_latest_analyses(session: Session, case_ids: Optional[Set[int]]) -> List[dict]:
+    """Return the id of the latest started analysis of each case."""
+    latest_started_at: Query = _filter_case_ids(
+        query=session.query(
+            Analysis.family_id, func.max(Analysis.started_at).label("started_at")
+        ).group_by(Analysis.family_id),
+        column=Analysis.family_id,
+        case_ids=case_ids,
+    ).subquery()
+    latest_analyses: Query = (
+        session.query(Analysis.family_id, func.max(Analysis.id))
+        .join(
+            latest_started_at,
+            and_(
+                Analysis.family_id == latest_started_at.c.family_id,
+                Analysis.started_at == latest_started_at.c.started_at,
+            ),
+        )
+        .group_by(Analysis.family_id)
+    )
+    return [
+        {"family_id": case_id, "analysis_id": analysis_id}
+        for case_id, analysis_id in latest_analyses
+    ]
+
+
+def _get_latest_analyzed_at_expression():
+    """Return an SQL expression for the latest analysis completion of a case, as
+    `Family.latest_analyzed`, which is None while any analysis of the case is not completed."""
+    return case(
+        [
+            (
+                func.count(Analysis.id) == func.count(Analysis.completed_at),
+                func.max(Analysis.completed_at),
+            )
+        ],
+        else_=None,
+    )
+
+
+def _get_case_progresses(session: Session, case_ids: Optional[Set[int]]) -> List[dict]:
+    """Return the sequencing and analysis progress of each case."""
+    latest_analyzed_at: Dict[int, object] = dict(
+        _filter_case_ids(
+            query=session.query(Analysis.family_id, _get_latest_analyzed_at_expression()).group_by(
+                Analysis.family_id
+            ),
+            column=Analysis.family_id,
+            case_ids=case_ids,
+        )
+    )
+    sample_progress: Query = _filter_case_ids(
+        query=session.query(
+            Family.id,
+            func.max(
+                case([(Application.is_external, Sample.ordered_at)], else_=Sample.sequenced_at)
+            ),
+            func.min(_get_sample_passes_qc_expression()),
+        )
+        .outerjoin(Family.links)
+        .outerjoin(FamilySample.sample)
+        .outerjoin(Sample.application_version)
+        .outerjoin(ApplicationVersion.application)
+        .group_by(Family.id),
+        column=Family.id,
+        case_ids=case_ids,
+    )
+    return [
+        {
+            "family_id": case_id,
+            "latest_sequenced_at": latest_sequenced_at,
+            "latest_analyzed_at": latest_analyzed_at.get(case_id),
+            "all_samples_pass_qc": all_samples_pass_qc != 0,
+        }
+        for case_id, latest_sequenced_at, all_samples_pass_qc in sample_progress
+    ]
+
+
+def refresh_case_progress(session: Session, case_ids: Optional[Iterable[int]] = None) -> None:
+    """Rebuild the latest analysis and progress of the given cases, or of all cases. Nothing is
+    committed."""
+    case_ids: Optional[Set[int]] = None if case_ids is None else set(case_ids)
+    if case_ids is not None and not case_ids:
+        return
+    LOG.debug(f"Refreshing progress of {'all' if case_ids is None else len(case_ids)} cases")
+    latest_analyses: List[dict] = _get_latest_analyses(session=session, case_ids=case_ids)
+    case_progresses: List[dict] = _get_case_progresses(session=session, case_ids=case_ids)
+    for table, rows in [
+        (LatestAnalysis.__table__, latest_analyses),
+        (CaseProgress.__table__, case_progresses),
+    ]:
+        delete_rows = table.delete()
+        if case_ids is not None:
+            delete_rows = delete_rows.where(table.c.family_id.in_(case_ids))
+        session.execute(delete_rows)
+        if rows:
+            session.execute(table.insert(), rows)
+
+
+def _refresh_changed_case_progress(session: Session, flush_context) -> None:
+    """Refresh the progress of the cases affected by a flush."""
+    refresh_case_progress(session=session, case_ids=_get_changed_case_ids(session=session))
+
+
+def track_case_progress(session_factory: sessionmaker) -> None:
+    """Keep the case progress summaries up to date for all sessions made by a session factory."""
+    event.listen(session_factory, "after_flush", _refresh_changed_case_progress)
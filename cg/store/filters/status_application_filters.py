@@ -10,6 +10,11 @@ def filter_applications_by_tag(applications: Query, tag: str, **kwargs) -> Query
     return applications.filter(Application.tag == tag)
 
 
+def filter_applications_by_tags(applications: Query, tags: List[str], **kwargs) -> Query:
+    """Return applications by tags."""
+    return applications.filter(Application.tag.in_(tags))
+
+
 def filter_applications_by_prep_category(
     applications: Query, prep_category: str, **kwargs
 ) -> Query:
@@ -46,6 +51,7 @@ def apply_application_filter(
     filter_functions: List[Callable],
     applications: Query,
     tag: str = None,
+    tags: List[str] = None,
     prep_category: str = None,
     entry_id: int = None,
 ) -> Query:
@@ -55,6 +61,7 @@ def apply_application_filter(
         applications: Query = filter_function(
             applications=applications,
             tag=tag,
+            tags=tags,
             prep_category=prep_category,
             entry_id=entry_id,
         )
@@ -67,6 +74,7 @@ class ApplicationFilter(Enum):
     FILTER_IS_EXTERNAL = filter_applications_is_external
     FILTER_IS_NOT_EXTERNAL = filter_applications_is_not_external
     FILTER_BY_TAG = filter_applications_by_tag
+    FILTER_BY_TAGS = filter_applications_by_tags
     FILTER_BY_PREP_CATEGORY = filter_applications_by_prep_category
     FILTER_IS_ARCHIVED = filter_applications_is_archived
     FILTER_IS_NOT_ARCHIVED = filter_applications_is_not_archived
@@ -41,11 +41,19 @@ def filter_application_versions_by_application_version_entry_id(
     return application_versions.filter(ApplicationVersion.id == application_version_entry_id)
 
 
+def filter_application_versions_by_application_version_entry_ids(
+    application_versions: Query, application_version_entry_ids: List[int], **kwargs
+) -> Query:
+    """Return the application versions given application version entry ids."""
+    return application_versions.filter(ApplicationVersion.id.in_(application_version_entry_ids))
+
+
 def apply_application_versions_filter(
     filter_functions: List[Callable],
     application_versions: Query,
     application_entry_id: int = None,
     application_version_entry_id: int = None,
+    application_version_entry_ids: List[int] = None,
     version: int = None,
     valid_from: datetime = None,
 ) -> Query:
@@ -55,6 +63,7 @@ def apply_application_versions_filter(
             application_versions=application_versions,
             application_entry_id=application_entry_id,
             application_version_entry_id=application_version_entry_id,
+            application_version_entry_ids=application_version_entry_ids,
             version=version,
             valid_from=valid_from,
         )
@@ -66,6 +75,7 @@ class ApplicationVersionFilter(Enum):
 
     FILTER_BY_APPLICATION_ENTRY_ID = filter_application_versions_by_application_entry_id
     FILTER_BY_ENTRY_ID = filter_application_versions_by_application_version_entry_id
+    FILTER_BY_ENTRY_IDS = filter_application_versions_by_application_version_entry_ids
     FILTER_BY_VALID_FROM_BEFORE = filter_application_versions_before_valid_from
     FILTER_BY_VERSION = filter_application_versions_by_version
     ORDER_BY_VALID_FROM_DESC = order_application_versions_by_valid_from_desc
@@ -12,7 +12,7 @@ from cg.constants.observations import (
     LOQUSDB_MIP_SEQUENCING_METHODS,
     LOQUSDB_BALSAMIC_SEQUENCING_METHODS,
 )
-from cg.store.models import Analysis, Application, Customer, Family, Sample
+from cg.store.models import Analysis, Application, CaseProgress, Customer, Family, Sample
 
 
 def get_cases_has_sequence(cases: Query, **kwargs) -> Query:
@@ -102,6 +102,29 @@ def get_cases_for_analysis(cases: Query, **kwargs) -> Query:
     )
 
 
+def filter_cases_with_new_sequence_data(cases: Query, **kwargs) -> Query:
+    """Filter cases that are sequenced and either set to be analysed, not analysed or sequenced
+    after their latest analysis, according to the case progress."""
+    return cases.filter(
+        CaseProgress.latest_sequenced_at.isnot(None),
+        or_(
+            Family.action == CaseActions.ANALYZE,
+            CaseProgress.latest_analyzed_at.is_(None),
+            CaseProgress.latest_analyzed_at < CaseProgress.latest_sequenced_at,
+        ),
+    )
+
+
+def filter_cases_pass_sequencing_qc(cases: Query, **kwargs) -> Query:
+    """Filter cases in which all samples pass sequencing QC, according to the case progress."""
+    return cases.filter(CaseProgress.all_samples_pass_qc.is_(True))
+
+
+def filter_cases_by_entry_ids(cases: Query, entry_ids: Query, **kwargs) -> Query:
+    """Filter cases by entry ids."""
+    return cases.filter(Family.id.in_(entry_ids))
+
+
 def filter_cases_not_analysed(cases: Query, **kwargs) -> Query:
     """Filter cases that have not been analysed and are not currently being analysed."""
     not_analyzed_condition = not_(Family.analyses.any(Analysis.completed_at.isnot(None)))
@@ -209,6 +232,7 @@ def apply_case_filter(
     pipeline: Optional[Pipeline] = None,
     internal_id: Optional[str] = None,
     entry_id: Optional[int] = None,
+    entry_ids: Optional[Query] = None,
     ticket_id: Optional[str] = None,
     customer_entry_id: Optional[int] = None,
     customer_entry_ids: Optional[List[int]] = None,
@@ -229,6 +253,7 @@ def apply_case_filter(
             pipeline=pipeline,
             internal_id=internal_id,
             entry_id=entry_id,
+            entry_ids=entry_ids,
             ticket_id=ticket_id,
             customer_entry_id=customer_entry_id,
             customer_entry_ids=customer_entry_ids,
@@ -259,9 +284,12 @@ class CaseFilter(Enum):
     )
     GET_FOR_ANALYSIS: Callable = get_cases_for_analysis
     GET_NOT_ANALYSED: Callable = filter_cases_not_analysed
+    GET_WITH_NEW_SEQUENCE_DATA: Callable = filter_cases_with_new_sequence_data
+    GET_PASS_SEQUENCING_QC: Callable = filter_cases_pass_sequencing_qc
     GET_WITH_SCOUT_DELIVERY: Callable = get_cases_with_scout_data_delivery
     GET_REPORT_SUPPORTED: Callable = get_report_supported_data_delivery_cases
     FILTER_BY_ENTRY_ID: Callable = filter_cases_by_entry_id
+    FILTER_BY_ENTRY_IDS: Callable = filter_cases_by_entry_ids
     FILTER_BY_INTERNAL_ID: Callable = filter_case_by_internal_id
     IS_RUNNING: Callable = get_running_cases
     FILTER_BY_TICKET: Callable = filter_cases_by_ticket_id
@@ -1,5 +1,6 @@
 from enum import Enum
 from typing import List, Optional, Callable
+from sqlalchemy import or_
 from sqlalchemy.orm import Query
 from cg.store.models import Pool, Customer
 
@@ -19,6 +20,11 @@ def filter_pools_by_order_enquiry(pools: Query, order_enquiry: str, **kwargs) ->
     return pools.filter(Pool.order.like(f"%{order_enquiry}%"))
 
 
+def filter_pools_by_name_or_order_enquiry(pools: Query, enquiry: str, **kwargs) -> Query:
+    """Return pools with a name or order matching the enquiry."""
+    return pools.filter(or_(Pool.name.like(f"%{enquiry}%"), Pool.order.like(f"%{enquiry}%")))
+
+
 def filter_pools_by_entry_id(pools: Query, entry_id: int, **kwargs) -> Query:
     """Return pools by entry id."""
     return pools.filter(Pool.id == entry_id)
@@ -83,6 +89,7 @@ def apply_pool_filter(
     customer_ids: Optional[List[int]] = None,
     name_enquiry: Optional[str] = None,
     order_enquiry: Optional[str] = None,
+    enquiry: Optional[str] = None,
     customer: Optional[Customer] = None,
 ) -> Query:
     """Apply filtering functions to the pool queries and return filtered results"""
@@ -96,6 +103,7 @@ def apply_pool_filter(
             customer_ids=customer_ids,
             name_enquiry=name_enquiry,
             order_enquiry=order_enquiry,
+            enquiry=enquiry,
             customer=customer,
         )
     return pools
@@ -117,4 +125,5 @@ class PoolFilter(Enum):
     FILTER_BY_CUSTOMER_ID: Callable = filter_pools_by_customer_id
     FILTER_BY_NAME_ENQUIRY: Callable = filter_pools_by_name_enquiry
     FILTER_BY_ORDER_ENQUIRY: Callable = filter_pools_by_order_enquiry
+    FILTER_BY_NAME_OR_ORDER_ENQUIRY: Callable = filter_pools_by_name_or_order_enquiry
     FILTER_BY_CUSTOMER: Callable = filter_pools_by_customer
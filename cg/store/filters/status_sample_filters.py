@@ -12,6 +12,11 @@ def filter_samples_by_internal_id(internal_id: str, samples: Query, **kwargs) ->
     return samples.filter(Sample.internal_id == internal_id)
 
 
+def filter_samples_by_internal_ids(internal_ids: List[str], samples: Query, **kwargs) -> Query:
+    """Return samples by internal ids."""
+    return samples.filter(Sample.internal_id.in_(internal_ids))
+
+
 def filter_samples_by_name(name: str, samples: Query, **kwargs) -> Query:
     """Return sample with sample name."""
     return samples.filter(Sample.name == name)
@@ -181,6 +186,7 @@ def apply_sample_filter(
     samples: Query,
     entry_id: Optional[int] = None,
     internal_id: Optional[str] = None,
+    internal_ids: Optional[List[str]] = None,
     tissue_type: Optional[SampleType] = None,
     data_analysis: Optional[str] = None,
     invoice_id: Optional[int] = None,
@@ -201,6 +207,7 @@ def apply_sample_filter(
             samples=samples,
             entry_id=entry_id,
             internal_id=internal_id,
+            internal_ids=internal_ids,
             tissue_type=tissue_type,
             data_analysis=data_analysis,
             invoice_id=invoice_id,
@@ -221,6 +228,7 @@ class SampleFilter(Enum):
     """Define Sample filter functions."""
 
     FILTER_BY_INTERNAL_ID: Callable = filter_samples_by_internal_id
+    FILTER_BY_INTERNAL_IDS: Callable = filter_samples_by_internal_ids
     FILTER_WITH_TYPE: Callable = filter_samples_with_type
     FILTER_WITH_LOQUSDB_ID: Callable = filter_samples_with_loqusdb_id
     FILTER_WITHOUT_LOQUSDB_ID: Callable = filter_samples_without_loqusdb_id
@@ -0,0 +1,195 @@
+"""Audit of the columns that statusdb statements filter and order on.
+
+The audit records every statement executed on an engine, which covers the queries built by the
+`apply_*_filter` functions, and derives composite index candidates from the recorded column
+combinations: equality columns first, followed by a single range or sort column. A statement is
+considered served when an existing index leads with one of the columns it filters on.
+"""
+import logging
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import (
+    Column,
+    ForeignKeyConstraint,
+    MetaData,
+    Table,
+    UniqueConstraint,
+    event,
+)
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, ClauseElement, UnaryExpression
+from sqlalchemy.sql.selectable import Select
+
+LOG = logging.getLogger(__name__)
+
+EQUALITY_OPERATORS: Set = {operators.eq, operators.is_, operators.in_op}
+RANGE_OPERATORS: Set = {operators.lt, operators.le, operators.gt, operators.ge, operators.isnot}
+REVERSED_RANGE_OPERATORS: Set = {operators.lt, operators.le, operators.gt, operators.ge}
+
+
+class FilterColumns(NamedTuple):
+    """The columns of a table that a statement filters and orders on."""
+
+    table: str
+    equality_columns: Tuple[str, ...]
+    range_columns: Tuple[str, ...]
+    order_columns: Tuple[str, ...]
+
+    @property
+    def index_columns(self) -> Tuple[str, ...]:
+        """Return the columns of the composite index that serves the statement best."""
+        trailing_columns: Tuple[str, ...] = tuple(
+            column
+            for column in self.range_columns[:1] or self.order_columns[:1]
+            if column not in self.equality_columns
+        )
+        return self.equality_columns + trailing_columns
+
+    @property
+    def leading_columns(self) -> Set[str]:
+        """Return the columns that an index can lead with to serve the statement."""
+        return set(self.equality_columns + self.range_columns + self.order_columns[:1])
+
+
+def _get_table_column(element: ClauseElement) -> Optional[Column]:
+    """Return the element if it is a column of a table."""
+    if isinstance(element, Column) and isinstance(element.table, Table):
+        return element
+    return None
+
+
+def _iterate_without_subqueries(clause: ClauseElement) -> Iterator[ClauseElement]:
+    """Iterate over the elements of a clause, without descending into nested selects."""
+    elements: List[ClauseElement] = [clause]
+    while elements:
+        element: ClauseElement = elements.pop()
+        yield element
+        elements.extend(child for child in element.get_children() if not isinstance(child, Select))
+
+
+def get_filter_columns(statement: Select) -> List[FilterColumns]:
+    """Return the columns that a select statement, including its subqueries, filters and orders
+    on, grouped by table."""
+    equality_columns: Dict[str, Set[str]] = {}
+    range_columns: Dict[str, Set[str]] = {}
+    order_columns: Dict[str, List[str]] = {}
+    selects: List[Select] = [
+        element for element in visitors.iterate(statement, {}) if isinstance(element, Select)
+    ]
+    for select in selects:
+        if select._whereclause is not None:
+            for element in _iterate_without_subqueries(clause=select._whereclause):
+                if not isinstance(element, BinaryExpression):
+                    continue
+                left_column: Optional[Column] = _get_table_column(element.left)
+                right_column: Optional[Column] = _get_table_column(element.right)
+                if left_column is not None and right_column is not None:
+                    continue
+                operator = element.operator
+                column: Optional[Column] = left_column
+                if column is None and operator in REVERSED_RANGE_OPERATORS:
+                    column = right_column
+                if column is None:
+                    continue
+                if operator in EQUALITY_OPERATORS:
+                    equality_columns.setdefault(column.table.name, set()).add(column.name)
+                elif operator in RANGE_OPERATORS:
+                    range_columns.setdefault(column.table.name, set()).add(column.name)
+        for element in select._order_by_clause:
+            if isinstance(element, UnaryExpression):
+                element = element.element
+            column: Optional[Column] = _get_table_column(element)
+            if column is not None:
+                order_columns.setdefault(column.table.name, []).append(column.name)
+    return [
+        FilterColumns(
+            table=table,
+            equality_columns=tuple(sorted(equality_columns.get(table, set()))),
+            range_columns=tuple(sorted(range_columns.get(table, set()))),
+            order_columns=tuple(order_columns.get(table, [])),
+        )
+        for table in sorted(set(equality_columns) | set(range_columns) | set(order_columns))
+    ]
+
+
+def get_existing_indexes(metadata: MetaData) -> Dict[str, List[Tuple[str, ...]]]:
+    """Return the columns of the indexes of each table, including the primary keys, unique
+    constraints and the foreign keys, which MySQL indexes implicitly."""
+    existing_indexes: Dict[str, List[Tuple[str, ...]]] = {}
+    for table in metadata.sorted_tables:
+        table_indexes: List[Tuple[str, ...]] = existing_indexes.setdefault(table.name, [])
+        table_indexes.append(tuple(column.name for column in table.primary_key.columns))
+        table_indexes.extend(
+            tuple(column.name for column in index.columns) for index in table.indexes
+        )
+        for constraint in table.constraints:
+            if isinstance(constraint, (ForeignKeyConstraint, UniqueConstraint)):
+                table_indexes.append(tuple(column.name for column in constraint.columns))
+        table_indexes.extend((column.name,) for column in table.columns if column.unique)
+    return existing_indexes
+
+
+class IndexAudit:
+    """Records the column combinations that the statements executed on an engine filter on."""
+
+    def __init__(self):
+        self.filter_columns: Counter = Counter()
+
+    def record(self, statement: ClauseElement) -> None:
+        """Record the filter columns of a statement."""
+        if isinstance(statement, Select):
+            self.filter_columns.update(get_filter_columns(statement=statement))
+
+    def _before_execute(self, conn, clauseelement, multiparams, params) -> None:
+        self.record(statement=clauseelement)
+
+    @contextmanager
+    def recording(self, engine: Engine) -> Iterator["IndexAudit"]:
+        """Record the statements executed on an engine within the context."""
+        event.listen(engine, "before_execute", self._before_execute)
+        try:
+            yield self
+        finally:
+            event.remove(engine, "before_execute", self._before_execute)
+
+    def get_index_candidates(self, min_count: int = 1) -> Dict[Tuple[str, Tuple[str, ...]], int]:
+        """Return the index candidates and the number of statements each would serve."""
+        index_candidates: Counter = Counter()
+        for filter_columns, count in self.filter_columns.items():
+            if filter_columns.index_columns:
+                index_candidates[(filter_columns.table, filter_columns.index_columns)] += count
+        return {
+            index_candidate: count
+            for index_candidate, count in index_candidates.most_common()
+            if count >= min_count
+        }
+
+    def get_missing_indexes(
+        self, metadata: MetaData, min_count: int = 1
+    ) -> Dict[Tuple[str, Tuple[str, ...]], int]:
+        """Return the index candidates of the statements that no existing index serves."""
+        existing_indexes: Dict[str, List[Tuple[str, ...]]] = get_existing_indexes(metadata=metadata)
+        missing_indexes: Counter = Counter()
+        for filter_columns, count in self.filter_columns.items():
+            leading_columns: Set[str] = filter_columns.leading_columns
+            if not leading_columns or any(
+                index_columns and index_columns[0] in leading_columns
+                for index_columns in existing_indexes.get(filter_columns.table, [])
+            ):
+                continue
+            missing_indexes[(filter_columns.table, filter_columns.index_columns)] += count
+        return {
+            index_candidate: count
+            for index_candidate, count in missing_indexes.most_common()
+            if count >= min_count
+        }
+
+    def log_report(self, metadata: MetaData, min_count: int = 1) -> None:
+        """Log the index candidates and whether they are missing."""
+        missing_indexes: Dict = self.get_missing_indexes(metadata=metadata, min_count=min_count)
+        for (table, columns), count in self.get_index_candidates(min_count=min_count).items():
+            status: str = "missing" if (table, columns) in missing_indexes else "served"
+            LOG.info(f"{table}({', '.join(columns)}): {count} statements, {status}")
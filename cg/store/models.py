@@ -3,7 +3,7 @@ import re
 from typing import List, Optional, Set, Dict
 
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, ForeignKey, Table, UniqueConstraint, orm, types
+from sqlalchemy import Column, ForeignKey, Index, Table, UniqueConstraint, orm, types
 from sqlalchemy.util import deprecated
 from sqlalchemy.orm.attributes import InstrumentedAttribute
 
@@ -177,6 +177,16 @@ class ApplicationVersion(Model):
 
 class Analysis(Model):
     __tablename__ = "analysis"
+    __table_args__ = (
+        Index("ix_analysis_cleaned_at_started_at", "cleaned_at", "started_at"),
+        Index(
+            "ix_analysis_pipeline_uploaded_at_completed_at",
+            "pipeline",
+            "uploaded_at",
+            "completed_at",
+        ),
+        Index("ix_analysis_uploaded_at_completed_at", "uploaded_at", "completed_at"),
+    )
 
     id = Column(types.Integer, primary_key=True)
     pipeline = Column(types.Enum(*list(Pipeline)))
@@ -255,6 +265,21 @@ class BedVersion(Model):
         return data
 
 
+class CaseProgress(Model):
+    """Sequencing and analysis progress of a case, maintained by the store on every flush."""
+
+    __tablename__ = "case_progress"
+
+    family_id = Column(ForeignKey("family.id", ondelete="CASCADE"), primary_key=True)
+    latest_sequenced_at = Column(types.DateTime, index=True)
+    latest_analyzed_at = Column(types.DateTime)
+    all_samples_pass_qc = Column(types.Boolean, nullable=False, default=True)
+    updated_at = Column(types.DateTime, default=dt.datetime.now, onupdate=dt.datetime.now)
+
+    def to_dict(self):
+        return to_dict(model_instance=self)
+
+
 class Customer(Model):
     __tablename__ = "customer"
     agreement_date = Column(types.DateTime)
@@ -340,7 +365,10 @@ class Delivery(Model):
 
 class Family(Model, PriorityMixin):
     __tablename__ = "family"
-    __table_args__ = (UniqueConstraint("customer_id", "name", name="_customer_name_uc"),)
+    __table_args__ = (
+        UniqueConstraint("customer_id", "name", name="_customer_name_uc"),
+        Index("ix_family_action_data_analysis_ordered_at", "action", "data_analysis", "ordered_at"),
+    )
 
     action = Column(types.Enum(*CASE_ACTIONS))
     analyses = orm.relationship(Analysis, backref="family", order_by="-Analysis.completed_at")
@@ -514,7 +542,7 @@ class Flowcell(Model):
     sequencer_type = Column(types.Enum("hiseqga", "hiseqx", "novaseq"))
     sequencer_name = Column(types.String(32))
     sequenced_at = Column(types.DateTime)
-    status = Column(types.Enum(*FLOWCELL_STATUS), default="ondisk")
+    status = Column(types.Enum(*FLOWCELL_STATUS), default="ondisk", index=True)
     archived_at = Column(types.DateTime)
     updated_at = Column(types.DateTime, onupdate=dt.datetime.now)
 
@@ -580,7 +608,7 @@ class Pool(Model):
     created_at = Column(types.DateTime, default=dt.datetime.now)
     customer_id = Column(ForeignKey("customer.id", ondelete="CASCADE"), nullable=False)
     customer = orm.relationship(Customer, foreign_keys=[customer_id])
-    delivered_at = Column(types.DateTime)
+    delivered_at = Column(types.DateTime, index=True)
     deliveries = orm.relationship(Delivery, backref="pool")
     id = Column(types.Integer, primary_key=True)
     invoice_id = Column(ForeignKey("invoice.id"))
@@ -588,7 +616,7 @@ class Pool(Model):
     no_invoice = Column(types.Boolean, default=False)
     order = Column(types.String(64), nullable=False)
     ordered_at = Column(types.DateTime, nullable=False)
-    received_at = Column(types.DateTime)
+    received_at = Column(types.DateTime, index=True)
     ticket = Column(types.String(32))
 
     def to_dict(self):
@@ -608,7 +636,7 @@ class Sample(Model, PriorityMixin):
     created_at = Column(types.DateTime, default=dt.datetime.now)
     customer_id = Column(ForeignKey("customer.id", ondelete="CASCADE"), nullable=False)
     customer = orm.relationship("Customer", foreign_keys=[customer_id])
-    delivered_at = Column(types.DateTime)
+    delivered_at = Column(types.DateTime, index=True)
     deliveries = orm.relationship(Delivery, backref="sample")
     downsampled_to = Column(types.BigInteger)
     from_sample = Column(types.String(128))
@@ -628,14 +656,14 @@ class Sample(Model, PriorityMixin):
     original_ticket = Column(types.String(32))
     _phenotype_groups = Column(types.Text)
     _phenotype_terms = Column(types.Text)
-    prepared_at = Column(types.DateTime)
+    prepared_at = Column(types.DateTime, index=True)
 
     priority = Column(types.Enum(Priority), default=Priority.standard, nullable=False)
     reads = Column(types.BigInteger, default=0)
-    received_at = Column(types.DateTime)
+    received_at = Column(types.DateTime, index=True)
     reference_genome = Column(types.String(255))
     sequence_start = Column(types.DateTime)
-    sequenced_at = Column(types.DateTime)
+    sequenced_at = Column(types.DateTime, index=True)
     sex = Column(types.Enum(*SEX_OPTIONS), nullable=False)
     subject_id = Column(types.String(128))
 
@@ -735,6 +763,18 @@ class Invoice(Model):
         return to_dict(model_instance=self)
 
 
+class LatestAnalysis(Model):
+    """The latest started analysis of a case, maintained by the store on every flush."""
+
+    __tablename__ = "latest_analysis"
+
+    family_id = Column(ForeignKey("family.id", ondelete="CASCADE"), primary_key=True)
+    analysis_id = Column(ForeignKey("analysis.id", ondelete="CASCADE"), nullable=False, unique=True)
+
+    def to_dict(self):
+        return to_dict(model_instance=self)
+
+
 class User(Model):
     __tablename__ = "user"
     id = Column(types.Integer, primary_key=True)
@@ -1 +1 @@
-from .commands import Process
+from .commands import Process, ProcessPool, ProcessResult
@@ -1,20 +1,70 @@
 import hashlib
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional
+
+from cg.constants.process import MAX_CONCURRENT_PROCESSES
+from cg.utils.checksum.checksum_cache import ChecksumCache
 
 LOG = logging.getLogger(__name__)
 
+BYTES_PER_CHUNK: int = 4 * 1024 * 1024
+MD5: str = "md5"
+SHA512: str = "sha512"
+
+
+def get_file_checksum(
+    file_path: Path, algorithm: str = MD5, checksum_cache: Optional[ChecksumCache] = None
+) -> str:
+    """Return the checksum of a file, from the checksum cache if the file is unchanged"""
+    if checksum_cache:
+        checksum: Optional[str] = checksum_cache.get(file_path=file_path, algorithm=algorithm)
+        if checksum:
+            LOG.debug(f"Using cached {algorithm} checksum for file {file_path}")
+            return checksum
+    file_stat: os.stat_result = os.stat(file_path)
+    file_hash = hashlib.new(algorithm)
+    buffer = bytearray(BYTES_PER_CHUNK)
+    view = memoryview(buffer)
+    with open(file_path, "rb", buffering=0) as file:
+        for size in iter(lambda: file.readinto(buffer), 0):
+            file_hash.update(view[:size])
+    checksum: str = file_hash.hexdigest()
+    if checksum_cache:
+        checksum_cache.add(
+            file_path=file_path, algorithm=algorithm, checksum=checksum, file_stat=file_stat
+        )
+    return checksum
+
+
+def get_file_checksums(
+    file_paths: List[Path],
+    algorithm: str = MD5,
+    checksum_cache: Optional[ChecksumCache] = None,
+    max_workers: int = MAX_CONCURRENT_PROCESSES,
+) -> Dict[Path, str]:
+    """Return the checksums of several files, hashing the files concurrently"""
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        checksums: List[str] = list(
+            executor.map(
+                lambda file_path: get_file_checksum(
+                    file_path=file_path, algorithm=algorithm, checksum_cache=checksum_cache
+                ),
+                file_paths,
+            )
+        )
+    return dict(zip(file_paths, checksums))
+
 
-def check_md5sum(file_path: Path, md5sum: str) -> bool:
+def check_md5sum(
+    file_path: Path, md5sum: str, checksum_cache: Optional[ChecksumCache] = None
+) -> bool:
     """Checks if the given md5_sum matches that of the given file"""
-    BYTES_PER_CHUNK: int = 8192
-    with open(file_path, "rb") as file:
-        file_hash = hashlib.md5()
-        chunk = file.read(BYTES_PER_CHUNK)
-        while chunk:
-            file_hash.update(chunk)
-            chunk = file.read(BYTES_PER_CHUNK)
-    calculated_md5sum = file_hash.hexdigest()
+    calculated_md5sum: str = get_file_checksum(
+        file_path=file_path, algorithm=MD5, checksum_cache=checksum_cache
+    )
     if md5sum == calculated_md5sum:
         return True
     LOG.info("The given md5sum does not match the md5sum for file %s" % file_path)
@@ -35,12 +85,11 @@ def extract_md5sum(md5sum_file: Path) -> str:
     return ""
 
 
-def sha512_checksum(file: Path) -> str:
+def sha512_checksum(file: Path, checksum_cache: Optional[ChecksumCache] = None) -> str:
     """Generates the sha512 checksum of a file"""
     LOG.debug("Checksum for file %s: ", file)
-    sha512_hash = hashlib.sha512()
-    with open(file, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            sha512_hash.update(chunk)
-    LOG.debug("Result: %s", sha512_hash.hexdigest())
-    return sha512_hash.hexdigest()
+    checksum: str = get_file_checksum(
+        file_path=file, algorithm=SHA512, checksum_cache=checksum_cache
+    )
+    LOG.debug("Result: %s", checksum)
+    return checksum
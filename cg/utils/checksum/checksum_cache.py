@@ -0,0 +1,83 @@
+"""Persistent cache of file checksums."""
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Union
+
+LOG = logging.getLogger(__name__)
+
+CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS checksum (
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    checksum TEXT NOT NULL,
+    PRIMARY KEY (device, inode, algorithm)
+)
+"""
+
+
+class ChecksumCache:
+    """Local cache of file checksums.
+
+    Entries are keyed on the device and inode of the file and are only valid as long as the size
+    and modification time of the file are unchanged, so renamed files keep their checksums and a
+    changed file is hashed again on the next lookup.
+    """
+
+    def __init__(self, cache_path: Union[Path, str]):
+        self.cache_path = Path(cache_path)
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.cache_path.as_posix(), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(CREATE_TABLE_SQL)
+
+    def get(self, file_path: Union[Path, str], algorithm: str) -> Optional[str]:
+        """Return the cached checksum or None if missing or if the file has changed."""
+        file_stat: os.stat_result = os.stat(file_path)
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT size, mtime_ns, checksum FROM checksum "
+                "WHERE device = ? AND inode = ? AND algorithm = ?",
+                (file_stat.st_dev, file_stat.st_ino, algorithm),
+            ).fetchone()
+        if row is None:
+            return None
+        size, mtime_ns, checksum = row
+        if size != file_stat.st_size or mtime_ns != file_stat.st_mtime_ns:
+            LOG.debug(f"File has changed since its checksum was cached: {file_path}")
+            return None
+        return checksum
+
+    def add(
+        self,
+        file_path: Union[Path, str],
+        algorithm: str,
+        checksum: str,
+        file_stat: Optional[os.stat_result] = None,
+    ) -> None:
+        """Add or replace the checksum of a file in the cache.
+
+        Pass the status of the file from before it was hashed, so that a file modified while
+        being hashed is not cached as unchanged.
+        """
+        file_stat: os.stat_result = file_stat or os.stat(file_path)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checksum VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    file_stat.st_dev,
+                    file_stat.st_ino,
+                    algorithm,
+                    file_stat.st_size,
+                    file_stat.st_mtime_ns,
+                    str(file_path),
+                    checksum,
+                ),
+            )
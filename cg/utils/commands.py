@@ -2,17 +2,35 @@
 Code to handle communications to the shell from CG.
 """
 
-import copy
 import logging
 import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from subprocess import CalledProcessError
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Union
 
-from cg.constants.process import RETURN_SUCCESS
+from cg.constants.process import MAX_CONCURRENT_PROCESSES, RETURN_SUCCESS
 
 LOG = logging.getLogger(__name__)
 
 
+@dataclass
+class ProcessResult:
+    """Exit status and output of a command executed by a process."""
+
+    command: str
+    return_code: Optional[int]
+    stdout: str = ""
+    stderr: str = ""
+    timed_out: bool = False
+
+    @property
+    def success(self) -> bool:
+        """Return True if the command exited successfully within its timeout."""
+        return not self.timed_out and self.return_code == RETURN_SUCCESS
+
+
 class Process:
     """Class to handle communication with other programs via the shell.
 
@@ -77,27 +95,20 @@ class Process:
         Return(int): Return code from called process
 
         """
-        command = copy.deepcopy(self.base_call)
-        if parameters:
-            command.extend(parameters)
+        command: List[str] = self.get_command_list(parameters=parameters)
 
         LOG.info("Running command %s", " ".join(command))
         if dry_run:
             LOG.info("Dry run: process call will not be executed!!")
             return RETURN_SUCCESS
 
-        if self.environment:
-            res = subprocess.run(
-                " ".join(command),
-                shell=True,
-                check=False,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-        else:
-            res = subprocess.run(
-                command, check=False, stdout=subprocess.PIPE, stderr=subprocess.PIPE
-            )
+        res = subprocess.run(
+            self._get_call(command=command),
+            shell=bool(self.environment),
+            check=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
 
         self.stdout = res.stdout.decode("utf-8").rstrip()
         self.stderr = res.stderr.decode("utf-8").rstrip()
@@ -108,14 +119,74 @@ class Process:
 
         return res.returncode
 
+    def execute(self, parameters: list = None, timeout: Optional[float] = None) -> ProcessResult:
+        """Execute a command in the shell and return its result instead of raising on failure.
+        The process instance is not modified, so several commands may be executed concurrently.
+
+        Args:
+            parameters(list):
+            timeout(float): Seconds to wait for the command before killing it
+        Return(ProcessResult): Exit status and output of the called process
+        """
+        command: List[str] = self.get_command_list(parameters=parameters)
+        LOG.info("Running command %s", " ".join(command))
+        try:
+            res = subprocess.run(
+                self._get_call(command=command),
+                shell=bool(self.environment),
+                check=False,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            LOG.error(f"Call {command} timed out after {timeout} seconds")
+            return ProcessResult(command=" ".join(command), return_code=None, timed_out=True)
+        if res.returncode != RETURN_SUCCESS:
+            LOG.error(f"Call {command} exit with a non zero exit code")
+        return ProcessResult(
+            command=" ".join(command),
+            return_code=res.returncode,
+            stdout=res.stdout.decode("utf-8").rstrip(),
+            stderr=res.stderr.decode("utf-8").rstrip(),
+        )
+
+    def stream_command(self, parameters: list = None) -> Iterator[str]:
+        """Execute a command in the shell and iterate over the lines of stdout as they are written,
+        without keeping the whole output in memory.
+
+        Raises:
+            CalledProcessError: when the command exits with a non zero exit code
+        """
+        command: List[str] = self.get_command_list(parameters=parameters)
+        LOG.info("Running command %s", " ".join(command))
+        with tempfile.TemporaryFile() as stderr_file:
+            with subprocess.Popen(
+                self._get_call(command=command),
+                shell=bool(self.environment),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            ) as process:
+                for line in process.stdout:
+                    yield line.decode("utf-8").rstrip("\n")
+            if process.returncode != RETURN_SUCCESS:
+                stderr_file.seek(0)
+                self.stderr = stderr_file.read().decode("utf-8").rstrip()
+                LOG.critical("Call %s exit with a non zero exit code", command)
+                LOG.critical(self.stderr)
+                raise CalledProcessError(process.returncode, command)
+
     def get_command(self, parameters: list = None) -> str:
         """Returns a command string given a list of parameters."""
+        return " ".join(self.get_command_list(parameters=parameters))
 
-        command: List[str] = copy.deepcopy(self.base_call)
-        if parameters:
-            command.extend(parameters)
+    def get_command_list(self, parameters: list = None) -> List[str]:
+        """Returns a new command list of the base call extended with the parameters."""
+        return self.base_call + list(parameters or [])
 
-        return " ".join(command)
+    def _get_call(self, command: List[str]) -> Union[str, List[str]]:
+        """Return the command as a string when it has to be executed in a shell."""
+        return " ".join(command) if self.environment else command
 
     @property
     def stdout(self):
@@ -153,3 +224,56 @@ class Process:
 
     def __repr__(self):
         return f"Process:base_call:{self.base_call}"
+
+
+class ProcessPool:
+    """Execute many commands of a process concurrently, with a bounded number of running commands.
+
+    The exit status and output of every command is collected, a failing command does not stop the
+    execution of the others.
+    """
+
+    def __init__(
+        self,
+        process: Process,
+        max_workers: int = MAX_CONCURRENT_PROCESSES,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Args:
+            process(Process): Process to execute the commands with
+            max_workers(int): Maximum number of commands running at the same time
+            timeout(float): Seconds to wait for each command before killing it
+        """
+        self.process: Process = process
+        self.max_workers: int = max_workers
+        self.timeout: Optional[float] = timeout
+
+    def run_commands(self, parameters: List[list], dry_run: bool = False) -> List[ProcessResult]:
+        """Execute the process once for each list of parameters.
+
+        Return(List[ProcessResult]): Results in the same order as the parameters
+        """
+        if dry_run:
+            for command_parameters in parameters:
+                LOG.info(f"Dry run: {self.process.get_command(parameters=command_parameters)}")
+            return [
+                ProcessResult(
+                    command=self.process.get_command(parameters=command_parameters),
+                    return_code=RETURN_SUCCESS,
+                )
+                for command_parameters in parameters
+            ]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results: List[ProcessResult] = list(
+                executor.map(
+                    lambda command_parameters: self.process.execute(
+                        parameters=command_parameters, timeout=self.timeout
+                    ),
+                    parameters,
+                )
+            )
+        failed_results: List[ProcessResult] = [result for result in results if not result.success]
+        if failed_results:
+            LOG.warning(f"{len(failed_results)} of {len(results)} commands failed")
+        return results
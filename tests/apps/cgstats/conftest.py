@@ -1,6 +1,6 @@
 from datetime import datetime
 from pathlib import Path
-from typing import Dict
+from typing import Dict, List, Optional
 
 import pytest
 from pydantic import BaseModel
@@ -68,6 +68,176 @@ class MockDemuxSample(BaseModel):
     lane: int = 1
 
 
+class MockNovaSeqSample(BaseModel):
+    """Mock sample sheet sample"""
+
+    lane: int
+    sample_id: str
+    index: str
+    second_index: Optional[str] = None
+    project: str
+
+
+def get_synthetic_index(number: int, length: int = 10) -> str:
+    """Return a unique index sequence for a number."""
+    sequence: str = ""
+    for _ in range(length):
+        number, remainder = divmod(number, 4)
+        sequence += "ACGT"[remainder]
+    return sequence
+
+
+def write_synthetic_conversion_stats(
+    conversion_stats_path: Path,
+    flow_cell_id: str,
+    samples: List[MockNovaSeqSample],
+    tiles_per_lane: int,
+) -> Path:
+    """Write a ConversionStats.xml file with tile statistics for each sample on each lane."""
+    read_lines: List[str] = []
+    for read_number in (1, 2):
+        read_lines.extend(
+            [
+                f'<Read number="{read_number}">',
+                "<Yield>242204</Yield>",
+                "<YieldQ30>227405</YieldQ30>",
+                "<QualityScoreSum>8705615</QualityScoreSum>",
+                "</Read>",
+            ]
+        )
+    tile_statistics: str = "\n".join(["<ClusterCount>1604</ClusterCount>"] + read_lines)
+    lines: List[str] = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        "<Stats>",
+        f'<Flowcell flowcell-id="{flow_cell_id}">',
+    ]
+    for sample in samples:
+        barcode: str = f"{sample.index}+{sample.second_index}"
+        lines.extend(
+            [
+                f'<Project name="{sample.project}">',
+                f'<Sample name="{sample.sample_id}">',
+                f'<Barcode name="{barcode}">',
+                f'<Lane number="{sample.lane}">',
+            ]
+        )
+        for tile_number in range(1101, 1101 + tiles_per_lane):
+            lines.extend(
+                [
+                    f'<Tile number="{tile_number}">',
+                    f"<Raw>{tile_statistics}</Raw>",
+                    f"<Pf>{tile_statistics}</Pf>",
+                    "</Tile>",
+                ]
+            )
+        lines.extend(["</Lane>", "</Barcode>", "</Sample>", "</Project>"])
+    lines.extend(["</Flowcell>", "</Stats>"])
+    conversion_stats_path.write_text("\n".join(lines))
+    return conversion_stats_path
+
+
+def write_synthetic_demultiplexing_stats(
+    demultiplexing_stats_path: Path, flow_cell_id: str, samples: List[MockNovaSeqSample]
+) -> Path:
+    """Write a DemultiplexingStats.xml file with barcode counts for each sample on each lane."""
+    lines: List[str] = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        "<Stats>",
+        f'<Flowcell flowcell-id="{flow_cell_id}">',
+    ]
+    for sample in samples:
+        lines.extend(
+            [
+                f'<Project name="{sample.project}">',
+                f'<Sample name="{sample.sample_id}">',
+                f'<Barcode name="{sample.index}+{sample.second_index}">',
+                f'<Lane number="{sample.lane}">',
+                "<BarcodeCount>949781</BarcodeCount>",
+                "<PerfectBarcodeCount>930520</PerfectBarcodeCount>",
+                "<OneMismatchBarcodeCount>19261</OneMismatchBarcodeCount>",
+                "</Lane>",
+                "</Barcode>",
+                "</Sample>",
+                "</Project>",
+            ]
+        )
+    lines.extend(["</Flowcell>", "</Stats>"])
+    demultiplexing_stats_path.write_text("\n".join(lines))
+    return demultiplexing_stats_path
+
+
+def write_synthetic_quality_metrics(
+    quality_metrics_path: Path, samples: List[MockNovaSeqSample]
+) -> Path:
+    """Write a Dragen Quality_Metrics.csv file with both reads of each sample on each lane."""
+    lines: List[str] = [
+        "Lane,SampleID,Sample_Project,index,index2,ReadNumber,Yield,YieldQ30,QualityScoreSum,"
+        "Mean Quality Score (PF),% Q30"
+    ]
+    for sample in samples:
+        for read_number in (1, 2):
+            lines.append(
+                f"{sample.lane},{sample.sample_id},{sample.project},{sample.index},"
+                f"{sample.second_index},{read_number},504688809,477724304,18226795139,36.11,0.95"
+            )
+    quality_metrics_path.write_text("\n".join(lines))
+    return quality_metrics_path
+
+
+def write_synthetic_adapter_metrics(
+    adapter_metrics_path: Path, samples: List[MockNovaSeqSample]
+) -> Path:
+    """Write a Dragen Adapter_Metrics.csv file with both reads of each sample on each lane."""
+    lines: List[str] = [
+        "Lane,Sample_ID,Sample_Project,index,index2,ReadNumber,AdapterBases,SampleBases,"
+        "% Adapter Bases"
+    ]
+    for sample in samples:
+        for read_number in (1, 2):
+            lines.append(
+                f"{sample.lane},{sample.sample_id},{sample.project},{sample.index},"
+                f"{sample.second_index},{read_number},0,504688809,0.000"
+            )
+    adapter_metrics_path.write_text("\n".join(lines))
+    return adapter_metrics_path
+
+
+def get_synthetic_samples(nr_lanes: int, samples_per_lane: int) -> List[MockNovaSeqSample]:
+    """Return sample sheet samples for a number of fully loaded lanes."""
+    samples: List[MockNovaSeqSample] = []
+    for lane in range(1, nr_lanes + 1):
+        for sample_number in range(samples_per_lane):
+            samples.append(
+                MockNovaSeqSample(
+                    lane=lane,
+                    sample_id=f"ACC{sample_number:05d}A{lane}",
+                    index=get_synthetic_index(number=sample_number),
+                    second_index=get_synthetic_index(number=sample_number + lane * 1000),
+                    project=str(100000 + sample_number // 48),
+                )
+            )
+    return samples
+
+
+@pytest.fixture(name="synthetic_sample_sheet_samples")
+def fixture_synthetic_sample_sheet_samples() -> List[MockNovaSeqSample]:
+    """Return sample sheet samples for a fully loaded NovaSeq S4 flow cell."""
+    return get_synthetic_samples(nr_lanes=4, samples_per_lane=384)
+
+
+@pytest.fixture(name="synthetic_conversion_stats_path")
+def fixture_synthetic_conversion_stats_path(
+    tmp_path: Path, synthetic_sample_sheet_samples: List[MockNovaSeqSample]
+) -> Path:
+    """Return the path to a synthetic ConversionStats.xml file for a NovaSeq S4 flow cell."""
+    return write_synthetic_conversion_stats(
+        conversion_stats_path=Path(tmp_path, "ConversionStats.xml"),
+        flow_cell_id="HXXXXXXXX",
+        samples=synthetic_sample_sheet_samples,
+        tiles_per_lane=8,
+    )
+
+
 @pytest.fixture(name="flow_cell_name")
 def fixture_flow_cell_name() -> str:
     """Return flow cell name."""
@@ -0,0 +1,209 @@
+"""Tests and benchmark for the bulk ingestion of demultiplexing results into cgstats."""
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import pytest
+from sqlalchemy import event
+
+from cg.apps.cgstats.crud import create
+from cg.apps.cgstats.db.models import Demux, Project, Sample, Unaligned
+from cg.apps.cgstats.demux_sample import DemuxSample
+from cg.apps.cgstats.parsers.conversion_stats import ConversionStats
+from cg.apps.cgstats.parsers.demux_stats import SampleBarcodeStats
+from cg.apps.cgstats.stats import StatsAPI
+from cg.models.demultiplex.demux_results import DemuxResults
+from tests.apps.cgstats.conftest import MockNovaSeqSample
+
+LOG = logging.getLogger(__name__)
+
+
+def _get_unaligned_rows(stats_api: StatsAPI) -> List[tuple]:
+    """Return the unaligned results with their sample and project, without database ids."""
+    return sorted(
+        Unaligned.query.join(Unaligned.sample, Sample.project)
+        .with_entities(
+            Project.projectname,
+            Sample.samplename,
+            Sample.limsid,
+            Sample.barcode,
+            Unaligned.lane,
+            Unaligned.yield_mb,
+            Unaligned.readcounts,
+            Unaligned.passed_filter_pct,
+            Unaligned.perfect_indexreads_pct,
+            Unaligned.q30_bases_pct,
+            Unaligned.mean_quality_score,
+        )
+        .all()
+    )
+
+
+def _get_demux_samples(
+    conversion_stats: ConversionStats, samples: List[MockNovaSeqSample]
+) -> Dict[int, Dict[str, DemuxSample]]:
+    """Return demux samples for the samples from the conversion stats."""
+    demux_samples: Dict[int, Dict[str, DemuxSample]] = {}
+    for sample in samples:
+        conversion_results = conversion_stats.lanes_to_barcode[sample.lane][
+            f"{sample.index}+{sample.second_index}"
+        ]
+        demux_samples.setdefault(sample.lane, {})[sample.sample_id] = DemuxSample(
+            sample_name=sample.sample_id,
+            flowcell=conversion_stats.flowcell_id,
+            lane=sample.lane,
+            nr_raw_clusters_=conversion_stats.raw_clusters_per_lane[sample.lane],
+            barcode_stats_=SampleBarcodeStats(
+                barcode_count=conversion_results.pass_filter_cluster_count,
+                perfect_barcode_count=conversion_results.pass_filter_cluster_count,
+                one_mismatch_barcode_count=0,
+            ),
+            conversion_stats_=conversion_results,
+        )
+    return demux_samples
+
+
+def _create_demux_without_samples(stats_api: StatsAPI, demux_results: DemuxResults) -> None:
+    """Create the flow cell and demux objects for demultiplexing results, but no samples."""
+    create.create_novaseq_flowcell(manager=stats_api, demux_results=demux_results)
+    Unaligned.query.delete()
+    Sample.query.delete()
+    stats_api.commit()
+
+
+def _ingest_samples(
+    stats_api: StatsAPI,
+    samples: List[MockNovaSeqSample],
+    demux_samples: Dict[int, Dict[str, DemuxSample]],
+    bulk: bool,
+) -> Tuple[int, float]:
+    """Ingest the samples into cgstats and return the number of statements and the run time."""
+    statements: List[str] = []
+
+    def count_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = stats_api.session.get_bind()
+    event.listen(engine, "before_cursor_execute", count_statement)
+    start_time: float = time.perf_counter()
+    demux_id: int = Demux.query.first().demux_id
+    if bulk:
+        project_name_to_id: Dict[str, int] = create.create_projects_in_bulk(
+            manager=stats_api, project_names=[sample.project for sample in samples]
+        )
+        create.insert_samples_in_bulk(
+            manager=stats_api,
+            samples=samples,
+            demux_samples=demux_samples,
+            get_unaligned_values_function=create.get_unaligned_values,
+            project_name_to_id=project_name_to_id,
+            demux_id=demux_id,
+        )
+    else:
+        project_name_to_id: Dict[str, int] = create.create_projects(
+            manager=stats_api, project_names={sample.project for sample in samples}
+        )
+        create.insert_samples_one_by_one(
+            manager=stats_api,
+            samples=samples,
+            demux_samples=demux_samples,
+            create_unaligned_function=create.create_unaligned,
+            project_name_to_id=project_name_to_id,
+            demux_id=demux_id,
+        )
+    stats_api.commit()
+    run_time: float = time.perf_counter() - start_time
+    event.remove(engine, "before_cursor_execute", count_statement)
+    return len(statements), run_time
+
+
+def test_create_novaseq_flowcell_in_bulk(
+    stats_api: StatsAPI, bcl2fastq_demux_results: DemuxResults
+):
+    """Test that bulk ingestion of a flow cell gives the same results as ingestion per sample."""
+    # GIVEN the results of a flow cell ingested one sample at a time
+    create.create_novaseq_flowcell(manager=stats_api, demux_results=bcl2fastq_demux_results)
+    expected_rows: List[tuple] = _get_unaligned_rows(stats_api=stats_api)
+    assert expected_rows
+
+    # GIVEN an empty database
+    stats_api.drop_all()
+    stats_api.create_all()
+
+    # WHEN ingesting the flow cell in bulk
+    create.create_novaseq_flowcell(
+        manager=stats_api, demux_results=bcl2fastq_demux_results, bulk=True
+    )
+
+    # THEN the same samples and unaligned results should have been created
+    assert _get_unaligned_rows(stats_api=stats_api) == expected_rows
+
+
+def test_create_novaseq_flowcell_in_bulk_twice(
+    stats_api: StatsAPI, bcl2fastq_demux_results: DemuxResults
+):
+    """Test that bulk ingestion of an already ingested flow cell does not duplicate rows."""
+    # GIVEN a flow cell ingested in bulk
+    create.create_novaseq_flowcell(
+        manager=stats_api, demux_results=bcl2fastq_demux_results, bulk=True
+    )
+    expected_rows: List[tuple] = _get_unaligned_rows(stats_api=stats_api)
+
+    # WHEN ingesting the flow cell again
+    create.create_novaseq_flowcell(
+        manager=stats_api, demux_results=bcl2fastq_demux_results, bulk=True
+    )
+
+    # THEN no rows should have been added
+    assert _get_unaligned_rows(stats_api=stats_api) == expected_rows
+
+
+@pytest.mark.benchmark
+def test_bulk_ingestion_benchmark(
+    stats_api: StatsAPI,
+    bcl2fastq_demux_results: DemuxResults,
+    synthetic_conversion_stats_path: Path,
+    synthetic_sample_sheet_samples: List[MockNovaSeqSample],
+):
+    """Benchmark bulk ingestion against ingestion per sample for a NovaSeq S4 flow cell."""
+    # GIVEN demux samples from a synthetic conversion stats file for a full flow cell
+    conversion_stats = ConversionStats(conversion_stats_path=synthetic_conversion_stats_path)
+    demux_samples: Dict[int, Dict[str, DemuxSample]] = _get_demux_samples(
+        conversion_stats=conversion_stats, samples=synthetic_sample_sheet_samples
+    )
+
+    # GIVEN a database with a demux for the flow cell
+    _create_demux_without_samples(stats_api=stats_api, demux_results=bcl2fastq_demux_results)
+
+    # WHEN ingesting the samples one at a time
+    statements_per_sample, run_time_per_sample = _ingest_samples(
+        stats_api=stats_api,
+        samples=synthetic_sample_sheet_samples,
+        demux_samples=demux_samples,
+        bulk=False,
+    )
+    expected_rows: List[tuple] = _get_unaligned_rows(stats_api=stats_api)
+
+    # WHEN ingesting the same samples in bulk into a fresh database
+    stats_api.drop_all()
+    stats_api.create_all()
+    _create_demux_without_samples(stats_api=stats_api, demux_results=bcl2fastq_demux_results)
+    bulk_statements, bulk_run_time = _ingest_samples(
+        stats_api=stats_api,
+        samples=synthetic_sample_sheet_samples,
+        demux_samples=demux_samples,
+        bulk=True,
+    )
+    LOG.info(
+        f"Ingested {len(synthetic_sample_sheet_samples)} samples: "
+        f"{statements_per_sample} statements in {run_time_per_sample:.2f}s one by one, "
+        f"{bulk_statements} statements in {bulk_run_time:.2f}s in bulk"
+    )
+
+    # THEN the same rows should have been created
+    assert _get_unaligned_rows(stats_api=stats_api) == expected_rows
+
+    # THEN bulk ingestion should use a handful of statements
+    assert bulk_statements < 10
+    assert bulk_statements < statements_per_sample
@@ -11,3 +11,16 @@ def test_parse_adapter_metrics(adapter_metrics_path: Path):
 
     # THEN the object should be successfully parsed
     assert adapter_metrics_obj.parse_metrics_file()
+
+
+def test_parse_adapter_metrics_fast(adapter_metrics_path: Path):
+    # GIVEN an existing Adapter_Metrics.csv path
+    assert adapter_metrics_path.exists()
+
+    # WHEN parsing the file in the default and in the fast mode
+    fast_adapter_metrics: AdapterMetrics = AdapterMetrics(adapter_metrics_path, fast=True)
+
+    # THEN the fast mode should give the same metrics
+    assert (
+        fast_adapter_metrics.parsed_metrics == AdapterMetrics(adapter_metrics_path).parsed_metrics
+    )
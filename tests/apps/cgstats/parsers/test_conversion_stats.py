@@ -15,3 +15,24 @@ def test_parse_demux_stats(conversion_stats_path: Path):
 
     # THEN assert that the parser have some content
     assert parser.lanes_to_barcode
+
+
+def test_parse_conversion_stats_fast(conversion_stats_path: Path):
+    # GIVEN an existing conversion stats file
+    assert conversion_stats_path.exists()
+
+    # WHEN parsing the file in the default and in the fast mode
+    parser: ConversionStats = ConversionStats(conversion_stats_path=conversion_stats_path)
+    fast_parser: ConversionStats = ConversionStats(
+        conversion_stats_path=conversion_stats_path, fast=True
+    )
+
+    # THEN the fast mode should give the same results
+    assert fast_parser.lanes_to_barcode
+    for lane, barcode_to_results in parser.lanes_to_barcode.items():
+        assert dict(fast_parser.lanes_to_barcode[lane]) == barcode_to_results
+    for barcode, lane_to_results in parser.barcode_to_lanes.items():
+        assert dict(fast_parser.barcode_to_lanes[barcode]) == lane_to_results
+    assert fast_parser.raw_clusters_per_lane == parser.raw_clusters_per_lane
+    assert fast_parser.lanes_to_unknown_barcode == parser.lanes_to_unknown_barcode
+    assert fast_parser.barcode_to_sample == parser.barcode_to_sample
@@ -15,3 +15,19 @@ def test_parse_demux_stats(demultiplexing_stats_path: Path):
 
     # THEN assert that the parser have some content
     assert parser.lanes_to_barcode
+
+
+def test_parse_demux_stats_fast(demultiplexing_stats_path: Path):
+    # GIVEN an existing demultiplexing stats file
+    assert demultiplexing_stats_path.exists()
+
+    # WHEN parsing the file in the default and in the fast mode
+    parser: DemuxStats = DemuxStats(demux_stats_path=demultiplexing_stats_path)
+    fast_parser: DemuxStats = DemuxStats(demux_stats_path=demultiplexing_stats_path, fast=True)
+
+    # THEN the fast mode should give the same results
+    assert fast_parser.lanes_to_barcode
+    for lane, barcode_to_stats in parser.lanes_to_barcode.items():
+        assert dict(fast_parser.lanes_to_barcode[lane]) == barcode_to_stats
+    for barcode, lane_to_stats in parser.barcode_to_lanes.items():
+        assert dict(fast_parser.barcode_to_lanes[barcode]) == lane_to_stats
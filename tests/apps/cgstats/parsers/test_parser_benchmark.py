@@ -0,0 +1,137 @@
+"""Benchmark of the default and fast parse modes of the demultiplexing statistics parsers.
+
+The synthetic files have the number of lanes and a fraction of the tiles of NovaSeq flow cells, so
+that the parse time and peak memory can be compared between releases without real data."""
+import logging
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+
+from cg.apps.cgstats.parsers.adapter_metrics import AdapterMetrics
+from cg.apps.cgstats.parsers.conversion_stats import ConversionStats
+from cg.apps.cgstats.parsers.demux_stats import DemuxStats
+from cg.apps.cgstats.parsers.quality_metrics import QualityMetrics
+from tests.apps.cgstats.conftest import (
+    MockNovaSeqSample,
+    get_synthetic_samples,
+    write_synthetic_adapter_metrics,
+    write_synthetic_conversion_stats,
+    write_synthetic_demultiplexing_stats,
+    write_synthetic_quality_metrics,
+)
+
+pytestmark = pytest.mark.benchmark
+
+LOG = logging.getLogger(__name__)
+
+# Number of lanes and tiles per lane of the benchmarked flow cell types
+FLOW_CELL_SCALES: Dict[str, Tuple[int, int]] = {"S1": (2, 8), "S2": (2, 16), "S4": (4, 24)}
+SAMPLES_PER_LANE: int = 96
+
+
+def _measure(parse: Callable[[], object]) -> Tuple[object, float, float]:
+    """Return the parsed object, the parse time in seconds and the peak memory in MiB."""
+    start_time: float = time.perf_counter()
+    parse()
+    run_time: float = time.perf_counter() - start_time
+    tracemalloc.start()
+    parsed: object = parse()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return parsed, run_time, peak_memory / 2**20
+
+
+def _log_benchmark(
+    parser_name: str, flow_cell_type: str, default: Tuple[float, float], fast: Tuple[float, float]
+) -> None:
+    LOG.info(
+        f"{parser_name} {flow_cell_type}: {default[0]:.3f}s and {default[1]:.1f}MiB by default, "
+        f"{fast[0]:.3f}s and {fast[1]:.1f}MiB in fast mode"
+    )
+
+
+@pytest.mark.parametrize("flow_cell_type", list(FLOW_CELL_SCALES))
+def test_bcl2fastq_parser_benchmark(flow_cell_type: str, tmp_path: Path):
+    """Benchmark parsing of bcl2fastq conversion and demultiplexing stats."""
+    # GIVEN bcl2fastq stats files of a fully loaded flow cell
+    nr_lanes, tiles_per_lane = FLOW_CELL_SCALES[flow_cell_type]
+    samples: List[MockNovaSeqSample] = get_synthetic_samples(
+        nr_lanes=nr_lanes, samples_per_lane=SAMPLES_PER_LANE
+    )
+    conversion_stats_path: Path = write_synthetic_conversion_stats(
+        conversion_stats_path=Path(tmp_path, "ConversionStats.xml"),
+        flow_cell_id="HXXXXXXXX",
+        samples=samples,
+        tiles_per_lane=tiles_per_lane,
+    )
+    demultiplexing_stats_path: Path = write_synthetic_demultiplexing_stats(
+        demultiplexing_stats_path=Path(tmp_path, "DemultiplexingStats.xml"),
+        flow_cell_id="HXXXXXXXX",
+        samples=samples,
+    )
+
+    # WHEN parsing the conversion stats in the default and in the fast mode
+    conversion_stats, *default_benchmark = _measure(
+        lambda: ConversionStats(conversion_stats_path=conversion_stats_path)
+    )
+    fast_conversion_stats, *fast_benchmark = _measure(
+        lambda: ConversionStats(conversion_stats_path=conversion_stats_path, fast=True)
+    )
+    _log_benchmark("ConversionStats", flow_cell_type, default_benchmark, fast_benchmark)
+
+    # THEN the results should be the same
+    for lane, barcode_to_results in conversion_stats.lanes_to_barcode.items():
+        assert dict(fast_conversion_stats.lanes_to_barcode[lane]) == barcode_to_results
+    assert fast_conversion_stats.raw_clusters_per_lane == conversion_stats.raw_clusters_per_lane
+
+    # WHEN parsing the demultiplexing stats in the default and in the fast mode
+    demux_stats, *default_benchmark = _measure(
+        lambda: DemuxStats(demux_stats_path=demultiplexing_stats_path)
+    )
+    fast_demux_stats, *fast_benchmark = _measure(
+        lambda: DemuxStats(demux_stats_path=demultiplexing_stats_path, fast=True)
+    )
+    _log_benchmark("DemuxStats", flow_cell_type, default_benchmark, fast_benchmark)
+
+    # THEN the results should be the same
+    for lane, barcode_to_stats in demux_stats.lanes_to_barcode.items():
+        assert dict(fast_demux_stats.lanes_to_barcode[lane]) == barcode_to_stats
+
+
+@pytest.mark.parametrize("flow_cell_type", list(FLOW_CELL_SCALES))
+def test_dragen_parser_benchmark(flow_cell_type: str, tmp_path: Path):
+    """Benchmark parsing of Dragen quality and adapter metrics."""
+    # GIVEN Dragen metrics files of a fully loaded flow cell
+    nr_lanes, _ = FLOW_CELL_SCALES[flow_cell_type]
+    samples: List[MockNovaSeqSample] = get_synthetic_samples(
+        nr_lanes=nr_lanes, samples_per_lane=SAMPLES_PER_LANE * 4
+    )
+    quality_metrics_path: Path = write_synthetic_quality_metrics(
+        quality_metrics_path=Path(tmp_path, "Quality_Metrics.csv"), samples=samples
+    )
+    adapter_metrics_path: Path = write_synthetic_adapter_metrics(
+        adapter_metrics_path=Path(tmp_path, "Adapter_Metrics.csv"), samples=samples
+    )
+
+    # WHEN parsing the quality metrics in the default and in the fast mode
+    quality_metrics, *default_benchmark = _measure(lambda: QualityMetrics(quality_metrics_path))
+    fast_quality_metrics, *fast_benchmark = _measure(
+        lambda: QualityMetrics(quality_metrics_path, fast=True)
+    )
+    _log_benchmark("QualityMetrics", flow_cell_type, default_benchmark, fast_benchmark)
+
+    # THEN the metrics should be the same
+    assert fast_quality_metrics.parsed_metrics == quality_metrics.parsed_metrics
+
+    # WHEN parsing the adapter metrics in the default and in the fast mode
+    adapter_metrics, *default_benchmark = _measure(lambda: AdapterMetrics(adapter_metrics_path))
+    fast_adapter_metrics, *fast_benchmark = _measure(
+        lambda: AdapterMetrics(adapter_metrics_path, fast=True)
+    )
+    _log_benchmark("AdapterMetrics", flow_cell_type, default_benchmark, fast_benchmark)
+
+    # THEN the metrics should be the same
+    assert fast_adapter_metrics.parsed_metrics == adapter_metrics.parsed_metrics
@@ -11,3 +11,16 @@ def test_parse_quality_metrics(quality_metrics_path: Path):
 
     # THEN the object should be successfully parsed
     assert quality_metrics_obj.parse_metrics_file()
+
+
+def test_parse_quality_metrics_fast(quality_metrics_path: Path):
+    # GIVEN an existing Quality_Metrics.csv path
+    assert quality_metrics_path.exists()
+
+    # WHEN parsing the file in the default and in the fast mode
+    fast_quality_metrics: QualityMetrics = QualityMetrics(quality_metrics_path, fast=True)
+
+    # THEN the fast mode should give the same metrics
+    assert (
+        fast_quality_metrics.parsed_metrics == QualityMetrics(quality_metrics_path).parsed_metrics
+    )
@@ -1,7 +1,105 @@
-from typing import Dict, Union
+import datetime as dt
+from pathlib import Path
+from typing import Dict, List, Union
 
-from cg.apps.cgstats.db.models import Demux, Flowcell, Sample, Unaligned
+from cg.apps.cgstats.db.models import (
+    Datasource,
+    Demux,
+    Flowcell,
+    Project,
+    Sample,
+    Supportparams,
+    Unaligned,
+)
 from cg.apps.cgstats.stats import StatsAPI
+from cg.constants.sequencing import Sequencers
+from cg.models.cgstats.flowcell import StatsSample
+
+
+def _add_flow_cell(stats_api: StatsAPI, flow_cell_name: str) -> Demux:
+    """Add a flow cell with a demultiplexing to the cgstats database."""
+    flow_cell = Flowcell(
+        flowcellname=flow_cell_name,
+        flowcell_pos="A",
+        hiseqtype=Sequencers.NOVASEQ,
+        time=dt.datetime.now(),
+    )
+    datasource = Datasource(document_path=flow_cell_name, document_type="html")
+    datasource.supportparams = Supportparams(document_path=flow_cell_name, idstring="NA")
+    demux = Demux()
+    demux.flowcell = flow_cell
+    demux.datasource = datasource
+    stats_api.add(demux)
+    return demux
+
+
+def _add_unaligned(
+    stats_api: StatsAPI, demux: Demux, sample: Sample, lane: int, q30: int = 85
+) -> None:
+    """Add the demultiplexing of a sample on a lane to the cgstats database."""
+    unaligned = Unaligned(lane=lane, readcounts=1000, q30_bases_pct=q30)
+    unaligned.sample = sample
+    unaligned.demux = demux
+    stats_api.add(unaligned)
+
+
+def _touch_fastqs(root_dir: Path, flow_cell_name: str, sample_dir_name: str, *names: str) -> None:
+    """Create FASTQ files in the sample directory of a demultiplexed flow cell."""
+    sample_dir: Path = Path(
+        root_dir, f"210101_A00689_0001_A{flow_cell_name}", "Unaligned", "Project_1", sample_dir_name
+    )
+    sample_dir.mkdir(parents=True)
+    for name in names:
+        Path(sample_dir, name).touch()
+
+
+def test_get_flowcell_samples(stats_api: StatsAPI, tmp_path: Path):
+    """Test fetching reads and FASTQ files of the samples on a flow cell"""
+    # GIVEN a flow cell with two samples on a pooled lane and one sample on its own lane
+    demux: Demux = _add_flow_cell(stats_api=stats_api, flow_cell_name="HAAAAAAXX")
+    project = Project(projectname="1", time=dt.datetime.now())
+    samples: Dict[str, Sample] = {
+        sample_name: Sample(samplename=sample_name, limsid=sample_name)
+        for sample_name in ["ACC1", "ACC2", "ACC3"]
+    }
+    for sample in samples.values():
+        sample.project = project
+    _add_unaligned(stats_api=stats_api, demux=demux, sample=samples["ACC1"], lane=1)
+    _add_unaligned(stats_api=stats_api, demux=demux, sample=samples["ACC2"], lane=1, q30=50)
+    _add_unaligned(stats_api=stats_api, demux=demux, sample=samples["ACC3"], lane=2)
+
+    # GIVEN that one of the samples was also sequenced on another flow cell
+    other_demux: Demux = _add_flow_cell(stats_api=stats_api, flow_cell_name="HBBBBBBXX")
+    _add_unaligned(stats_api=stats_api, demux=other_demux, sample=samples["ACC1"], lane=1)
+    stats_api.commit()
+
+    # GIVEN FASTQ files of the samples, including undetermined reads
+    stats_api.root_dir = tmp_path
+    _touch_fastqs(tmp_path, "HAAAAAAXX", "Sample_ACC1", "ACC1.fastq.gz", "Undetermined.fastq.gz")
+    _touch_fastqs(tmp_path, "HAAAAAAXX", "Sample_ACC2", "ACC2.fastq.gz")
+    _touch_fastqs(tmp_path, "HAAAAAAXX", "Sample_ACC3_XTC", "Undetermined.fastq.gz")
+    _touch_fastqs(tmp_path, "HBBBBBBXX", "Sample_ACC1", "ACC1_2.fastq.gz")
+
+    # WHEN fetching the samples on the flow cell
+    flow_cell_samples: List[StatsSample] = stats_api.get_flowcell_samples(
+        flowcell_object=demux.flowcell
+    )
+    samples_by_name: Dict[str, StatsSample] = {sample.name: sample for sample in flow_cell_samples}
+
+    # THEN the reads from both flow cells should be counted, without undetermined pooled reads
+    assert samples_by_name["ACC1"].reads == 2000
+    assert [Path(fastq).name for fastq in samples_by_name["ACC1"].fastqs] == [
+        "ACC1.fastq.gz",
+        "ACC1_2.fastq.gz",
+    ]
+
+    # THEN the sample with too low q30 should be left out
+    assert "ACC2" not in samples_by_name
+
+    # THEN undetermined reads on a lane that is not pooled should be included
+    assert [Path(fastq).name for fastq in samples_by_name["ACC3"].fastqs] == [
+        "Undetermined.fastq.gz"
+    ]
 
 
 def test_flow_cell_reads_and_q30_summary(
@@ -1,9 +1,12 @@
-from typing import List
+from typing import List, Set
+
+import pytest
 
 from cg.apps.demultiplex.sample_sheet import dummy_sample, index
 from cg.apps.demultiplex.sample_sheet.index import Index
 from cg.apps.demultiplex.sample_sheet.novaseq_sample_sheet import SampleSheetCreator
 from cg.apps.lims.samplesheet import LimsFlowcellSample
+from cg.exc import FlowCellError
 
 
 def test_get_valid_indexes():
@@ -42,3 +45,80 @@ def test_get_dummy_sample(flow_cell_id: str, index_obj: Index):
 
     # THEN assert the sample id was correct
     assert dummy_sample_obj.sample_id == dummy_sample.dummy_sample_name(index_obj.name)
+
+
+def test_get_index_catalogue():
+    # GIVEN the valid indexes
+
+    # WHEN fetching the index catalogue twice
+    index_catalogue: index.IndexCatalogue = index.get_index_catalogue()
+
+    # THEN the catalogue should only be built once
+    assert index.get_index_catalogue() is index_catalogue
+
+    # THEN all valid dual indexes should be found by sequence
+    valid_indexes: List[Index] = index.get_valid_indexes()
+    assert list(index_catalogue.indexes) == valid_indexes
+    assert index_catalogue.get_index(valid_indexes[0].sequence) == valid_indexes[0]
+
+
+def test_get_reverse_complement_from_index_catalogue(index_obj: Index):
+    # GIVEN an index catalogue with a dual index
+    index_catalogue: index.IndexCatalogue = index.build_index_catalogue(indexes=[index_obj])
+    index2: str = index_obj.sequence.split("-")[1]
+
+    # WHEN fetching the reverse complement of the padded second index
+    padded_index2: str = index.pad_index_two(index_string=index2, reverse_complement=True)
+    reverse_complement: str = index_catalogue.get_reverse_complement(padded_index2)
+
+    # THEN the precomputed reverse complement should be returned
+    assert padded_index2 in index_catalogue.reverse_complements
+    assert reverse_complement == index.get_reverse_complement_dna_seq(padded_index2)
+
+    # THEN the reverse complement of sequences that are not in the catalogue should be computed
+    assert index_catalogue.get_reverse_complement("AACC") == "GGTT"
+
+
+def test_get_index_prefixes():
+    # GIVEN indexes used in a lane
+    lane_indexes: Set[str] = {"GTCCTGGC-AGGTACGT", "AACGTG"}
+
+    # WHEN getting the prefixes of the indexes
+    index_prefixes: Set[str] = index.get_index_prefixes(indexes=lane_indexes)
+
+    # THEN an index should be among the prefixes when it is the start of a used index
+    for sequence in ["GTCCTGGC", "GTCCTGGC-AGGTACGT", "AACGTG", "CAGATC", "AACGTGAA"]:
+        assert (sequence in index_prefixes) == index.index_exists(
+            index=sequence, indexes=lane_indexes
+        )
+
+
+def test_get_index_collisions(lims_novaseq_samples: List[LimsFlowcellSample]):
+    # GIVEN two samples with the same indexes in a lane and one sample in another lane
+    samples: List[LimsFlowcellSample] = [
+        lims_novaseq_samples[0].copy(update={"sample_id": sample_id, "lane": lane})
+        for sample_id, lane in [("ACC1", 1), ("ACC2", 1), ("ACC3", 2)]
+    ]
+
+    # WHEN checking for index collisions
+    collisions = index.get_index_collisions(samples=samples)
+
+    # THEN only the samples in the same lane should collide
+    assert [(sample.sample_id, other.sample_id) for sample, other in collisions] == [
+        ("ACC1", "ACC2")
+    ]
+
+
+def test_construct_sample_sheet_with_index_collision(
+    novaseq_bcl2fastq_sample_sheet_object: SampleSheetCreator,
+):
+    # GIVEN a sample sheet where two samples in a lane have the same indexes
+    sample: LimsFlowcellSample = novaseq_bcl2fastq_sample_sheet_object.lims_samples[0]
+    novaseq_bcl2fastq_sample_sheet_object.lims_samples.append(
+        sample.copy(update={"sample_id": "ACC0"})
+    )
+
+    # WHEN constructing the sample sheet
+    # THEN the index collision should be found
+    with pytest.raises(FlowCellError):
+        novaseq_bcl2fastq_sample_sheet_object.construct_sample_sheet()
@@ -0,0 +1,72 @@
+"""Benchmark of the creation of NovaSeq sample sheets for flow cells with a thousand samples.
+
+The samples have synthetic dual indexes, so that the time to add dummy samples, adapt the indexes
+and validate the sample sheet can be compared between releases without LIMS data."""
+import itertools
+import logging
+import time
+from typing import Dict, List, Set
+
+import pytest
+
+from cg.apps.demultiplex.sample_sheet import index
+from cg.apps.demultiplex.sample_sheet.novaseq_sample_sheet import SampleSheetCreator
+from cg.apps.lims.samplesheet import LimsFlowcellSampleBcl2Fastq
+from cg.models.demultiplex.run_parameters import RunParameters
+
+pytestmark = pytest.mark.benchmark
+
+LOG = logging.getLogger(__name__)
+
+NR_LANES: int = 4
+SAMPLES_PER_FLOW_CELL: List[int] = [1000, 2000]
+
+
+def get_synthetic_samples(
+    flow_cell_id: str, nr_samples: int, nr_lanes: int
+) -> List[LimsFlowcellSampleBcl2Fastq]:
+    """Return samples spread over the lanes, with unique synthetic dual indexes in each lane."""
+    sequences = ("".join(bases) for bases in itertools.product("ACGT", repeat=8))
+    return [
+        LimsFlowcellSampleBcl2Fastq(
+            flowcell_id=flow_cell_id,
+            lane=sample_number % nr_lanes + 1,
+            sample_id=f"ACC{sample_number}",
+            index=f"{next(sequences)}-{next(sequences)}",
+            sample_name=f"sample_{sample_number}",
+            project="benchmark",
+        )
+        for sample_number in range(nr_samples)
+    ]
+
+
+@pytest.mark.parametrize("nr_samples", SAMPLES_PER_FLOW_CELL)
+def test_sample_sheet_benchmark(
+    nr_samples: int, flow_cell_id: str, novaseq_run_parameters_object: RunParameters
+):
+    """Benchmark the creation of a sample sheet for a fully loaded flow cell."""
+    # GIVEN samples of a fully loaded flow cell
+    lims_samples: List[LimsFlowcellSampleBcl2Fastq] = get_synthetic_samples(
+        flow_cell_id=flow_cell_id, nr_samples=nr_samples, nr_lanes=NR_LANES
+    )
+    indexes_by_lane: Dict[int, Set[str]] = index.get_indexes_by_lane(samples=lims_samples)
+    sample_sheet_creator = SampleSheetCreator(
+        bcl_converter="bcl2fastq",
+        flowcell_id=flow_cell_id,
+        lims_samples=lims_samples,
+        run_parameters=novaseq_run_parameters_object,
+    )
+
+    # WHEN creating the sample sheet
+    start_time: float = time.perf_counter()
+    sample_sheet: str = sample_sheet_creator.construct_sample_sheet()
+    run_time: float = time.perf_counter() - start_time
+    LOG.info(f"Sample sheet with {nr_samples} samples: {run_time:.3f}s")
+
+    # THEN every lane should have a dummy sample for each valid index that is not in use
+    nr_dummy_samples: int = sum(
+        not index.index_exists(index=index_obj.sequence, indexes=lane_indexes)
+        for lane_indexes in indexes_by_lane.values()
+        for index_obj in index.get_valid_indexes(dual_indexes_only=True)
+    )
+    assert len(sample_sheet.splitlines()) == 5 + nr_samples + nr_dummy_samples
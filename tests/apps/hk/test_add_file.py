@@ -1,7 +1,10 @@
 """ Test adding files with Housekeeper API."""
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List
 
+from housekeeper.store.models import File
+
+from cg.apps.housekeeper.hk import HousekeeperAPI
 from tests.mocks.hk_mock import MockHousekeeperAPI
 from tests.store_helpers import StoreHelpers
 
@@ -50,3 +53,32 @@ def test_add_file_with_list_of_tags(
 
     # THEN the file should have been added to Housekeeper
     assert new_file
+
+
+def test_add_and_include_files_does_not_commit_new_tags(
+    housekeeper_api: HousekeeperAPI,
+    helpers: StoreHelpers,
+    hk_bundle_data: Dict[str, Any],
+    fastq_file: Path,
+    not_existing_hk_tag: str,
+    mocker,
+):
+    """Test that adding files in a batch leaves the new tags and files to be committed once."""
+
+    # GIVEN a hk api populated with a version obj
+    version_obj = helpers.ensure_hk_version(housekeeper_api, hk_bundle_data)
+    mocker.patch.object(
+        HousekeeperAPI, "include_file", side_effect=lambda file_obj, version_obj: file_obj
+    )
+
+    # WHEN adding and including files with a tag that does not exist
+    hk_files: List[File] = housekeeper_api.add_and_include_files(
+        version=version_obj, file_paths=[fastq_file], tags=[not_existing_hk_tag]
+    )
+
+    # THEN the files should have the new tag
+    assert [tag.name for tag in hk_files[0].tags] == [not_existing_hk_tag]
+
+    # THEN neither the tag nor the files should have been committed
+    housekeeper_api.rollback()
+    assert housekeeper_api.get_tag(not_existing_hk_tag) is None
@@ -1,8 +1,16 @@
 """Fixtures for lims tests"""
+import json
+import threading
+from pathlib import Path
+from typing import Dict
+from urllib.parse import urlencode
+from xml.etree import ElementTree
 
 import pytest
+from genologics.lims import Lims
 
 from cg.apps.lims.api import LimsAPI
+from cg.apps.lims.cache import LimsResponseCache
 
 
 class MockLims(LimsAPI):
@@ -13,6 +21,10 @@ class MockLims(LimsAPI):
     def __init__(self):
         """Mock the init method"""
         self.lims = self
+        self.baseuri = "https://lims.test/"
+        self.VERSION = "v2"
+        self.cache = {}
+        self.response_cache = LimsResponseCache(expire_after=3600, max_entries=100)
 
     def get_prepmethod(self, lims_id: str) -> str:
         """Override the get_prepmethod"""
@@ -24,6 +36,42 @@ class MockLims(LimsAPI):
         """Override the get_deliverymethod"""
 
 
+class RecordedLims(Lims):
+    """Lims that serves recorded responses instead of sending requests, and counts the requests"""
+
+    def __init__(self, responses: Dict[str, str]):
+        super().__init__(baseuri="https://lims.test", username="user", password="password")
+        self.responses: Dict[str, str] = responses
+        self.requests: int = 0
+        self.lock = threading.Lock()
+
+    def get_response(self, uri: str) -> ElementTree.Element:
+        return ElementTree.fromstring(self.responses[uri.replace(self.get_uri() + "/", "")])
+
+    def get(self, uri, params=dict()) -> ElementTree.Element:
+        with self.lock:
+            self.requests += 1
+        if params:
+            uri = f"{uri}?{urlencode(params)}"
+        return self.get_response(uri)
+
+    def post(self, uri, data, params=dict()) -> ElementTree.Element:
+        """Serve a batch request with the recorded responses of the linked entities"""
+        with self.lock:
+            self.requests += 1
+        details = ElementTree.Element("details")
+        for link in ElementTree.fromstring(data).findall("link"):
+            details.append(self.get_response(link.attrib["uri"]))
+        return details
+
+
+@pytest.fixture(name="recorded_lims")
+def fixture_recorded_lims(apps_dir: Path) -> RecordedLims:
+    """Return a lims with the recorded responses of a flow cell with pooled samples"""
+    with open(Path(apps_dir, "lims", "flow_cell_responses.json")) as responses_file:
+        return RecordedLims(responses=json.load(responses_file))
+
+
 @pytest.fixture(scope="function")
 def lims_api():
     """Returns a Lims api mock"""
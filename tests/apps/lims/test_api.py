@@ -1,6 +1,9 @@
 """Test the Lims api"""
 import datetime as dt
+from xml.etree import ElementTree
 
+from genologics.entities import Sample
+from genologics.lims import Lims
 from requests.exceptions import HTTPError
 
 from cg.apps.lims.api import LimsAPI
@@ -35,6 +38,20 @@ def test_get_received_date_no_sample(lims_api, mocker):
     assert res is None
 
 
+def test_samples(lims_api, mocker):
+    """Test to fetch samples in batch, leaving out the samples that are not found"""
+    # GIVEN a lims api where only one of two samples is found
+    mocker.patch("cg.apps.lims.api.Sample", side_effect=lambda lims, id: mocker.Mock(id=id))
+    mocker.patch.object(LimsAPI, "load_samples", side_effect=lambda samples: [samples[0]])
+    mocker.patch.object(LimsAPI, "_export_sample", side_effect=lambda sample: {"id": sample.id})
+
+    # WHEN fetching the samples
+    res = lims_api.samples(["ACC1", "ACC2"])
+
+    # THEN assert only the found sample is returned
+    assert res == {"ACC1": {"id": "ACC1"}}
+
+
 def test_get_prepared_date(lims_api, mocker):
     """Test to get the prepared date for an existing sample"""
     # GIVEN a lims api and a mocked sample that returns a prepared at date
@@ -91,3 +108,41 @@ def test_get_delivery_date_no_sample(lims_api, mocker):
 
     # THEN assert that None is returned since a exception was raised
     assert res is None
+
+
+def test_get_from_response_cache(lims_api, mocker):
+    """Test that a LIMS response is fetched once and then read from the response cache"""
+    # GIVEN a lims api where a sample is fetched from LIMS
+    fetch_sample = mocker.patch.object(
+        Lims, "get", return_value=ElementTree.fromstring("<sample limsid='ACC1'/>")
+    )
+    sample_uri = "https://lims.test/api/v2/samples/ACC1"
+
+    # WHEN fetching the sample twice
+    lims_api.get(sample_uri)
+    root: ElementTree.Element = lims_api.get(sample_uri)
+
+    # THEN the sample should only be fetched from LIMS once
+    fetch_sample.assert_called_once()
+    assert root.attrib["limsid"] == "ACC1"
+
+    # WHEN invalidating the sample and fetching it again
+    lims_api.response_cache.invalidate(uri=sample_uri)
+    lims_api.get(sample_uri)
+
+    # THEN the sample should be fetched from LIMS again
+    assert fetch_sample.call_count == 2
+
+
+def test_get_sample_with_expired_response(lims_api):
+    """Test that a loaded sample is fetched again when its cached response has expired"""
+    # GIVEN a loaded sample without a cached response
+    lims_sample = Sample(lims_api, uri="https://lims.test/api/v2/samples/ACC1")
+    lims_sample.root = ElementTree.fromstring("<sample limsid='ACC1'/>")
+
+    # WHEN getting the sample
+    sample: Sample = lims_api.get_sample("ACC1")
+
+    # THEN the same sample should be returned, to be fetched again when used
+    assert sample is lims_sample
+    assert sample.root is None
@@ -0,0 +1,92 @@
+"""Tests for the cache of LIMS responses"""
+import time
+from pathlib import Path
+from typing import List
+
+from cg.apps.lims.cache import LimsResponseCache
+
+SAMPLE_URI: str = "https://lims.test/api/v2/samples/ACC1"
+SAMPLE_RESPONSE: str = "<sample limsid='ACC1'/>"
+
+
+def test_get_response():
+    """Test getting a cached response"""
+    # GIVEN a cache with a response
+    cache = LimsResponseCache(expire_after=60, max_entries=10)
+    cache.set(uri=SAMPLE_URI, response=SAMPLE_RESPONSE)
+
+    # WHEN getting the response
+    response: str = cache.get(uri=SAMPLE_URI)
+
+    # THEN the cached response should be returned
+    assert response == SAMPLE_RESPONSE
+    assert SAMPLE_URI in cache
+
+
+def test_get_expired_response(mocker):
+    """Test that an expired response is not returned"""
+    # GIVEN a cache with a response
+    cache = LimsResponseCache(expire_after=60, max_entries=10)
+    cache.set(uri=SAMPLE_URI, response=SAMPLE_RESPONSE)
+
+    # GIVEN that the response has expired
+    mocker.patch.object(time, "time", return_value=time.time() + 61)
+
+    # WHEN getting the response
+    response: str = cache.get(uri=SAMPLE_URI)
+
+    # THEN no response should be returned
+    assert response is None
+    assert SAMPLE_URI not in cache
+
+
+def test_set_response_evicts_least_recently_used():
+    """Test that the least recently used response is evicted when the cache is full"""
+    # GIVEN a full cache where the first response was used last
+    cache = LimsResponseCache(expire_after=60, max_entries=2)
+    cache.set(uri="first", response=SAMPLE_RESPONSE)
+    cache.set(uri="second", response=SAMPLE_RESPONSE)
+    cache.get(uri="first")
+
+    # WHEN adding another response
+    evicted_uris: List[str] = cache.set(uri="third", response=SAMPLE_RESPONSE)
+
+    # THEN the least recently used response should be evicted
+    assert evicted_uris == ["second"]
+    assert len(cache) == 2
+    assert "second" not in cache
+
+
+def test_invalidate_response():
+    """Test removing the response of an entity"""
+    # GIVEN a cache with a response
+    cache = LimsResponseCache(expire_after=60, max_entries=10)
+    cache.set(uri=SAMPLE_URI, response=SAMPLE_RESPONSE)
+
+    # WHEN invalidating the response
+    cache.invalidate(uri=SAMPLE_URI)
+
+    # THEN the response should be removed
+    assert cache.get(uri=SAMPLE_URI) is None
+
+
+def test_persisted_responses(tmp_path: Path, mocker):
+    """Test that responses are reused by a later cache until they expire"""
+    # GIVEN a persistent cache with a response
+    cache_path = Path(tmp_path, "lims_cache.sqlite")
+    LimsResponseCache(expire_after=60, max_entries=10, path=cache_path).set(
+        uri=SAMPLE_URI, response=SAMPLE_RESPONSE
+    )
+
+    # WHEN opening the cache again
+    cache = LimsResponseCache(expire_after=60, max_entries=10, path=cache_path)
+
+    # THEN the response should be loaded
+    assert cache.get(uri=SAMPLE_URI) == SAMPLE_RESPONSE
+
+    # WHEN opening the cache after the response has expired
+    mocker.patch.object(time, "time", return_value=time.time() + 61)
+    cache = LimsResponseCache(expire_after=60, max_entries=10, path=cache_path)
+
+    # THEN the response should not be loaded
+    assert len(cache) == 0
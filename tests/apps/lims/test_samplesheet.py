@@ -0,0 +1,51 @@
+"""Tests for fetching sample sheet information from Lims"""
+from typing import List
+
+from cg.apps.lims.samplesheet import (
+    LimsFlowcellSampleBcl2Fastq,
+    flowcell_samples,
+    get_index,
+    get_non_pooled_artifacts,
+)
+from genologics.entities import Container
+from tests.apps.lims.conftest import RecordedLims
+
+
+def test_flowcell_samples(recorded_lims: RecordedLims):
+    """Test fetching the samples of a flow cell with pooled and nested pooled lanes"""
+    # GIVEN a lims with a flow cell with pooled samples
+
+    # WHEN fetching the samples of the flow cell
+    samples: List[LimsFlowcellSampleBcl2Fastq] = list(
+        flowcell_samples(lims=recorded_lims, flowcell_id="HXXXXXXXX", bcl_converter="bcl2fastq")
+    )
+
+    # THEN the samples should be returned in lane order with their indexes and projects
+    assert [(sample.lane, sample.sample_id, sample.project) for sample in samples] == [
+        (1, "ACC1", "project-1"),
+        (1, "ACC2", "project-1"),
+        (2, "ACC2", "project-1"),
+        (2, "ACC3", "project-2"),
+        (2, "ACC4", "project-2"),
+    ]
+    assert samples[0].index == "ATTACTCG-TATAGCCT"
+    assert samples[0].sample_name == "acc1"
+
+
+def test_flowcell_samples_prefetch(recorded_lims: RecordedLims):
+    """Test that the artifacts of a flow cell are fetched with fewer requests than one at a time"""
+    # GIVEN a lims with a flow cell with pooled samples
+
+    # WHEN fetching the samples of the flow cell
+    list(flowcell_samples(lims=recorded_lims, flowcell_id="HXXXXXXXX", bcl_converter="bcl2fastq"))
+
+    # WHEN fetching the same information one artifact at a time
+    serial_lims = RecordedLims(responses=recorded_lims.responses)
+    container: Container = serial_lims.get_containers(name="HXXXXXXXX")[-1]
+    for placement_artifact in container.placements.values():
+        for artifact in get_non_pooled_artifacts(placement_artifact):
+            get_index(lims=serial_lims, label=artifact.reagent_labels[0])
+            assert artifact.samples[0].project.name
+
+    # THEN the prefetch should need fewer requests
+    assert recorded_lims.requests < serial_lims.requests
@@ -256,3 +256,19 @@ def test_repr_string(loqusdb_api: LoqusdbAPI, loqusdb_binary_path: str, loqusdb_
         f"LoqusdbAPI(binary_path={loqusdb_binary_path}, config_path={loqusdb_config_path})"
         in repr_string
     )
+
+
+def test_clone(loqusdb_api: LoqusdbAPI, loqusdb_case_output: bytes):
+    """Test that a cloned Loqusdb API keeps the output of its commands to itself."""
+
+    # GIVEN a Loqusdb API and a clone of it
+    loqusdb_api_clone: LoqusdbAPI = loqusdb_api.clone()
+
+    # WHEN the clone runs a command
+    loqusdb_api_clone.process.stdout = loqusdb_case_output.decode("utf-8")
+
+    # THEN the clone should use the same Loqusdb instance
+    assert loqusdb_api_clone.config_path == loqusdb_api.config_path
+
+    # THEN the output should not be seen by the original API
+    assert loqusdb_api.process.stdout != loqusdb_api_clone.process.stdout
@@ -3,6 +3,7 @@ from pathlib import Path
 
 from cg.apps.slurm.slurm_api import SlurmAPI
 from cg.models.slurm.sbatch import Sbatch
+from tests.mocks.process_mock import ProcessMock
 
 
 def test_instantiate_slurm_api():
@@ -136,3 +137,20 @@ def test_submit_sbatch_script_invalid_sbatch_response(
 
     # THEN assert that a job number 0 indicating malfunction
     assert job_number == 0
+
+
+def test_get_number_of_queued_jobs(slurm_account: str):
+    # GIVEN a slurm api
+    api = SlurmAPI()
+    api.queue_process = ProcessMock(binary="squeue")
+
+    # GIVEN that the queue holds two jobs
+    api.queue_process.set_stdout(text="4120\n4121\n")
+
+    # WHEN counting the queued jobs
+    number_of_jobs: int = api.get_number_of_queued_jobs(
+        account=slurm_account, quality_of_service="maintenance"
+    )
+
+    # THEN assert that both jobs are counted
+    assert number_of_jobs == 2
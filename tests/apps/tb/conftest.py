@@ -0,0 +1,37 @@
+"""Fixtures for the Trailblazer API tests."""
+from typing import Generator
+
+import pytest
+
+from cg.apps.tb import TrailblazerAPI
+from tests.mocks.tb_server import StubTrailblazerServer
+
+
+@pytest.fixture(name="stub_trailblazer_server")
+def fixture_stub_trailblazer_server() -> Generator[StubTrailblazerServer, None, None]:
+    """Return a running local Trailblazer stub."""
+    server = StubTrailblazerServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture(name="stub_trailblazer_api")
+def fixture_stub_trailblazer_api(
+    stub_trailblazer_server: StubTrailblazerServer, mocker
+) -> TrailblazerAPI:
+    """Return a Trailblazer API querying the local Trailblazer stub."""
+    mocker.patch("cg.apps.tb.api.TRAILBLAZER_RETRY_BACKOFF_FACTOR", 0)
+    trailblazer_api = TrailblazerAPI(
+        config={
+            "trailblazer": {
+                "host": stub_trailblazer_server.url,
+                "service_account": "SERVICE",
+                "service_account_auth_file": "trailblazer-auth.json",
+            }
+        }
+    )
+    mocker.patch.object(
+        TrailblazerAPI, "auth_header", new_callable=mocker.PropertyMock, return_value={}
+    )
+    return trailblazer_api
@@ -0,0 +1,97 @@
+"""Tests for the HTTP layer of the Trailblazer API."""
+from typing import Dict, List, Optional, Set
+
+import pytest
+
+from cg.apps.tb import TrailblazerAPI
+from cg.constants.tb import TRAILBLAZER_POOL_SIZE, TRAILBLAZER_RETRIES, AnalysisStatus
+from cg.exc import TrailblazerAPIHTTPError
+from tests.mocks.tb_server import StubTrailblazerServer
+
+
+def test_get_latest_analyses_statuses(
+    stub_trailblazer_api: TrailblazerAPI, stub_trailblazer_server: StubTrailblazerServer
+):
+    """Test that the statuses of many cases are fetched over a bounded number of connections."""
+    # GIVEN a Trailblazer with analyses for many cases and a case without analyses
+    case_ids: List[str] = [f"case_{number}" for number in range(200)]
+    stub_trailblazer_server.analysis_statuses = {
+        case_id: AnalysisStatus.COMPLETED if number % 2 else AnalysisStatus.FAILED
+        for number, case_id in enumerate(case_ids)
+    }
+    case_ids.append("case_without_analysis")
+
+    # WHEN fetching the statuses of the latest analyses of the cases
+    statuses: Dict[str, Optional[str]] = stub_trailblazer_api.get_latest_analyses_statuses(
+        case_ids=case_ids
+    )
+
+    # THEN the status of each case should be returned
+    assert statuses == {**stub_trailblazer_server.analysis_statuses, "case_without_analysis": None}
+
+    # THEN the connections should have been reused
+    assert stub_trailblazer_server.connection_count <= TRAILBLAZER_POOL_SIZE
+
+
+def test_get_cases_with_latest_analysis_completed(
+    stub_trailblazer_api: TrailblazerAPI, stub_trailblazer_server: StubTrailblazerServer
+):
+    """Test that only the cases with a completed latest analysis are returned."""
+    # GIVEN a Trailblazer with a completed and a running analysis
+    stub_trailblazer_server.analysis_statuses = {
+        "completed_case": AnalysisStatus.COMPLETED,
+        "running_case": AnalysisStatus.RUNNING,
+    }
+
+    # WHEN fetching the cases with a completed latest analysis
+    completed_case_ids: Set[str] = stub_trailblazer_api.get_cases_with_latest_analysis_completed(
+        case_ids=["completed_case", "running_case"]
+    )
+
+    # THEN only the completed case should be returned
+    assert completed_case_ids == {"completed_case"}
+
+
+def test_query_trailblazer_retries_unavailable(
+    stub_trailblazer_api: TrailblazerAPI, stub_trailblazer_server: StubTrailblazerServer
+):
+    """Test that an idempotent request is retried when Trailblazer is temporarily unavailable."""
+    # GIVEN a Trailblazer that is unavailable for the first two requests
+    stub_trailblazer_server.failing_responses = [503, 502]
+
+    # WHEN setting the status of an analysis
+    stub_trailblazer_api.set_analysis_status(case_id="case_id", status=AnalysisStatus.FAILED)
+
+    # THEN the status should have been set after retrying
+    assert stub_trailblazer_server.request_count == 3
+
+
+def test_query_trailblazer_retries_are_bounded(
+    stub_trailblazer_api: TrailblazerAPI, stub_trailblazer_server: StubTrailblazerServer
+):
+    """Test that an error is raised when Trailblazer stays unavailable."""
+    # GIVEN a Trailblazer that is unavailable for longer than the retries
+    stub_trailblazer_server.failing_responses = [503] * (TRAILBLAZER_RETRIES + 2)
+
+    # WHEN setting the status of an analysis
+    with pytest.raises(TrailblazerAPIHTTPError):
+        stub_trailblazer_api.set_analysis_status(case_id="case_id", status=AnalysisStatus.FAILED)
+
+    # THEN the request should have been sent once and then retried a bounded number of times
+    assert stub_trailblazer_server.request_count == TRAILBLAZER_RETRIES + 1
+
+
+def test_query_trailblazer_does_not_retry_post_on_status(
+    stub_trailblazer_api: TrailblazerAPI, stub_trailblazer_server: StubTrailblazerServer
+):
+    """Test that a POST request is not retried once it may have been processed by Trailblazer."""
+    # GIVEN a Trailblazer that is unavailable for the first request
+    stub_trailblazer_server.analysis_statuses = {"case_id": AnalysisStatus.RUNNING}
+    stub_trailblazer_server.failing_responses = [503]
+
+    # WHEN fetching the status of the latest analysis
+    with pytest.raises(TrailblazerAPIHTTPError):
+        stub_trailblazer_api.get_latest_analysis_status(case_id="case_id")
+
+    # THEN the request should only have been sent once
+    assert stub_trailblazer_server.request_count == 1
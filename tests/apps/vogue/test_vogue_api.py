@@ -182,3 +182,26 @@ def test_vogue_load_flowcells(vogue_api, caplog):
 
     # THEN assert vogue output is comunicated
     assert "vogue output" in caplog.text
+
+
+def test_load_genotype_data_bulk(vogue_config, caplog):
+    """Test loading many genotype documents in vogue api"""
+
+    # GIVEN a vogue api and two genotype documents
+    vogue_api = VogueAPI(vogue_config)
+    genotype_dicts = [{"_id": "ACC1"}, {"_id": "ACC2"}]
+    caplog.set_level(logging.INFO)
+
+    # WHEN loading the documents and the first load fails
+    with mock.patch.object(subprocess, "run") as mocked:
+        mocked.side_effect = [
+            mock.Mock(returncode=1, stdout=b"", stderr=b"dummy_stderr"),
+            mock.Mock(returncode=0, stdout=b"", stderr=b""),
+        ]
+        loaded_ids = vogue_api.load_genotype_data_bulk(genotype_dicts=genotype_dicts, max_workers=1)
+
+    # THEN the id of the loaded document should be returned
+    assert loaded_ids == ["ACC2"]
+
+    # THEN the failing load should be logged
+    assert "Could not load genotype data of ACC1" in caplog.text
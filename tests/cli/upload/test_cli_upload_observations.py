@@ -13,6 +13,7 @@ from cg.cli.upload.observations.utils import (
     get_observations_case_to_upload,
     get_observations_api,
     get_sequencing_method,
+    upload_observations_batch,
 )
 from cg.constants import EXIT_SUCCESS
 from cg.constants.sequencing import SequencingMethod
@@ -20,6 +21,7 @@ from cg.constants.subject import PhenotypeStatus
 from cg.exc import CaseNotFoundError, LoqusdbUploadCaseError
 from cg.meta.observations.mip_dna_observations_api import MipDNAObservationsAPI
 from cg.models.cg_config import CGConfig
+from cg.models.observations.upload_report import ObservationsUploadReport
 from cg.store import Store
 from cg.store.models import Family, Sample
 from tests.store_helpers import StoreHelpers
@@ -104,6 +106,35 @@ def test_get_observations_api(base_context: CGConfig, helpers: StoreHelpers):
     assert isinstance(observations_api, MipDNAObservationsAPI)
 
 
+def test_upload_observations_batch(base_context: CGConfig, helpers: StoreHelpers, mocker):
+    """Test uploading the observations of many cases with one observations API per pipeline."""
+    store: Store = base_context.status_db
+
+    # GIVEN a case of a whitelisted customer and a case of a customer that is not
+    case: Family = helpers.add_case(store, internal_id="whitelisted_case")
+    case.customer.loqus_upload = True
+    other_case: Family = helpers.add_case(store, internal_id="other_case", customer_id="cust001")
+    other_case.customer.loqus_upload = False
+    for family in [case, other_case]:
+        sample: Sample = helpers.add_sample(store, application_type=SequencingMethod.WES)
+        store.relate_sample(family=family, sample=sample, status=PhenotypeStatus.UNKNOWN)
+    mocker.patch.object(
+        MipDNAObservationsAPI,
+        "upload_batch",
+        return_value=ObservationsUploadReport(uploaded_case_ids=[case.internal_id]),
+    )
+
+    # WHEN uploading the observations of the cases in a batch
+    report: ObservationsUploadReport = upload_observations_batch(
+        context=base_context, cases=[case, other_case], max_workers=2
+    )
+
+    # THEN only the case of the whitelisted customer should be uploaded
+    MipDNAObservationsAPI.upload_batch.assert_called_once_with(cases=[case], max_workers=2)
+    assert report.uploaded_case_ids == [case.internal_id]
+    assert report.failed_case_ids == [other_case.internal_id]
+
+
 def test_get_sequencing_method(base_context: CGConfig, helpers: StoreHelpers):
     """Test sequencing method extraction for Loqusdb upload."""
     store: Store = base_context.status_db
@@ -1,6 +1,7 @@
 """Fixtures for cli analysis tests"""
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, List, Set
 
 import pytest
 from cg.constants import Pipeline, DataDelivery
@@ -239,6 +240,15 @@ class MockTB:
         """Override TrailblazerAPI get_analysis_status method to avoid default behaviour"""
         return None
 
+    def get_latest_analyses_statuses(self, case_ids: List[str]) -> Dict[str, None]:
+        """Override TrailblazerAPI get_latest_analyses_statuses method to avoid default behaviour"""
+        return {case_id: None for case_id in case_ids}
+
+    def get_cases_with_latest_analysis_completed(self, case_ids: List[str]) -> Set[str]:
+        """Override TrailblazerAPI get_cases_with_latest_analysis_completed method to avoid
+        default behaviour"""
+        return set()
+
     def has_latest_analysis_started(self, case_id: str):
         """Override TrailblazerAPI has_analysis_started method to avoid default behaviour"""
         return False
@@ -44,6 +44,26 @@ from tests.store_helpers import StoreHelpers
 LOG = logging.getLogger(__name__)
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", default=False, help="Run the benchmark tests"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: benchmark test, only run with --benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the benchmark tests unless they are requested."""
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
 # Timestamp fixture
 
 
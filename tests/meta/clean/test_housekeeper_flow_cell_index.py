@@ -0,0 +1,71 @@
+"""Tests for the index of Housekeeper files and bundles of flow cells."""
+from pathlib import Path
+from typing import List
+
+from housekeeper.store.models import File, Version
+
+from cg.apps.housekeeper.hk import HousekeeperAPI
+from cg.constants.housekeeper_tags import SequencingFileTag
+from cg.meta.clean.housekeeper_flow_cell_index import HousekeeperFlowCellIndex
+
+
+def test_get_flow_cell_files(real_housekeeper_api: HousekeeperAPI, tmp_path: Path):
+    """Test that files are indexed on every flow cell whose id occurs in their path."""
+    # GIVEN FASTQ files in Housekeeper for two flow cells, one of them in a run directory
+    real_housekeeper_api.create_new_bundle_and_version(name="sample")
+    version: Version = real_housekeeper_api.last_version(bundle="sample")
+    file_paths: List[Path] = [
+        Path(tmp_path, "HJKLMDSXX_sample_L001_R1_001.fastq.gz"),
+        Path(tmp_path, "220101_A00689_0001_AHGFEDDSXX", "sample_L001_R1_001.fastq.gz"),
+        Path(tmp_path, "HJKLMDSXX_HGFEDDSXX_sample_L001_R1_001.fastq.gz"),
+        Path(tmp_path, "HXXXXDSXX_sample_L001_R1_001.fastq.gz"),
+    ]
+    for file_path in file_paths:
+        real_housekeeper_api.add_file(
+            path=file_path, version_obj=version, tags=[SequencingFileTag.FASTQ]
+        )
+    real_housekeeper_api.commit()
+    fastq_files: List[File] = real_housekeeper_api.files(tags=[SequencingFileTag.FASTQ]).all()
+
+    # WHEN indexing the FASTQ files for the flow cells
+    index = HousekeeperFlowCellIndex(
+        housekeeper_api=real_housekeeper_api, flow_cell_ids=["HJKLMDSXX", "HGFEDDSXX"]
+    )
+    index.add_flow_cell_files(tag=SequencingFileTag.FASTQ, files=fastq_files)
+
+    # THEN each flow cell should have the files that a substring search would find
+    for flow_cell_id in ["HJKLMDSXX", "HGFEDDSXX"]:
+        assert index.get_flow_cell_files(
+            flow_cell_id=flow_cell_id, tag=SequencingFileTag.FASTQ
+        ) == [fastq_file for fastq_file in fastq_files if flow_cell_id in fastq_file.path]
+
+    # THEN there should be no SPRING files for the flow cells
+    assert not index.get_flow_cell_files(flow_cell_id="HJKLMDSXX", tag=SequencingFileTag.SPRING)
+
+
+def test_is_fastq_or_spring_in_all_bundles(
+    real_housekeeper_api: HousekeeperAPI, madeline_output: Path, case_id: str, sample_id: str
+):
+    """Test that the indexed bundles give the same results as querying Housekeeper per bundle."""
+    # GIVEN a bundle with an included FASTQ file and an empty bundle
+    real_housekeeper_api.create_new_bundle_and_version(name=case_id)
+    real_housekeeper_api.add_and_include_file_to_latest_version(
+        bundle_name=case_id, file=madeline_output, tags=[SequencingFileTag.FASTQ]
+    )
+    real_housekeeper_api.create_new_bundle_and_version(name=sample_id)
+
+    # WHEN indexing the bundles
+    index = HousekeeperFlowCellIndex(housekeeper_api=real_housekeeper_api, flow_cell_ids=[])
+    index.add_bundles(bundle_names=[case_id, sample_id])
+
+    # THEN the bundles should be checked as when querying Housekeeper per bundle
+    for bundle_names in [[case_id], [sample_id], [case_id, sample_id]]:
+        assert index.is_fastq_or_spring_in_all_bundles(
+            bundle_names=bundle_names
+        ) == real_housekeeper_api.is_fastq_or_spring_in_all_bundles(bundle_names=bundle_names)
+        assert index.is_fastq_or_spring_on_disk_in_all_bundles(
+            bundle_names=bundle_names
+        ) == real_housekeeper_api.is_fastq_or_spring_on_disk_in_all_bundles(
+            bundle_names=bundle_names
+        )
+    assert index.is_fastq_or_spring_in_all_bundles(bundle_names=[case_id])
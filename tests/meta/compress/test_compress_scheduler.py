@@ -0,0 +1,170 @@
+"""Tests for the scheduling of FASTQ compression"""
+import datetime as dt
+from pathlib import Path
+from typing import Dict, List
+
+from cg.apps.crunchy import CrunchyAPI
+from cg.constants.compression import FASTQ_FIRST_READ_SUFFIX, FASTQ_SECOND_READ_SUFFIX
+from cg.meta.compress import CompressAPI
+from cg.meta.compress.scheduler import (
+    FastqCompressionCandidate,
+    FastqCompressionCheckpoint,
+    FastqCompressionScheduler,
+    get_fastq_compression_candidate,
+)
+from cg.store import Store
+from cg.store.models import Sample
+from tests.meta.compress.conftest import MockCompressionData
+from tests.store_helpers import StoreHelpers
+
+
+def _create_fastq_pair(directory: Path, sample_id: str, size: int) -> List[Path]:
+    """Create an old pair of FASTQ files of the given size for a sample."""
+    fastq_paths: List[Path] = [
+        directory.joinpath(f"{sample_id}{suffix}")
+        for suffix in (FASTQ_FIRST_READ_SUFFIX, FASTQ_SECOND_READ_SUFFIX)
+    ]
+    for fastq_path in fastq_paths:
+        fastq_path.write_bytes(b"@" * size)
+        MockCompressionData.make_old(fastq_path)
+    return fastq_paths
+
+
+def _get_scheduler(
+    compress_api: CompressAPI, fastq_paths: Dict[str, List[Path]], checkpoint_path: Path, mocker
+) -> FastqCompressionScheduler:
+    """Return a scheduler finding the given FASTQ files of each sample."""
+    scheduler = FastqCompressionScheduler(
+        compress_api=compress_api, checkpoint_path=checkpoint_path, max_workers=2
+    )
+    mocker.patch.object(
+        scheduler, "_get_fastq_paths", side_effect=lambda sample_id: fastq_paths[sample_id]
+    )
+    return scheduler
+
+
+def test_get_fastq_compression_candidate(tmp_path: Path):
+    """Test getting the compression candidate of a sample with an old pair of FASTQ files"""
+    # GIVEN an old pair of FASTQ files
+    fastq_paths: List[Path] = _create_fastq_pair(directory=tmp_path, sample_id="ACC1", size=100)
+
+    # WHEN getting the compression candidate
+    candidate: FastqCompressionCandidate = get_fastq_compression_candidate(
+        sample_id="ACC1", reads=1000, fastq_paths=fastq_paths
+    )
+
+    # THEN one job should reclaim the size of both files
+    assert candidate.jobs == 1
+    assert candidate.reclaimable_bytes == 200
+
+
+def test_get_fastq_compression_candidate_when_compressed(tmp_path: Path):
+    """Test that a sample with a SPRING archive is not a compression candidate"""
+    # GIVEN an old pair of FASTQ files that are already compressed
+    fastq_paths: List[Path] = _create_fastq_pair(directory=tmp_path, sample_id="ACC1", size=100)
+    tmp_path.joinpath("ACC1.spring").touch()
+
+    # WHEN getting the compression candidate
+    candidate = get_fastq_compression_candidate(
+        sample_id="ACC1", reads=1000, fastq_paths=fastq_paths
+    )
+
+    # THEN there should be no candidate
+    assert candidate is None
+
+
+def test_scan_orders_by_reclaimable_bytes(
+    compress_api: CompressAPI, store: Store, helpers: StoreHelpers, tmp_path: Path, mocker
+):
+    """Test that the samples with the most reclaimable bytes are scanned first"""
+    # GIVEN samples with FASTQ files of different sizes
+    sizes: Dict[str, int] = {"ACC1": 10, "ACC2": 30, "ACC3": 20}
+    samples: List[Sample] = [
+        helpers.add_sample(store=store, internal_id=sample_id) for sample_id in sizes
+    ]
+    scheduler: FastqCompressionScheduler = _get_scheduler(
+        compress_api=compress_api,
+        fastq_paths={
+            sample_id: _create_fastq_pair(directory=tmp_path, sample_id=sample_id, size=size)
+            for sample_id, size in sizes.items()
+        },
+        checkpoint_path=tmp_path.joinpath("checkpoint.json"),
+        mocker=mocker,
+    )
+
+    # WHEN scanning the samples
+    candidates: List[FastqCompressionCandidate] = scheduler.scan(samples=samples)
+
+    # THEN the candidates should be ordered by reclaimable bytes
+    assert [candidate.sample_id for candidate in candidates] == ["ACC2", "ACC3", "ACC1"]
+
+
+def test_compress_within_job_budget_and_resume(
+    compress_api: CompressAPI, store: Store, helpers: StoreHelpers, tmp_path: Path, mocker
+):
+    """Test that compression stops at the job budget and resumes from the checkpoint"""
+    # GIVEN two samples with FASTQ files to compress
+    sizes: Dict[str, int] = {"ACC1": 10, "ACC2": 30}
+    samples: List[Sample] = [
+        helpers.add_sample(store=store, internal_id=sample_id) for sample_id in sizes
+    ]
+    checkpoint_path: Path = tmp_path.joinpath("checkpoint.json")
+    scheduler: FastqCompressionScheduler = _get_scheduler(
+        compress_api=compress_api,
+        fastq_paths={
+            sample_id: _create_fastq_pair(directory=tmp_path, sample_id=sample_id, size=size)
+            for sample_id, size in sizes.items()
+        },
+        checkpoint_path=checkpoint_path,
+        mocker=mocker,
+    )
+
+    # GIVEN that one more compression job can be queued
+    mocker.patch.object(CrunchyAPI, "get_number_of_queued_jobs", return_value=9)
+
+    # WHEN compressing the samples
+    compressed_sample_ids: List[str] = scheduler.compress(
+        samples=samples, max_queued_jobs=10, compress_sample=lambda candidate: True
+    )
+
+    # THEN only the sample with the most reclaimable bytes should be compressed
+    assert compressed_sample_ids == ["ACC2"]
+
+    # THEN the run should be saved in the checkpoint
+    checkpoint = FastqCompressionCheckpoint.parse_file(checkpoint_path)
+    assert checkpoint.handled_sample_ids == ["ACC2"]
+
+    # WHEN compressing again without any samples
+    compressed_sample_ids: List[str] = scheduler.compress(
+        samples=[], max_queued_jobs=10, compress_sample=lambda candidate: True
+    )
+
+    # THEN the remaining sample from the checkpoint should be compressed
+    assert compressed_sample_ids == ["ACC1"]
+
+    # THEN the checkpoint of the completed run should be removed
+    assert not checkpoint_path.exists()
+
+
+def test_compress_ignores_outdated_checkpoint(compress_api: CompressAPI, tmp_path: Path, mocker):
+    """Test that an outdated checkpoint is not resumed"""
+    # GIVEN a checkpoint from an old run
+    checkpoint_path: Path = tmp_path.joinpath("checkpoint.json")
+    checkpoint_path.write_text(
+        FastqCompressionCheckpoint(
+            created_at=dt.datetime.now() - dt.timedelta(days=2),
+            candidates=[FastqCompressionCandidate(sample_id="ACC1", reads=1000, jobs=1)],
+        ).json()
+    )
+    scheduler: FastqCompressionScheduler = _get_scheduler(
+        compress_api=compress_api, fastq_paths={}, checkpoint_path=checkpoint_path, mocker=mocker
+    )
+    mocker.patch.object(CrunchyAPI, "get_number_of_queued_jobs", return_value=0)
+
+    # WHEN compressing without any samples
+    compressed_sample_ids: List[str] = scheduler.compress(
+        samples=[], max_queued_jobs=10, compress_sample=lambda candidate: True
+    )
+
+    # THEN the samples of the old run should not be compressed
+    assert not compressed_sample_ids
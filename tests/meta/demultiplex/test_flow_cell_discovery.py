@@ -0,0 +1,79 @@
+"""Tests for finding flow cells that are ready for demultiplexing."""
+import json
+import os
+import shutil
+from pathlib import Path
+
+from cg.meta.demultiplex.flow_cell_discovery import SampleSheetValidationCache
+from cg.models.demultiplex.flow_cell import FlowCell
+
+
+def test_sample_sheet_validation_is_cached(flow_cell: FlowCell, tmp_path: Path, mocker):
+    """Test that an unchanged sample sheet is only validated once, also between runs."""
+    # GIVEN a flow cell with a sample sheet and an empty validation cache
+    cache_path = Path(tmp_path, "validation.json")
+    validation_cache = SampleSheetValidationCache(cache_path=cache_path)
+    validate_sample_sheet = mocker.spy(FlowCell, "validate_sample_sheet")
+
+    # WHEN checking the sample sheet twice and in a new run using the written cache
+    is_valid: bool = validation_cache.is_sample_sheet_valid(flow_cell=flow_cell)
+    assert validation_cache.is_sample_sheet_valid(flow_cell=flow_cell) is is_valid
+    validation_cache.write()
+    new_validation_cache = SampleSheetValidationCache(cache_path=cache_path)
+    assert new_validation_cache.is_sample_sheet_valid(flow_cell=flow_cell) is is_valid
+
+    # THEN the sample sheet should only have been validated once
+    assert validate_sample_sheet.call_count == 1
+
+
+def test_sample_sheet_validation_cache_is_invalidated(
+    flow_cell: FlowCell, tmp_flow_cell_run_path: Path, tmp_path: Path, mocker
+):
+    """Test that a modified sample sheet is validated again."""
+    # GIVEN a flow cell with a validated sample sheet
+    shutil.copy(flow_cell.sample_sheet_path, tmp_flow_cell_run_path)
+    tmp_flow_cell = FlowCell(flow_cell_path=tmp_flow_cell_run_path)
+    validation_cache = SampleSheetValidationCache(cache_path=Path(tmp_path, "validation.json"))
+    validation_cache.is_sample_sheet_valid(flow_cell=tmp_flow_cell)
+    validate_sample_sheet = mocker.spy(FlowCell, "validate_sample_sheet")
+
+    # GIVEN that the sample sheet is modified
+    sample_sheet_stat: os.stat_result = os.stat(tmp_flow_cell.sample_sheet_path)
+    os.utime(
+        tmp_flow_cell.sample_sheet_path,
+        ns=(sample_sheet_stat.st_atime_ns, sample_sheet_stat.st_mtime_ns + 1_000_000_000),
+    )
+
+    # WHEN checking the sample sheet
+    validation_cache.is_sample_sheet_valid(flow_cell=tmp_flow_cell)
+
+    # THEN the sample sheet should have been validated again
+    assert validate_sample_sheet.call_count == 1
+
+
+def test_sample_sheet_validation_cache_evicts_unchecked_sample_sheets(
+    flow_cell: FlowCell, tmp_path: Path
+):
+    """Test that only the validations of the sample sheets checked in a run are written."""
+    # GIVEN a validation cache with the result of a sample sheet that no longer exists
+    cache_path = Path(tmp_path, "validation.json")
+    removed_sample_sheet: str = Path(tmp_path, "removed", "SampleSheet.csv").as_posix()
+    cache_path.write_text(
+        json.dumps(
+            {
+                removed_sample_sheet: {
+                    "bcl_converter": flow_cell.bcl_converter,
+                    "is_valid": True,
+                    "modified_at": 0,
+                }
+            }
+        )
+    )
+    validation_cache = SampleSheetValidationCache(cache_path=cache_path)
+
+    # WHEN checking the sample sheet of an existing flow cell and writing the cache
+    validation_cache.is_sample_sheet_valid(flow_cell=flow_cell)
+    validation_cache.write()
+
+    # THEN only the checked sample sheet should be kept in the cache
+    assert list(json.loads(cache_path.read_text())) == [flow_cell.sample_sheet_path.as_posix()]
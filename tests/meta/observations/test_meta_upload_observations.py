@@ -1,14 +1,19 @@
 """Test observations API methods."""
 
 import logging
-from typing import Dict
+from typing import Dict, List
 
 import pytest
 from _pytest.logging import LogCaptureFixture
 from cgmodels.cg.constants import Pipeline
 
 from cg.apps.loqus import LoqusdbAPI
-from cg.constants.observations import LoqusdbInstance, MipDNALoadParameters, LoqusdbMipCustomers
+from cg.constants.observations import (
+    LOQUSDB_ID,
+    LoqusdbInstance,
+    MipDNALoadParameters,
+    LoqusdbMipCustomers,
+)
 from cg.constants.sequencing import SequencingMethod
 from cg.exc import LoqusdbDuplicateRecordError, LoqusdbUploadCaseError, CaseNotFoundError
 from cg.meta.observations.balsamic_observations_api import BalsamicObservationsAPI
@@ -18,6 +23,7 @@ from cg.models.observations.input_files import (
     MipDNAObservationsInputFiles,
     BalsamicObservationsInputFiles,
 )
+from cg.models.observations.upload_report import ObservationsUploadReport
 from cg.store import Store
 from cg.store.models import Family
 from cg.store.models import Customer
@@ -73,6 +79,157 @@ def test_get_loqusdb_api(
     assert loqusdb_api.config_path == loqusdb_config_dict[LoqusdbInstance.WES]["config_path"]
 
 
+def test_get_loqusdb_api_is_shared(cg_config_object: CGConfig):
+    """Test that the Loqusdb APIs are instantiated once and shared between observations APIs."""
+
+    # GIVEN two observations APIs with the same config
+    mip_dna_observations_api = MipDNAObservationsAPI(cg_config_object, SequencingMethod.WGS)
+    balsamic_observations_api = BalsamicObservationsAPI(cg_config_object, SequencingMethod.WGS)
+
+    # WHEN getting the WGS Loqusdb API of both
+    loqusdb_api: LoqusdbAPI = mip_dna_observations_api.get_loqusdb_api(LoqusdbInstance.WGS)
+
+    # THEN the same Loqusdb API should be returned
+    assert balsamic_observations_api.get_loqusdb_api(LoqusdbInstance.WGS) is loqusdb_api
+
+    # THEN only the Loqusdb APIs in use should have been instantiated
+    assert LoqusdbInstance.WES not in cg_config_object.loqusdb_apis_
+
+
+def test_upload_batch(
+    case_id: str,
+    mip_dna_observations_api: MipDNAObservationsAPI,
+    observations_input_files: MipDNAObservationsInputFiles,
+    analysis_store: Store,
+    helpers: StoreHelpers,
+    mocker,
+):
+    """Test uploading the observations of many cases."""
+
+    # GIVEN a case of a whitelisted customer and a case of a customer that is not
+    case: Family = analysis_store.get_case_by_internal_id(internal_id=case_id)
+    case.customer.internal_id = LoqusdbMipCustomers.KLINISK_IMMUNOLOGI.value
+    other_case: Family = helpers.add_case(store=analysis_store, internal_id="other_case")
+    mocker.patch.object(
+        mip_dna_observations_api,
+        "get_observations_input_files",
+        return_value=observations_input_files,
+    )
+    mocker.patch.object(mip_dna_observations_api, "check_loqusdb_duplicates")
+
+    # WHEN uploading the observations of the cases in a batch
+    report: ObservationsUploadReport = mip_dna_observations_api.upload_batch(
+        cases=[case, other_case], max_workers=2
+    )
+
+    # THEN only the case of the whitelisted customer should be uploaded
+    assert report.uploaded_case_ids == [case_id]
+    assert report.failed_case_ids == ["other_case"]
+
+    # THEN the Loqusdb ID of the uploaded case should be saved
+    assert all(sample.loqusdb_id == "123" for sample in case.samples)
+
+    # THEN the time of the upload should be reported
+    assert case_id in report.case_seconds
+    assert "Uploaded 1 cases, 1 failed" in report.get_summary()[0]
+
+
+def test_upload_batch_with_shared_sample(
+    case_id: str,
+    mip_dna_observations_api: MipDNAObservationsAPI,
+    observations_input_files: MipDNAObservationsInputFiles,
+    analysis_store: Store,
+    helpers: StoreHelpers,
+    mocker,
+):
+    """Test that a case sharing a sample with another case of a batch is not uploaded."""
+
+    # GIVEN a case, a case sharing a sample with it and a case with a sample of its own
+    case: Family = analysis_store.get_case_by_internal_id(internal_id=case_id)
+    case.customer.internal_id = LoqusdbMipCustomers.KLINISK_IMMUNOLOGI.value
+    shared_sample_case: Family = helpers.add_case(store=analysis_store, internal_id="shared")
+    helpers.add_relationship(store=analysis_store, sample=case.samples[0], case=shared_sample_case)
+    other_case: Family = helpers.add_case_with_sample(
+        base_store=analysis_store, case_id="other_case", sample_id="other_sample"
+    )
+    for batch_case in [shared_sample_case, other_case]:
+        batch_case.customer = case.customer
+    mocker.patch.object(
+        mip_dna_observations_api,
+        "get_observations_input_files",
+        return_value=observations_input_files,
+    )
+    mocker.patch.object(mip_dna_observations_api, "check_loqusdb_duplicates")
+
+    # WHEN uploading the observations of the cases in a batch
+    report: ObservationsUploadReport = mip_dna_observations_api.upload_batch(
+        cases=[case, shared_sample_case, other_case], max_workers=2
+    )
+
+    # THEN the case sharing a sample with another case of the batch should not be uploaded
+    assert report.uploaded_case_ids == [case_id, "other_case"]
+    assert report.failed_case_ids == ["shared"]
+
+
+def test_upload_batch_with_matching_profiles(
+    case_id: str,
+    mip_dna_observations_api: MipDNAObservationsAPI,
+    observations_input_files: MipDNAObservationsInputFiles,
+    analysis_store: Store,
+    helpers: StoreHelpers,
+    mocker,
+):
+    """Test that only one of two cases of a batch with matching profiles is uploaded."""
+
+    # GIVEN two cases of the same individual under different sample ids
+    case: Family = analysis_store.get_case_by_internal_id(internal_id=case_id)
+    case.customer.internal_id = LoqusdbMipCustomers.KLINISK_IMMUNOLOGI.value
+    other_case: Family = helpers.add_case_with_sample(
+        base_store=analysis_store, case_id="other_case", sample_id="other_sample"
+    )
+    other_case.customer = case.customer
+
+    # GIVEN that the profile VCFs of the cases match
+    mocker.patch.object(
+        mip_dna_observations_api,
+        "get_observations_input_files",
+        return_value=observations_input_files,
+    )
+
+    # GIVEN a Loqusdb instance where a loaded case matches the profile of any other case
+    loaded_case_ids: List[str] = []
+    loqusdb_api: LoqusdbAPI = mip_dna_observations_api.loqusdb_api
+    mocker.patch.object(
+        loqusdb_api,
+        "get_case",
+        side_effect=lambda case_id: {LOQUSDB_ID: case_id} if case_id in loaded_case_ids else None,
+    )
+    mocker.patch.object(
+        loqusdb_api,
+        "get_duplicate",
+        side_effect=lambda **kwargs: {"case_id": loaded_case_ids[0]} if loaded_case_ids else None,
+    )
+    mocker.patch.object(
+        loqusdb_api,
+        "load",
+        side_effect=lambda case_id, **kwargs: loaded_case_ids.append(case_id) or {"variants": 1},
+    )
+
+    # WHEN uploading the observations of the cases in a batch
+    report: ObservationsUploadReport = mip_dna_observations_api.upload_batch(
+        cases=[case, other_case], max_workers=2
+    )
+
+    # THEN only one of the cases should be loaded and uploaded
+    assert loaded_case_ids == report.uploaded_case_ids
+    assert len(report.uploaded_case_ids) == 1
+
+    # THEN the other case should be reported as failed
+    assert sorted(report.uploaded_case_ids + report.failed_case_ids) == sorted(
+        [case_id, "other_case"]
+    )
+
+
 def test_is_duplicate(
     case_id: str,
     mip_dna_observations_api: MipDNAObservationsAPI,
@@ -379,7 +536,9 @@ def test_balsamic_load_cancer_observations(
 
     # WHEN loading the case to a somatic Loqusdb instance
     balsamic_observations_api.load_cancer_observations(
-        case, balsamic_observations_input_files, balsamic_observations_api.loqusdb_somatic_api
+        case.internal_id,
+        balsamic_observations_input_files,
+        balsamic_observations_api.loqusdb_somatic_api,
     )
 
     # THEN the observations should be loaded successfully
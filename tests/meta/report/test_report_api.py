@@ -49,6 +49,34 @@ def test_create_delivery_report_file(report_api_mip_dna, case_mip_dna, tmp_path)
     assert os.path.isfile(created_report_file.name)
 
 
+def test_create_delivery_report_with_prefetched_report_data(
+    report_api_mip_dna, case_mip_dna, mocker
+):
+    """Tests that a delivery report is created from prefetched LIMS and status DB data."""
+
+    # GIVEN a pre-built case
+    lims_sample_spy = mocker.spy(report_api_mip_dna.lims_api, "sample")
+    application_spy = mocker.spy(report_api_mip_dna.status_db, "get_application_by_tag")
+
+    # WHEN creating the report within a context of prefetched report data
+    with report_api_mip_dna.prefetched_report_data(cases=[case_mip_dna]):
+        delivery_report: str = report_api_mip_dna.create_delivery_report(
+            case_id=case_mip_dna.internal_id,
+            analysis_date=case_mip_dna.analyses[0].started_at,
+            force_report=False,
+        )
+
+    # THEN the report should be created without fetching the data per sample
+    assert len(delivery_report) > 0
+    lims_sample_spy.assert_not_called()
+    application_spy.assert_not_called()
+
+    # THEN the prefetched data should be removed after the context
+    assert not report_api_mip_dna.lims_samples
+    assert not report_api_mip_dna.sample_methods
+    assert not report_api_mip_dna.applications
+
+
 def test_render_delivery_report(report_api_mip_dna, case_mip_dna):
     """Tests delivery report rendering."""
 
@@ -1,14 +1,38 @@
+import logging
+import time
+from datetime import datetime
+from typing import List, Tuple
+
 import mock
+import pytest
 
 
 from cg.meta.invoice import InvoiceAPI
 
-from cg.constants.invoice import CostCenters
+from cg.constants.invoice import CostCenters, CustomerNames
 from cg.constants.sequencing import RecordType
 from cg.constants.priority import PriorityTerms
-from cg.store.models import Pool, Sample
+from cg.store import Store
+from cg.store.models import Customer, Invoice, Pool, Sample
 
 from cg.models.invoice.invoice import InvoiceInfo
+from tests.store_helpers import StoreHelpers
+
+LOG = logging.getLogger(__name__)
+
+LIMS_LATENCY: float = 0.001
+
+
+class MockPoolLims:
+    """Mock LIMS returning one sample per pool after a delay."""
+
+    def __init__(self):
+        self.requests: List[Tuple[str, str]] = []
+
+    def samples_in_pools(self, pool_name: str, projectname: str) -> List[str]:
+        self.requests.append((pool_name, projectname))
+        time.sleep(LIMS_LATENCY)
+        return [f"{pool_name}_sample"]
 
 
 def test_instantiate_invoice_api(get_invoice_api_sample):
@@ -29,6 +53,21 @@ def test_assert_invoice_api(get_invoice_api_sample):
     assert type(report) == dict
 
 
+def test_get_application_version(get_invoice_api_sample):
+    """Test that the application versions of the records are taken from the preloaded ones."""
+    # GIVEN an invoice API with the application versions of its records preloaded
+    api: InvoiceAPI = get_invoice_api_sample
+    assert api.application_versions
+
+    # WHEN getting the application version of each record
+    for record in api.raw_records:
+        # THEN the preloaded application version should be returned
+        assert (
+            api.get_application_version(record=record)
+            is api.application_versions[record.application_version_id]
+        )
+
+
 def test_invoice_api_sample(get_invoice_api_sample, record_type: str = RecordType.Sample):
     """Test that the invoice records the right record_type"""
     # THEN calling InvoiceAPI should return an API
@@ -90,3 +129,76 @@ def test_invoice_pool_generic_customer(
     # THEN prepare_invoice_report should set priority to research
     api.get_invoice_report(CostCenters.ki)
     assert api.invoice_info.priority == PriorityTerms.RESEARCH
+
+
+def test_get_pooled_samples(get_invoice_api_pool_generic_customer):
+    """Test that the samples of each pool are fetched from LIMS once"""
+    # GIVEN an invoice API with a pool
+    api: InvoiceAPI = get_invoice_api_pool_generic_customer
+    api.genologics_lims = MockPoolLims()
+    pool: Pool = api.raw_records[0]
+
+    # WHEN getting the pooled samples for two reports
+    api.get_invoice_report(CostCenters.ki)
+    pooled_samples: List[str] = api.get_pooled_samples()
+
+    # THEN the pool contents should be fetched once
+    assert api.genologics_lims.requests == [(pool.name, pool.ticket)]
+    assert pooled_samples == [f"{pool.name}_sample"]
+
+
+@pytest.mark.benchmark
+def test_invoice_report_benchmark(store: Store, helpers: StoreHelpers, lims_api):
+    """Benchmark the KTH and KI reports of an invoice with 1000 pools"""
+    # GIVEN an invoice with 1000 pools
+    pool: Pool = helpers.ensure_pool(store=store, customer_id=CustomerNames.cust132, name="pool_0")
+    invoice: Invoice = helpers.ensure_invoice(
+        store, customer_id=CustomerNames.cust132, pools=[pool]
+    )
+    store.session.execute(
+        Pool.__table__.insert(),
+        [
+            {
+                "application_version_id": pool.application_version_id,
+                "customer_id": pool.customer_id,
+                "invoice_id": invoice.id,
+                "name": f"pool_{number}",
+                "order": pool.order,
+                "ordered_at": datetime.now(),
+                "ticket": str(number),
+            }
+            for number in range(1, 1000)
+        ],
+    )
+    kth_customer: Customer = helpers.ensure_customer(store=store, customer_id=CustomerNames.cust999)
+    kth_customer.invoice_contact = invoice.customer.invoice_contact
+    store.session.commit()
+    store.session.expire(invoice)
+
+    # GIVEN a LIMS with latency
+    lims = MockPoolLims()
+    start_time: float = time.perf_counter()
+    for record in invoice.pools + invoice.pools:
+        lims.samples_in_pools(record.name, record.ticket)
+    sequential_run_time: float = time.perf_counter() - start_time
+
+    # WHEN generating the KTH and KI reports of the invoice
+    start_time: float = time.perf_counter()
+    api = InvoiceAPI(store, lims_api, invoice)
+    api.genologics_lims = MockPoolLims()
+    reports: List[dict] = [
+        api.get_invoice_report(cost_center) for cost_center in (CostCenters.kth, CostCenters.ki)
+    ]
+    run_time: float = time.perf_counter() - start_time
+    LOG.info(
+        f"Generated 2 reports of 1000 pools in {run_time:.2f}s with "
+        f"{len(api.genologics_lims.requests)} LIMS requests, compared to "
+        f"{sequential_run_time:.2f}s for the 2000 sequential LIMS requests of one per record"
+    )
+
+    # THEN each report should contain all records and pooled samples
+    for report in reports:
+        assert len(report["records"]) == len(report["pooled_samples"]) == 1000
+
+    # THEN each pool should be fetched from LIMS once
+    assert len(api.genologics_lims.requests) == 1000
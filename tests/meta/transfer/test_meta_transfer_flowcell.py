@@ -3,8 +3,9 @@ from datetime import datetime
 import logging
 import warnings
 from pathlib import Path
-from typing import Generator
+from typing import Dict, Generator, List
 
+from housekeeper.store.models import File
 from sqlalchemy import exc as sa_exc
 
 from cg.apps.housekeeper.hk import HousekeeperAPI
@@ -467,3 +468,53 @@ def test_transfer(
 
     for hk_file in hk_bundle.versions[0].files:
         assert hk_file.path.endswith("fastq.gz") or hk_file.path.endswith("csv")
+
+
+def test_store_bundles_sequencing_files(
+    base_store_stats,
+    flow_cell_id: str,
+    flowcell_store: Store,
+    real_housekeeper_api: HousekeeperAPI,
+    tmp_path: Path,
+):
+    """Test storing the sequencing files of many bundles in Housekeeper at once."""
+    # GIVEN a transfer flow cell API with a Housekeeper database
+    transfer_flow_cell_api = TransferFlowCell(
+        db=flowcell_store, stats_api=base_store_stats, hk_api=real_housekeeper_api
+    )
+
+    # GIVEN a FASTQ file for a sample without bundle and one for a sample with the file already
+    # in its bundle
+    fastq_paths: Dict[str, Path] = {}
+    for sample_id in ["new_sample", "existing_sample"]:
+        fastq_paths[sample_id] = Path(tmp_path, f"{sample_id}_L001_R1_001.fastq.gz")
+        fastq_paths[sample_id].touch()
+    real_housekeeper_api.create_new_bundle_and_version(name="existing_sample")
+    Path(tmp_path, "previous_run").mkdir()
+    previous_fastq_path = Path(tmp_path, "previous_run", fastq_paths["existing_sample"].name)
+    previous_fastq_path.touch()
+    real_housekeeper_api.add_and_include_file_to_latest_version(
+        bundle_name="existing_sample", file=previous_fastq_path, tags=[SequencingFileTag.FASTQ]
+    )
+
+    # WHEN storing the FASTQ files of the samples
+    transfer_flow_cell_api._store_bundles_sequencing_files(
+        flow_cell_id=flow_cell_id,
+        bundle_sequencing_files={
+            sample_id: [fastq_path.as_posix()] for sample_id, fastq_path in fastq_paths.items()
+        },
+        tag_name=SequencingFileTag.FASTQ,
+    )
+
+    # THEN a bundle should have been created with the new FASTQ file
+    new_sample_files: List[File] = real_housekeeper_api.files(bundle="new_sample").all()
+    assert [Path(hk_file.path).name for hk_file in new_sample_files] == [
+        fastq_paths["new_sample"].name
+    ]
+    assert {tag.name for tag in new_sample_files[0].tags} == {
+        SequencingFileTag.FASTQ,
+        flow_cell_id,
+    }
+
+    # THEN the file already in the existing bundle should not have been added again
+    assert real_housekeeper_api.files(bundle="existing_sample").count() == 1
@@ -38,6 +38,27 @@ def test_transfer_samples_received_at_overwriteable(
     assert has_same_received_at(lims_api, sample)
 
 
+def test_transfer_samples_in_batch(transfer_lims_api: TransferLims, timestamp_now: dt.datetime):
+    # GIVEN a sample exists in statusdb and it has a received_at date but no delivered_at date,
+    # there is a sample in lims with the same internal id and another received_at date
+    lims_api = transfer_lims_api.lims
+    sample_store = transfer_lims_api.status
+    sample = sample_store.get_samples_to_deliver()[0]
+    lims_samples = [
+        sample_store.add_sample(
+            name=sample.name, sex=sample.sex, internal_id=sample.internal_id, received=timestamp_now
+        )
+    ]
+    lims_api.set_samples(lims_samples)
+    assert not has_same_received_at(lims_api, sample)
+
+    # WHEN transfer_samples_in_batch has been called
+    transfer_lims_api.transfer_samples_in_batch(SampleState.RECEIVED, IncludeOptions.ALL.value)
+
+    # THEN the samples should have the same received_at as in lims
+    assert has_same_received_at(lims_api, sample)
+
+
 def test_transfer_samples_all(transfer_lims_api: TransferLims, timestamp_now: dt.datetime):
     # GIVEN a sample exists in statusdb and it has a received_at date but no delivered_at date,
     # there is a sample in lims with the same internal id and another received_at date
@@ -1,10 +1,13 @@
 """Test for UploadVogueAPI"""
 
+import datetime as dt
+from pathlib import Path
+
 import mock
 
 from cg.constants.constants import FileFormat
 from cg.io.controller import ReadStream
-from cg.meta.upload.vogue import UploadVogueAPI
+from cg.meta.upload.vogue import GenotypeLoadState, UploadVogueAPI
 from typing import List, Dict
 
 
@@ -34,6 +37,66 @@ def test_load_genotype(genotype_api, vogue_api, genotype_return, mocker, store):
         assert call[0][0]["_id"] in samples.keys()
 
 
+def test_load_genotype_incremental(
+    genotype_api, vogue_api, genotype_return, mocker, store, tmp_path: Path
+):
+    """Test that only new genotype documents are loaded incrementally"""
+
+    # GIVEN UploadVogueAPI, a genotype_return_sample and no previous loads
+    mocker.patch.object(
+        vogue_api,
+        "load_genotype_data_bulk",
+        side_effect=lambda genotype_dicts: [document["_id"] for document in genotype_dicts],
+    )
+    mocker.patch.object(genotype_api, "export_sample", return_value=genotype_return["sample"])
+    mocker.patch.object(
+        genotype_api, "export_sample_analysis", return_value=genotype_return["sample_analysis"]
+    )
+    state_path: Path = tmp_path.joinpath("genotype_state.json")
+    upload_vogue_api = UploadVogueAPI(genotype_api=genotype_api, vogue_api=vogue_api, store=store)
+
+    # WHEN loading the genotype data incrementally
+    nr_loaded_documents: int = upload_vogue_api.load_genotype_incremental(
+        days=10, state_path=state_path
+    )
+
+    # THEN all sample and sample analysis documents should be loaded in one bulk load each
+    assert nr_loaded_documents == 4
+    assert vogue_api.load_genotype_data_bulk.call_count == 2
+
+    # THEN the high-water mark should be saved
+    state: GenotypeLoadState = GenotypeLoadState.parse_file(state_path)
+    assert state.loaded_at
+    assert len(state.document_digests) == 4
+
+    # WHEN loading the same genotype data again
+    nr_loaded_documents: int = upload_vogue_api.load_genotype_incremental(
+        days=10, state_path=state_path
+    )
+
+    # THEN no documents should be loaded
+    assert nr_loaded_documents == 0
+
+    # THEN only the days since the previous load should be exported
+    genotype_api.export_sample.assert_called_with(days=1)
+
+
+def test_get_export_days():
+    """Test that the export window is narrowed to the time since the previous load"""
+
+    # GIVEN a previous load three days ago
+    loaded_at: dt.datetime = dt.datetime.now() - dt.timedelta(days=3)
+
+    # WHEN getting the number of days to export
+    export_days: int = UploadVogueAPI.get_export_days(days=10, loaded_at=loaded_at)
+
+    # THEN the days since the previous load should be exported
+    assert export_days == 4
+
+    # THEN the given number of days should be exported without a previous load
+    assert UploadVogueAPI.get_export_days(days=10, loaded_at=None) == 10
+
+
 def test_load_apptags(vogue_api, genotype_api, store, mocker):
     """Test load application tags"""
     # GIVEN UploadVogueAPI and a set of application tags
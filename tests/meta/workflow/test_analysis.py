@@ -1,4 +1,5 @@
 """Test for analysis"""
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 import pytest
@@ -7,6 +8,9 @@ from cg.constants import COLLABORATORS, Priority, GenePanelMasterList
 from cg.constants.priority import SlurmQos
 from cg.meta.workflow.analysis import AnalysisAPI
 from cg.meta.workflow.mip import MipAnalysisAPI
+from cg.meta.workflow.mip_dna import MipDNAAnalysisAPI
+from cg.models.cg_config import CGConfig
+from cg.utils import Process
 
 
 @pytest.mark.parametrize(
@@ -63,3 +67,18 @@ def test_gene_panels_not_added(customer_id):
     assert set(list_of_gene_panels_used) == set(
         default_panels_not_included + [GenePanelMasterList.OMIM_AUTO]
     )
+
+
+def test_process_is_not_shared_between_threads(cg_context: CGConfig):
+    """Test that each thread running commands of an analysis API gets its own process."""
+    # GIVEN an analysis API with a process in the current thread
+    analysis_api = MipDNAAnalysisAPI(config=cg_context)
+    process: Process = analysis_api.process
+
+    # WHEN getting the process in another thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        thread_process: Process = executor.submit(lambda: analysis_api.process).result()
+
+    # THEN the process should be reused within a thread but not shared between threads
+    assert analysis_api.process is process
+    assert thread_process is not process
@@ -0,0 +1,70 @@
+"""Tests for starting the analyses of several cases."""
+import threading
+from typing import Dict, List, Set
+
+import pytest
+
+from cg.constants import Pipeline
+from cg.constants.process import MAX_CONCURRENT_CASE_STARTS
+from cg.exc import CgError
+from cg.meta.workflow.case_scheduler import get_case_start_workers, start_cases
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_start_cases_reports_failed_cases(workers: int, caplog):
+    """Test that all cases are started and that the failed cases are reported."""
+    # GIVEN cases of which two fail to start
+    case_ids: List[str] = [f"case_{number}" for number in range(10)]
+    started_cases: List[str] = []
+
+    def start_case(case_id: str) -> None:
+        if case_id == "case_3":
+            raise CgError("No config file")
+        if case_id == "case_7":
+            raise ValueError("Unexpected value")
+        started_cases.append(case_id)
+
+    # WHEN starting the cases
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids, start_case=start_case, pipeline=Pipeline.BALSAMIC, workers=workers
+    )
+
+    # THEN the other cases should have been started
+    assert sorted(started_cases) == sorted(set(case_ids) - {"case_3", "case_7"})
+
+    # THEN the failed cases should be reported with their errors
+    assert failed_cases == {"case_3": "No config file", "case_7": "Unexpected value"}
+    assert "Could not start case_3: No config file" in caplog.text
+
+
+def test_start_cases_concurrently():
+    """Test that cases are started in several threads when there is more than one worker."""
+    # GIVEN cases that wait until four of them are started at the same time
+    case_ids: List[str] = [f"case_{number}" for number in range(4)]
+    barrier = threading.Barrier(parties=len(case_ids), timeout=10)
+    thread_names: Set[str] = set()
+
+    def start_case(case_id: str) -> None:
+        thread_names.add(threading.current_thread().name)
+        barrier.wait()
+
+    # WHEN starting the cases with four workers
+    failed_cases: Dict[str, str] = start_cases(
+        case_ids=case_ids, start_case=start_case, pipeline=Pipeline.BALSAMIC, workers=4
+    )
+
+    # THEN all cases should have been started, each in its own thread
+    assert not failed_cases
+    assert len(thread_names) == len(case_ids)
+
+
+def test_get_case_start_workers_is_limited_per_pipeline():
+    """Test that the number of workers is limited by the pipeline."""
+    # GIVEN a pipeline with a concurrency limit
+    pipeline = Pipeline.FLUFFY
+
+    # WHEN asking for more workers than the limit
+    workers: int = get_case_start_workers(pipeline=pipeline, workers=10)
+
+    # THEN the number of workers should be the limit of the pipeline
+    assert workers == MAX_CONCURRENT_CASE_STARTS[pipeline]
@@ -0,0 +1,95 @@
+"""Tests for the FASTQ header index."""
+import gzip
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from cg.meta.workflow.fastq import FastqHandler
+from cg.meta.workflow.fastq_header_index import FastqHeaderIndex
+
+FASTQ_HEADER: str = "@A00689:73:XXXXXXXXXX:2:1101:4806:1047 1:N:0:GCCAATAT\n"
+
+
+def _write_fastq(fastq_path: Path, header: str = FASTQ_HEADER) -> None:
+    with gzip.open(fastq_path, "wt") as handle:
+        handle.write(f"{header}ACGT\n+\nFFFF\n")
+
+
+def test_get_file_data_parses_once(tmp_path: Path, mocker):
+    """Test that the FASTQ header is only parsed on an index miss."""
+    # GIVEN a FASTQ file and an empty index
+    fastq_path: str = Path(tmp_path, "sample_L002_R1_001.fastq.gz").as_posix()
+    _write_fastq(fastq_path=Path(fastq_path))
+    index = FastqHeaderIndex(index_path=Path(tmp_path, "index.sqlite"))
+    parse_file_data = mocker.Mock(side_effect=FastqHandler.parse_file_data)
+
+    # WHEN fetching the file data twice
+    first_file_data: dict = index.get_file_data(
+        fastq_path=fastq_path, parse_file_data=parse_file_data
+    )
+    second_file_data: dict = index.get_file_data(
+        fastq_path=fastq_path, parse_file_data=parse_file_data
+    )
+
+    # THEN the file should only have been parsed once
+    assert parse_file_data.call_count == 1
+
+    # THEN the indexed data should be the parsed data
+    assert second_file_data == first_file_data
+    assert second_file_data["lane"] == 2
+    assert second_file_data["read"] == 1
+    assert second_file_data["flowcell"] == "XXXXXXXXXX"
+    assert second_file_data["undetermined"] is False
+
+
+def test_get_changed_file_is_invalidated(tmp_path: Path):
+    """Test that an indexed FASTQ file is invalidated when the file changes."""
+    # GIVEN an indexed FASTQ file
+    fastq_path: str = Path(tmp_path, "sample_L002_R1_001.fastq.gz").as_posix()
+    _write_fastq(fastq_path=Path(fastq_path))
+    index = FastqHeaderIndex(index_path=Path(tmp_path, "index.sqlite"))
+    index.get_file_data(fastq_path=fastq_path, parse_file_data=FastqHandler.parse_file_data)
+
+    # GIVEN that the file is rewritten with another header
+    _write_fastq(fastq_path=Path(fastq_path), header=FASTQ_HEADER.replace(":2:1101", ":3:1101"))
+    file_stat: os.stat_result = os.stat(fastq_path)
+    os.utime(fastq_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+    # WHEN fetching the file data from the index
+    file_data = index.get(fastq_path=fastq_path)
+
+    # THEN the outdated entry should not be returned
+    assert file_data is None
+
+    # THEN fetching the file data should parse the new header
+    file_data: dict = index.get_file_data(
+        fastq_path=fastq_path, parse_file_data=FastqHandler.parse_file_data
+    )
+    assert file_data["lane"] == 3
+
+
+def test_get_file_data_from_threads(tmp_path: Path):
+    """Test that the index can be shared by threads other than the one that opened it."""
+    # GIVEN FASTQ files of several lanes and an empty index
+    fastq_paths: List[str] = []
+    for lane in range(1, 5):
+        fastq_path = Path(tmp_path, f"sample_L00{lane}_R1_001.fastq.gz")
+        _write_fastq(fastq_path=fastq_path, header=FASTQ_HEADER.replace(":2:1101", f":{lane}:1101"))
+        fastq_paths.append(fastq_path.as_posix())
+    index = FastqHeaderIndex(index_path=Path(tmp_path, "index.sqlite"))
+
+    # WHEN fetching the file data of the files in a thread pool
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        files_data: List[dict] = list(
+            executor.map(
+                lambda fastq_path: index.get_file_data(
+                    fastq_path=fastq_path, parse_file_data=FastqHandler.parse_file_data
+                ),
+                fastq_paths,
+            )
+        )
+
+    # THEN the file data of every file should be parsed and indexed
+    assert [file_data["lane"] for file_data in files_data] == [1, 2, 3, 4]
+    assert all(index.get(fastq_path=fastq_path) for fastq_path in fastq_paths)
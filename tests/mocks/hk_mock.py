@@ -499,6 +499,38 @@ class MockHousekeeperAPI:
         self.include_file(version_obj=version, file_obj=hk_file)
         self.commit()
 
+    def get_or_create_latest_versions(self, bundle_names: List[str]) -> Dict[str, Version]:
+        """Return the latest version of each bundle, creating the missing bundles with a version."""
+        latest_versions: Dict[str, Version] = {}
+        for bundle_name in bundle_names:
+            bundle: MockBundle = self.bundle(bundle_name) or self.create_new_bundle_and_version(
+                name=bundle_name
+            )
+            latest_versions[bundle_name] = bundle.versions[-1]
+        return latest_versions
+
+    def get_files_from_versions(self, version_ids: List[int], tags: List[str]) -> List[File]:
+        """Return the files in any of the given versions."""
+        return [
+            hk_file
+            for bundle in self.bundles()
+            for version in bundle.versions
+            if version.id in version_ids
+            for hk_file in version.files
+        ]
+
+    def add_and_include_files(
+        self, version: Version, file_paths: List[Path], tags: List[str]
+    ) -> List[File]:
+        """Add and include files in a version."""
+        hk_files: List[File] = []
+        for file_path in file_paths:
+            hk_file: File = self.add_file(path=file_path, version_obj=version, tags=tags)
+            hk_file.version_id = version.id
+            self.include_file(version_obj=version, file_obj=hk_file)
+            hk_files.append(hk_file)
+        return hk_files
+
     def include_files_to_latest_version(self, bundle_name: str) -> None:
         """Include all files in the latest version on a bundle."""
         bundle_version: Version = self.get_latest_bundle_version(bundle_name=bundle_name)
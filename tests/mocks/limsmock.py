@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from cg.apps.lims import LimsAPI
 from pydantic import BaseModel
@@ -58,6 +58,9 @@ class MockLimsAPI(LimsAPI):
     def sample(self, sample_id: str) -> Optional[dict]:
         return next((sample for sample in self._samples if sample["id"] == sample_id), None)
 
+    def samples(self, lims_ids: List[str]) -> Dict[str, dict]:
+        return {sample["id"]: sample for sample in self._samples if sample["id"] in lims_ids}
+
     def add_sample(self, internal_id: str):
         self.sample_vars[internal_id] = {}
 
@@ -103,3 +106,6 @@ class MockLimsAPI(LimsAPI):
             if sample.internal_id == lims_id:
                 received_date = sample.received_at
         return received_date
+
+    def get_received_dates(self, lims_ids: List[str]) -> dict:
+        return {lims_id: self.get_received_date(lims_id=lims_id) for lims_id in lims_ids}
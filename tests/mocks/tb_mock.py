@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, List, Optional, Set
 
 from cg.apps.tb.models import TrailblazerAnalysis
 
@@ -41,3 +41,13 @@ class MockTB:
 
     def is_latest_analysis_completed(self, case_id: str):
         return True
+
+    def get_latest_analyses_statuses(self, case_ids: List[str]) -> Dict[str, Optional[str]]:
+        statuses: Dict[str, Optional[str]] = {}
+        for case_id in case_ids:
+            analysis: Optional[TrailblazerAnalysis] = self.get_latest_analysis(case_id=case_id)
+            statuses[case_id] = analysis.status if analysis else None
+        return statuses
+
+    def get_cases_with_latest_analysis_completed(self, case_ids: List[str]) -> Set[str]:
+        return set(case_ids)
@@ -0,0 +1,77 @@
+"""Local stub of the Trailblazer REST API for testing the HTTP layer of the Trailblazer API."""
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from typing import Dict, List, Optional, Tuple
+
+
+class StubTrailblazerServer(ThreadingHTTPServer):
+    """Trailblazer stub serving the latest analysis of cases over keep-alive connections."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StubTrailblazerRequestHandler)
+        self.analysis_statuses: Dict[str, str] = {}
+        self.failing_responses: List[int] = []
+        self.connection_count: int = 0
+        self.request_count: int = 0
+        self._lock = Lock()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.server_address[0]}:{self.server_address[1]}"
+
+    def start(self) -> None:
+        self._thread = Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def add_connection(self) -> None:
+        with self._lock:
+            self.connection_count += 1
+
+    def get_response(self, command: str, request_body: dict) -> Tuple[int, Optional[dict]]:
+        """Return the status code and body of the response to a request."""
+        with self._lock:
+            self.request_count += 1
+            if self.failing_responses:
+                return self.failing_responses.pop(0), None
+        if command == "set-analysis-status":
+            return 200, None
+        if command != "get-latest-analysis":
+            return 404, None
+        case_id: str = request_body["case_id"]
+        if case_id not in self.analysis_statuses:
+            return 200, None
+        return 200, {"id": 1, "family": case_id, "status": self.analysis_statuses[case_id]}
+
+
+class StubTrailblazerRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self) -> None:
+        super().setup()
+        self.server.add_connection()
+
+    def do_POST(self) -> None:
+        content_length = int(self.headers.get("Content-Length", 0))
+        request_body: dict = json.loads(self.rfile.read(content_length) or "{}")
+        status_code, response_body = self.server.get_response(
+            command=self.path.strip("/"), request_body=request_body
+        )
+        content: bytes = json.dumps(response_body).encode()
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_PUT = do_POST
+
+    def log_message(self, format: str, *args) -> None:
+        """Do not log requests to stderr."""
@@ -41,3 +41,17 @@ def test_api_instantiated_once(base_config_dict: dict, caplog):
     caplog.clear()
     config_object.status_db
     assert "Instantiating status db" not in caplog.text
+
+
+def test_status_db_with_read_only_database(base_config_dict: dict):
+    # GIVEN a dictionary with the basic configs, pool settings and a read-only database
+    base_config_dict["database_pool"] = {"pool_size": 3, "pool_recycle": 600}
+    base_config_dict["database_read_only"] = base_config_dict["database"]
+
+    # WHEN fetching the status db
+    status_db: Store = CGConfig(**base_config_dict).status_db
+
+    # THEN assert that the reads can be routed to a separate store
+    assert status_db.read_only_store is not status_db
+    # THEN assert that the pool settings were applied
+    assert status_db.engine.pool._recycle == 600
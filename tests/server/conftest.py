@@ -1,9 +1,17 @@
 """Test fixtures for cg/server tests"""
 import os
+from typing import Generator
+from unittest import mock
 
 import pytest
+from flask import Flask
+from flask.testing import FlaskClient
 
+from cg.server import ext
 from cg.server.app import create_app
+from cg.store import Store
+from cg.store.models import Customer, User
+from tests.store_helpers import StoreHelpers
 
 os.environ["CG_SQL_DATABASE_URI"] = "sqlite:///:memory:"
 os.environ["LIMS_HOST"] = "dummy_value"
@@ -18,3 +26,36 @@ def app():
     """Test fixture to use when the flask app is needed"""
     _app = create_app()
     return _app
+
+
+@pytest.fixture(name="api_app")
+def fixture_api_app() -> Flask:
+    """Return a flask app with the API registered, created without fetching the Google OAuth2
+    certificates and without the admin views."""
+    with mock.patch("cg.server.app.requests.get"), mock.patch(
+        "cg.server.config.CG_ENABLE_ADMIN", True
+    ), mock.patch("cg.server.app._register_admin_views"):
+        return create_app()
+
+
+@pytest.fixture(name="api_store")
+def fixture_api_store(api_app: Flask) -> Generator[Store, None, None]:
+    """Return the database of the flask app, with empty tables."""
+    ext.db.create_all()
+    yield ext.db
+    ext.db.remove_sessions()
+    ext.db.drop_all()
+
+
+@pytest.fixture(name="api_client")
+def fixture_api_client(
+    api_app: Flask, api_store: Store, helpers: StoreHelpers, mocker
+) -> FlaskClient:
+    """Return a client of the flask app, authorised as an admin user."""
+    customer: Customer = helpers.ensure_customer(store=api_store)
+    user: User = helpers.ensure_user(store=api_store, customer=customer, is_admin=True)
+    user.order_portal_login = True
+    api_store.session.commit()
+    mocker.patch("cg.server.api.get_google_oauth2_certificates", return_value={})
+    mocker.patch("cg.server.api.jwt.decode", return_value={"email": user.email})
+    return api_app.test_client()
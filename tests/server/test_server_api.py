@@ -0,0 +1,89 @@
+"""Tests for the paginated list endpoints in api.py"""
+import http
+import json
+from datetime import datetime
+from typing import List
+
+from flask.testing import FlaskClient
+
+from cg.store import Store
+from cg.store.models import Family, Sample
+from tests.store_helpers import StoreHelpers
+
+API_REQUEST: dict = {"base_url": "https://localhost", "headers": {"Authorization": "Bearer t"}}
+
+
+def test_parse_samples_default_page(
+    api_client: FlaskClient, api_store: Store, helpers: StoreHelpers
+):
+    """Test that the samples endpoint returns the first page of samples and their total count."""
+
+    # GIVEN a database with more samples than fit on a page
+    samples: List[Sample] = helpers.add_samples(store=api_store, nr_samples=52)
+
+    # WHEN requesting samples without paging arguments
+    response = api_client.get("/api/v1/samples", **API_REQUEST)
+
+    # THEN the response should be streamed
+    assert response.status_code == http.HTTPStatus.OK
+    assert response.is_streamed
+    assert response.mimetype == "application/json"
+
+    # THEN the first 50 samples should be returned, with the total count of all samples
+    content: dict = json.loads(response.get_data(as_text=True))
+    assert set(content) == {"samples", "total"}
+    assert len(content["samples"]) == 50
+    assert content["total"] == len(samples)
+
+
+def test_parse_samples_explicit_page(
+    api_client: FlaskClient, api_store: Store, helpers: StoreHelpers
+):
+    """Test that the samples endpoint returns the page of samples given by offset and limit."""
+
+    # GIVEN a database with a few samples
+    samples: List[Sample] = helpers.add_samples(store=api_store, nr_samples=4)
+    all_samples: List[dict] = api_client.get("/api/v1/samples", **API_REQUEST).get_json()["samples"]
+
+    # WHEN requesting the second sample only
+    response = api_client.get("/api/v1/samples?offset=1&limit=1", **API_REQUEST)
+
+    # THEN only the second sample should be returned, with the total count of all samples
+    content: dict = response.get_json()
+    assert content["samples"] == all_samples[1:2]
+    assert content["total"] == len(samples)
+
+
+def test_parse_samples_invalid_page(api_client: FlaskClient, api_store: Store):
+    """Test that the samples endpoint rejects paging arguments that are not integers."""
+
+    # GIVEN a database
+
+    # WHEN requesting samples with a limit that is not an integer
+    response = api_client.get("/api/v1/samples?offset=0&limit=many", **API_REQUEST)
+
+    # THEN the request should be rejected
+    assert response.status_code == http.HTTPStatus.BAD_REQUEST
+    assert response.get_json() == {"message": "Offset and limit must be integers"}
+
+
+def test_get_families_to_analyze_page(
+    api_client: FlaskClient, api_store: Store, helpers: StoreHelpers
+):
+    """Test that the cases to analyze are paged in the database, oldest order first."""
+
+    # GIVEN a database with a few cases to analyze
+    cases: List[Family] = helpers.add_cases_with_samples(
+        base_store=api_store, nr_cases=3, sequenced_at=datetime.now()
+    )
+    for days, case in enumerate(cases):
+        case.ordered_at = datetime(2020, 1, 1 + days)
+    api_store.session.commit()
+
+    # WHEN requesting the second case to analyze
+    response = api_client.get("/api/v1/families?status=analysis&offset=1&limit=1", **API_REQUEST)
+
+    # THEN only the second oldest case should be returned, with the total count of all cases
+    content: dict = response.get_json()
+    assert [case["internal_id"] for case in content["families"]] == [cases[1].internal_id]
+    assert content["total"] == len(cases)
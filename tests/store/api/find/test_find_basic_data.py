@@ -97,6 +97,19 @@ def test_get_application_by_tag(microbial_store: Store, tag: str = MicrosaltAppT
     assert application.tag == tag
 
 
+def test_get_applications_by_tags(microbial_store: Store):
+    """Test function to return the applications by tags."""
+
+    # GIVEN a store with application records
+
+    # WHEN getting the applications of two tags and a tag that does not exist
+    tags: List[str] = [MicrosaltAppTags.MWRNXTR003, MicrosaltAppTags.MWXNXTR003, "does_not_exist"]
+    applications: List[Application] = microbial_store.get_applications_by_tags(tags=tags)
+
+    # THEN return the applications with the supplied application tags
+    assert sorted(application.tag for application in applications) == tags[:2]
+
+
 def test_get_applications_is_not_archived(
     microbial_store: Store, EXPECTED_NUMBER_OF_NOT_ARCHIVED_APPLICATIONS
 ):
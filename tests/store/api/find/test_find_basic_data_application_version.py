@@ -105,3 +105,23 @@ def test_get_current_application_version_by_tag_latest_version(
     # THEN the application version has the newest attribute 'valid_from'
     for app_version in application_versions_with_tag:
         assert current_application_version.valid_from >= app_version.valid_from
+
+
+def test_get_application_versions_by_entry_ids(store_with_different_application_versions: Store):
+    """Test that the application versions are returned with their applications by entry ids."""
+    # GIVEN a store with multiple application versions
+    store: Store = store_with_different_application_versions
+    entry_ids: List[int] = [
+        application_version.id for application_version in store.get_application_versions()
+    ]
+
+    # WHEN getting the application versions by entry ids
+    application_versions: List[ApplicationVersion] = store.get_application_versions_by_entry_ids(
+        entry_ids=entry_ids
+    )
+
+    # THEN all application versions should be returned with their applications
+    assert sorted(application_version.id for application_version in application_versions) == sorted(
+        entry_ids
+    )
+    assert all(application_version.application for application_version in application_versions)
@@ -665,7 +665,7 @@ def test_get_pools_to_render_with(
     # GIVEN a database with two pools
 
     # WHEN fetching pools with no customer or enquiry
-    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render()
+    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render_query().all()
 
     # THEN two pools should be returned
     assert len(pools) == 2
@@ -678,9 +678,9 @@ def test_get_pools_to_render_with_customer(
     # GIVEN a database with two pools
 
     # WHEN getting pools by customer id
-    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render(
+    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render_query(
         customers=store_with_multiple_pools_for_customer.get_customers()
-    )
+    ).all()
 
     # THEN two pools should be returned
     assert len(pools) == 2
@@ -693,9 +693,9 @@ def test_get_pools_to_render_with_customer_and_name_enquiry(
     """Test that pools can be fetched from the store by customer id."""
     # GIVEN a database with two pools
     # WHEN fetching pools by customer id and name enquiry
-    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render(
+    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render_query(
         customers=store_with_multiple_pools_for_customer.get_customers(), enquiry=pool_name_1
-    )
+    ).all()
 
     # THEN one pools should be returned
     assert len(pools) == 1
@@ -710,9 +710,9 @@ def test_get_pools_to_render_with_customer_and_order_enquiry(
 
     # WHEN fetching pools by customer id and order enquiry
 
-    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render(
+    pools: List[Pool] = store_with_multiple_pools_for_customer.get_pools_to_render_query(
         customers=store_with_multiple_pools_for_customer.get_customers(), enquiry=pool_order_1
-    )
+    ).all()
 
     # THEN one pools should be returned
     assert len(pools) == 1
@@ -1485,6 +1485,34 @@ def test_structure(base_store: Store, helpers):
         assert "samples_invoiced" in case.keys()
 
 
+def test_cases_aggregated_per_case(base_store: Store, helpers):
+    """Test that cases aggregates sample and flow cell data separately for each case"""
+
+    # GIVEN a database with one case with two sequenced samples on a flow cell on disk
+    large_case = add_case(helpers, base_store, case_id="large_case")
+    sequenced_samples = [
+        helpers.add_sample(base_store, sequenced_at=datetime.now()) for _ in range(2)
+    ]
+    helpers.add_flowcell(base_store, status="ondisk", samples=sequenced_samples)
+    for sample in sequenced_samples:
+        base_store.relate_sample(large_case, sample, "unknown")
+
+    # GIVEN a case with a single sample not yet sequenced
+    small_case = add_case(helpers, base_store, case_id="small_case")
+    base_store.relate_sample(small_case, helpers.add_sample(base_store), "unknown")
+
+    # WHEN getting active cases
+    cases = {case.get("internal_id"): case for case in base_store.cases()}
+
+    # THEN each case should only contain data from its own samples and flow cells
+    assert cases[large_case.internal_id]["total_samples"] == 2
+    assert cases[large_case.internal_id]["samples_sequenced"] == 2
+    assert cases[large_case.internal_id]["flowcells_on_disk"] == 1
+    assert cases[small_case.internal_id]["total_samples"] == 1
+    assert cases[small_case.internal_id]["samples_sequenced"] == 0
+    assert cases[small_case.internal_id]["flowcells_status"] == "new"
+
+
 def add_case(
     helpers,
     disk_store,
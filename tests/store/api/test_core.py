@@ -0,0 +1,69 @@
+"""Tests for the connection options and the read-only routing of the Store."""
+from pathlib import Path
+
+import pytest
+
+from cg.exc import CgError
+from cg.store import Store
+from cg.store.api.core import ReadOnlyStore, get_engine_options
+from cg.store.models import Customer
+from tests.store_helpers import StoreHelpers
+
+POOL_OPTIONS: dict = {"pool_size": 3, "max_overflow": 2, "pool_pre_ping": True, "pool_recycle": 60}
+
+
+def test_get_engine_options_for_mysql():
+    """Test that all pool options are used for a MySQL database."""
+    # GIVEN an uri of a MySQL database
+
+    # WHEN getting the engine options
+    engine_options: dict = get_engine_options(uri="mysql+pymysql://user@host/cg", **POOL_OPTIONS)
+
+    # THEN all pool options should be used
+    assert engine_options == POOL_OPTIONS
+
+
+def test_get_engine_options_for_sqlite():
+    """Test that the pool size options are left out for an SQLite database."""
+    # GIVEN an uri of an SQLite database
+
+    # WHEN getting the engine options
+    engine_options: dict = get_engine_options(uri="sqlite:///", **POOL_OPTIONS)
+
+    # THEN only the options that do not size the pool should be used
+    assert engine_options == {"pool_pre_ping": True, "pool_recycle": 60}
+
+
+def test_store_without_read_only_database(store: Store):
+    """Test that reads are routed to the primary database when there is no read-only database."""
+    # GIVEN a store without a read-only database
+
+    # THEN the read-only store should be the store itself
+    assert store.read_only_store is store
+
+
+def test_store_with_read_only_database(helpers: StoreHelpers, tmp_path: Path):
+    """Test that reads can be routed to a read-only database but writes can not."""
+    # GIVEN a store with a read-only replica of its database
+    database_uri: str = f"sqlite:///{tmp_path.joinpath('cg.sqlite')}"
+    store = Store(uri=database_uri, read_only_uri=database_uri, **POOL_OPTIONS)
+    store.create_all()
+    assert isinstance(store.read_only_store, ReadOnlyStore)
+
+    # WHEN adding a customer to the primary database
+    customer: Customer = helpers.ensure_customer(store=store)
+
+    # THEN the customer should be found in the read-only database
+    read_only_customer: Customer = store.read_only_store.get_customer_by_internal_id(
+        customer_internal_id=customer.internal_id
+    )
+    assert read_only_customer.id == customer.id
+
+    # WHEN changing the customer in the read-only database
+    read_only_customer.name = "changed"
+
+    # THEN the change should not be written
+    with pytest.raises(CgError):
+        store.read_only_store.session.commit()
+    store.remove_sessions()
+    store.drop_all()
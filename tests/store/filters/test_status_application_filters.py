@@ -2,6 +2,7 @@ from cg.store.filters.status_application_filters import (
     filter_applications_by_entry_id,
     filter_applications_by_prep_category,
     filter_applications_by_tag,
+    filter_applications_by_tags,
     filter_applications_is_archived,
     filter_applications_is_external,
     filter_applications_is_not_external,
@@ -36,6 +37,28 @@ def test_filter_get_application_by_tag(
     assert application.all() and len(application.all()) == 1 and application.all()[0].tag == tag
 
 
+def test_filter_get_applications_by_tags(
+    store_with_an_application_with_and_without_attributes: Store,
+    tag=StoreConftestFixture.TAG_APPLICATION_WITH_ATTRIBUTES.value,
+) -> None:
+    """Test to get applications by tags."""
+    # GIVEN a store with two applications of which one has a tag
+
+    # WHEN getting applications by the tag and a tag that does not exist
+    applications: Query = filter_applications_by_tags(
+        applications=store_with_an_application_with_and_without_attributes._get_query(
+            table=Application
+        ),
+        tags=[tag, "does_not_exist"],
+    )
+
+    # ASSERT that applications is a query
+    assert isinstance(applications, Query)
+
+    # THEN assert only the application with the tag was found
+    assert [application.tag for application in applications.all()] == [tag]
+
+
 def test_filter_get_applications_by_prep_category(
     store_with_an_application_with_and_without_attributes: Store,
     prep_category=StoreConftestFixture.PREP_CATEGORY_APPLICATION_WITH_ATTRIBUTES.value,
@@ -8,6 +8,7 @@ from cg.store.filters.status_application_version_filters import (
     filter_application_versions_by_application_entry_id,
     filter_application_versions_before_valid_from,
     filter_application_versions_by_application_version_entry_id,
+    filter_application_versions_by_application_version_entry_ids,
     filter_application_versions_by_version,
     order_application_versions_by_valid_from_desc,
 )
@@ -313,3 +314,29 @@ def test_filter_application_versions_by_application_version_entry_id_match(
     # THEN the query should return the application version with the matching entry id
     assert filtered_application_versions.count() == 1
     assert filtered_application_versions.first().id == existing_application_version_entry_id
+
+
+def test_filter_application_versions_by_application_version_entry_ids(
+    store_with_different_application_versions: Store,
+):
+    """Test that application versions matching application version entry ids are returned."""
+    # GIVEN a store containing multiple application versions
+    application_versions_query: Query = store_with_different_application_versions._get_query(
+        table=ApplicationVersion
+    )
+    entry_ids: List[int] = [
+        application_version.id for application_version in application_versions_query.all()[:2]
+    ]
+
+    # WHEN filtering application versions by the entry ids and an entry id that does not exist
+    filtered_application_versions: Query = (
+        filter_application_versions_by_application_version_entry_ids(
+            application_versions=application_versions_query,
+            application_version_entry_ids=entry_ids + [-1],
+        )
+    )
+
+    # THEN the query should return the application versions with the matching entry ids
+    assert sorted(
+        application_version.id for application_version in filtered_application_versions
+    ) == sorted(entry_ids)
@@ -12,6 +12,7 @@ from cg.store.filters.status_pool_filters import (
     filter_pools_by_invoice_id,
     filter_pools_by_order_enquiry,
     filter_pools_by_name_enquiry,
+    filter_pools_by_name_or_order_enquiry,
     filter_pools_by_customer_id,
 )
 from tests.store.conftest import StoreConftestFixture
@@ -281,6 +282,30 @@ def test_filter_pools_by_order_enquiry(
     assert pools.all()[0].name == name
 
 
+def test_filter_pools_by_name_or_order_enquiry(
+    store_with_a_pool_with_and_without_attributes: Store,
+    name=StoreConftestFixture.NAME_POOL_WITH_ATTRIBUTES.value,
+):
+    """Test that a pool is returned when its name or order matches the enquiry."""
+
+    # GIVEN a store with two pools of which one has a specific order
+
+    # WHEN getting pools with the order as enquiry
+    pools: Query = filter_pools_by_name_or_order_enquiry(
+        pools=store_with_a_pool_with_and_without_attributes._get_query(table=Pool),
+        enquiry=StoreConftestFixture.ORDER_POOL_WITH_ATTRIBUTES.value,
+    )
+
+    # THEN a Query is returned
+    assert isinstance(pools, Query)
+
+    # THEN only one pool should be returned
+    assert len(pools.all()) == 1
+
+    # THEN the pool should have the expected name
+    assert pools.all()[0].name == name
+
+
 def test_filter_pools_by_customer_id(
     store_with_a_pool_with_and_without_attributes: Store,
     name=StoreConftestFixture.NAME_POOL_WITH_ATTRIBUTES.value,
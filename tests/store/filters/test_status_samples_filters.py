@@ -19,6 +19,7 @@ from cg.store.filters.status_sample_filters import (
     filter_samples_do_not_invoice,
     filter_samples_by_invoice_id,
     filter_samples_by_internal_id,
+    filter_samples_by_internal_ids,
     filter_samples_by_entry_id,
     filter_samples_with_type,
     filter_samples_is_prepared,
@@ -496,6 +497,29 @@ def test_filter_get_samples_by_internal_id(
     assert samples.all()[0].internal_id == sample_internal_id
 
 
+def test_filter_samples_by_internal_ids(
+    store_with_a_sample_that_has_many_attributes_and_one_without: Store,
+    sample_internal_id: str = StoreConftestFixture.INTERNAL_ID_SAMPLE_WITH_ATTRIBUTES.value,
+):
+    """Test that only the samples with any of the given internal ids are returned."""
+
+    # GIVEN a store with two samples of which one has one of the given internal ids
+
+    # WHEN getting samples by internal ids
+    samples: Query = filter_samples_by_internal_ids(
+        samples=store_with_a_sample_that_has_many_attributes_and_one_without._get_query(
+            table=Sample
+        ),
+        internal_ids=[sample_internal_id, "does_not_exist"],
+    )
+
+    # ASSERT that samples is a query
+    assert isinstance(samples, Query)
+
+    # THEN samples should only contain the sample with the internal id
+    assert [sample.internal_id for sample in samples.all()] == [sample_internal_id]
+
+
 def test_filter_get_samples_by_entry_id(
     store_with_a_sample_that_has_many_attributes_and_one_without: Store,
     entry_id: int = 1,
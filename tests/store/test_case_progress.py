@@ -0,0 +1,129 @@
+"""Tests for the maintenance of the latest analysis and progress summary tables of cases."""
+
+from datetime import datetime
+from typing import List
+
+from cg.store import Store
+from cg.store.case_progress import refresh_case_progress
+from cg.store.models import (
+    Analysis,
+    Application,
+    CaseProgress,
+    Family,
+    LatestAnalysis,
+    Sample,
+)
+from tests.store_helpers import StoreHelpers
+
+
+def get_case_progress(store: Store, case: Family) -> CaseProgress:
+    """Return the progress of a case."""
+    return store._get_query(table=CaseProgress).filter(CaseProgress.family_id == case.id).one()
+
+
+def get_summary_rows(store: Store) -> List[tuple]:
+    """Return the rows of the summary tables, apart from the time they were updated."""
+    return [
+        (row.family_id, row.latest_sequenced_at, row.latest_analyzed_at, row.all_samples_pass_qc)
+        for row in store._get_query(table=CaseProgress).order_by(CaseProgress.family_id)
+    ] + [
+        (row.family_id, row.analysis_id)
+        for row in store._get_query(table=LatestAnalysis).order_by(LatestAnalysis.family_id)
+    ]
+
+
+def test_case_progress_follows_writes(
+    base_store: Store,
+    case_id: str,
+    helpers: StoreHelpers,
+    timestamp_now: datetime,
+    timestamp_yesterday: datetime,
+):
+    """Test that the case progress is kept up to date when samples and analyses change."""
+    # GIVEN a case with a sample that is not sequenced
+    case: Family = helpers.add_case(store=base_store, internal_id=case_id, name=case_id)
+    sample: Sample = helpers.add_sample(store=base_store, reads=0)
+    helpers.add_relationship(store=base_store, sample=sample, case=case)
+
+    # THEN the case should not be sequenced
+    assert get_case_progress(store=base_store, case=case).latest_sequenced_at is None
+
+    # WHEN the sample is sequenced with enough reads
+    sample.sequenced_at = timestamp_yesterday
+    sample.reads = sample.application_version.application.expected_reads + 1
+    base_store.session.commit()
+
+    # THEN the progress should be the same as computed from the case
+    case_progress: CaseProgress = get_case_progress(store=base_store, case=case)
+    assert case_progress.latest_sequenced_at == case.latest_sequenced == timestamp_yesterday
+    assert case_progress.all_samples_pass_qc is case.all_samples_pass_qc is True
+    assert case_progress.latest_analyzed_at is None
+
+    # WHEN analysing the case twice
+    helpers.add_analysis(
+        store=base_store, case=case, started_at=timestamp_yesterday, completed_at=timestamp_now
+    )
+    latest_analysis: Analysis = helpers.add_analysis(
+        store=base_store, case=case, started_at=timestamp_now
+    )
+
+    # THEN the latest started analysis should be tracked
+    assert base_store._get_latest_analyses_for_cases_query().filter(
+        Analysis.family_id == case.id
+    ).all() == [latest_analysis]
+
+    # THEN the case should not be analysed while its latest analysis is not completed
+    assert get_case_progress(store=base_store, case=case).latest_analyzed_at is None
+    assert case.latest_analyzed is None
+
+    # WHEN the latest analysis is completed
+    latest_analysis.completed_at = timestamp_now
+    base_store.session.commit()
+
+    # THEN the latest analysis completion should be the same as computed from the case
+    assert (
+        get_case_progress(store=base_store, case=case).latest_analyzed_at
+        == case.latest_analyzed
+        == timestamp_now
+    )
+
+
+def test_refresh_case_progress(
+    base_store: Store, case_id: str, helpers: StoreHelpers, sample_id: str, timestamp_now: datetime
+):
+    """Test that rebuilding the summaries of all cases gives the maintained summaries."""
+    # GIVEN cases with samples and analyses
+    case: Family = helpers.add_case_with_sample(
+        base_store=base_store, case_id=case_id, sample_id=sample_id
+    )
+    helpers.add_analysis(store=base_store, case=case, completed_at=timestamp_now)
+    helpers.add_case(store=base_store, internal_id="case_without_samples", name="no_samples")
+    maintained_rows: List[tuple] = get_summary_rows(store=base_store)
+
+    # WHEN rebuilding the summaries of all cases
+    refresh_case_progress(session=base_store.session)
+
+    # THEN the summaries should be the same as the maintained ones
+    assert get_summary_rows(store=base_store) == maintained_rows
+    assert len(maintained_rows) == 3
+
+
+def test_case_progress_follows_application_changes(
+    base_store: Store, case_id: str, helpers: StoreHelpers, timestamp_yesterday: datetime
+):
+    """Test that the sample QC of cases is kept up to date when their application changes."""
+    # GIVEN a case with a sample sequenced with enough reads for its application
+    case: Family = helpers.add_case(store=base_store, internal_id=case_id, name=case_id)
+    sample: Sample = helpers.add_sample(store=base_store, sequenced_at=timestamp_yesterday)
+    application: Application = sample.application_version.application
+    sample.reads = application.expected_reads + 1
+    helpers.add_relationship(store=base_store, sample=sample, case=case)
+    assert get_case_progress(store=base_store, case=case).all_samples_pass_qc is True
+
+    # WHEN the application requires more reads than the sample has
+    application.target_reads = sample.reads * 10
+    base_store.session.commit()
+
+    # THEN the progress should be the same as computed from the case
+    assert get_case_progress(store=base_store, case=case).all_samples_pass_qc is False
+    assert case.all_samples_pass_qc is False
@@ -0,0 +1,189 @@
+"""Tests and benchmark for the audit of the columns that statusdb statements filter on."""
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Tuple
+
+import pytest
+from sqlalchemy import Index
+from sqlalchemy.orm import Query
+
+from cg.constants import Pipeline
+from cg.store import Store
+from cg.store.index_audit import FilterColumns, IndexAudit, get_filter_columns
+from cg.store.models import Analysis, Model, Sample
+from tests.store_helpers import StoreHelpers
+
+LOG = logging.getLogger(__name__)
+
+HOT_STATUS_QUERIES: List[Callable[[Store], Query]] = [
+    lambda store: store.get_samples_to_receive_query(),
+    lambda store: store.get_samples_to_prepare_query(),
+    lambda store: store.get_samples_to_sequence_query(),
+    lambda store: store.get_samples_to_invoice_query(),
+    lambda store: store.get_pools_to_invoice_query(),
+    lambda store: store.get_analyses_to_upload_query(pipeline=Pipeline.MIP_DNA),
+    lambda store: store.get_analyses_to_upload_query(),
+    lambda store: store.get_analyses_to_deliver_for_pipeline_query(pipeline=Pipeline.MIP_DNA),
+]
+
+
+def _add_samples(store: Store, helpers: StoreHelpers, nr_samples: int) -> None:
+    """Add samples of which one in a hundred is not received, inserted in bulk."""
+    sample: Sample = helpers.add_sample(store=store)
+    ordered_at: datetime = datetime.now() - timedelta(days=30)
+    store.session.execute(
+        Sample.__table__.insert(),
+        [
+            {
+                "application_version_id": sample.application_version_id,
+                "customer_id": sample.customer_id,
+                "internal_id": f"ACC{number}",
+                "name": f"sample_{number}",
+                "ordered_at": ordered_at,
+                "priority": sample.priority,
+                "received_at": None if number % 100 == 0 else ordered_at + timedelta(days=1),
+                "sex": sample.sex,
+            }
+            for number in range(nr_samples)
+        ],
+    )
+    store.session.commit()
+
+
+def _get_query_plan(store: Store, query: Query) -> str:
+    """Return the SQLite query plan of a query."""
+    compiled = query.statement.compile(bind=store.engine)
+    return " ".join(
+        str(row[-1])
+        for row in store.engine.execute(
+            f"EXPLAIN QUERY PLAN {compiled}",
+            tuple(compiled.params[name] for name in compiled.positiontup),
+        )
+    )
+
+
+def _time_query(query: Query, repeats: int = 5) -> Tuple[int, float]:
+    """Return the number of rows and the best run time of a query."""
+    run_times: List[float] = []
+    for _ in range(repeats):
+        start_time: float = time.perf_counter()
+        nr_rows: int = len(query.all())
+        run_times.append(time.perf_counter() - start_time)
+    return nr_rows, min(run_times)
+
+
+def test_get_filter_columns(store: Store, timestamp_now: datetime):
+    """Test that the equality, range and sort columns of a statement are found per table."""
+    # GIVEN a query filtering on analyses with a join condition, equality and range filters
+    query: Query = (
+        store._get_query(table=Analysis)
+        .filter(
+            Analysis.family_id == Sample.id,
+            Analysis.pipeline == Pipeline.MIP_DNA,
+            Analysis.uploaded_at.is_(None),
+            Analysis.completed_at < timestamp_now,
+        )
+        .order_by(Analysis.completed_at.desc())
+    )
+
+    # WHEN getting the filter columns of the statement
+    filter_columns: List[FilterColumns] = get_filter_columns(statement=query.statement)
+
+    # THEN the join condition should be ignored and the index should end with the range column
+    assert filter_columns == [
+        FilterColumns(
+            table="analysis",
+            equality_columns=("pipeline", "uploaded_at"),
+            range_columns=("completed_at",),
+            order_columns=("completed_at",),
+        )
+    ]
+    assert filter_columns[0].index_columns == ("pipeline", "uploaded_at", "completed_at")
+
+
+def test_get_filter_columns_of_subqueries(store: Store):
+    """Test that the filter columns of joined subqueries are found."""
+    # GIVEN a query on analyses joined with a subquery of samples that are not received
+    samples_to_receive = (
+        store.session.query(Sample.id).filter(Sample.received_at.is_(None)).subquery()
+    )
+    query: Query = (
+        store._get_query(table=Analysis)
+        .join(samples_to_receive, Analysis.family_id == samples_to_receive.c.id)
+        .filter(Analysis.pipeline == Pipeline.MIP_DNA)
+    )
+
+    # WHEN getting the filter columns of the statement
+    filter_columns: List[FilterColumns] = get_filter_columns(statement=query.statement)
+
+    # THEN the filter columns of both the query and the subquery should be found
+    assert filter_columns == [
+        FilterColumns(
+            table="analysis",
+            equality_columns=("pipeline",),
+            range_columns=(),
+            order_columns=(),
+        ),
+        FilterColumns(
+            table="sample",
+            equality_columns=("received_at",),
+            range_columns=(),
+            order_columns=(),
+        ),
+    ]
+
+
+def test_hot_status_queries_are_indexed(base_store: Store):
+    """Test that an index serves each of the status queries run by the daily workflows."""
+    # GIVEN an audit of the statements executed on the store
+    audit = IndexAudit()
+
+    # WHEN running the status queries
+    with audit.recording(engine=base_store.engine):
+        for get_query in HOT_STATUS_QUERIES:
+            get_query(base_store).all()
+
+    # THEN the statements on the big tables should have been recorded
+    candidate_tables: List[str] = [table for table, _ in audit.get_index_candidates()]
+    assert {"analysis", "pool", "sample"}.issubset(candidate_tables)
+
+    # THEN they should all be served by an index
+    missing_indexes: Dict[Tuple[str, Tuple[str, ...]], int] = audit.get_missing_indexes(
+        metadata=Model.metadata
+    )
+    assert not {
+        (table, columns): count
+        for (table, columns), count in missing_indexes.items()
+        if table != "application"
+    }
+
+
+@pytest.mark.benchmark
+def test_filter_index_benchmark(base_store: Store, helpers: StoreHelpers):
+    """Benchmark the samples to receive query with and without the index on received_at."""
+    # GIVEN a store with many received samples and a few samples to receive
+    _add_samples(store=base_store, helpers=helpers, nr_samples=20000)
+    query: Query = base_store.get_samples_to_receive_query()
+
+    # WHEN querying the samples to receive with the index
+    assert "ix_sample_received_at" in _get_query_plan(store=base_store, query=query)
+    nr_indexed_rows, indexed_run_time = _time_query(query=query)
+
+    # WHEN querying the samples to receive without the index
+    index: Index = next(
+        index for index in Sample.__table__.indexes if index.name == "ix_sample_received_at"
+    )
+    base_store.session.commit()
+    index.drop(bind=base_store.engine)
+    try:
+        nr_rows, run_time = _time_query(query=query)
+    finally:
+        index.create(bind=base_store.engine)
+    LOG.info(
+        f"Queried {nr_rows} samples to receive out of 20000: "
+        f"{run_time * 1000:.1f}ms without index, {indexed_run_time * 1000:.1f}ms with index"
+    )
+
+    # THEN the same samples should be returned
+    assert nr_indexed_rows == nr_rows == 201
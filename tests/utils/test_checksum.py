@@ -0,0 +1,71 @@
+"""Tests for the checksum utilities."""
+import hashlib
+import os
+from pathlib import Path
+from typing import Dict, List
+
+from cg.utils.checksum import checksum
+from cg.utils.checksum.checksum import SHA512, get_file_checksum, get_file_checksums
+from cg.utils.checksum.checksum_cache import ChecksumCache
+
+
+def _write_files(directory: Path, number_of_files: int) -> List[Path]:
+    """Write files with different contents spanning several read chunks."""
+    file_paths: List[Path] = []
+    for number in range(number_of_files):
+        file_path = Path(directory, f"file_{number}.spring")
+        file_path.write_bytes(bytes([number]) * (checksum.BYTES_PER_CHUNK + number + 1))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def test_get_file_checksums(tmp_path: Path):
+    """Test that the checksums of several files are those of hashlib."""
+    # GIVEN files larger than one read chunk
+    file_paths: List[Path] = _write_files(directory=tmp_path, number_of_files=4)
+
+    # WHEN calculating the checksums of the files concurrently
+    checksums: Dict[Path, str] = get_file_checksums(file_paths=file_paths, algorithm=SHA512)
+
+    # THEN every checksum should be the checksum of the whole file
+    assert checksums == {
+        file_path: hashlib.sha512(file_path.read_bytes()).hexdigest() for file_path in file_paths
+    }
+
+
+def test_get_file_checksum_uses_cache(tmp_path: Path, mocker):
+    """Test that an unchanged file is only hashed once, also when it has been renamed."""
+    # GIVEN a file and an empty checksum cache
+    file_path: Path = _write_files(directory=tmp_path, number_of_files=1)[0]
+    checksum_cache = ChecksumCache(cache_path=Path(tmp_path, "cache", "checksums.sqlite"))
+    new_hash = mocker.spy(checksum.hashlib, "new")
+
+    # WHEN calculating the checksum twice, the second time after renaming the file
+    first_checksum: str = get_file_checksum(file_path=file_path, checksum_cache=checksum_cache)
+    renamed_file_path: Path = file_path.rename(Path(tmp_path, "renamed.spring"))
+    second_checksum: str = get_file_checksum(
+        file_path=renamed_file_path, checksum_cache=checksum_cache
+    )
+
+    # THEN the file should only have been hashed once
+    assert new_hash.call_count == 1
+    assert second_checksum == first_checksum
+
+
+def test_get_file_checksum_of_changed_file(tmp_path: Path):
+    """Test that a file that changed since its checksum was cached is hashed again."""
+    # GIVEN a file with a cached checksum
+    file_path: Path = _write_files(directory=tmp_path, number_of_files=1)[0]
+    checksum_cache = ChecksumCache(cache_path=Path(tmp_path, "checksums.sqlite"))
+    get_file_checksum(file_path=file_path, checksum_cache=checksum_cache)
+
+    # GIVEN that the file is changed
+    file_path.write_bytes(b"changed")
+    file_stat: os.stat_result = os.stat(file_path)
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns + 1_000_000_000))
+
+    # WHEN calculating the checksum of the file
+    file_checksum: str = get_file_checksum(file_path=file_path, checksum_cache=checksum_cache)
+
+    # THEN the checksum should be that of the changed file
+    assert file_checksum == hashlib.md5(b"changed").hexdigest()
@@ -5,7 +5,7 @@ from subprocess import CalledProcessError
 
 import pytest
 
-from cg.utils import Process
+from cg.utils import Process, ProcessPool
 
 
 def test_process():
@@ -95,3 +95,32 @@ def test_iter_stderr_lines_no_output(ls_process):
     for i, line in enumerate(process.stderr_lines(), 1):
         assert line == ""
     assert i == 1
+
+
+def test_stream_command(echo_process):
+    # GIVEN a process with 'echo' as binary
+    process = echo_process
+    # WHEN streaming the output of a command printing two lines
+    lines = list(process.stream_command(parameters=["-e", "first\\nsecond"]))
+    # THEN assert each line is yielded without the line break
+    assert lines == ["first", "second"]
+
+
+def test_stream_command_non_zero_exit_code(ls_process):
+    # GIVEN a process with 'ls' as binary
+    process = ls_process
+    # WHEN streaming the output of a command with invalid parameters
+    with pytest.raises(CalledProcessError):
+        # THEN assert that a exception is raised
+        list(process.stream_command(parameters=["-kffd4"]))
+
+
+def test_process_pool_collects_results():
+    # GIVEN a process pool with 'sleep' as binary and a timeout
+    process_pool = ProcessPool(process=Process(binary="sleep"), max_workers=2, timeout=1)
+    # WHEN running one successful, one timed out and one failing command
+    results = process_pool.run_commands(parameters=[["0"], ["5"], ["invalid"]])
+    # THEN assert that the result of every command is returned in order
+    assert [result.success for result in results] == [True, False, False]
+    assert results[1].timed_out
+    assert results[2].return_code != 0